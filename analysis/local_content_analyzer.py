@@ -1,252 +1,4 @@
-نسبة توفر المادة محلياً (0 إلى 100)
-        """
-        # البحث في قاعدة بيانات المواد المحلية
-        material_name = material_name.lower()
-        
-        # مطابقة الاسم بالكامل
-        for local_material in self.local_materials_db:
-            if local_material.get('name', '').lower() == material_name:
-                return local_material.get('availability_percentage', 100.0)
-        
-        # مطابقة جزئية
-        matches = []
-        for local_material in self.local_materials_db:
-            local_name = local_material.get('name', '').lower()
-            # حساب درجة التشابه البسيط
-            similarity = self._simple_similarity(material_name, local_name)
-            if similarity > 0.7:  # عتبة التشابه
-                matches.append((local_material, similarity))
-        
-        if matches:
-            # ترتيب المطابقات حسب درجة التشابه
-            matches.sort(key=lambda x: x[1], reverse=True)
-            return matches[0][0].get('availability_percentage', 0.0)
-        
-        # إذا لم يتم العثور على مطابقات، نفترض نسبة منخفضة
-        return 20.0  # قيمة افتراضية منخفضة
-    
-    def _simple_similarity(self, str1: str, str2: str) -> float:
-        """
-        حساب درجة التشابه البسيط بين سلسلتين
-        
-        المعاملات:
-        ----------
-        str1 : str
-            السلسلة الأولى
-        str2 : str
-            السلسلة الثانية
-            
-        المخرجات:
-        --------
-        float
-            درجة التشابه (0 إلى 1)
-        """
-        # تنظيف السلاسل
-        str1 = str1.strip().lower()
-        str2 = str2.strip().lower()
-        
-        # تحويل السلاسل إلى مجموعات من الكلمات
-        words1 = set(str1.split())
-        words2 = set(str2.split())
-        
-        # حساب معامل جاكارد
-        intersection = len(words1.intersection(words2))
-        union = len(words1.union(words2))
-        
-        if union == 0:
-            return 0.0
-        
-        return intersection / union
-    
-    def _extract_tables(self, text: str) -> List[str]:
-        """
-        استخراج أقسام الجداول من النص
-        
-        المعاملات:
-        ----------
-        text : str
-            النص المستخرج من المناقصة
-            
-        المخرجات:
-        --------
-        List[str]
-            قائمة بأقسام الجداول
-        """
-        # بحث بسيط عن أقسام الجداول
-        # البحث عن أقسام تبدأ بعناوين مثل "جدول المواصفات" أو "قائمة الكميات"
-        table_headers = [
-            "جدول المواصفات",
-            "جدول الكميات",
-            "قائمة المواد",
-            "قائمة الكميات",
-            "جدول المنتجات",
-            "المواد المطلوبة",
-            "قائمة البنود",
-            "بنود المناقصة"
-        ]
-        
-        tables = []
-        for header in table_headers:
-            # البحث عن أقسام تبدأ بالعنوان المحدد
-            matches = re.finditer(f"{header}.*?(?=\n\n|\Z)", text, re.DOTALL)
-            for match in matches:
-                table_section = match.group(0)
-                if len(table_section.split('\n')) > 2:  # التأكد من أن القسم يحتوي على أكثر من سطرين
-                    tables.append(table_section)
-        
-        # البحث عن أنماط الجداول (أسطر تحتوي على عدة عناصر مفصولة بـ | أو مسافات متعددة)
-        table_pattern = r'(?:\n|^)((?:[^\n]+\|[^\n]+\|[^\n]+\n){3,})'
-        table_matches = re.finditer(table_pattern, text)
-        for match in table_matches:
-            tables.append(match.group(1))
-        
-        return tables
-    
-    def _parse_table_for_materials(self, table_text: str) -> List[Dict[str, Any]]:
-        """
-        تحليل نص الجدول لاستخراج المواد
-        
-        المعاملات:
-        ----------
-        table_text : str
-            نص الجدول
-            
-        المخرجات:
-        --------
-        List[Dict[str, Any]]
-            قائمة بالمواد المستخرجة
-        """
-        items = []
-        
-        # تقسيم الجدول إلى أسطر
-        lines = table_text.strip().split('\n')
-        
-        # تحديد الأعمدة من السطر الأول (العناوين)
-        if len(lines) < 2:
-            return []
-        
-        # تعرف على العناوين
-        headers = lines[0].strip()
-        header_cols = []
-        
-        # البحث عن أعمدة محتملة للمواد والكميات
-        name_col_idx = -1
-        quantity_col_idx = -1
-        unit_col_idx = -1
-        
-        # تقسيم العناوين إما بفواصل | أو مسافات متعددة
-        if '|' in headers:
-            header_cols = [col.strip() for col in headers.split('|')]
-        else:
-            # محاولة تقسيم بناءً على المسافات المتعددة
-            header_cols = re.split(r'\s{2,}', headers)
-        
-        # تحديد أعمدة المواد والكميات والوحدات
-        for i, col in enumerate(header_cols):
-            col_lower = col.lower()
-            if any(term in col_lower for term in ['اسم', 'وصف', 'البند', 'المادة', 'منتج']):
-                name_col_idx = i
-            elif any(term in col_lower for term in ['كمية', 'العدد']):
-                quantity_col_idx = i
-            elif any(term in col_lower for term in ['وحدة', 'القياس']):
-                unit_col_idx = i
-        
-        # إذا لم نتمكن من العثور على عمود الاسم، نحاول استخدام نهج بديل
-        if name_col_idx == -1:
-            # افتراض أن العمود الأول يحتوي على الاسم
-            name_col_idx = 0
-        
-        # معالجة كل سطر في الجدول (نبدأ من السطر الثاني لتخطي العناوين)
-        for i in range(1, len(lines)):
-            line = lines[i].strip()
-            if not line:
-                continue
-            
-            # تقسيم السطر إلى أعمدة
-            cols = []
-            if '|' in line:
-                cols = [col.strip() for col in line.split('|')]
-            else:
-                # محاولة تقسيم بناءً على المسافات المتعددة
-                cols = re.split(r'\s{2,}', line)
-            
-            # تخطي الأسطر القصيرة جدًا
-            if len(cols) < 2:
-                continue
-            
-            # استخراج المعلومات المطلوبة
-            name = cols[name_col_idx] if name_col_idx < len(cols) else ""
-            
-            # تنظيف الاسم
-            name = re.sub(r'\d+', '', name).strip()
-            
-            # استخراج الكمية والوحدة إذا كانت متوفرة
-            quantity = ""
-            if quantity_col_idx != -1 and quantity_col_idx < len(cols):
-                quantity = cols[quantity_col_idx]
-                
-                # محاولة تحويل الكمية إلى رقم
-                try:
-                    quantity = float(re.search(r'\d+(?:\.\d+)?', quantity).group(0))
-                except (ValueError, AttributeError):
-                    quantity = ""
-            
-            unit = ""
-            if unit_col_idx != -1 and unit_col_idx < len(cols):
-                unit = cols[unit_col_idx]
-            
-            # إضافة المادة إلى القائمة إذا كان الاسم غير فارغ
-            if name:
-                items.append({
-                    "name": name,
-                    "quantity": quantity,
-                    "unit": unit,
-                    "source": "table"
-                })
-        
-        return items
-    
-    def _extract_materials_from_text(self, text: str) -> List[Dict[str, Any]]:
-        """
-        استخراج المواد من النص العادي
-        
-        المعاملات:
-        ----------
-        text : str
-            النص المستخرج من المناقصة
-            
-        المخرجات:
-        --------
-        List[Dict[str, Any]]
-            قائمة بالمواد المستخرجة
-        """
-        items = []
-        
-        # البحث عن قوائم بنقاط
-        bullet_lists = re.findall(r'(?<=\n)(?:[-•*]\s+[^\n]+(?:\n|$))+', text)
-        
-        for bullet_list in bullet_lists:
-            # تقسيم القائمة إلى عناصر
-            list_items = re.findall(r'[-•*]\s+([^\n]+)(?:\n|$)', bullet_list)
-            
-            # معالجة كل عنصر
-            for item in list_items:
-                # البحث عن الكمية والوحدة في العنصر
-                quantity_match = re.search(r'(\d+(?:\.\d+)?)\s*([كمقطعةوحدةمترطنكجم]*)', item)
-                
-                quantity = ""
-                unit = ""
-                name = item
-                
-                if quantity_match:
-                    quantity = quantity_match.group(1)
-                    unit = quantity_match.group(2)
-                    # إزالة الكمية والوحدة من الاسم
-                    name = item.replace(quantity_match.group(0), "").strip()
-                
-                # تنظيف الاسم
-                name = re.sub(r'^[-\s]*', '', name)
-                name = re.sub(r'[-\s]*"""
+"""
 محلل المحتوى المحلي
 يقوم بتحليل متطلبات المحتوى المحلي في المناقصات وتقييم نسب المحتوى المحلي
 """
@@ -258,6 +10,13 @@ import os
 from typing import Dict, List, Any, Tuple, Optional, Union
 import numpy as np
 
+from utils.supplier_store import SupplierStore
+
+from .section_index import get_document_index
+from .result_cache import cached_analysis
+from utils.tracing import traced
+from utils.arabic_normalizer import normalize_term, word_similarity
+
 logger = logging.getLogger(__name__)
 
 class LocalContentAnalyzer:
@@ -281,7 +40,7 @@ class LocalContentAnalyzer:
         
         # تحميل قوائم المنتجات والمواد المحلية
         self.local_materials_db = self._load_local_materials()
-        self.local_suppliers_db = self._load_local_suppliers()
+        self.local_suppliers_db = SupplierStore.from_records(self._load_local_suppliers())
         
         # تحميل قواعد ولوائح المحتوى المحلي
         self.local_content_regulations = self._load_regulations()
@@ -297,7 +56,10 @@ class LocalContentAnalyzer:
         
         logger.info("تم تهيئة محلل المحتوى المحلي")
     
-    def analyze(self, extracted_text: str) -> Dict[str, Any]:
+    @traced("analysis.local_content_analyzer.analyze")
+    @cached_analysis("local_content_analyzer", ("local_materials_db", "local_suppliers_db", "local_content_regulations"))
+    def analyze(self, extracted_text: str, tables: Optional[List[Dict[str, Any]]] = None,
+                boq_items: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
         """
         تحليل المحتوى المحلي من نص المناقصة
         
@@ -305,6 +67,10 @@ class LocalContentAnalyzer:
         ----------
         extracted_text : str
             النص المستخرج من المناقصة
+        tables : List[Dict[str, Any]], optional
+            الجداول المستخرجة مسبقاً من المستند (مفتاح "tables" في نتيجة معالج المستندات)
+        boq_items : List[Dict[str, Any]], optional
+            بنود جدول الكميات المستخرجة مسبقاً (مفتاح "boq_items" في نتيجة معالج المستندات)
             
         المخرجات:
         --------
@@ -318,7 +84,7 @@ class LocalContentAnalyzer:
             local_content_requirements = self._extract_local_content_requirements(extracted_text)
             
             # استخراج المواد والمنتجات المطلوبة
-            required_materials = self._extract_required_materials(extracted_text)
+            required_materials = self._extract_required_materials(extracted_text, tables, boq_items)
             
             # تقدير نسبة المحتوى المحلي المتوقعة
             estimated_local_content = self._estimate_local_content(required_materials)
@@ -440,9 +206,6 @@ class LocalContentAnalyzer:
         List[str]
             قائمة بالفقرات المتعلقة بالمحتوى المحلي
         """
-        # تقسيم النص إلى فقرات
-        paragraphs = re.split(r'\n\s*\n', text)
-        
         # الكلمات المفتاحية للمحتوى المحلي
         local_content_keywords = [
             'المحتوى المحلي',
@@ -462,23 +225,16 @@ class LocalContentAnalyzer:
             'السعودة',
         ]
         
-        # البحث عن الفقرات التي تحتوي على كلمات مفتاحية للمحتوى المحلي
-        local_content_paragraphs = []
-        
-        for paragraph in paragraphs:
-            paragraph = paragraph.strip()
-            if not paragraph:
-                continue
-                
-            # البحث عن الكلمات المفتاحية في الفقرة
-            for keyword in local_content_keywords:
-                if keyword in paragraph.lower():
-                    local_content_paragraphs.append(paragraph)
-                    break
+        # البحث في فهرس المستند عن الفقرات التي تحتوي على كلمات مفتاحية للمحتوى المحلي
+        index = get_document_index(text)
+        local_content_paragraphs = [
+            paragraph["text"] for paragraph in index.paragraphs_containing(local_content_keywords)
+        ]
         
         return local_content_paragraphs
     
-    def _extract_required_materials(self, text: str) -> List[Dict[str, Any]]:
+    def _extract_required_materials(self, text: str, tables: Optional[List[Dict[str, Any]]] = None,
+                                    boq_items: Optional[List[Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
         """
         استخراج المواد والمنتجات المطلوبة من نص المناقصة
         
@@ -486,6 +242,10 @@ class LocalContentAnalyzer:
         ----------
         text : str
             النص المستخرج من المناقصة
+        tables : List[Dict[str, Any]], optional
+            الجداول المستخرجة مسبقاً (عند تمريرها لا يُعاد البحث عن الجداول في النص)
+        boq_items : List[Dict[str, Any]], optional
+            بنود جدول الكميات المستخرجة مسبقاً
             
         المخرجات:
         --------
@@ -494,14 +254,30 @@ class LocalContentAnalyzer:
         """
         required_materials = []
         
-        # البحث عن جداول المواصفات والكميات
-        tables = self._extract_tables(text)
-        
-        # البحث عن قوائم المواد في النص
-        for table in tables:
-            items = self._parse_table_for_materials(table)
-            if items:
+        # بنود جدول الكميات المستخرجة مسبقاً
+        for item in boq_items or []:
+            required_materials.append({
+                "name": item.get("description", ""),
+                "quantity": item.get("quantity", ""),
+                "unit": item.get("unit", ""),
+                "source": "boq"
+            })
+        
+        if tables is not None:
+            # الجداول المستخرجة من المستند مباشرة
+            for table in tables:
+                frame = table["data"]
+                items = self._parse_table_rows(
+                    [str(column) for column in frame.columns],
+                    ([str(value) for value in row] for row in frame.itertuples(index=False, name=None))
+                )
                 required_materials.extend(items)
+        else:
+            # البحث عن جداول المواصفات والكميات في النص
+            for table in self._extract_tables(text):
+                items = self._parse_table_for_materials(table)
+                if items:
+                    required_materials.extend(items)
         
         # البحث عن قوائم المواد في النص العادي
         text_materials = self._extract_materials_from_text(text)
@@ -536,29 +312,282 @@ class LocalContentAnalyzer:
         المخرجات:
         --------
         float
-            نسبة توفر المادة مح, '', name)
-                
-                # إضافة المادة إلى القائمة إذا كان الاسم غير فارغ
-                if name and len(name) > 3:  # تجاهل الأسماء القصيرة جدًا
-                    items.append({
-                        "name": name,
-                        "quantity": quantity,
-                        "unit": unit,
-                        "source": "text"
-                    })
-        
-        return items
-    
-    def _estimate_local_content(self, required_materials: List[Dict[str, Any]]) -> float:
+            نسبة توفر المادة محلياً (0 إلى 100)
         """
-        تقدير نسبة المحتوى المحلي المتوقعة
+        # البحث في قاعدة بيانات المواد المحلية (بالصيغة الموحدة للأسماء)
+        normalized_name = normalize_term(material_name)
         
-        المعاملات:
-        ----------
-        required_materials : List[Dict[str, Any]]
-            قائمة المواد المطلوبة
-            
-        المخرجات:
+        # مطابقة الاسم بالكامل
+        for local_material in self.local_materials_db:
+            if normalize_term(local_material.get('name', '')) == normalized_name:
+                return local_material.get('availability_percentage', 100.0)
+        
+        # مطابقة جزئية
+        matches = []
+        for local_material in self.local_materials_db:
+            local_name = local_material.get('name', '')
+            # حساب درجة التشابه البسيط
+            similarity = self._simple_similarity(material_name, local_name)
+            if similarity > 0.7:  # عتبة التشابه
+                matches.append((local_material, similarity))
+        
+        if matches:
+            # ترتيب المطابقات حسب درجة التشابه
+            matches.sort(key=lambda x: x[1], reverse=True)
+            return matches[0][0].get('availability_percentage', 0.0)
+        
+        # إذا لم يتم العثور على مطابقات، نفترض نسبة منخفضة
+        return 20.0  # قيمة افتراضية منخفضة
+    
+    def _simple_similarity(self, str1: str, str2: str) -> float:
+        """
+        حساب درجة التشابه البسيط بين سلسلتين
+        
+        المعاملات:
+        ----------
+        str1 : str
+            السلسلة الأولى
+        str2 : str
+            السلسلة الثانية
+            
+        المخرجات:
+        --------
+        float
+            درجة التشابه (0 إلى 1)
+        """
+        # معامل جاكارد بين مجموعات الكلمات بعد توحيد الأحرف العربية (تُحسب مرة واحدة لكل سلسلة)
+        return word_similarity(str1, str2)
+    
+    def _extract_tables(self, text: str) -> List[str]:
+        """
+        استخراج أقسام الجداول من النص
+        
+        المعاملات:
+        ----------
+        text : str
+            النص المستخرج من المناقصة
+            
+        المخرجات:
+        --------
+        List[str]
+            قائمة بأقسام الجداول
+        """
+        # بحث بسيط عن أقسام الجداول
+        # البحث عن أقسام تبدأ بعناوين مثل "جدول المواصفات" أو "قائمة الكميات"
+        table_headers = [
+            "جدول المواصفات",
+            "جدول الكميات",
+            "قائمة المواد",
+            "قائمة الكميات",
+            "جدول المنتجات",
+            "المواد المطلوبة",
+            "قائمة البنود",
+            "بنود المناقصة"
+        ]
+        
+        tables = []
+        for header in table_headers:
+            # البحث عن أقسام تبدأ بالعنوان المحدد
+            matches = re.finditer(rf"{header}.*?(?=\n\n|\Z)", text, re.DOTALL)
+            for match in matches:
+                table_section = match.group(0)
+                if len(table_section.split('\n')) > 2:  # التأكد من أن القسم يحتوي على أكثر من سطرين
+                    tables.append(table_section)
+        
+        # البحث عن أنماط الجداول (أسطر تحتوي على عدة عناصر مفصولة بـ | أو مسافات متعددة)
+        table_pattern = r'(?:\n|^)((?:[^\n]+\|[^\n]+\|[^\n]+\n){3,})'
+        table_matches = re.finditer(table_pattern, text)
+        for match in table_matches:
+            tables.append(match.group(1))
+        
+        return tables
+    
+    def _parse_table_for_materials(self, table_text: str) -> List[Dict[str, Any]]:
+        """
+        تحليل نص الجدول لاستخراج المواد
+        
+        المعاملات:
+        ----------
+        table_text : str
+            نص الجدول
+            
+        المخرجات:
+        --------
+        List[Dict[str, Any]]
+            قائمة بالمواد المستخرجة
+        """
+        # تقسيم الجدول إلى أسطر
+        lines = table_text.strip().split('\n')
+        
+        # تحديد الأعمدة من السطر الأول (العناوين)
+        if len(lines) < 2:
+            return []
+        
+        # تعرف على العناوين
+        headers = lines[0].strip()
+        header_cols = []
+        
+        # تقسيم العناوين إما بفواصل | أو مسافات متعددة
+        if '|' in headers:
+            header_cols = [col.strip() for col in headers.split('|')]
+        else:
+            # محاولة تقسيم بناءً على المسافات المتعددة
+            header_cols = re.split(r'\s{2,}', headers)
+        
+        # تقسيم بقية الأسطر إلى أعمدة
+        rows = []
+        for i in range(1, len(lines)):
+            line = lines[i].strip()
+            if not line:
+                continue
+            
+            if '|' in line:
+                rows.append([col.strip() for col in line.split('|')])
+            else:
+                # محاولة تقسيم بناءً على المسافات المتعددة
+                rows.append(re.split(r'\s{2,}', line))
+        
+        return self._parse_table_rows(header_cols, rows)
+    
+    def _parse_table_rows(self, header_cols: List[str], rows) -> List[Dict[str, Any]]:
+        """
+        استخراج المواد من صفوف جدول مقسمة إلى أعمدة
+        
+        المعاملات:
+        ----------
+        header_cols : List[str]
+            عناوين الأعمدة
+        rows : Iterable[List[str]]
+            قيم أعمدة كل صف
+            
+        المخرجات:
+        --------
+        List[Dict[str, Any]]
+            قائمة بالمواد المستخرجة
+        """
+        items = []
+        
+        # البحث عن أعمدة محتملة للمواد والكميات
+        name_col_idx = -1
+        quantity_col_idx = -1
+        unit_col_idx = -1
+        
+        # تحديد أعمدة المواد والكميات والوحدات
+        for i, col in enumerate(header_cols):
+            col_lower = col.lower()
+            if any(term in col_lower for term in ['اسم', 'وصف', 'البند', 'المادة', 'منتج']):
+                name_col_idx = i
+            elif any(term in col_lower for term in ['كمية', 'العدد']):
+                quantity_col_idx = i
+            elif any(term in col_lower for term in ['وحدة', 'القياس']):
+                unit_col_idx = i
+        
+        # إذا لم نتمكن من العثور على عمود الاسم، نحاول استخدام نهج بديل
+        if name_col_idx == -1:
+            # افتراض أن العمود الأول يحتوي على الاسم
+            name_col_idx = 0
+        
+        # معالجة كل صف في الجدول
+        for cols in rows:
+            # تخطي الأسطر القصيرة جدًا
+            if len(cols) < 2:
+                continue
+            
+            # استخراج المعلومات المطلوبة
+            name = cols[name_col_idx] if name_col_idx < len(cols) else ""
+            
+            # تنظيف الاسم
+            name = re.sub(r'\d+', '', name).strip()
+            
+            # استخراج الكمية والوحدة إذا كانت متوفرة
+            quantity = ""
+            if quantity_col_idx != -1 and quantity_col_idx < len(cols):
+                quantity = cols[quantity_col_idx]
+                
+                # محاولة تحويل الكمية إلى رقم
+                try:
+                    quantity = float(re.search(r'\d+(?:\.\d+)?', quantity).group(0))
+                except (ValueError, AttributeError):
+                    quantity = ""
+            
+            unit = ""
+            if unit_col_idx != -1 and unit_col_idx < len(cols):
+                unit = cols[unit_col_idx]
+            
+            # إضافة المادة إلى القائمة إذا كان الاسم غير فارغ
+            if name:
+                items.append({
+                    "name": name,
+                    "quantity": quantity,
+                    "unit": unit,
+                    "source": "table"
+                })
+        
+        return items
+    
+    def _extract_materials_from_text(self, text: str) -> List[Dict[str, Any]]:
+        """
+        استخراج المواد من النص العادي
+        
+        المعاملات:
+        ----------
+        text : str
+            النص المستخرج من المناقصة
+            
+        المخرجات:
+        --------
+        List[Dict[str, Any]]
+            قائمة بالمواد المستخرجة
+        """
+        items = []
+        
+        # البحث عن قوائم بنقاط
+        bullet_lists = re.findall(r'(?<=\n)(?:[-•*]\s+[^\n]+(?:\n|$))+', text)
+        
+        for bullet_list in bullet_lists:
+            # تقسيم القائمة إلى عناصر
+            list_items = re.findall(r'[-•*]\s+([^\n]+)(?:\n|$)', bullet_list)
+            
+            # معالجة كل عنصر
+            for item in list_items:
+                # البحث عن الكمية والوحدة في العنصر
+                quantity_match = re.search(r'(\d+(?:\.\d+)?)\s*([كمقطعةوحدةمترطنكجم]*)', item)
+                
+                quantity = ""
+                unit = ""
+                name = item
+                
+                if quantity_match:
+                    quantity = quantity_match.group(1)
+                    unit = quantity_match.group(2)
+                    # إزالة الكمية والوحدة من الاسم
+                    name = item.replace(quantity_match.group(0), "").strip()
+                
+                # تنظيف الاسم
+                name = re.sub(r'^[-\s]*', '', name)
+                name = re.sub(r'[-\s]*$', '', name)
+                
+                # إضافة المادة إلى القائمة إذا كان الاسم غير فارغ
+                if name and len(name) > 3:  # تجاهل الأسماء القصيرة جدًا
+                    items.append({
+                        "name": name,
+                        "quantity": quantity,
+                        "unit": unit,
+                        "source": "text"
+                    })
+        
+        return items
+    
+    def _estimate_local_content(self, required_materials: List[Dict[str, Any]]) -> float:
+        """
+        تقدير نسبة المحتوى المحلي المتوقعة
+        
+        المعاملات:
+        ----------
+        required_materials : List[Dict[str, Any]]
+            قائمة المواد المطلوبة
+            
+        المخرجات:
         --------
         float
             نسبة المحتوى المحلي المقدرة
@@ -643,16 +672,18 @@ class LocalContentAnalyzer:
             material_name = material['name']
             suppliers_for_material = []
             
-            # البحث في قاعدة بيانات الموردين
-            for supplier in self.local_suppliers_db:
-                # التحقق مما إذا كان المورد يوفر هذه المادة
-                if any(self._simple_similarity(material_name, product) > 0.6 for product in supplier.get('products', [])):
-                    suppliers_for_material.append({
-                        "name": supplier.get('name', ''),
-                        "region": supplier.get('region', ''),
-                        "reliability": supplier.get('reliability', 0),
-                        "contact": supplier.get('contact', '')
-                    })
+            # البحث في قاعدة بيانات الموردين: الموردون الذين يوفرون هذه المادة
+            # (يُقارن اسم المادة بكل منتج مختلف مرة واحدة بدلاً من كل ظهور له لدى الموردين)
+            providers = self.local_suppliers_db.match(
+                'products', lambda product: self._simple_similarity(material_name, product) > 0.6
+            )
+            for supplier in self.local_suppliers_db.records(np.flatnonzero(providers)):
+                suppliers_for_material.append({
+                    "name": supplier.get('name', ''),
+                    "region": supplier.get('region', ''),
+                    "reliability": supplier.get('reliability', 0),
+                    "contact": supplier.get('contact', '')
+                })
             
             # إضافة الموردين المحتملين للمادة
             if suppliers_for_material:
@@ -856,7 +887,34 @@ class LocalContentAnalyzer:
                 "nitaqat_category": "بلاتيني"
             },
             {
-                "name": "شركة امجاد للسباكة",
+                "name": "اسمنت اليمامة",
+                "region": "الرياض",
+                "category": "مواد بناء",
+                "products": ["أسمنت", "خرسانة جاهزة"],
+                "reliability": 4.7,
+                "contact": "info@yamama-cement.sa",
+                "nitaqat_category": "بلاتيني"
+            },
+            {
+                "name": "الشركة السعودية للصناعات الكهربائية",
+                "region": "جدة",
+                "category": "كهرباء",
+                "products": ["أسلاك كهربائية", "لوحات كهربائية", "مفاتيح كهربائية"],
+                "reliability": 4.2,
+                "contact": "info@siec.sa",
+                "nitaqat_category": "أخضر مرتفع"
+            },
+            {
+                "name": "شركة الزامل للتكييف",
+                "region": "الدمام",
+                "category": "تكييف",
+                "products": ["وحدات تكييف", "معدات تبريد", "أجهزة تهوية"],
+                "reliability": 4.8,
+                "contact": "info@zamil-ac.sa",
+                "nitaqat_category": "بلاتيني"
+            },
+            {
+                "name": "شركة امجاد للسباكة",
                 "region": "الرياض",
                 "category": "سباكة",
                 "products": ["أنابيب مياه", "خزانات مياه", "مواسير صرف"],
@@ -952,342 +1010,4 @@ class LocalContentAnalyzer:
                 "دليل تطبيق آلية الوزن النسبي للمحتوى المحلي في التقييم المالي"
             ],
             "last_updated": "2023-06-15"
-        }category": "بلاتيني"
-            },
-            {
-                "name": "اسمنت اليمامة",
-                "region": "الرياض",
-                "category": "مواد بناء",
-                "products": ["أسمنت", "خرسانة جاهزة"],
-                "reliability": 4.7,
-                "contact": "info@yamama-cement.sa",
-                "nitaqat_category": "بلاتيني"
-            },
-            {
-                "name": "الشركة السعودية للصناعات الكهربائية",
-                "region": "جدة",
-                "category": "كهرباء",
-                "products": ["أسلاك كهربائية", "لوحات كهربائية", "مفاتيح كهربائية"],
-                "reliability": 4.2,
-                "contact": "info@siec.sa",
-                "nitaqat_category": "أخضر مرتفع"
-            },
-            {
-                "name": "شركة الزامل للتكييف",
-                "region": "الدمام",
-                "category": "تكييف",
-                "products": ["وحدات تكييف", "معدات تبريد", "أجهزة تهوية"],
-                "reliability": 4.8,
-                "contact": "info@zamil-ac.sa",
-                "nitaqat_"""
-محلل المحتوى المحلي
-يقوم بتحليل متطلبات المحتوى المحلي في المناقصات وتقييم نسب المحتوى المحلي
-"""
-
-import re
-import json
-import logging
-import os
-from typing import Dict, List, Any, Tuple, Optional, Union
-import numpy as np
-
-logger = logging.getLogger(__name__)
-
-class LocalContentAnalyzer:
-    """
-    محلل المحتوى المحلي في المناقصات
-    """
-    
-    def __init__(self, model_loader, config=None):
-        """
-        تهيئة محلل المحتوى المحلي
-        
-        المعاملات:
-        ----------
-        model_loader : ModelLoader
-            محمّل النماذج المستخدمة للتحليل
-        config : Dict, optional
-            إعدادات المحلل
-        """
-        self.config = config or {}
-        self.model_loader = model_loader
-        
-        # تحميل قوائم المنتجات والمواد المحلية
-        self.local_materials_db = self._load_local_materials()
-        self.local_suppliers_db = self._load_local_suppliers()
-        
-        # تحميل قواعد ولوائح المحتوى المحلي
-        self.local_content_regulations = self._load_regulations()
-        
-        # تحميل نموذج تحليل النصوص إذا كان متاحاً
-        self.ner_model = None
-        if hasattr(model_loader, 'get_ner_model'):
-            try:
-                self.ner_model = model_loader.get_ner_model()
-                logger.info("تم تحميل نموذج التعرف على الكيانات المسماة")
-            except Exception as e:
-                logger.warning(f"فشل في تحميل نموذج التعرف على الكيانات المسماة: {str(e)}")
-        
-        logger.info("تم تهيئة محلل المحتوى المحلي")
-    
-    def analyze(self, extracted_text: str) -> Dict[str, Any]:
-        """
-        تحليل المحتوى المحلي من نص المناقصة
-        
-        المعاملات:
-        ----------
-        extracted_text : str
-            النص المستخرج من المناقصة
-            
-        المخرجات:
-        --------
-        Dict[str, Any]
-            نتائج تحليل المحتوى المحلي
-        """
-        try:
-            logger.info("بدء تحليل المحتوى المحلي")
-            
-            # استخراج متطلبات المحتوى المحلي
-            local_content_requirements = self._extract_local_content_requirements(extracted_text)
-            
-            # استخراج المواد والمنتجات المطلوبة
-            required_materials = self._extract_required_materials(extracted_text)
-            
-            # تقدير نسبة المحتوى المحلي المتوقعة
-            estimated_local_content = self._estimate_local_content(required_materials)
-            
-            # تحديد النسبة المطلوبة من المحتوى المحلي
-            required_local_content = self._get_required_local_content(local_content_requirements, extracted_text)
-            
-            # تحديد الموردين المحليين المحتملين
-            potential_suppliers = self._identify_potential_suppliers(required_materials)
-            
-            # اقتراح استراتيجيات تحسين المحتوى المحلي
-            improvement_strategies = self._generate_improvement_strategies(
-                estimated_local_content, 
-                required_local_content,
-                required_materials
-            )
-            
-            # إعداد النتائج
-            results = {
-                "estimated_local_content": estimated_local_content,
-                "required_local_content": required_local_content,
-                "local_content_requirements": local_content_requirements,
-                "required_materials": required_materials,
-                "potential_suppliers": potential_suppliers,
-                "improvement_strategies": improvement_strategies
-            }
-            
-            logger.info(f"اكتمل تحليل المحتوى المحلي: تقدير {estimated_local_content:.1f}%، مطلوب {required_local_content:.1f}%")
-            return results
-            
-        except Exception as e:
-            logger.error(f"فشل في تحليل المحتوى المحلي: {str(e)}")
-            return {
-                "estimated_local_content": 0,
-                "required_local_content": 0,
-                "local_content_requirements": [],
-                "required_materials": [],
-                "potential_suppliers": [],
-                "improvement_strategies": [
-                    "حدث خطأ في تحليل المحتوى المحلي. يرجى التحقق من البيانات المدخلة."
-                ],
-                "error": str(e)
-            }
-    
-    def _extract_local_content_requirements(self, text: str) -> List[Dict[str, Any]]:
-        """
-        استخراج متطلبات المحتوى المحلي من نص المناقصة
-        
-        المعاملات:
-        ----------
-        text : str
-            النص المستخرج من المناقصة
-            
-        المخرجات:
-        --------
-        List[Dict[str, Any]]
-            قائمة بمتطلبات المحتوى المحلي
-        """
-        requirements = []
-        
-        # البحث عن الفقرات المتعلقة بالمحتوى المحلي
-        local_content_paragraphs = self._find_local_content_paragraphs(text)
-        
-        for paragraph in local_content_paragraphs:
-            # البحث عن النسب المئوية
-            percentage_matches = re.findall(r'(\d+(?:\.\d+)?)\s*(%|في المائة|بالمائة|نسبة)', paragraph)
-            
-            for match in percentage_matches:
-                percentage = float(match[0])
-                
-                # التحقق مما إذا كانت النسبة في النطاق المعقول للمحتوى المحلي
-                if 0 <= percentage <= 100:
-                    # تحديد نوع المتطلب
-                    req_type = "غير محدد"
-                    
-                    if re.search(r'الحد الأدنى|الأقل|على الأقل', paragraph):
-                        req_type = "الحد الأدنى"
-                    elif re.search(r'الحد الأقصى|كحد أقصى', paragraph):
-                        req_type = "الحد الأقصى"
-                    elif re.search(r'هدف|مستهدف', paragraph):
-                        req_type = "مستهدف"
-                    
-                    # تحديد الفئة
-                    category = "عام"
-                    
-                    if re.search(r'توظيف|عمالة|السعودة|التوطين|الموظفين', paragraph):
-                        category = "توظيف"
-                    elif re.search(r'خدمات|استشارات', paragraph):
-                        category = "خدمات"
-                    elif re.search(r'توريد|مواد|منتجات|بضائع', paragraph):
-                        category = "منتجات"
-                    elif re.search(r'تدريب|تأهيل|تطوير', paragraph):
-                        category = "تدريب"
-                    
-                    # تحديد الإلزامية
-                    is_mandatory = bool(re.search(r'إلزامي|يجب|ضروري|لا بد|لابد|مطلوب|يلتزم|ملزم', paragraph))
-                    
-                    requirements.append({
-                        "description": paragraph[:200] + ("..." if len(paragraph) > 200 else ""),
-                        "percentage": percentage,
-                        "type": req_type,
-                        "category": category,
-                        "is_mandatory": is_mandatory
-                    })
-        
-        return requirements
-    
-    def _find_local_content_paragraphs(self, text: str) -> List[str]:
-        """
-        البحث عن الفقرات المتعلقة بالمحتوى المحلي
-        
-        المعاملات:
-        ----------
-        text : str
-            النص المستخرج من المناقصة
-            
-        المخرجات:
-        --------
-        List[str]
-            قائمة بالفقرات المتعلقة بالمحتوى المحلي
-        """
-        # تقسيم النص إلى فقرات
-        paragraphs = re.split(r'\n\s*\n', text)
-        
-        # الكلمات المفتاحية للمحتوى المحلي
-        local_content_keywords = [
-            'المحتوى المحلي',
-            'التوطين',
-            'المواد المحلية',
-            'المنتجات المحلية',
-            'نسبة المحتوى',
-            'مبادرة المحتوى المحلي',
-            'هيئة المحتوى المحلي',
-            'منتجات وطنية',
-            'صنع في السعودية',
-            'المصنّعين المحليين',
-            'الموردين المحليين',
-            'القيمة المضافة',
-            'نقل التقنية',
-            'توطين الوظائف',
-            'السعودة',
-        ]
-        
-        # البحث عن الفقرات التي تحتوي على كلمات مفتاحية للمحتوى المحلي
-        local_content_paragraphs = []
-        
-        for paragraph in paragraphs:
-            paragraph = paragraph.strip()
-            if not paragraph:
-                continue
-                
-            # البحث عن الكلمات المفتاحية في الفقرة
-            for keyword in local_content_keywords:
-                if keyword in paragraph.lower():
-                    local_content_paragraphs.append(paragraph)
-                    break
-        
-        return local_content_paragraphs
-    
-    def _extract_required_materials(self, text: str) -> List[Dict[str, Any]]:
-        """
-        استخراج المواد والمنتجات المطلوبة من نص المناقصة
-        
-        المعاملات:
-        ----------
-        text : str
-            النص المستخرج من المناقصة
-            
-        المخرجات:
-        --------
-        List[Dict[str, Any]]
-            قائمة بالمواد والمنتجات المطلوبة
-        """
-        required_materials = []
-        
-        # البحث عن جداول المواصفات والكميات
-        tables = self._extract_tables(text)
-        
-        # البحث عن قوائم المواد في النص
-        for table in tables:
-            items = self._parse_table_for_materials(table)
-            if items:
-                required_materials.extend(items)
-        
-        # البحث عن قوائم المواد في النص العادي
-        text_materials = self._extract_materials_from_text(text)
-        if text_materials:
-            required_materials.extend(text_materials)
-        
-        # إزالة التكرارات
-        unique_materials = []
-        material_names = set()
-        
-        for material in required_materials:
-            name = material.get('name', '').lower()
-            if name and name not in material_names:
-                material_names.add(name)
-                unique_materials.append(material)
-        
-        # تقييم توفر المواد محلياً
-        for material in unique_materials:
-            material['local_availability'] = self._check_local_availability(material['name'])
-        
-        return unique_materials
-    
-    def _check_local_availability(self, material_name: str) -> float:
-        """
-        تقييم مدى توفر المادة محلياً بناءً على قاعدة بيانات أو تحليل البيانات المتاحة.
-
-        المعاملات:
-        ----------
-        material_name : str
-            اسم المادة التي نريد التحقق من توفرها محليًا.
-
-        المخرجات:
-        --------
-        float
-            نسبة توفر المادة محليًا، تتراوح بين 0.0 (غير متوفرة) إلى 1.0 (متوفرة بالكامل).
-        """
-
-        # قاعدة بيانات تقديرية لتوفر المواد محليًا (يمكن استبدالها بمصدر بيانات فعلي)
-        local_materials = {
-            "حديد": 0.95,   # متوفر بنسبة 95%
-            "أسمنت": 0.9,   # متوفر بنسبة 90%
-            "خشب": 0.7,    # متوفر بنسبة 70%
-            "زجاج": 0.6,    # متوفر بنسبة 60%
-            "ألمنيوم": 0.85, # متوفر بنسبة 85%
-            "بلاستيك": 0.8,  # متوفر بنسبة 80%
-            "نحاس": 0.5,    # متوفر بنسبة 50%
-            "إلكترونيات متخصصة": 0.3 # متوفر بنسبة 30%
         }
-
-        # البحث عن المادة في القائمة
-        for key in local_materials:
-            if key in material_name:
-                return local_materials[key]
-
-        # إذا لم تكن المادة موجودة في القائمة، نفترض توفرها بنسبة 0.5 كافتراضي
-        return 0.5
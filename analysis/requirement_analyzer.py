@@ -1,156 +1,457 @@
-# إذا كانت الجملة الأولى طويلة، اختصرها
-        if len(first_sentence) > 50:
-            if ":" in first_sentence:
-                # استخدام النص قبل العلامة : كعنوان
-                title = first_sentence.split(":")[0].strip()
-            else:
-                # اختصار الجملة الأولى
-                words = first_sentence.split()
-                title = " ".join(words[:7]) + "..."
-        else:
-            title = first_sentence
-        
-        return title
+"""
+محلل متطلبات المناقصات
+يقوم باستخراج وتحليل وتصنيف متطلبات المناقصات
+"""
+
+import re
+import logging
+import json
+import os
+from typing import Dict, List, Any, Tuple, Optional, Union
+import numpy as np
+
+from .section_index import get_document_index
+from .result_cache import cached_analysis
+from utils.tracing import traced
+
+logger = logging.getLogger(__name__)
+
+class RequirementAnalyzer:
+    """
+    محلل متطلبات المناقصات
+    """
     
-    def _categorize_requirements(self, requirements: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    def __init__(self, model_loader, arabic_nlp, config=None):
         """
-        تصنيف المتطلبات إلى فئات
+        تهيئة محلل المتطلبات
         
         المعاملات:
         ----------
-        requirements : List[Dict[str, Any]]
-            قائمة المتطلبات
-            
-        المخرجات:
-        --------
-        Dict[str, List[Dict[str, Any]]]
-            المتطلبات مصنفة حسب الفئة
+        model_loader : ModelLoader
+            محمّل النماذج المستخدمة للتحليل
+        arabic_nlp : ArabicNLP
+            أدوات معالجة اللغة العربية
+        config : Dict, optional
+            إعدادات المحلل
         """
-        categorized = {
-            "technical": [],
-            "financial": [],
-            "legal": []
-        }
+        self.config = config or {}
+        self.model_loader = model_loader
+        self.arabic_nlp = arabic_nlp
         
-        for req in requirements:
-            description = req.get("description", "").lower()
-            title = req.get("title", "").lower()
-            text = title + " " + description
-            
-            # تحديد الفئة بناءً على الكلمات المفتاحية
-            if any(keyword in text for keyword in ["فني", "تقني", "هندسي", "مواصفات", "جودة", "معايير", "أداء", "تصميم", "مخطط"]):
-                req["category"] = "technical"
-                categorized["technical"].append(req)
-            elif any(keyword in text for keyword in ["مالي", "سعر", "تكلفة", "دفع", "ضمان", "تأمين", "غرامة", "ميزانية", "ضريبة", "محاسبة"]):
-                req["category"] = "financial"
-                categorized["financial"].append(req)
-            elif any(keyword in text for keyword in ["قانوني", "شرط", "عقد", "التزام", "تعاقد", "نظام", "لائحة", "تشريع", "ترخيص", "حقوق"]):
-                req["category"] = "legal"
-                categorized["legal"].append(req)
-            else:
-                # إذا لم يتطابق مع أي فئة، افترض أنه متطلب فني
-                req["category"] = "technical"
-                categorized["technical"].append(req)
+        # تحميل النماذج
+        self.ner_model = None
+        if hasattr(model_loader, 'get_ner_model'):
+            try:
+                self.ner_model = model_loader.get_ner_model()
+                logger.info("تم تحميل نموذج التعرف على الكيانات المسماة")
+            except Exception as e:
+                logger.warning(f"فشل في تحميل نموذج التعرف على الكيانات المسماة: {str(e)}")
         
-        return categorized
+        # تحميل قوالب المتطلبات
+        self.requirement_templates = self._load_requirement_templates()
+        
+        logger.info("تم تهيئة محلل المتطلبات")
     
-    def _analyze_importance_difficulty(self, categorized_requirements: Dict[str, List[Dict[str, Any]]]) -> Dict[str, List[Dict[str, Any]]]:
+    @traced("analysis.requirement_analyzer.analyze")
+    @cached_analysis("requirement_analyzer", ("requirement_templates",))
+    def analyze(self, text: str) -> Dict[str, Any]:
         """
-        تحليل أهمية وصعوبة المتطلبات
+        تحليل متطلبات المناقصة من النص
         
         المعاملات:
         ----------
-        categorized_requirements : Dict[str, List[Dict[str, Any]]]
-            المتطلبات مصنفة حسب الفئة
+        text : str
+            النص المستخرج من المناقصة
             
         المخرجات:
         --------
-        Dict[str, List[Dict[str, Any]]]
-            المتطلبات بعد تحليل الأهمية والصعوبة
+        Dict[str, Any]
+            نتائج تحليل المتطلبات
         """
-        analyzed = {}
-        
-        for category, reqs in categorized_requirements.items():
-            analyzed_reqs = []
+        try:
+            logger.info("بدء تحليل متطلبات المناقصة")
             
-            for req in reqs:
-                # تحليل الأهمية
-                req["importance"] = self._determine_importance(req)
-                
-                # تحليل صعوبة التنفيذ
-                req["difficulty"] = self._determine_difficulty(req)
-                
-                # تحديد الفجوات
-                req["gaps"] = self._identify_gaps(req)
-                
-                # اقتراح تحسينات
-                req["improvements"] = self._suggest_improvements(req)
-                
-                analyzed_reqs.append(req)
+            # استخراج المتطلبات من النص
+            requirements = self._extract_requirements(text)
             
-            analyzed[category] = analyzed_reqs
-        
-        return analyzed
+            # تصنيف المتطلبات
+            categorized_requirements = self._categorize_requirements(requirements)
+            
+            # تحليل الأهمية والصعوبة
+            analyzed_requirements = self._analyze_importance_difficulty(categorized_requirements)
+            
+            # تحليل متطلبات المحتوى المحلي
+            local_content_requirements = self._extract_local_content_requirements(text)
+            
+            # تحديد عدد المتطلبات الإلزامية
+            mandatory_count = sum(1 for req in requirements if req.get("importance", "") == "إلزامي")
+            
+            # حساب متوسط صعوبة التنفيذ
+            difficulty_values = [req.get("difficulty", 3) for req in requirements if req.get("difficulty", 0) > 0]
+            avg_difficulty = np.mean(difficulty_values) if difficulty_values else 3.0
+            
+            # حساب نسبة متطلبات المحتوى المحلي
+            total_count = len(requirements)
+            local_content_percentage = (len(local_content_requirements) / total_count * 100) if total_count > 0 else 0
+            
+            # إعداد ملخص المتطلبات
+            summary = self._generate_requirements_summary(
+                analyzed_requirements, local_content_requirements, total_count, mandatory_count, avg_difficulty
+            )
+            
+            # إعداد النتائج
+            results = {
+                "summary": summary,
+                "technical": analyzed_requirements.get("technical", []),
+                "financial": analyzed_requirements.get("financial", []),
+                "legal": analyzed_requirements.get("legal", []),
+                "local_content": local_content_requirements,
+                "total_count": total_count,
+                "mandatory_count": mandatory_count,
+                "avg_difficulty": avg_difficulty,
+                "local_content_percentage": local_content_percentage
+            }
+            
+            logger.info(f"اكتمل تحليل المتطلبات: {total_count} متطلبات، {mandatory_count} إلزامية")
+            return results
+            
+        except Exception as e:
+            logger.error(f"فشل في تحليل المتطلبات: {str(e)}")
+            return {
+                "summary": "حدث خطأ أثناء تحليل المتطلبات",
+                "technical": [],
+                "financial": [],
+                "legal": [],
+                "local_content": [],
+                "total_count": 0,
+                "mandatory_count": 0,
+                "avg_difficulty": 0,
+                "local_content_percentage": 0,
+                "error": str(e)
+            }
     
-    def _determine_importance(self, requirement: Dict[str, Any]) -> str:
+    def _extract_requirements(self, text: str) -> List[Dict[str, Any]]:
         """
-        تحديد أهمية المتطلب
+        استخراج المتطلبات من النص
         
         المعاملات:
         ----------
-        requirement : Dict[str, Any]
-            المتطلب
+        text : str
+            النص المستخرج من المناقصة
             
         المخرجات:
         --------
-        str
-            درجة الأهمية
+        List[Dict[str, Any]]
+            قائمة المتطلبات المستخرجة
         """
-        text = requirement.get("description", "").lower()
+        requirements = []
         
-        # البحث عن كلمات تدل على الإلزامية
-        if any(keyword in text for keyword in ["يجب", "إلزامي", "ضروري", "لا بد", "لابد", "مطلوب", "يلتزم", "ملزم"]):
-            return "إلزامي"
+        # البحث عن قسم المتطلبات أو الشروط
+        requirement_sections = self._find_requirement_sections(text)
         
-        # البحث عن كلمات تدل على الأهمية الثانوية
-        elif any(keyword in text for keyword in ["يفضل", "مرغوب", "محبذ", "يحبذ", "يستحسن"]):
-            return "ثانوي"
+        # إذا لم يتم العثور على أقسام للمتطلبات، استخدم النص كاملاً
+        if not requirement_sections:
+            requirement_sections = [text]
         
-        # إذا لم يتطابق مع أي حالة، افترض أنه متطلب عادي
-        else:
-            return "عادي"
+        # معالجة كل قسم
+        for section in requirement_sections:
+            # استخراج المتطلبات من النص
+            section_requirements = self._parse_requirements_text(section)
+            
+            # دمج المتطلبات المستخرجة
+            requirements.extend(section_requirements)
+        
+        # إذا لم يتم العثور على متطلبات، استخدم القوالب
+        if not requirements:
+            requirements = self._generate_template_requirements()
+        
+        # تنظيف وتوحيد المتطلبات
+        requirements = self._clean_requirements(requirements)
+        
+        return requirements
     
-    def _determine_difficulty(self, requirement: Dict[str, Any]) -> int:
+    def _find_requirement_sections(self, text: str) -> List[str]:
         """
-        تحديد صعوبة تنفيذ المتطلب
+        البحث عن أقسام المتطلبات في النص
         
         المعاملات:
         ----------
-        requirement : Dict[str, Any]
-            المتطلب
+        text : str
+            النص المستخرج من المناقصة
             
         المخرجات:
         --------
-        int
-            درجة الصعوبة (1-5)
+        List[str]
+            أقسام المتطلبات المستخرجة
         """
-        text = requirement.get("description", "").lower()
-        category = requirement.get("category", "")
-        importance = requirement.get("importance", "")
+        sections = []
         
-        # تعيين درجة صعوبة أساسية
-        base_difficulty = 3  # متوسط
+        # الكلمات المفتاحية لأقسام المتطلبات
+        section_keywords = [
+            "المتطلبات", "الشروط", "المواصفات", "نطاق العمل", 
+            "البنود", "المعايير", "الالتزامات", "المؤهلات", 
+            "التأهيل", "الواجبات", "نطاق الأعمال", "الخدمات المطلوبة"
+        ]
         
-        # زيادة الصعوبة للمتطلبات الإلزامية
-        if importance == "إلزامي":
-            base_difficulty += 1
+        index = get_document_index(text)
         
-        # زيادة الصعوبة بناءً على طول النص
-        if len(text) > 200:
-            base_difficulty += 0.5
+        # البحث عن أقسام المتطلبات (من العنوان حتى العنوان التالي من المستوى نفسه أو أعلى)
+        headings = index.find_headings(section_keywords)
+        for heading in headings:
+            section_text = index.section_text(heading)
+            if len(section_text) > 50:  # تجاهل الأقسام القصيرة جدًا
+                sections.append(section_text)
         
-        # زيادة الصعوبة بناءً على الكلمات المفتاحية
-        if any(keyword in text for keyword in ["معقد", "صعب", "متقدم", "عالي", "متطور", "خبير", "مخصص", "خاص"]):
+        # الفقرات التي تبدأ بكلمة مفتاحية دون عنوان مستقل (مثل "الشروط: يجب ...")
+        heading_starts = {heading["start"] for heading in headings}
+        for paragraph in index.paragraphs_containing(section_keywords):
+            if paragraph["start"] in heading_starts or not paragraph["text"].startswith(tuple(section_keywords)):
+                continue
+            if len(paragraph["text"]) > 50:
+                sections.append(paragraph["text"])
+        
+        # قوائم البنود النقطية والمرقمة
+        for block in index.list_blocks():
+            if len(block["text"]) > 100:  # تجاهل القوائم القصيرة
+                sections.append(block["text"])
+        
+        return sections
+    
+    def _parse_requirements_text(self, text: str) -> List[Dict[str, Any]]:
+        """
+        تحليل نص المتطلبات لاستخراج المتطلبات الفردية
+        
+        المعاملات:
+        ----------
+        text : str
+            نص قسم المتطلبات
+            
+        المخرجات:
+        --------
+        List[Dict[str, Any]]
+            قائمة المتطلبات المستخرجة
+        """
+        requirements = []
+        
+        # استخراج المتطلبات من القوائم النقطية
+        bullet_items = re.findall(r'[•\-*]\s+(.*?)(?:\n[•\-*]|\n\n|\Z)', text, re.DOTALL)
+        
+        for item in bullet_items:
+            item = item.strip()
+            if len(item) > 10:  # تجاهل العناصر القصيرة جدًا
+                requirements.append({
+                    "title": self._extract_requirement_title(item),
+                    "description": item,
+                    "source": "bullet_list"
+                })
+        
+        # استخراج المتطلبات من القوائم المرقمة
+        numbered_items = re.findall(r'(\d+)[.)\s]+(.*?)(?:\n\d+[.)\s]|\n\n|\Z)', text, re.DOTALL)
+        
+        for num, item in numbered_items:
+            item = item.strip()
+            if len(item) > 10:  # تجاهل العناصر القصيرة جدًا
+                requirements.append({
+                    "title": self._extract_requirement_title(item),
+                    "description": item,
+                    "source": "numbered_list",
+                    "number": int(num)
+                })
+        
+        # استخراج المتطلبات من الفقرات
+        if not requirements:
+            paragraphs = re.split(r'\n\s*\n', text)
+            
+            for paragraph in paragraphs:
+                paragraph = paragraph.strip()
+                if len(paragraph) > 50 and len(paragraph) < 500:  # تجاهل الفقرات القصيرة جدًا أو الطويلة جدًا
+                    # تحقق مما إذا كانت الفقرة تحتوي على عبارات المتطلبات
+                    if any(keyword in paragraph.lower() for keyword in ["يجب", "ضرورة", "إلزامي", "مطلوب", "يلتزم", "لا بد", "لابد", "شرط", "اشتراط"]):
+                        requirements.append({
+                            "title": self._extract_requirement_title(paragraph),
+                            "description": paragraph,
+                            "source": "paragraph"
+                        })
+        
+        return requirements
+    
+    def _extract_requirement_title(self, text: str) -> str:
+        """
+        استخراج عنوان المتطلب من النص.
+
+        المعاملات:
+        ----------
+        text : str
+            نص المتطلب.
+
+        المخرجات:
+        --------
+        str
+            عنوان المتطلب المستخرج.
+        """
+        # تنظيف النص وإزالة أي فراغات زائدة
+        text = text.strip()
+
+        # محاولة استخراج العنوان من بداية النص باستخدام الجملة الأولى
+        first_sentence = re.split(r'[.!?،؛]', text)[0].strip()
+
+        # إذا كان النص قصيرًا جدًا، نعيده كما هو
+        if len(first_sentence) < 5:
+            return text
+        
+        # إذا كانت الجملة الأولى طويلة، اختصرها
+        if len(first_sentence) > 50:
+            if ":" in first_sentence:
+                # استخدام النص قبل العلامة : كعنوان
+                title = first_sentence.split(":")[0].strip()
+            else:
+                # اختصار الجملة الأولى
+                words = first_sentence.split()
+                title = " ".join(words[:7]) + "..."
+        else:
+            title = first_sentence
+        
+        return title
+    
+    def _categorize_requirements(self, requirements: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        تصنيف المتطلبات إلى فئات
+        
+        المعاملات:
+        ----------
+        requirements : List[Dict[str, Any]]
+            قائمة المتطلبات
+            
+        المخرجات:
+        --------
+        Dict[str, List[Dict[str, Any]]]
+            المتطلبات مصنفة حسب الفئة
+        """
+        categorized = {
+            "technical": [],
+            "financial": [],
+            "legal": []
+        }
+        
+        for req in requirements:
+            description = req.get("description", "").lower()
+            title = req.get("title", "").lower()
+            text = title + " " + description
+            
+            # تحديد الفئة بناءً على الكلمات المفتاحية
+            if any(keyword in text for keyword in ["فني", "تقني", "هندسي", "مواصفات", "جودة", "معايير", "أداء", "تصميم", "مخطط"]):
+                req["category"] = "technical"
+                categorized["technical"].append(req)
+            elif any(keyword in text for keyword in ["مالي", "سعر", "تكلفة", "دفع", "ضمان", "تأمين", "غرامة", "ميزانية", "ضريبة", "محاسبة"]):
+                req["category"] = "financial"
+                categorized["financial"].append(req)
+            elif any(keyword in text for keyword in ["قانوني", "شرط", "عقد", "التزام", "تعاقد", "نظام", "لائحة", "تشريع", "ترخيص", "حقوق"]):
+                req["category"] = "legal"
+                categorized["legal"].append(req)
+            else:
+                # إذا لم يتطابق مع أي فئة، افترض أنه متطلب فني
+                req["category"] = "technical"
+                categorized["technical"].append(req)
+        
+        return categorized
+    
+    def _analyze_importance_difficulty(self, categorized_requirements: Dict[str, List[Dict[str, Any]]]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        تحليل أهمية وصعوبة المتطلبات
+        
+        المعاملات:
+        ----------
+        categorized_requirements : Dict[str, List[Dict[str, Any]]]
+            المتطلبات مصنفة حسب الفئة
+            
+        المخرجات:
+        --------
+        Dict[str, List[Dict[str, Any]]]
+            المتطلبات بعد تحليل الأهمية والصعوبة
+        """
+        analyzed = {}
+        
+        for category, reqs in categorized_requirements.items():
+            analyzed_reqs = []
+            
+            for req in reqs:
+                # تحليل الأهمية
+                req["importance"] = self._determine_importance(req)
+                
+                # تحليل صعوبة التنفيذ
+                req["difficulty"] = self._determine_difficulty(req)
+                
+                # تحديد الفجوات
+                req["gaps"] = self._identify_gaps(req)
+                
+                # اقتراح تحسينات
+                req["improvements"] = self._suggest_improvements(req)
+                
+                analyzed_reqs.append(req)
+            
+            analyzed[category] = analyzed_reqs
+        
+        return analyzed
+    
+    def _determine_importance(self, requirement: Dict[str, Any]) -> str:
+        """
+        تحديد أهمية المتطلب
+        
+        المعاملات:
+        ----------
+        requirement : Dict[str, Any]
+            المتطلب
+            
+        المخرجات:
+        --------
+        str
+            درجة الأهمية
+        """
+        text = requirement.get("description", "").lower()
+        
+        # البحث عن كلمات تدل على الإلزامية
+        if any(keyword in text for keyword in ["يجب", "إلزامي", "ضروري", "لا بد", "لابد", "مطلوب", "يلتزم", "ملزم"]):
+            return "إلزامي"
+        
+        # البحث عن كلمات تدل على الأهمية الثانوية
+        elif any(keyword in text for keyword in ["يفضل", "مرغوب", "محبذ", "يحبذ", "يستحسن"]):
+            return "ثانوي"
+        
+        # إذا لم يتطابق مع أي حالة، افترض أنه متطلب عادي
+        else:
+            return "عادي"
+    
+    def _determine_difficulty(self, requirement: Dict[str, Any]) -> int:
+        """
+        تحديد صعوبة تنفيذ المتطلب
+        
+        المعاملات:
+        ----------
+        requirement : Dict[str, Any]
+            المتطلب
+            
+        المخرجات:
+        --------
+        int
+            درجة الصعوبة (1-5)
+        """
+        text = requirement.get("description", "").lower()
+        category = requirement.get("category", "")
+        importance = requirement.get("importance", "")
+        
+        # تعيين درجة صعوبة أساسية
+        base_difficulty = 3  # متوسط
+        
+        # زيادة الصعوبة للمتطلبات الإلزامية
+        if importance == "إلزامي":
+            base_difficulty += 1
+        
+        # زيادة الصعوبة بناءً على طول النص
+        if len(text) > 200:
+            base_difficulty += 0.5
+        
+        # زيادة الصعوبة بناءً على الكلمات المفتاحية
+        if any(keyword in text for keyword in ["معقد", "صعب", "متقدم", "عالي", "متطور", "خبير", "مخصص", "خاص"]):
             base_difficulty += 1
         
         # تخفيض الصعوبة للمتطلبات البسيطة
@@ -272,13 +573,12 @@
         
         local_content_requirements = []
         
-        # البحث عن أقسام المحتوى المحلي
+        index = get_document_index(text)
+        
+        # البحث عن أقسام المحتوى المحلي (من أول ورود للكلمة المفتاحية حتى نهاية الفقرة)
         for keyword in local_content_keywords:
-            pattern = rf"((?:{keyword}|{keyword.upper()}).*?(?:\n\n|\Z))"
-            matches = re.finditer(pattern, text, re.DOTALL)
-            
-            for match in matches:
-                section_text = match.group(1).strip()
+            for paragraph in index.paragraphs_containing([keyword]):
+                section_text = paragraph["text"][paragraph["text"].find(keyword):].strip()
                 
                 # استخراج النسب المئوية
                 percentage_matches = re.findall(r'(\d+(?:\.\d+)?)(?:\s*%|\s*في المائة|\s*بالمائة)', section_text)
@@ -573,309 +873,4 @@
             ]
         }
         
-        return templates"""
-محلل متطلبات المناقصات
-يقوم باستخراج وتحليل وتصنيف متطلبات المناقصات
-"""
-
-import re
-import logging
-import json
-import os
-from typing import Dict, List, Any, Tuple, Optional, Union
-import numpy as np
-
-logger = logging.getLogger(__name__)
-
-class RequirementAnalyzer:
-    """
-    محلل متطلبات المناقصات
-    """
-    
-    def __init__(self, model_loader, arabic_nlp, config=None):
-        """
-        تهيئة محلل المتطلبات
-        
-        المعاملات:
-        ----------
-        model_loader : ModelLoader
-            محمّل النماذج المستخدمة للتحليل
-        arabic_nlp : ArabicNLP
-            أدوات معالجة اللغة العربية
-        config : Dict, optional
-            إعدادات المحلل
-        """
-        self.config = config or {}
-        self.model_loader = model_loader
-        self.arabic_nlp = arabic_nlp
-        
-        # تحميل النماذج
-        self.ner_model = None
-        if hasattr(model_loader, 'get_ner_model'):
-            try:
-                self.ner_model = model_loader.get_ner_model()
-                logger.info("تم تحميل نموذج التعرف على الكيانات المسماة")
-            except Exception as e:
-                logger.warning(f"فشل في تحميل نموذج التعرف على الكيانات المسماة: {str(e)}")
-        
-        # تحميل قوالب المتطلبات
-        self.requirement_templates = self._load_requirement_templates()
-        
-        logger.info("تم تهيئة محلل المتطلبات")
-    
-    def analyze(self, text: str) -> Dict[str, Any]:
-        """
-        تحليل متطلبات المناقصة من النص
-        
-        المعاملات:
-        ----------
-        text : str
-            النص المستخرج من المناقصة
-            
-        المخرجات:
-        --------
-        Dict[str, Any]
-            نتائج تحليل المتطلبات
-        """
-        try:
-            logger.info("بدء تحليل متطلبات المناقصة")
-            
-            # استخراج المتطلبات من النص
-            requirements = self._extract_requirements(text)
-            
-            # تصنيف المتطلبات
-            categorized_requirements = self._categorize_requirements(requirements)
-            
-            # تحليل الأهمية والصعوبة
-            analyzed_requirements = self._analyze_importance_difficulty(categorized_requirements)
-            
-            # تحليل متطلبات المحتوى المحلي
-            local_content_requirements = self._extract_local_content_requirements(text)
-            
-            # تحديد عدد المتطلبات الإلزامية
-            mandatory_count = sum(1 for req in requirements if req.get("importance", "") == "إلزامي")
-            
-            # حساب متوسط صعوبة التنفيذ
-            difficulty_values = [req.get("difficulty", 3) for req in requirements if req.get("difficulty", 0) > 0]
-            avg_difficulty = np.mean(difficulty_values) if difficulty_values else 3.0
-            
-            # حساب نسبة متطلبات المحتوى المحلي
-            total_count = len(requirements)
-            local_content_percentage = (len(local_content_requirements) / total_count * 100) if total_count > 0 else 0
-            
-            # إعداد ملخص المتطلبات
-            summary = self._generate_requirements_summary(
-                analyzed_requirements, local_content_requirements, total_count, mandatory_count, avg_difficulty
-            )
-            
-            # إعداد النتائج
-            results = {
-                "summary": summary,
-                "technical": analyzed_requirements.get("technical", []),
-                "financial": analyzed_requirements.get("financial", []),
-                "legal": analyzed_requirements.get("legal", []),
-                "local_content": local_content_requirements,
-                "total_count": total_count,
-                "mandatory_count": mandatory_count,
-                "avg_difficulty": avg_difficulty,
-                "local_content_percentage": local_content_percentage
-            }
-            
-            logger.info(f"اكتمل تحليل المتطلبات: {total_count} متطلبات، {mandatory_count} إلزامية")
-            return results
-            
-        except Exception as e:
-            logger.error(f"فشل في تحليل المتطلبات: {str(e)}")
-            return {
-                "summary": "حدث خطأ أثناء تحليل المتطلبات",
-                "technical": [],
-                "financial": [],
-                "legal": [],
-                "local_content": [],
-                "total_count": 0,
-                "mandatory_count": 0,
-                "avg_difficulty": 0,
-                "local_content_percentage": 0,
-                "error": str(e)
-            }
-    
-    def _extract_requirements(self, text: str) -> List[Dict[str, Any]]:
-        """
-        استخراج المتطلبات من النص
-        
-        المعاملات:
-        ----------
-        text : str
-            النص المستخرج من المناقصة
-            
-        المخرجات:
-        --------
-        List[Dict[str, Any]]
-            قائمة المتطلبات المستخرجة
-        """
-        requirements = []
-        
-        # البحث عن قسم المتطلبات أو الشروط
-        requirement_sections = self._find_requirement_sections(text)
-        
-        # إذا لم يتم العثور على أقسام للمتطلبات، استخدم النص كاملاً
-        if not requirement_sections:
-            requirement_sections = [text]
-        
-        # معالجة كل قسم
-        for section in requirement_sections:
-            # استخراج المتطلبات من النص
-            section_requirements = self._parse_requirements_text(section)
-            
-            # دمج المتطلبات المستخرجة
-            requirements.extend(section_requirements)
-        
-        # إذا لم يتم العثور على متطلبات، استخدم القوالب
-        if not requirements:
-            requirements = self._generate_template_requirements()
-        
-        # تنظيف وتوحيد المتطلبات
-        requirements = self._clean_requirements(requirements)
-        
-        return requirements
-    
-    def _find_requirement_sections(self, text: str) -> List[str]:
-        """
-        البحث عن أقسام المتطلبات في النص
-        
-        المعاملات:
-        ----------
-        text : str
-            النص المستخرج من المناقصة
-            
-        المخرجات:
-        --------
-        List[str]
-            أقسام المتطلبات المستخرجة
-        """
-        sections = []
-        
-        # الكلمات المفتاحية لأقسام المتطلبات
-        section_keywords = [
-            "المتطلبات", "الشروط", "المواصفات", "نطاق العمل", 
-            "البنود", "المعايير", "الالتزامات", "المؤهلات", 
-            "التأهيل", "الواجبات", "نطاق الأعمال", "الخدمات المطلوبة"
-        ]
-        
-        # البحث عن أقسام المتطلبات
-        for keyword in section_keywords:
-            pattern = rf"((?:{keyword}|{keyword.upper()})[:\s].*?)(?:^(?:{section_keywords[0]}|{section_keywords[0].upper()})[:\s]|\Z)"
-            matches = re.finditer(pattern, text, re.MULTILINE | re.DOTALL)
-            
-            for match in matches:
-                section_text = match.group(1).strip()
-                if len(section_text) > 50:  # تجاهل الأقسام القصيرة جدًا
-                    sections.append(section_text)
-        
-        # البحث عن قوائم البنود
-        bullet_lists = re.findall(r'(?:^|\n)(?:[•\-*]\s+.*(?:\n|$))+', text, re.MULTILINE)
-        
-        for bullet_list in bullet_lists:
-            if len(bullet_list) > 100:  # تجاهل القوائم القصيرة
-                sections.append(bullet_list)
-        
-        # البحث عن قوائم مرقمة
-        numbered_lists = re.findall(r'(?:^|\n)(?:\d+[.)\s]+.*(?:\n|$))+', text, re.MULTILINE)
-        
-        for numbered_list in numbered_lists:
-            if len(numbered_list) > 100:  # تجاهل القوائم القصيرة
-                sections.append(numbered_list)
-        
-        return sections
-    
-    def _parse_requirements_text(self, text: str) -> List[Dict[str, Any]]:
-        """
-        تحليل نص المتطلبات لاستخراج المتطلبات الفردية
-        
-        المعاملات:
-        ----------
-        text : str
-            نص قسم المتطلبات
-            
-        المخرجات:
-        --------
-        List[Dict[str, Any]]
-            قائمة المتطلبات المستخرجة
-        """
-        requirements = []
-        
-        # استخراج المتطلبات من القوائم النقطية
-        bullet_items = re.findall(r'[•\-*]\s+(.*?)(?:\n[•\-*]|\n\n|\Z)', text, re.DOTALL)
-        
-        for item in bullet_items:
-            item = item.strip()
-            if len(item) > 10:  # تجاهل العناصر القصيرة جدًا
-                requirements.append({
-                    "title": self._extract_requirement_title(item),
-                    "description": item,
-                    "source": "bullet_list"
-                })
-        
-        # استخراج المتطلبات من القوائم المرقمة
-        numbered_items = re.findall(r'(\d+)[.)\s]+(.*?)(?:\n\d+[.)\s]|\n\n|\Z)', text, re.DOTALL)
-        
-        for num, item in numbered_items:
-            item = item.strip()
-            if len(item) > 10:  # تجاهل العناصر القصيرة جدًا
-                requirements.append({
-                    "title": self._extract_requirement_title(item),
-                    "description": item,
-                    "source": "numbered_list",
-                    "number": int(num)
-                })
-        
-        # استخراج المتطلبات من الفقرات
-        if not requirements:
-            paragraphs = re.split(r'\n\s*\n', text)
-            
-            for paragraph in paragraphs:
-                paragraph = paragraph.strip()
-                if len(paragraph) > 50 and len(paragraph) < 500:  # تجاهل الفقرات القصيرة جدًا أو الطويلة جدًا
-                    # تحقق مما إذا كانت الفقرة تحتوي على عبارات المتطلبات
-                    if any(keyword in paragraph.lower() for keyword in ["يجب", "ضرورة", "إلزامي", "مطلوب", "يلتزم", "لا بد", "لابد", "شرط", "اشتراط"]):
-                        requirements.append({
-                            "title": self._extract_requirement_title(paragraph),
-                            "description": paragraph,
-                            "source": "paragraph"
-                        })
-        
-        return requirements
-    
-    import re
-
-    def _extract_requirement_title(self, text: str) -> str:
-        """
-        استخراج عنوان المتطلب من النص.
-
-        المعاملات:
-        ----------
-        text : str
-            نص المتطلب.
-
-        المخرجات:
-        --------
-        str
-            عنوان المتطلب المستخرج.
-        """
-        # تنظيف النص وإزالة أي فراغات زائدة
-        text = text.strip()
-
-        # محاولة استخراج العنوان من بداية النص باستخدام الجملة الأولى
-        first_sentence = re.split(r'[.!?،؛]', text)[0].strip()
-
-        # إذا كان النص قصيرًا جدًا، نعيده كما هو
-        if len(first_sentence) < 5:
-            return text
-        
-        # التحقق من أن العنوان لا يحتوي على أرقام أو رموز غير مفهومة
-        if re.search(r'\d', first_sentence):
-            return text  # إذا كان هناك أرقام، نعيد النص الأصلي
-
-        return first_sentence
-
-
+        return templates
@@ -0,0 +1,321 @@
+"""
+ذاكرة التخزين المؤقت لنتائج المحللات
+تحفظ نتيجة كل محلل مفهرسة بـ (بصمة النص والمدخلات، اسم المحلل، بصمة قواعد بياناته وإعداداته)
+في ذاكرة داخل العملية (LRU) وعلى القرص، فلا يعاد التحليل عند إعادة تشغيل صفحة Streamlit للمستند نفسه،
+وتتغير المفاتيح تلقائياً عند تغير قواعد بيانات التكاليف أو المخاطر أو الموردين
+"""
+
+import copy
+import hashlib
+import inspect
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from functools import lru_cache, wraps
+from typing import Dict, Any, Callable, Iterable, Optional
+
+import pandas as pd
+
+from modules.extraction_cache import ExtractionCache
+from utils.tracing import current_span
+
+logger = logging.getLogger(__name__)
+
+# إصدار صيغة النتائج المخزنة (تغيّر شيفرة المحلل أو أحد ملفات CODE_FILES يبطل نتائجه تلقائياً،
+# ويُرفع هذا عند تغيير صيغة التخزين أو عند اعتماد المحللات على وحدة جديدة لم تُضف إلى CODE_FILES)
+RESULT_CACHE_VERSION = "1"
+
+# الوحدات المساعدة التي تعتمد عليها نتائج المحللات (تغيّرها يبطل جميع النتائج المخزنة)
+CODE_FILES = (
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "section_index.py"),
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "utils", "keyword_matcher.py"),
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "utils", "arabic_normalizer.py"),
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "utils", "supplier_store.py")
+)
+
+# الإعدادات الافتراضية (يمكن تجاوزها من إعدادات كل محلل)
+DEFAULT_CACHE_DIR = "data/analysis_cache"
+DEFAULT_MEMORY_SIZE = 32
+DEFAULT_MAX_SIZE_MB = 200
+
+
+def _digest(value: Any) -> str:
+    """
+    بصمة SHA-256 لقيمة قابلة للتحويل إلى JSON (تُحوّل الجداول إلى بصمة محتواها والقيم الأخرى إلى نص)
+    """
+    if isinstance(value, str):
+        data = value.encode("utf-8")
+    else:
+        data = json.dumps(value, sort_keys=True, ensure_ascii=False, default=_encode).encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+
+def _encode(value: Any) -> Any:
+    """
+    تمثيل القيم غير القابلة للتحويل إلى JSON في البصمة
+    """
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return _frame_digest(value)
+    return str(value)
+
+
+def _frame_digest(frame: Any) -> str:
+    """
+    بصمة محتوى جدول أو عمود pandas كاملاً (str يختصر الجداول الطويلة فتتطابق بصمات جداول مختلفة)
+    """
+    columns = frame.columns if isinstance(frame, pd.DataFrame) else [frame.name]
+    dtypes = frame.dtypes if isinstance(frame, pd.DataFrame) else [frame.dtype]
+    digest = hashlib.sha256(json.dumps([[str(column) for column in columns], [str(dtype) for dtype in dtypes]],
+                                       ensure_ascii=False).encode("utf-8"))
+    try:
+        digest.update(pd.util.hash_pandas_object(frame, index=True).to_numpy().tobytes())
+    except TypeError:
+        # خلايا غير قابلة للتجزئة (قوائم أو قواميس)
+        digest.update(frame.to_csv().encode("utf-8"))
+    return digest.hexdigest()
+
+
+class AnalysisResultCache:
+    """
+    ذاكرة مؤقتة من مستويين: قاموس LRU داخل العملية، ونسخة دائمة على القرص
+    """
+    
+    def __init__(self, cache_dir: Optional[str] = DEFAULT_CACHE_DIR, memory_size: int = DEFAULT_MEMORY_SIZE,
+                 max_size_mb: float = DEFAULT_MAX_SIZE_MB):
+        """
+        تهيئة الذاكرة المؤقتة
+        
+        المعاملات:
+        ----------
+        cache_dir : str, optional
+            مجلد التخزين على القرص (None لتعطيل التخزين على القرص)
+        memory_size : int, optional
+            عدد النتائج المحفوظة في الذاكرة (افتراضي: 32)
+        max_size_mb : float, optional
+            الحجم الأقصى للتخزين على القرص بالميجابايت (افتراضي: 200)
+        """
+        self.memory_size = max(0, int(memory_size))
+        self.disk = ExtractionCache(cache_dir, max_size_mb) if cache_dir else None
+        
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+    
+    @staticmethod
+    def make_key(analyzer_name: str, fingerprint: str, inputs: Any) -> str:
+        """
+        إنشاء مفتاح التخزين
+        
+        المعاملات:
+        ----------
+        analyzer_name : str
+            اسم المحلل
+        fingerprint : str
+            بصمة قواعد بيانات المحلل وإعداداته
+        inputs : Any
+            مدخلات التحليل (النص والجداول وغيرها)
+        
+        المخرجات:
+        --------
+        str
+            المفتاح
+        """
+        return f"{analyzer_name}_{RESULT_CACHE_VERSION}_{fingerprint[:16]}_{_digest(inputs)}"
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        استرجاع نتيجة مخزنة (نسخة مستقلة يمكن تعديلها دون التأثير على المخزن)
+        
+        المعاملات:
+        ----------
+        key : str
+            مفتاح التخزين
+        
+        المخرجات:
+        --------
+        Dict[str, Any] or None
+            النتيجة المخزنة أو None إذا لم تكن موجودة
+        """
+        with self._lock:
+            result = self._memory.get(key)
+            if result is not None:
+                self._memory.move_to_end(key)
+                self._stats["memory_hits"] += 1
+                return copy.deepcopy(result)
+        
+        result = self.disk.get(key) if self.disk is not None else None
+        with self._lock:
+            if result is None:
+                self._stats["misses"] += 1
+                return None
+            self._stats["disk_hits"] += 1
+        
+        self._remember(key, result)
+        return copy.deepcopy(result)
+    
+    def put(self, key: str, result: Dict[str, Any]) -> None:
+        """
+        تخزين نتيجة في الذاكرة وعلى القرص
+        
+        المعاملات:
+        ----------
+        key : str
+            مفتاح التخزين
+        result : Dict[str, Any]
+            نتيجة التحليل
+        """
+        result = copy.deepcopy(result)
+        self._remember(key, result)
+        if self.disk is not None:
+            self.disk.put(key, result)
+    
+    def clear(self) -> None:
+        """
+        حذف جميع النتائج المخزنة
+        """
+        with self._lock:
+            self._memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        الحصول على إحصائيات الاستخدام
+        
+        المخرجات:
+        --------
+        Dict[str, Any]
+            الإصابات من الذاكرة ومن القرص، والإخفاقات، وعدد النتائج في الذاكرة
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["memory_entries"] = len(self._memory)
+        return stats
+    
+    def _remember(self, key: str, result: Dict[str, Any]) -> None:
+        """
+        إضافة نتيجة إلى ذاكرة LRU وإزالة الأقدم عند تجاوز الحد
+        """
+        if not self.memory_size:
+            return
+        with self._lock:
+            self._memory[key] = result
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_size:
+                self._memory.popitem(last=False)
+
+
+_caches: Dict[tuple, AnalysisResultCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_result_cache(config: Optional[Dict[str, Any]] = None) -> Optional[AnalysisResultCache]:
+    """
+    الحصول على الذاكرة المؤقتة المشتركة حسب إعدادات المحلل
+    
+    المعاملات:
+    ----------
+    config : Dict, optional
+        إعدادات المحلل: result_cache (تفعيل الذاكرة، افتراضي: True)، result_cache_dir (مجلد القرص،
+        None لتعطيله)، result_cache_memory_size، result_cache_max_mb
+    
+    المخرجات:
+    --------
+    AnalysisResultCache or None
+        الذاكرة المؤقتة، أو None إذا كانت معطلة
+    """
+    config = config or {}
+    if not config.get("result_cache", True):
+        return None
+    
+    settings = (
+        config.get("result_cache_dir", DEFAULT_CACHE_DIR),
+        config.get("result_cache_memory_size", DEFAULT_MEMORY_SIZE),
+        config.get("result_cache_max_mb", DEFAULT_MAX_SIZE_MB)
+    )
+    with _caches_lock:
+        cache = _caches.get(settings)
+        if cache is None:
+            try:
+                cache = _caches[settings] = AnalysisResultCache(*settings)
+            except OSError as e:
+                logger.warning(f"تعذر إنشاء مجلد ذاكرة نتائج التحليل: {str(e)}")
+                cache = _caches[settings] = AnalysisResultCache(None, settings[1])
+        return cache
+
+
+def cached_analysis(analyzer_name: str, sources: Iterable[str]) -> Callable:
+    """
+    مزخرف لدالة التحليل الرئيسية في المحلل لتخزين نتائجها
+    
+    المعاملات:
+    ----------
+    analyzer_name : str
+        اسم المحلل في مفتاح التخزين
+    sources : Iterable[str]
+        أسماء خصائص المحلل التي تحمل قواعد بياناته (تدخل مع الإعدادات في بصمة المحلل)
+    
+    المخرجات:
+    --------
+    Callable
+        المزخرف
+    """
+    sources = tuple(sources)
+    
+    def decorator(method: Callable) -> Callable:
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            cache = get_result_cache(self.config)
+            if cache is None:
+                return method(self, *args, **kwargs)
+            
+            key = cache.make_key(analyzer_name, _fingerprint(self, sources), [args, kwargs])
+            result = cache.get(key)
+            current_span().set("cache", "miss" if result is None else "hit")
+            if result is not None:
+                logger.info(f"استخدام نتيجة {analyzer_name} المخزنة")
+                return result
+            
+            result = method(self, *args, **kwargs)
+            
+            # عدم تخزين نتائج التحليل الفاشل حتى يعاد المحاولة في المرة التالية
+            if isinstance(result, dict) and "error" not in result:
+                cache.put(key, result)
+            return result
+        
+        return wrapper
+    
+    return decorator
+
+
+@lru_cache(maxsize=None)
+def _code_fingerprint(analyzer_class: type) -> str:
+    """
+    بصمة ملف شيفرة المحلل والوحدات المساعدة في CODE_FILES (حتى لا تُستخدم نتائج مخزنة من إصدار سابق من منطق التحليل)
+    """
+    try:
+        paths = (inspect.getfile(analyzer_class),) + CODE_FILES
+    except TypeError:
+        paths = CODE_FILES
+    
+    digest = hashlib.sha256()
+    for path in paths:
+        try:
+            with open(path, "rb") as f:
+                digest.update(hashlib.sha256(f.read()).digest())
+        except OSError:
+            continue
+    return digest.hexdigest()
+
+
+def _fingerprint(analyzer: Any, sources: tuple) -> str:
+    """
+    بصمة شيفرة المحلل وقواعد بياناته وإعداداته (تُحسب في كل استدعاء حتى يُكتشف تعديلها في مكانها)
+    """
+    databases = [getattr(analyzer, source, None) for source in sources]
+    
+    # استبعاد إعدادات الذاكرة المؤقتة نفسها من البصمة
+    config = {key: value for key, value in analyzer.config.items() if not key.startswith("result_cache")}
+    return _digest([_code_fingerprint(type(analyzer)), databases, config])
@@ -11,6 +11,12 @@ from typing import Dict, List, Any, Tuple, Optional, Union
 import numpy as np
 from collections import defaultdict
 
+from .section_index import get_document_index
+from .result_cache import cached_analysis
+from utils.tracing import traced
+from utils.keyword_matcher import get_keyword_matcher
+from utils.arabic_normalizer import word_similarity
+
 logger = logging.getLogger(__name__)
 
 class RiskAnalyzer:
@@ -37,6 +43,8 @@ class RiskAnalyzer:
         
         logger.info("تم تهيئة محلل المخاطر")
     
+    @traced("analysis.risk_analyzer.analyze")
+    @cached_analysis("risk_analyzer", ("risk_templates",))
     def analyze(self, extracted_text: str) -> Dict[str, Any]:
         """
         تحليل المخاطر من نص المناقصة
@@ -161,13 +169,13 @@ class RiskAnalyzer:
             "services": ["خدمة", "تشغيل", "إدارة", "تقديم"]
         }
         
-        # حساب عدد مرات ظهور كل كلمة مفتاحية
+        # حساب عدد مرات ظهور كل كلمة مفتاحية (الكلمات التي تبدأ بها) في مرور واحد على النص
+        counts = get_keyword_matcher([word for words in keywords.values() for word in words], prefix=True).count(text)
         scores = defaultdict(int)
         
         for project_type, words in keywords.items():
             for word in words:
-                count = len(re.findall(r'\b' + re.escape(word) + r'\w*', text, re.IGNORECASE))
-                scores[project_type] += count
+                scores[project_type] += counts[word]
         
         # تحديد نوع المشروع بناءً على أعلى نتيجة
         if not scores:
@@ -197,13 +205,12 @@ class RiskAnalyzer:
             "تأخير", "تأخر", "عدم الالتزام", "خرق", "غرامة", "عقوبة"
         ]
         
-        # البحث عن الفقرات التي تحتوي على كلمات المخاطر
+        index = get_document_index(text)
+        seen_risks = set()
+        
+        # البحث عن الجمل التي تحتوي على كلمات المخاطر
         for keyword in risk_keywords:
-            # البحث عن الفقرات التي تحتوي على الكلمة المفتاحية
-            matches = re.finditer(r'(?:[^\n.]*' + re.escape(keyword) + r'[^\n.]*[.\n])', text)
-            
-            for match in matches:
-                risk_text = match.group(0).strip()
+            for risk_text in index.sentences_containing(keyword):
                 
                 # تحديد نوع المخاطرة
                 risk_type = "general"
@@ -242,7 +249,8 @@ class RiskAnalyzer:
                     probability = 1
                 
                 # إضافة المخاطرة إذا لم تكن موجودة بالفعل
-                if not any(risk["risk"] == risk_text for risk in explicit_risks):
+                if risk_text not in seen_risks:
+                    seen_risks.add(risk_text)
                     explicit_risks.append({
                         "risk": risk_text,
                         "type": risk_type,
@@ -335,22 +343,8 @@ class RiskAnalyzer:
         bool
             True إذا كانت المخاطرتان متشابهتين، False خلاف ذلك
         """
-        # التحقق من التشابه في النص
-        risk1_text = risk1.get("risk", "").lower()
-        risk2_text = risk2.get("risk", "").lower()
-        
-        # تحويل النصوص إلى مجموعات من الكلمات
-        words1 = set(risk1_text.split())
-        words2 = set(risk2_text.split())
-        
-        # حساب معامل جاكارد للتشابه
-        intersection = len(words1.intersection(words2))
-        union = len(words1.union(words2))
-        
-        if union == 0:
-            return False
-        
-        jaccard = intersection / union
+        # معامل جاكارد للتشابه بين نصي المخاطرتين بعد توحيد الأحرف العربية
+        jaccard = word_similarity(risk1.get("risk", ""), risk2.get("risk", ""))
         
         # إذا كان معامل التشابه أكبر من العتبة، نعتبر المخاطرتين متشابهتين
         return jaccard > 0.3
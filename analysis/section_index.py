@@ -0,0 +1,391 @@
+"""
+فهرس أقسام المستند
+يبني في مرور واحد على نص المناقصة فهرساً للعناوين وتسلسلها الهرمي والفقرات والبنود المرقمة والنقطية
+مع مواضعها في النص، لتستعلم منه جميع المحللات بدلاً من إعادة مسح النص كاملاً
+"""
+
+import re
+import threading
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Iterable
+
+from utils.arabic_normalizer import normalize_arabic
+
+# عدد الفهارس المحفوظة في الذاكرة (مستند لكل تحليل عادةً)
+INDEX_CACHE_SIZE = 8
+
+# أنماط التعرف على العناوين والبنود (تُطبق على السطر بعد إزالة المسافات الطرفية)
+MARKDOWN_HEADING_PATTERN = re.compile(r'^(#{1,6})\s+(.+?)\s*#*$')
+CHAPTER_HEADING_PATTERN = re.compile(r'^(الباب|الفصل|القسم|الجزء)\s+\S+')
+ARTICLE_HEADING_PATTERN = re.compile(r'^(المادة|البند)\s+\S+')
+ORDINAL_HEADING_PATTERN = re.compile(r'^(أولاً|أولا|ثانياً|ثانيا|ثالثاً|ثالثا|رابعاً|رابعا|خامساً|خامسا|سادساً|سادسا|سابعاً|سابعا|ثامناً|ثامنا|تاسعاً|تاسعا|عاشراً|عاشرا)\s*[:\-–]')
+NUMBERED_PATTERN = re.compile(r'^(\d+(?:\.\d+)*)[.)\-\s]+(.*)$')
+BULLET_PATTERN = re.compile(r'^[•\-*]\s+(.*)$')
+
+# الحد الأقصى لطول سطر العنوان وعدد كلماته (الأسطر الأطول جمل عادية)
+MAX_HEADING_LENGTH = 80
+MAX_HEADING_WORDS = 8
+
+
+class DocumentIndex:
+    """
+    فهرس أقسام وفقرات وبنود مستند واحد
+    """
+    
+    def __init__(self, text: str):
+        """
+        بناء الفهرس في مرور واحد على أسطر النص
+        
+        المعاملات:
+        ----------
+        text : str
+            النص المستخرج من المناقصة
+        """
+        self.text = text or ""
+        
+        # الفقرات المفصولة بأسطر فارغة: {index, start, end, text, section}
+        self.paragraphs: List[Dict[str, Any]] = []
+        
+        # العناوين: {index, title, level, number, start, line_end, end, parent}
+        self.headings: List[Dict[str, Any]] = []
+        
+        # البنود المرقمة والنقطية: {kind, number, text, start, end, section, block}
+        self.clauses: List[Dict[str, Any]] = []
+        
+        # القوائم (بنود متتالية من النوع نفسه): {index, kind, start, end, text}
+        self.lists: List[Dict[str, Any]] = []
+        
+        # أجزاء الجمل المنتهية بنقطة أو سطر جديد (تُبنى عند أول استعلام)
+        self._sentences: Optional[List[str]] = None
+        
+        # الصيغ الموحدة للعناوين والفقرات (تُحسب مرة واحدة عند أول بحث بالكلمات المفتاحية)
+        self._normalized_titles: Optional[List[str]] = None
+        self._normalized_paragraphs: Optional[List[str]] = None
+        
+        self._build()
+        
+        self._paragraph_starts = [paragraph["start"] for paragraph in self.paragraphs]
+        self._clause_starts = [clause["start"] for clause in self.clauses]
+        self._heading_starts = [heading["start"] for heading in self.headings]
+    
+    def _build(self):
+        """
+        المرور على أسطر النص وتسجيل الفقرات والعناوين والبنود
+        """
+        text = self.text
+        length = len(text)
+        
+        open_headings: List[Dict[str, Any]] = []
+        paragraph = None
+        clause = None
+        current_list = None
+        
+        position = 0
+        while position < length:
+            line_end = text.find("\n", position)
+            if line_end == -1:
+                line_end = length
+            line = text[position:line_end]
+            stripped = line.strip()
+            line_start = position + (len(line) - len(line.lstrip()))
+            line_stop = line_start + len(stripped)
+            position = line_end + 1
+            
+            # السطر الفارغ ينهي الفقرة والبند والقائمة الحالية
+            if not stripped:
+                paragraph = clause = current_list = None
+                continue
+            
+            section = open_headings[-1]["index"] if open_headings else None
+            heading = self._classify_heading(stripped)
+            
+            if heading is not None:
+                level, number, title = heading
+                
+                # إغلاق العناوين المفتوحة من المستوى نفسه أو أدنى
+                while open_headings and open_headings[-1]["level"] >= level:
+                    open_headings.pop()["end"] = line_start
+                
+                entry = {
+                    "index": len(self.headings),
+                    "title": title,
+                    "level": level,
+                    "number": number,
+                    "start": line_start,
+                    "line_end": line_stop,
+                    "end": length,
+                    "parent": open_headings[-1]["index"] if open_headings else None
+                }
+                self.headings.append(entry)
+                open_headings.append(entry)
+                section = entry["index"]
+                clause = current_list = None
+            else:
+                kind, number, item_text = self._classify_clause(stripped)
+                if kind is not None:
+                    # بند جديد؛ يبدأ قائمة جديدة إذا اختلف نوعه عن القائمة الحالية
+                    if current_list is None or current_list["kind"] != kind:
+                        current_list = {
+                            "index": len(self.lists),
+                            "kind": kind,
+                            "start": line_start,
+                            "end": line_stop
+                        }
+                        self.lists.append(current_list)
+                    clause = {
+                        "kind": kind,
+                        "number": number,
+                        "text": item_text,
+                        "start": line_start,
+                        "end": line_stop,
+                        "section": section,
+                        "block": current_list["index"]
+                    }
+                    self.clauses.append(clause)
+                elif clause is not None:
+                    # سطر تابع للبند السابق
+                    clause["text"] = f"{clause['text']}\n{stripped}"
+                    clause["end"] = line_stop
+                
+                if current_list is not None:
+                    current_list["end"] = line_stop
+            
+            if paragraph is None:
+                paragraph = {
+                    "index": len(self.paragraphs),
+                    "start": line_start,
+                    "end": line_stop,
+                    "section": section
+                }
+                self.paragraphs.append(paragraph)
+            else:
+                paragraph["end"] = line_stop
+        
+        for paragraph in self.paragraphs:
+            paragraph["text"] = text[paragraph["start"]:paragraph["end"]]
+        for current_list in self.lists:
+            current_list["text"] = text[current_list["start"]:current_list["end"]]
+    
+    @staticmethod
+    def _classify_heading(line: str) -> Optional[tuple]:
+        """
+        تحديد ما إذا كان السطر عنواناً
+        
+        المعاملات:
+        ----------
+        line : str
+            السطر بعد إزالة المسافات الطرفية
+        
+        المخرجات:
+        --------
+        Optional[tuple]
+            (المستوى، الرقم، العنوان) أو None إذا لم يكن السطر عنواناً
+        """
+        if len(line) > MAX_HEADING_LENGTH:
+            return None
+        
+        match = MARKDOWN_HEADING_PATTERN.match(line)
+        if match:
+            return len(match.group(1)), None, match.group(2).strip()
+        
+        if len(line.split()) > MAX_HEADING_WORDS:
+            return None
+        
+        if CHAPTER_HEADING_PATTERN.match(line) or ORDINAL_HEADING_PATTERN.match(line):
+            return 1, None, line.rstrip(":").strip()
+        
+        if ARTICLE_HEADING_PATTERN.match(line):
+            return 2, None, line.rstrip(":").strip()
+        
+        if not line.endswith(":"):
+            return None
+        
+        # البنود المرقمة القصيرة المنتهية بنقطتين عناوين فرعية (المستوى حسب عمق الترقيم)
+        match = NUMBERED_PATTERN.match(line)
+        if match:
+            number = match.group(1)
+            return number.count(".") + 3, number, match.group(2).rstrip(":").strip()
+        
+        # العناوين النصية مثل "المتطلبات:" (داخل الأبواب والفصول)
+        if BULLET_PATTERN.match(line):
+            return None
+        return 2, None, line.rstrip(":").strip()
+    
+    @staticmethod
+    def _classify_clause(line: str) -> tuple:
+        """
+        تحديد نوع البند في السطر
+        
+        المخرجات:
+        --------
+        tuple
+            (النوع "numbered" أو "bullet" أو None، الرقم، نص البند)
+        """
+        match = BULLET_PATTERN.match(line)
+        if match:
+            return "bullet", None, match.group(1).strip()
+        
+        match = NUMBERED_PATTERN.match(line)
+        if match and match.group(2).strip():
+            return "numbered", match.group(1), match.group(2).strip()
+        
+        return None, None, line
+    
+    def section_text(self, heading: Dict[str, Any]) -> str:
+        """
+        نص القسم كاملاً (من العنوان حتى العنوان التالي من المستوى نفسه أو أعلى)
+        """
+        return self.text[heading["start"]:heading["end"]].strip()
+    
+    def section_path(self, heading: Dict[str, Any]) -> List[str]:
+        """
+        عناوين الأقسام من الأعلى حتى القسم المحدد
+        """
+        path = []
+        while heading is not None:
+            path.append(heading["title"])
+            heading = self.headings[heading["parent"]] if heading["parent"] is not None else None
+        return path[::-1]
+    
+    def find_headings(self, keywords: Iterable[str]) -> List[Dict[str, Any]]:
+        """
+        العناوين التي تحتوي على إحدى الكلمات المفتاحية بعد توحيد الأحرف العربية (بترتيب ورودها في النص)
+        
+        المعاملات:
+        ----------
+        keywords : Iterable[str]
+            الكلمات المفتاحية
+        
+        المخرجات:
+        --------
+        List[Dict[str, Any]]
+            العناوين المطابقة
+        """
+        if self._normalized_titles is None:
+            self._normalized_titles = [normalize_arabic(heading["title"]) for heading in self.headings]
+        
+        keywords = [normalize_arabic(keyword) for keyword in keywords]
+        return [
+            heading for heading, title in zip(self.headings, self._normalized_titles)
+            if any(keyword in title for keyword in keywords)
+        ]
+    
+    def paragraphs_containing(self, keywords: Iterable[str]) -> List[Dict[str, Any]]:
+        """
+        الفقرات التي تحتوي على إحدى الكلمات المفتاحية بعد توحيد الأحرف العربية (بترتيب ورودها في النص)
+        
+        المعاملات:
+        ----------
+        keywords : Iterable[str]
+            الكلمات المفتاحية
+        
+        المخرجات:
+        --------
+        List[Dict[str, Any]]
+            الفقرات المطابقة
+        """
+        if self._normalized_paragraphs is None:
+            self._normalized_paragraphs = [normalize_arabic(paragraph["text"]) for paragraph in self.paragraphs]
+        
+        keywords = [normalize_arabic(keyword) for keyword in keywords]
+        return [
+            paragraph for paragraph, normalized in zip(self.paragraphs, self._normalized_paragraphs)
+            if any(keyword in normalized for keyword in keywords)
+        ]
+    
+    def paragraphs_in(self, start: int, end: int) -> List[Dict[str, Any]]:
+        """
+        الفقرات التي تبدأ ضمن نطاق المواضع [start, end)
+        """
+        first = bisect_left(self._paragraph_starts, start)
+        last = bisect_left(self._paragraph_starts, end)
+        return self.paragraphs[first:last]
+    
+    def clauses_in(self, start: int, end: int, kind: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        البنود التي تبدأ ضمن نطاق المواضع [start, end)، مع إمكانية التصفية حسب النوع
+        """
+        first = bisect_left(self._clause_starts, start)
+        last = bisect_left(self._clause_starts, end)
+        return [clause for clause in self.clauses[first:last] if kind is None or clause["kind"] == kind]
+    
+    def paragraph_at(self, offset: int) -> Optional[Dict[str, Any]]:
+        """
+        الفقرة التي تحتوي على الموضع المحدد
+        """
+        position = bisect_right(self._paragraph_starts, offset) - 1
+        if position >= 0 and offset <= self.paragraphs[position]["end"]:
+            return self.paragraphs[position]
+        return None
+    
+    def heading_at(self, offset: int) -> Optional[Dict[str, Any]]:
+        """
+        العنوان الذي يقع الموضع المحدد في سطره
+        """
+        position = bisect_right(self._heading_starts, offset) - 1
+        if position >= 0 and offset < self.headings[position]["line_end"]:
+            return self.headings[position]
+        return None
+    
+    def list_blocks(self, kind: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        القوائم المرقمة أو النقطية في المستند
+        """
+        return [block for block in self.lists if kind is None or block["kind"] == kind]
+    
+    def sentences_containing(self, keyword: str) -> List[str]:
+        """
+        أجزاء الجمل (المنتهية بنقطة أو سطر جديد) التي تحتوي على الكلمة المفتاحية
+        
+        المعاملات:
+        ----------
+        keyword : str
+            الكلمة المفتاحية
+        
+        المخرجات:
+        --------
+        List[str]
+            أجزاء الجمل المطابقة بعد إزالة المسافات الطرفية
+        """
+        if self._sentences is None:
+            self._sentences = re.findall(r'[^\n.]*[.\n]', self.text)
+        return [sentence.strip() for sentence in self._sentences if keyword in sentence]
+
+
+_lock = threading.Lock()
+_index_cache: "OrderedDict[int, DocumentIndex]" = OrderedDict()
+
+
+def get_document_index(text: str) -> DocumentIndex:
+    """
+    الحصول على فهرس المستند (يُبنى مرة واحدة لكل نص ويُشارك بين جميع المحللات)
+    
+    المعاملات:
+    ----------
+    text : str
+        النص المستخرج من المناقصة
+    
+    المخرجات:
+    --------
+    DocumentIndex
+        فهرس أقسام المستند
+    """
+    text = text or ""
+    key = hash(text)
+    
+    with _lock:
+        index = _index_cache.get(key)
+        if index is not None and index.text == text:
+            _index_cache.move_to_end(key)
+            return index
+    
+    index = DocumentIndex(text)
+    
+    with _lock:
+        _index_cache[key] = index
+        _index_cache.move_to_end(key)
+        while len(_index_cache) > INDEX_CACHE_SIZE:
+            _index_cache.popitem(last=False)
+    
+    return index
@@ -613,7 +613,7 @@ def home_page():
                 active_tenders,
                 x='نسبة النجاح المتوقعة',
                 y='رقم المناقصة',
-title='نسب النجاح المتوقعة للمناقصات النشطة',
+                title='نسب النجاح المتوقعة للمناقصات النشطة',
                 color='نسبة النجاح المتوقعة',
                 color_continuous_scale='Viridis',
                 orientation='h'
@@ -1215,7 +1215,7 @@ def requirements_analysis_page():
                 with col2:
                     st.metric("تقدير الجهد", "87 يوم عمل")
                     st.metric("التكلفة التقديرية", "435,000 ريال")
-st.metric("درجة التعقيد", "متوسطة")
+                    st.metric("درجة التعقيد", "متوسطة")
             
             with tab2:
                 requirements_demo = pd.DataFrame({
@@ -0,0 +1,147 @@
+"""
+قياس أداء استخراج معلومات المشروع ومدته ونطاق العمل في محلل التكاليف
+يقارن البحث الحالي (بحث حرفي عن كل كلمة مفتاحية ثم نمط مترجم مسبقاً لما يليها، مرة واحدة لكل نص)
+بالطريقة السابقة (re.search منفصل لكل تركيبة من الكلمة والوحدة) على نص مناقصة كبير
+
+الاستخدام:
+    python benchmarks/extraction_benchmark.py [--size-mb 5] [--runs 3]
+"""
+
+import os
+import re
+import sys
+import time
+import argparse
+import statistics
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+
+from analysis.cost_estimator import CostEstimator, EXTRACTION_KEYWORDS, PROJECT_INFO_FIELDS, DURATION_UNITS
+
+# فقرة حشو نموذجية من شروط المناقصة
+FILLER = (
+    "يلتزم المقاول بتوريد وتركيب جميع المواد وفقاً للمخططات المعتمدة والمواصفات الفنية، "
+    "مع تقديم عينات للاعتماد قبل التوريد والالتزام بتعليمات المهندس المشرف في الموقع.\n"
+    "- توريد حديد التسليح مقاس 16 مم بكمية 120 طن\n\n"
+)
+
+HEADER = (
+    "اسم المشروع: إنشاء مجمع مدارس\n"
+    "موقع المشروع: الرياض\n"
+    "الجهة المالكة: وزارة التعليم\n"
+    "القيمة التقديرية: 25,000,000 ريال\n\n"
+)
+
+FOOTER = "مدة التنفيذ: 540 يوم\n\nنطاق العمل:\n- أعمال الحفر والردم\n- أعمال الخرسانة\n"
+
+
+# سيناريوهات القياس: بيانات المشروع في بداية المستند، أو في ملحق بنهايته
+SCENARIOS = ("header", "appendix")
+
+
+def build_text(size_mb: float, scenario: str = "header") -> str:
+    """
+    إنشاء نص مناقصة بالحجم المطلوب (دون ذكر القطاع، والمدة ونطاق العمل في نهايته)
+    """
+    repeats = max(1, int(size_mb * 1024 * 1024 / len(FILLER.encode("utf-8"))))
+    if scenario == "appendix":
+        return FILLER * repeats + HEADER + FOOTER
+    return HEADER + FILLER * repeats + FOOTER
+
+
+def legacy_extract(text: str):
+    """
+    الطريقة السابقة: نمط منفصل لكل كلمة مفتاحية، وتحديد الوحدة من نص النمط نفسه
+    """
+    info = {}
+    for field in PROJECT_INFO_FIELDS:
+        for keyword in EXTRACTION_KEYWORDS[field]:
+            match = re.search(keyword + r'[:\s]+(.*?)(?:\n|$)', text, re.IGNORECASE)
+            if match:
+                info[field] = match.group(1).strip()
+                break
+    for keyword in EXTRACTION_KEYWORDS["value"]:
+        match = re.search(keyword + r'[:\s]+.*?(\d[\d,\.]+)\s*ريال', text, re.IGNORECASE)
+        if match:
+            info["estimated_value"] = float(match.group(1).replace(',', ''))
+            break
+    
+    duration = 12
+    patterns = [
+        keyword + r'[:\s]+(\d+)\s*(?:' + "|".join(words) + ')'
+        for words in DURATION_UNITS.values() for keyword in EXTRACTION_KEYWORDS["duration"]
+    ]
+    for pattern in patterns:
+        match = re.search(pattern, text, re.IGNORECASE)
+        if match:
+            duration = int(match.group(1))
+            if "يوم" in pattern or "أيام" in pattern:
+                duration = max(1, round(duration / 30))
+            elif "سنة" in pattern or "سنوات" in pattern:
+                duration *= 12
+            break
+    
+    scope_section = ""
+    for keyword in EXTRACTION_KEYWORDS["scope"]:
+        match = re.search(keyword + r'.*?(?=\n\n|\Z)', text, re.DOTALL)
+        if match:
+            scope_section = match.group(0)
+            break
+    
+    return info, duration, scope_section
+
+
+def combined_extract(estimator: CostEstimator, text: str):
+    """
+    الطريقة الحالية في محلل التكاليف (مع مسح النتيجة المحفوظة قبل كل تكرار)
+    """
+    estimator._keyword_scan = None
+    info = estimator._extract_project_info(text)
+    duration = estimator._extract_project_duration(text)
+    scope = estimator._scan_keywords(text)["scope"]
+    return info, duration, scope
+
+
+def measure(func, runs: int) -> float:
+    """
+    الوسيط لزمن التنفيذ بالثواني
+    """
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="قياس أداء أنماط الاستخراج المجمعة في محلل التكاليف")
+    parser.add_argument("--size-mb", type=float, default=5.0, help="حجم نص المناقصة بالميجابايت (افتراضي: 5)")
+    parser.add_argument("--runs", type=int, default=3, help="عدد التكرارات (افتراضي: 3)")
+    args = parser.parse_args(argv)
+    
+    estimator = CostEstimator()
+    
+    print(f"حجم النص: {args.size_mb:.1f} ميجابايت، التكرارات: {args.runs}")
+    for scenario in SCENARIOS:
+        text = build_text(args.size_mb, scenario)
+        
+        legacy_info, legacy_duration, _ = legacy_extract(text)
+        info, duration, _ = combined_extract(estimator, text)
+        assert duration == legacy_duration, (duration, legacy_duration)
+        assert all(info[field] == value for field, value in legacy_info.items()), (info, legacy_info)
+        
+        legacy_time = measure(lambda: legacy_extract(text), args.runs)
+        combined_time = measure(lambda: combined_extract(estimator, text), args.runs)
+        
+        print(f"{scenario}:")
+        print(f"  أنماط منفصلة:    {legacy_time * 1000:8.1f} مللي ثانية")
+        print(f"  الطريقة الحالية: {combined_time * 1000:8.1f} مللي ثانية")
+        print(f"  التسريع: {legacy_time / combined_time:.2f}x")
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+"""
+قياس أداء توحيد النصوص العربية
+يقارن توحيد مستند من عدة ميغابايت بسلسلة تعابير منتظمة (تعبير لكل قاعدة)، وبتطبيق جدول التحويل
+مباشرة عبر str.translate، وبالدالة normalize_arabic (الجدول نفسه عبر str.replace)، ويقيس مقارنة قوائم المخاطر والمنتجات بالتشابه على الكلمات الموحدة
+
+الاستخدام:
+    python benchmarks/normalization_benchmark.py [--size-mb 5] [--runs 5]
+"""
+
+import os
+import re
+import sys
+import time
+import random
+import argparse
+import statistics
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from utils.arabic_normalizer import NORMALIZATION_TABLE, normalize_arabic, normalized_words, word_similarity
+
+# كلمات بصيغ مختلفة للألف والهمزة والتاء المربوطة والتشكيل والتطويل والأرقام
+WORDS = [
+    "أسمنت", "إسمنت", "اسمنت", "آلات", "مؤسسة", "مسئولية", "الطاقة", "الطاقه", "مبنى", "مبني",
+    "الخرسانة", "خرســـانة", "مُقاوِلٌ", "المشروع", "٢٤", "شهراً", "١٢٠", "Steel", "PIPES", "توريد",
+    "تركيب", "الأعمال", "المحتوى", "المحلي", "ضمان", "بنكي", "نهائي", "غرامة", "تأخير", "صيانة"
+]
+
+# سلسلة التعابير المنتظمة المتتالية (الطريقة المعتادة دون جدول تحويل)
+LEGACY_RULES = [
+    (re.compile("[أإآٱ]"), "ا"),
+    (re.compile("ة"), "ه"),
+    (re.compile("ى"), "ي"),
+    (re.compile("ؤ"), "و"),
+    (re.compile("ئ"), "ي"),
+    (re.compile("[ـً-ْٰ]"), ""),
+]
+LEGACY_DIGITS = {chr(0x0660 + digit): str(digit) for digit in range(10)}
+LEGACY_DIGITS.update({chr(0x06F0 + digit): str(digit) for digit in range(10)})
+
+
+def legacy_normalize(text: str) -> str:
+    """
+    التوحيد بتعبير منتظم لكل قاعدة ثم استبدال الأرقام رقماً رقماً
+    """
+    for pattern, replacement in LEGACY_RULES:
+        text = pattern.sub(replacement, text)
+    for digit, ascii_digit in LEGACY_DIGITS.items():
+        text = text.replace(digit, ascii_digit)
+    return text.lower()
+
+
+def legacy_similarity(str1: str, str2: str) -> float:
+    """
+    معامل جاكارد كما كان يُحسب سابقاً (تصغير وتقسيم في كل استدعاء)
+    """
+    words1 = set(str1.lower().strip().split())
+    words2 = set(str2.lower().strip().split())
+    union = len(words1 | words2)
+    return len(words1 & words2) / union if union else 0.0
+
+
+def build_document(size_mb: float, rng: random.Random) -> str:
+    """
+    بناء مستند اختباري بالحجم المطلوب
+    """
+    target = int(size_mb * 1024 * 1024)
+    lines = []
+    length = 0
+    while length < target:
+        line = " ".join(rng.choice(WORDS) for _ in range(rng.randint(6, 16)))
+        lines.append(line)
+        length += len(line) + 1
+    return "\n".join(lines)
+
+
+def timed(function, runs: int) -> float:
+    """
+    وسيط زمن التنفيذ بالمللي ثانية
+    """
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        function()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="قياس أداء توحيد النصوص العربية")
+    parser.add_argument("--size-mb", type=float, default=5.0, help="حجم المستند بملايين الأحرف تقريباً (افتراضي: 5)")
+    parser.add_argument("--runs", type=int, default=5, help="عدد التكرارات (افتراضي: 5)")
+    args = parser.parse_args(argv)
+    
+    rng = random.Random(42)
+    document = build_document(args.size_mb, rng)
+    
+    # التحقق من تطابق النتائج قبل القياس
+    expected = document.translate(NORMALIZATION_TABLE).lower()
+    if legacy_normalize(document) != expected or normalize_arabic(document) != expected:
+        print("تحذير: نتائج طرق التوحيد غير متطابقة")
+    
+    legacy_ms = timed(lambda: legacy_normalize(document), args.runs)
+    translate_ms = timed(lambda: document.translate(NORMALIZATION_TABLE).lower(), args.runs)
+    table_ms = timed(lambda: normalize_arabic(document), args.runs)
+    print(f"حجم المستند: {len(document) / 1e6:.1f} مليون حرف ({len(document.encode('utf-8')) / 1024 / 1024:.1f} ميغابايت UTF-8)")
+    print(f"{'التعابير المنتظمة':>22}: {legacy_ms:8.1f} مللي ثانية")
+    print(f"{'str.translate':>22}: {translate_ms:8.1f} مللي ثانية ({legacy_ms / translate_ms:.1f}x)")
+    print(f"{'normalize_arabic':>22}: {table_ms:8.1f} مللي ثانية ({legacy_ms / table_ms:.1f}x)")
+    
+    # مقارنة كل مخاطرة بجميع المخاطر السابقة كما في دمج المخاطر، وكل مادة بجميع المنتجات
+    items = [" ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 8))) for _ in range(1500)]
+    pairs = [(items[i], items[j]) for i in range(0, len(items), 3) for j in range(i)]
+    
+    def run_legacy_pairs():
+        return sum(legacy_similarity(first, second) > 0.3 for first, second in pairs)
+    
+    def run_cached_pairs():
+        normalized_words.cache_clear()
+        return sum(word_similarity(first, second) > 0.3 for first, second in pairs)
+    
+    legacy_matches = run_legacy_pairs()
+    cached_matches = run_cached_pairs()
+    legacy_pairs_ms = timed(run_legacy_pairs, args.runs)
+    cached_pairs_ms = timed(run_cached_pairs, args.runs)
+    print(f"عدد المقارنات: {len(pairs)}")
+    print(f"{'التشابه دون توحيد':>22}: {legacy_pairs_ms:8.1f} مللي ثانية، {legacy_matches} زوجاً متشابهاً")
+    print(f"{'التشابه بعد التوحيد':>22}: {cached_pairs_ms:8.1f} مللي ثانية، {cached_matches} زوجاً متشابهاً "
+          f"({legacy_pairs_ms / cached_pairs_ms:.1f}x)")
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
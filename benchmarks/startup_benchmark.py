@@ -0,0 +1,64 @@
+"""
+قياس زمن بدء التشغيل لمعالج المستندات
+يقيس في عملية جديدة لكل تكرار: زمن استيراد الوحدة، وزمن إنشاء المعالج، وزمن أول استخدام للكلمات التوقفية
+
+الاستخدام:
+    python benchmarks/startup_benchmark.py [--runs 5]
+"""
+
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# الشيفرة التي تُنفذ في كل عملية جديدة (تطبع الأزمنة بصيغة JSON)
+PROBE = """
+import json, time
+started = time.perf_counter()
+from modules.document_processor import DocumentProcessor
+imported = time.perf_counter()
+processor = DocumentProcessor({"cache_enabled": False})
+constructed = time.perf_counter()
+stopword_count = len(processor.arabic_stopwords)
+first_use = time.perf_counter()
+print(json.dumps({
+    "import": imported - started,
+    "construct": constructed - imported,
+    "first_stopwords": first_use - constructed,
+    "stopword_count": stopword_count
+}))
+"""
+
+
+def run_probe() -> dict:
+    """
+    تشغيل القياس في عملية بايثون جديدة (حتى لا تؤثر الوحدات المحملة مسبقاً على النتائج)
+    """
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE], cwd=PROJECT_ROOT, check=True,
+        capture_output=True, text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="قياس زمن بدء تشغيل معالج المستندات")
+    parser.add_argument("--runs", type=int, default=5, help="عدد التكرارات (افتراضي: 5)")
+    args = parser.parse_args(argv)
+    
+    samples = [run_probe() for _ in range(args.runs)]
+    
+    print(f"عدد التكرارات: {args.runs}، عدد الكلمات التوقفية: {samples[-1]['stopword_count']}")
+    for stage in ("import", "construct", "first_stopwords"):
+        values = [sample[stage] * 1000 for sample in samples]
+        print(f"{stage:>16}: الوسيط {statistics.median(values):8.1f} مللي ثانية، الأدنى {min(values):8.1f}، الأعلى {max(values):8.1f}")
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,363 @@
+"""
+قياس أداء ربط منتجات الموردين بالكتالوج
+يقارن بناء فهارس SuppliersDatabase بالفهرس المقلوب للكلمات الموحدة بالمسح الكامل السابق
+(مقارنة كل منتج لكل مورد بجميع منتجات الكتالوج) ويتحقق من تطابق الروابط الناتجة
+
+الاستخدام:
+    python benchmarks/supplier_index_benchmark.py [--suppliers 4000] [--products 15000] [--full-scan-suppliers 100]
+
+المسح الكامل بطيء جداً على الأحجام الكبيرة، لذا يُقاس على أول --full-scan-suppliers مورد فقط
+ويُقدّر زمنه لجميع الموردين بالتناسب
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import tempfile
+import argparse
+from typing import Any, Dict, List, Tuple
+from collections import defaultdict
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from supply_chain.suppliers_database import SuppliersDatabase, PRODUCT_SIMILARITY_THRESHOLD
+from utils.arabic_normalizer import normalize_arabic
+from tender_corpus import generate_suppliers
+
+# مفردات أسماء المنتجات (النوع والوصف والمقاس والعلامة التجارية ورمز الصنف)
+PRODUCT_TYPES = [
+    "خرسانة", "حديد", "أسمنت", "بلوك", "أنابيب", "كابلات", "لوحات", "دهانات", "عزل", "بلاط",
+    "أبواب", "نوافذ", "مضخات", "ألواح", "صمامات", "محولات", "زجاج", "رخام", "خزانات", "مراوح"
+]
+PRODUCT_QUALIFIERS = [
+    "مسلحة", "مجلفن", "مقاوم", "معزول", "نحاسية", "بلاستيكية", "حرارية", "مائية", "داخلية", "خارجية",
+    "صناعية", "سريعة", "مضغوطة", "مرنة", "مقوى", "لامع", "مطفي", "عازلة", "خفيفة", "ثقيلة",
+    "مزدوجة", "أحادية", "مقاومة", "مصقول", "مسبقة"
+]
+PRODUCT_UNITS = ["مم", "سم", "م", "كجم", "لتر", "بوصة"]
+PRODUCT_BRANDS = [
+    "الوطنية", "الخليج", "الراجحي", "الزامل", "اليمامة", "الجزيرة", "السعودية", "العربية", "الشرق", "النخبة",
+    "الرواد", "الأمانة", "الصفوة", "المتحدة", "الفجر", "التميز", "البناء", "الإعمار", "الريادة", "الاتحاد",
+    "القمة", "الأصالة", "المستقبل", "الحديثة", "الدولية", "الذهبية", "المتقدمة", "الأولى", "الماسية", "الصحراء"
+]
+# استعلامات بحث كما تُكتب حرفاً حرفاً في صفحة الموردين
+SEARCH_QUERIES = ["م", "مص", "مصن", "مصنع", "حديد", "حديد تس", "الشرقية", "الرياض 12", "بورتلاندي", "للصناعة", "غير موجود"]
+SUPPLIER_REGIONS = ["الرياض", "مكة المكرمة", "المنطقة الشرقية", "المدينة المنورة", "القصيم", "عسير", "تبوك", "جازان"]
+
+
+def generate_catalogue(supplier_count: int, product_count: int, seed: int = 42) -> Dict[str, Any]:
+    """
+    توليد كتالوج منتجات وقائمة موردين بأحجام قريبة من قاعدة البيانات الفعلية
+    
+    المعاملات:
+    ----------
+    supplier_count : int
+        عدد الموردين
+    product_count : int
+        عدد منتجات الكتالوج
+    seed : int, optional
+        بذرة التوليد (افتراضي: 42)
+    
+    المخرجات:
+    --------
+    Dict[str, Any]
+        suppliers (بالصيغة التي تحملها SuppliersDatabase) و products (قاموس المنتجات بمعرفاتها)
+    """
+    rng = random.Random(f"catalogue:{seed}:{supplier_count}:{product_count}")
+    products = {}
+    names = []
+    for index in range(product_count):
+        # أسماء مكررة بمعرفات مختلفة (يُربط المورد بأولها) وأسماء دون رمز الصنف
+        if names and rng.random() < 0.02:
+            name = rng.choice(names)
+        else:
+            name = (f"{rng.choice(PRODUCT_TYPES)} {rng.choice(PRODUCT_QUALIFIERS)} {rng.randint(1, 400)} "
+                    f"{rng.choice(PRODUCT_UNITS)} {rng.choice(PRODUCT_BRANDS)}")
+            if rng.random() < 0.8:
+                name += f" ص{index + 1}"
+        names.append(name)
+        product_id = f"P{index + 1:06d}"
+        products[product_id] = {"id": product_id, "name": name}
+    
+    suppliers = []
+    for index in range(supplier_count):
+        supplier_products = []
+        for _ in range(rng.randint(1, 6)):
+            name = rng.choice(names)
+            draw = rng.random()
+            if draw < 0.15:
+                # كتابة مختلفة للهمزات يوحدها التطبيع
+                name = name.replace("أ", "ا").replace("إ", "ا")
+            elif draw < 0.25:
+                # اسم دون العلامة التجارية ورمز الصنف (قد لا يطابق أي منتج)
+                name = " ".join(name.split()[:4])
+            supplier_products.append(name)
+        suppliers.append({
+            "id": f"S{index + 1:06d}",
+            "name": f"مؤسسة {rng.choice(PRODUCT_BRANDS)} {index + 1}",
+            "region": rng.choice(SUPPLIER_REGIONS),
+            "products": supplier_products
+        })
+    
+    return {"suppliers": suppliers, "products": products}
+
+
+def full_scan_links(database: SuppliersDatabase, suppliers: List[Dict[str, Any]]) -> Tuple[Dict[str, List[str]], Dict[str, List[str]]]:
+    """
+    ربط منتجات الموردين بالمسح الكامل للكتالوج (الطريقة السابقة لبناء الفهارس)
+    
+    المعاملات:
+    ----------
+    database : SuppliersDatabase
+        قاعدة البيانات (تُستخدم منتجاتها ودالة التشابه فيها)
+    suppliers : List[Dict[str, Any]]
+        الموردون المراد ربط منتجاتهم
+    
+    المخرجات:
+    --------
+    Tuple[Dict[str, List[str]], Dict[str, List[str]]]
+        المنتجات حسب المورد والموردون حسب المنتج
+    """
+    supplier_products = defaultdict(list)
+    product_suppliers = defaultdict(list)
+    for supplier in suppliers:
+        supplier_id = supplier.get("id")
+        for product_name in supplier.get("products", []):
+            matching_product_id = None
+            best_similarity = 0
+            for product_id, product in database.products.items():
+                similarity = database._calculate_similarity(product_name, product.get("name", ""))
+                if similarity > PRODUCT_SIMILARITY_THRESHOLD and similarity > best_similarity:
+                    best_similarity = similarity
+                    matching_product_id = product_id
+            if matching_product_id:
+                supplier_products[supplier_id].append(matching_product_id)
+                product_suppliers[matching_product_id].append(supplier_id)
+    return supplier_products, product_suppliers
+
+
+def generate_materials(products: Dict[str, Dict[str, Any]], count: int, seed: int = 42) -> List[Dict[str, Any]]:
+    """
+    توليد قائمة مواد جدول كميات من أسماء منتجات الكتالوج (مع تكرار المواد واختلاف كتابتها)
+    
+    المعاملات:
+    ----------
+    products : Dict[str, Dict[str, Any]]
+        منتجات الكتالوج
+    count : int
+        عدد بنود جدول الكميات
+    seed : int, optional
+        بذرة التوليد (افتراضي: 42)
+    
+    المخرجات:
+    --------
+    List[Dict[str, Any]]
+        المواد بالصيغة التي تستقبلها find_matching_suppliers
+    """
+    rng = random.Random(f"materials:{seed}:{count}")
+    names = [product["name"] for product in products.values()]
+    distinct = rng.sample(names, min(len(names), max(1, count // 3)))
+    materials = []
+    for _ in range(count):
+        name = rng.choice(distinct)
+        if rng.random() < 0.2:
+            name = name.replace("أ", "ا").replace("إ", "ا")
+        materials.append({"name": name})
+    return materials
+
+
+def full_scan_matches(database: SuppliersDatabase, name: str) -> List[Tuple[str, float]]:
+    """
+    المنتجات المطابقة لاسم بالمسح الكامل للكتالوج (الطريقة السابقة في find_matching_suppliers)
+    
+    المعاملات:
+    ----------
+    database : SuppliersDatabase
+        قاعدة البيانات
+    name : str
+        اسم المادة
+    
+    المخرجات:
+    --------
+    List[Tuple[str, float]]
+        معرفات المنتجات المطابقة ودرجات تشابهها بترتيب المنتجات في قاعدة البيانات
+    """
+    matching_products = []
+    for product_id, product in database.products.items():
+        similarity = database._calculate_similarity(name, product.get("name", ""))
+        if similarity > PRODUCT_SIMILARITY_THRESHOLD:
+            matching_products.append((product_id, similarity))
+    return matching_products
+
+
+def full_scan_search(database: SuppliersDatabase, query: str, category: str = None) -> List[Dict[str, Any]]:
+    """
+    البحث عن الموردين بالمرور على جميع الموردين (الطريقة السابقة في search_suppliers)
+    
+    المعاملات:
+    ----------
+    database : SuppliersDatabase
+        قاعدة البيانات
+    query : str
+        استعلام البحث
+    category : str, optional
+        فئة المورد
+    
+    المخرجات:
+    --------
+    List[Dict[str, Any]]
+        الموردون المطابقون بترتيبهم في قاعدة البيانات
+    """
+    query = normalize_arabic(query).strip()
+    results = []
+    for supplier, (name, region, products) in zip(database.suppliers, database._normalized_suppliers):
+        if category and category != "الكل" and supplier.get("category") != category:
+            continue
+        if query in name or query in region or any(query in product for product in products):
+            results.append(supplier)
+    return results
+
+
+def write_source_files(data: Dict[str, Any], directory: str) -> Dict[str, str]:
+    """
+    كتابة الموردين والمنتجات بصيغة ملفات المصدر التي تقرأها SuppliersDatabase
+    
+    المعاملات:
+    ----------
+    data : Dict[str, Any]
+        suppliers و products كما يعيدها generate_catalogue
+    directory : str
+        مجلد الملفات
+    
+    المخرجات:
+    --------
+    Dict[str, str]
+        إعدادات قاعدة البيانات بمسارات الملفات وملف الفهارس
+    """
+    config = {
+        "suppliers_file": os.path.join(directory, "local_suppliers.json"),
+        "products_file": os.path.join(directory, "local_materials.json"),
+        "index_artifact_path": os.path.join(directory, "suppliers_index.pkl")
+    }
+    with open(config["suppliers_file"], "w", encoding="utf-8") as f:
+        json.dump(data["suppliers"], f, ensure_ascii=False)
+    with open(config["products_file"], "w", encoding="utf-8") as f:
+        json.dump([{"name": product["name"]} for product in data["products"].values()], f, ensure_ascii=False)
+    return config
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="قياس أداء ربط منتجات الموردين بالكتالوج")
+    parser.add_argument("--suppliers", type=int, default=4000, help="عدد الموردين (افتراضي: 4000)")
+    parser.add_argument("--products", type=int, default=15000, help="عدد منتجات الكتالوج (افتراضي: 15000)")
+    parser.add_argument("--full-scan-suppliers", type=int, default=100,
+                        help="عدد الموردين الذين يُقاس عليهم المسح الكامل، 0 لتخطيه (افتراضي: 100)")
+    parser.add_argument("--materials", type=int, default=3000, help="عدد بنود جدول الكميات (افتراضي: 3000)")
+    parser.add_argument("--search-suppliers", type=int, default=100000,
+                        help="عدد الموردين في قياس البحث، 0 لتخطيه (افتراضي: 100000)")
+    parser.add_argument("--startup-suppliers", type=int, default=10000,
+                        help="عدد الموردين في قياس بدء التشغيل من ملف الفهارس، 0 لتخطيه (افتراضي: 10000)")
+    parser.add_argument("--seed", type=int, default=42, help="بذرة التوليد (افتراضي: 42)")
+    args = parser.parse_args(argv)
+    
+    data = generate_catalogue(args.suppliers, args.products, args.seed)
+    database = SuppliersDatabase()
+    database.suppliers = data["suppliers"]
+    database.products = data["products"]
+    
+    started = time.perf_counter()
+    database._initialize_indexes()
+    index_s = time.perf_counter() - started
+    links = sum(len(products) for products in database.supplier_products.values())
+    print(f"الموردون: {args.suppliers}، منتجات الكتالوج: {args.products}، الروابط: {links}")
+    print(f"{'الفهرس المقلوب':>16}: {index_s:8.2f} ثانية لجميع الموردين")
+    
+    if args.full_scan_suppliers > 0:
+        sample = database.suppliers[:args.full_scan_suppliers]
+        started = time.perf_counter()
+        expected_products, _ = full_scan_links(database, sample)
+        scan_s = time.perf_counter() - started
+        estimated_s = scan_s * len(database.suppliers) / len(sample)
+        print(f"{'المسح الكامل':>16}: {scan_s:8.2f} ثانية لأول {len(sample)} مورد "
+              f"(تقدير {estimated_s:.0f} ثانية لجميع الموردين، {estimated_s / index_s:.0f}x)")
+        
+        # التحقق من تطابق الروابط على العينة
+        for supplier in sample:
+            supplier_id = supplier["id"]
+            if expected_products.get(supplier_id, []) != database.supplier_products.get(supplier_id, []):
+                print(f"تحذير: روابط المورد {supplier_id} غير متطابقة")
+                return 1
+    
+    # مطابقة مواد جدول الكميات بالموردين
+    materials = generate_materials(database.products, args.materials, args.seed)
+    started = time.perf_counter()
+    results = database.find_matching_suppliers(materials)
+    match_s = time.perf_counter() - started
+    print(f"بنود جدول الكميات: {len(materials)}، الموردون المطابقون: {results['summary']['total_matching_suppliers']}")
+    print(f"{'مطابقة المواد':>16}: {match_s:8.2f} ثانية")
+    
+    if args.full_scan_suppliers > 0 and materials:
+        # المسح الكامل لكل بند (دون توحيد البنود المكررة) على عينة من البنود
+        sample = materials[:max(1, args.full_scan_suppliers // 2)]
+        started = time.perf_counter()
+        for material in sample:
+            full_scan_matches(database, material["name"])
+        estimated_s = (time.perf_counter() - started) * len(materials) / len(sample)
+        print(f"{'المسح الكامل':>16}: تقدير {estimated_s:.0f} ثانية لجميع البنود ({estimated_s / match_s:.0f}x)")
+    
+    # البحث في الموردين بالمقاطع الثلاثية مقارنة بالمرور على جميع الموردين
+    if args.search_suppliers > 0:
+        data = generate_suppliers(args.search_suppliers, args.seed)
+        database.suppliers = data["suppliers"]
+        database.products = data["products"]
+        started = time.perf_counter()
+        database._initialize_indexes()
+        print(f"الموردون في قياس البحث: {len(database.suppliers)} (بناء الفهارس {time.perf_counter() - started:.2f} ثانية)")
+        
+        for query in SEARCH_QUERIES:
+            started = time.perf_counter()
+            results = database.search_suppliers(query)
+            search_ms = (time.perf_counter() - started) * 1000
+            started = time.perf_counter()
+            limited = database.search_suppliers(query, limit=20, rank=True)
+            limited_ms = (time.perf_counter() - started) * 1000
+            started = time.perf_counter()
+            expected = full_scan_search(database, query)
+            scan_ms = (time.perf_counter() - started) * 1000
+            if results != expected:
+                print(f"تحذير: نتائج البحث عن «{query}» غير متطابقة")
+                return 1
+            print(f"{query:>12}: {len(results):6d} نتيجة، الفهرس {search_ms:7.1f} مللي ثانية، "
+                  f"أفضل 20 {limited_ms:7.1f} مللي ثانية، المرور الكامل {scan_ms:7.1f} مللي ثانية")
+    
+    
+    # بدء التشغيل من ملفات JSON مع بناء الفهارس مقارنة بتحميل ملف الفهارس المبني مسبقاً
+    if args.startup_suppliers > 0:
+        directory = tempfile.mkdtemp()
+        try:
+            config = write_source_files(generate_catalogue(args.startup_suppliers, args.products, args.seed), directory)
+            started = time.perf_counter()
+            built = SuppliersDatabase(config)
+            build_s = time.perf_counter() - started
+            started = time.perf_counter()
+            loaded = SuppliersDatabase(config)
+            load_s = time.perf_counter() - started
+            if loaded.supplier_products != built.supplier_products:
+                print("تحذير: الفهارس المحملة من الملف غير مطابقة")
+                return 1
+            size_mb = os.path.getsize(config["index_artifact_path"]) / 1024 / 1024
+            print(f"بدء التشغيل ({args.startup_suppliers} مورد، {args.products} منتج، ملف فهارس {size_mb:.1f} ميغابايت):")
+            print(f"{'بناء الفهارس':>16}: {build_s:8.2f} ثانية")
+            print(f"{'ملف الفهارس':>16}: {load_s:8.2f} ثانية ({build_s / load_s:.0f}x)")
+        finally:
+            shutil.rmtree(directory)
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
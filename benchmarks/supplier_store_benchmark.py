@@ -0,0 +1,172 @@
+"""
+قياس ذاكرة وأداء مخزن الموردين العمودي
+يقارن ذاكرة سجلات الموردين كقائمة قواميس (كما تُقرأ من JSON) بذاكرة SupplierStore، وزمن تصفية
+الموردين بالمرور على القواميس بزمن التصفية بأقنعة الأعمدة، ويتحقق من تطابق السجلات والنتائج
+
+الاستخدام:
+    python benchmarks/supplier_store_benchmark.py [--suppliers 100000] [--seed 42]
+"""
+
+import os
+import sys
+import gc
+import json
+import time
+import random
+import argparse
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+import numpy as np
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from utils.supplier_store import SupplierStore
+from tender_corpus import BOQ_MATERIALS, SUPPLIER_CATEGORIES, SUPPLIER_NAMES, SUPPLIER_REGIONS
+
+# قطاعات الموردين وشهاداتهم بالصيغة التي يستخدمها SupplyChainAnalyzer
+SUPPLIER_SECTORS = ["الإنشاءات", "الطاقة", "تقنية المعلومات", "النقل", "الصحة", "عام"]
+SUPPLIER_CERTIFICATIONS = ["ISO 9001", "ISO 14001", "OHSAS 18001", "ISO 45001", "SASO", "LEED"]
+NITAQAT_CATEGORIES = ["بلاتيني", "أخضر مرتفع", "أخضر متوسط", "أخضر منخفض", "أصفر"]
+
+
+def generate_supplier_records(count: int, seed: int = 42) -> List[Dict[str, Any]]:
+    """
+    توليد سجلات موردين اصطناعية تجمع حقول SuppliersDatabase و SupplyChainAnalyzer و LocalContentAnalyzer
+    
+    المعاملات:
+    ----------
+    count : int
+        عدد الموردين
+    seed : int, optional
+        بذرة التوليد (افتراضي: 42)
+    
+    المخرجات:
+    --------
+    List[Dict[str, Any]]
+        سجلات الموردين
+    """
+    rng = random.Random(f"supplier-records:{seed}:{count}")
+    records = []
+    for index in range(count):
+        region = rng.choice(SUPPLIER_REGIONS)
+        records.append({
+            "id": f"S{index + 1:06d}",
+            "name": f"{rng.choice(SUPPLIER_NAMES)} {region} {index + 1} للصناعة",
+            "sector": rng.choice(SUPPLIER_SECTORS),
+            "category": rng.choice(SUPPLIER_CATEGORIES),
+            "region": region,
+            "categories": rng.sample(SUPPLIER_CATEGORIES, rng.randint(1, 3)),
+            "products": [material[0] for material in rng.sample(BOQ_MATERIALS, rng.randint(1, 4))],
+            "local_content_percentage": rng.randint(30, 100),
+            "rating": round(rng.uniform(2.5, 5.0), 1),
+            "reliability": round(rng.uniform(2.5, 5.0), 1),
+            "certifications": rng.sample(SUPPLIER_CERTIFICATIONS, rng.randint(0, 3)),
+            "historical_performance": {
+                "on_time_delivery": rng.randint(60, 100),
+                "quality": rng.randint(60, 100),
+                "cost": rng.randint(60, 100)
+            },
+            "nitaqat_category": rng.choice(NITAQAT_CATEGORIES)
+        })
+    return records
+
+
+def measure_memory(build: Callable[[], Any]) -> Tuple[Any, int]:
+    """
+    الذاكرة التي يحتفظ بها ناتج الدالة بعد انتهائها (بالبايت)
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = build()
+        gc.collect()
+        retained = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    return result, retained
+
+
+def best_ms(function: Callable[[], Any], repeats: int = 5) -> float:
+    """
+    أقل زمن تنفيذ من عدة تكرارات (بالمللي ثانية)
+    """
+    samples = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        function()
+        samples.append(time.perf_counter() - started)
+    return min(samples) * 1000
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="قياس ذاكرة وأداء مخزن الموردين العمودي")
+    parser.add_argument("--suppliers", type=int, default=100000, help="عدد الموردين (افتراضي: 100000)")
+    parser.add_argument("--seed", type=int, default=42, help="بذرة التوليد (افتراضي: 42)")
+    args = parser.parse_args(argv)
+    
+    # السجلات كما تُقرأ من ملف JSON (نسخة مستقلة من كل نص كما في التحميل الفعلي)
+    text = json.dumps(generate_supplier_records(args.suppliers, args.seed), ensure_ascii=False)
+    records, records_bytes = measure_memory(lambda: json.loads(text))
+    store, store_bytes = measure_memory(lambda: SupplierStore.from_records(json.loads(text)))
+    del text
+    
+    if list(store) != records:
+        print("تحذير: سجلات المخزن غير مطابقة للسجلات الأصلية")
+        return 1
+    
+    print(f"الموردون: {len(records)}")
+    print(f"{'قائمة القواميس':>16}: {records_bytes / 1024 / 1024:8.1f} ميغابايت "
+          f"({records_bytes / len(records):.0f} بايت لكل مورد)")
+    print(f"{'المخزن العمودي':>16}: {store_bytes / 1024 / 1024:8.1f} ميغابايت "
+          f"({store_bytes / len(records):.0f} بايت لكل مورد، {records_bytes / store_bytes:.1f}x أصغر)")
+    
+    # التصفية: القطاع وفئات المواد (مرشح SupplyChainAnalyzer) ثم الحقول الرقمية
+    sector = SUPPLIER_SECTORS[0]
+    categories = set(SUPPLIER_CATEGORIES[:2])
+    
+    def loop_filter():
+        return [
+            position for position, supplier in enumerate(records)
+            if supplier["sector"] in (sector, "عام") and categories.intersection(supplier["categories"])
+            and supplier["rating"] >= 4.0 and supplier["historical_performance"]["quality"] >= 80
+        ]
+    
+    def store_filter():
+        mask = store.isin("sector", [sector, "عام"]) & store.isin("categories", categories)
+        mask &= (store.numeric("rating") >= 4.0) & (store.numeric("historical_performance.quality") >= 80)
+        return np.flatnonzero(mask).tolist()
+    
+    if loop_filter() != store_filter():
+        print("تحذير: نتائج التصفية غير متطابقة")
+        return 1
+    
+    loop_ms = best_ms(loop_filter)
+    store_ms = best_ms(store_filter)
+    print(f"الموردون المطابقون للمرشح: {len(store_filter())}")
+    print(f"{'المرور على القواميس':>20}: {loop_ms:8.1f} مللي ثانية")
+    print(f"{'أقنعة الأعمدة':>20}: {store_ms:8.1f} مللي ثانية ({loop_ms / store_ms:.0f}x)")
+    
+    # توزيع الموردين حسب المنطقة
+    def loop_counts():
+        counts = {}
+        for supplier in records:
+            region = supplier.get("region", "غير محدد")
+            counts[region] = counts.get(region, 0) + 1
+        return counts
+    
+    if loop_counts() != store.value_counts("region", "غير محدد"):
+        print("تحذير: توزيع المناطق غير متطابق")
+        return 1
+    
+    loop_ms = best_ms(loop_counts)
+    store_ms = best_ms(lambda: store.value_counts("region", "غير محدد"))
+    print(f"{'توزيع المناطق':>20}: {loop_ms:8.1f} مللي ثانية بالقواميس، {store_ms:8.1f} مللي ثانية بالأعمدة "
+          f"({loop_ms / store_ms:.0f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
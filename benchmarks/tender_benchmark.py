@@ -0,0 +1,297 @@
+"""
+قياس أداء معالجة المناقصات من البداية إلى النهاية
+يقيس على مناقصات اصطناعية بعدة أحجام (benchmarks/tender_corpus.py): معالج المستندات لكل صيغة،
+وبناء فهرس المستند، وكل محلل، ومسارات البحث عن الموردين ومطابقتهم، ويكتب تقريراً بصيغة JSON
+يمكن مقارنته بتقرير سابق لاكتشاف التراجع في الأداء بين الإصدارات
+
+الاستخدام:
+    python benchmarks/tender_benchmark.py [--pages 10 100 500] [--formats txt docx pdf xlsx] [--runs 3]
+        [--output report.json] [--compare baseline.json] [--threshold 1.25]
+
+تُعيد الأداة الرمز 1 عند المقارنة إذا كانت أي حالة أبطأ من التقرير السابق بأكثر من النسبة المحددة
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import statistics
+import subprocess
+from datetime import datetime
+from typing import Dict, List, Any, Callable, Optional
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from tender_corpus import FORMATS, build_document, generate_tender, generate_suppliers, render_text
+from modules.document_processor import DocumentProcessor
+from analysis.section_index import DocumentIndex, get_document_index
+from analysis.cost_estimator import CostEstimator
+from analysis.risk_analyzer import RiskAnalyzer
+from analysis.requirement_analyzer import RequirementAnalyzer
+from analysis.local_content_analyzer import LocalContentAnalyzer
+from supply_chain.suppliers_database import SuppliersDatabase
+
+# إصدار صيغة التقرير (يُرفع عند تغيير أسماء الحالات أو بنية التقرير)
+REPORT_VERSION = 1
+
+# عدد الموردين في قاعدة الموردين الاصطناعية لكل صفحة من المناقصة (بحد أدنى 50)
+SUPPLIERS_PER_PAGE = 2
+
+
+def measure(function: Callable[[], Any], runs: int) -> Dict[str, Any]:
+    """
+    تشغيل الدالة عدة مرات وحساب إحصائيات الزمن بالثواني
+    
+    المخرجات:
+    --------
+    Dict[str, Any]
+        median_s و min_s و max_s و runs، ومخرج آخر تشغيل في result
+    """
+    samples = []
+    result = None
+    for _ in range(runs):
+        started = time.perf_counter()
+        result = function()
+        samples.append(time.perf_counter() - started)
+    return {
+        "median_s": round(statistics.median(samples), 6),
+        "min_s": round(min(samples), 6),
+        "max_s": round(max(samples), 6),
+        "runs": runs,
+        "result": result
+    }
+
+
+class TenderBenchmark:
+    """
+    تشغيل حالات القياس وجمع نتائجها
+    """
+    
+    def __init__(self, runs: int = 3, seed: int = 42, corpus_dir: Optional[str] = None):
+        """
+        تهيئة القياس
+        
+        المعاملات:
+        ----------
+        runs : int, optional
+            عدد التكرارات لكل حالة (افتراضي: 3)
+        seed : int, optional
+            بذرة توليد المناقصات (افتراضي: 42)
+        corpus_dir : str, optional
+            مجلد حفظ المستندات المولدة لإعادة استخدامها (افتراضي: بدون حفظ)
+        """
+        self.runs = runs
+        self.seed = seed
+        self.corpus_dir = corpus_dir
+        self.results: List[Dict[str, Any]] = []
+        
+        # تعطيل ذاكرات التخزين المؤقت حتى يقاس العمل الفعلي في كل تكرار
+        analyzer_config = {"result_cache": False}
+        self.processor = DocumentProcessor({"cache_enabled": False})
+        self.analyzers = {
+            "requirements": RequirementAnalyzer(None, None, analyzer_config),
+            "costs": CostEstimator(analyzer_config),
+            "risks": RiskAnalyzer(None, analyzer_config),
+            "local_content": LocalContentAnalyzer(None, analyzer_config)
+        }
+    
+    def record(self, name: str, pages: int, measurement: Dict[str, Any], **counts) -> None:
+        """
+        إضافة نتيجة حالة إلى التقرير وطباعتها
+        """
+        measurement.pop("result", None)
+        entry = {"name": name, "pages": pages, **measurement}
+        if counts:
+            entry["counts"] = counts
+        self.results.append(entry)
+        print(f"{name:>34} {pages:>6} صفحة: {measurement['median_s'] * 1000:10.1f} مللي ثانية")
+    
+    def run_documents(self, pages: int, formats: List[str]) -> None:
+        """
+        قياس معالج المستندات لكل صيغة
+        """
+        for file_format in formats:
+            content = build_document(pages, file_format, self.seed, self.corpus_dir)
+            measurement = measure(
+                lambda: self.processor.process_document(content, file_format, f"tender.{file_format}"), self.runs
+            )
+            extracted = measurement["result"]
+            if "error" in extracted:
+                print(f"تحذير: {extracted['error']}")
+            self.record(
+                f"document_processor.{file_format}", pages, measurement,
+                bytes=len(content), chars=len(extracted.get("text", "")),
+                tables=len(extracted.get("tables", [])), boq_items=len(extracted.get("boq_items", []))
+            )
+    
+    def run_analyzers(self, pages: int) -> None:
+        """
+        قياس بناء فهرس المستند وكل محلل على نص المناقصة وبنود كمياتها
+        """
+        tender = generate_tender(pages, self.seed)
+        text = render_text(tender)
+        boq_items = tender["boq_items"]
+        
+        index_measurement = measure(lambda: DocumentIndex(text), self.runs)
+        index = index_measurement["result"]
+        self.record("analysis.document_index", pages, index_measurement,
+                    chars=len(text), headings=len(index.headings), paragraphs=len(index.paragraphs))
+        
+        # تشترك المحللات في فهرس واحد لكل نص، لذا يُبنى قبل قياسها فيقيس كل محلل عمله الخاص فقط
+        get_document_index(text)
+        cases = {
+            "requirements": lambda: self.analyzers["requirements"].analyze(text),
+            "costs": lambda: self.analyzers["costs"].estimate(text, None, boq_items),
+            "risks": lambda: self.analyzers["risks"].analyze(text),
+            "local_content": lambda: self.analyzers["local_content"].analyze(text, None, boq_items)
+        }
+        for name, case in cases.items():
+            measurement = measure(case, self.runs)
+            if isinstance(measurement["result"], dict) and "error" in measurement["result"]:
+                print(f"تحذير: {measurement['result']['error']}")
+            self.record(f"analysis.{name}", pages, measurement)
+    
+    def run_suppliers(self, pages: int) -> None:
+        """
+        قياس بناء فهارس الموردين والبحث عنهم ومطابقة مواد جدول الكميات بهم
+        (حجم قاعدة الموردين وعدد المواد يتناسبان مع حجم المناقصة)
+        """
+        tender = generate_tender(pages, self.seed)
+        data = generate_suppliers(max(50, pages * SUPPLIERS_PER_PAGE), self.seed)
+        materials = [{"name": item["description"], "quantity": item["quantity"]} for item in tender["boq_items"]]
+        queries = sorted({item["description"].split()[0] for item in tender["boq_items"]}) or ["أسمنت"]
+        
+        database = SuppliersDatabase()
+        database.suppliers = data["suppliers"]
+        database.products = data["products"]
+        self.record("suppliers.index", pages, measure(database._initialize_indexes, self.runs),
+                    suppliers=len(data["suppliers"]))
+        self.record("suppliers.search", pages,
+                    measure(lambda: [database.search_suppliers(query) for query in queries], self.runs),
+                    queries=len(queries))
+        self.record("suppliers.find_matching", pages,
+                    measure(lambda: database.find_matching_suppliers(materials), self.runs),
+                    materials=len(materials))
+    
+    def report(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        تقرير القياس القابل للمقارنة
+        """
+        return {
+            "version": REPORT_VERSION,
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "args": args,
+            "results": self.results
+        }
+
+
+def _git_commit() -> Optional[str]:
+    """
+    معرف الإصدار الحالي في git (إن وجد)
+    """
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=PROJECT_ROOT, check=True, capture_output=True, text=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare_reports(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float,
+                    min_delta_s: float = 0.005) -> List[Dict[str, Any]]:
+    """
+    مقارنة تقريرين حسب الحالة وعدد الصفحات
+    
+    المعاملات:
+    ----------
+    current : Dict[str, Any]
+        التقرير الحالي
+    baseline : Dict[str, Any]
+        التقرير السابق
+    threshold : float
+        نسبة الزمن (الحالي إلى السابق) التي يُعد تجاوزها تراجعاً
+    min_delta_s : float, optional
+        أقل زيادة في الزمن بالثواني تُعد تراجعاً (لتجاهل تذبذب الحالات القصيرة جداً، افتراضي: 0.005)
+    
+    المخرجات:
+    --------
+    List[Dict[str, Any]]
+        لكل حالة مشتركة: الاسم وعدد الصفحات والزمنان والنسبة و regression
+    """
+    previous = {(entry["name"], entry["pages"]): entry for entry in baseline.get("results", [])}
+    comparison = []
+    for entry in current.get("results", []):
+        before = previous.get((entry["name"], entry["pages"]))
+        if before is None:
+            continue
+        ratio = entry["median_s"] / before["median_s"] if before["median_s"] else 1.0
+        comparison.append({
+            "name": entry["name"],
+            "pages": entry["pages"],
+            "baseline_s": before["median_s"],
+            "current_s": entry["median_s"],
+            "ratio": round(ratio, 3),
+            "regression": ratio > threshold and entry["median_s"] - before["median_s"] > min_delta_s
+        })
+    return comparison
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="قياس أداء معالجة المناقصات من البداية إلى النهاية")
+    parser.add_argument("--pages", type=int, nargs="+", default=[10, 100, 500],
+                        help="أحجام المناقصات بالصفحات (افتراضي: 10 100 500، ويدعم حتى 2000)")
+    parser.add_argument("--formats", nargs="+", choices=FORMATS, default=list(FORMATS), help="صيغ المستندات (افتراضي: جميعها)")
+    parser.add_argument("--runs", type=int, default=3, help="عدد التكرارات لكل حالة (افتراضي: 3)")
+    parser.add_argument("--seed", type=int, default=42, help="بذرة توليد المناقصات (افتراضي: 42)")
+    parser.add_argument("--corpus-dir", default=os.path.join("data", "benchmarks", "corpus"),
+                        help="مجلد حفظ المستندات المولدة (افتراضي: data/benchmarks/corpus)")
+    parser.add_argument("--output", help="مسار تقرير JSON (افتراضي: data/benchmarks/report_<commit>.json)")
+    parser.add_argument("--compare", help="تقرير سابق للمقارنة")
+    parser.add_argument("--threshold", type=float, default=1.25, help="نسبة التراجع المسموحة عند المقارنة (افتراضي: 1.25)")
+    parser.add_argument("--min-delta-ms", type=float, default=5.0,
+                        help="أقل زيادة في الزمن بالمللي ثانية تُعد تراجعاً (افتراضي: 5)")
+    parser.add_argument("--skip", nargs="*", choices=["documents", "analyzers", "suppliers"], default=[],
+                        help="مجموعات الحالات المستبعدة")
+    args = parser.parse_args(argv)
+    
+    benchmark = TenderBenchmark(args.runs, args.seed, args.corpus_dir)
+    for pages in args.pages:
+        if "documents" not in args.skip:
+            benchmark.run_documents(pages, args.formats)
+        if "analyzers" not in args.skip:
+            benchmark.run_analyzers(pages)
+        if "suppliers" not in args.skip:
+            benchmark.run_suppliers(pages)
+    
+    report = benchmark.report({key: value for key, value in vars(args).items() if key not in ("output", "compare")})
+    output = args.output or os.path.join("data", "benchmarks", f"report_{report['commit'] or 'local'}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"تم حفظ التقرير: {output}")
+    
+    if not args.compare:
+        return 0
+    
+    with open(args.compare, encoding="utf-8") as f:
+        baseline = json.load(f)
+    comparison = compare_reports(report, baseline, args.threshold, args.min_delta_ms / 1000)
+    print(f"المقارنة مع {baseline.get('commit') or args.compare}:")
+    for entry in comparison:
+        marker = "  <-- تراجع" if entry["regression"] else ""
+        print(f"{entry['name']:>34} {entry['pages']:>6} صفحة: {entry['baseline_s'] * 1000:10.1f} -> "
+              f"{entry['current_s'] * 1000:10.1f} مللي ثانية ({entry['ratio']:.2f}x){marker}")
+    
+    return 1 if any(entry["regression"] for entry in comparison) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,527 @@
+"""
+مولّد مستندات مناقصات عربية اصطناعية لقياس الأداء
+يبني مناقصة واقعية البنية (صفحة غلاف بالبيانات الأساسية والتواريخ، أبواب ومواد بشروط ومتطلبات ومخاطر،
+قسم للمحتوى المحلي، وجداول كميات) بعدد الصفحات المطلوب (من 10 إلى 2000 صفحة)، ويكتبها بصيغ TXT و DOCX و PDF و XLSX.
+المحتوى حتمي لكل بذرة وعدد صفحات، فتقيس جميع الإصدارات المستندات نفسها
+
+الاستخدام:
+    python benchmarks/tender_corpus.py [--pages 10 100 500] [--formats txt docx pdf xlsx] [--output data/benchmarks/corpus]
+"""
+
+import io
+import os
+import sys
+import random
+import argparse
+from datetime import date, timedelta
+from typing import Dict, List, Any, Optional
+
+# صيغ الملفات المدعومة
+FORMATS = ("txt", "docx", "pdf", "xlsx")
+
+# عدد الكتل (عناوين وفقرات) في صفحة الشروط
+BLOCKS_PER_PAGE = 32
+
+# عدد الأحرف في السطر الواحد عند كتابة ملفات PDF
+PDF_LINE_CHARS = 95
+
+# عدد صفوف جدول الكميات في صفحة الجداول
+BOQ_ROWS_PER_PAGE = 30
+
+# عناوين أعمدة جدول الكميات (تطابق أسماء الأعمدة التي يتعرف عليها معالج المستندات)
+BOQ_HEADERS = ["رقم البند", "الوصف", "الوحدة", "الكمية", "سعر الوحدة", "الإجمالي"]
+
+# خطوط تحتوي على الحروف العربية لكتابة ملفات PDF بنص قابل للاستخراج (يمكن تحديد غيرها بمتغير البيئة BENCHMARK_PDF_FONT)
+PDF_FONT_CANDIDATES = [
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+    "/usr/share/fonts/dejavu/DejaVuSans.ttf",
+    "/usr/share/fonts/truetype/noto/NotoNaskhArabic-Regular.ttf",
+    "/Library/Fonts/Arial Unicode.ttf",
+    "/System/Library/Fonts/Supplemental/Arial Unicode.ttf",
+    "C:/Windows/Fonts/arial.ttf"
+]
+
+PROJECTS = [
+    ("إنشاء مجمع مدارس", "الرياض", "وزارة التعليم", "التعليم"),
+    ("إنشاء مستشفى عام بسعة 300 سرير", "الدمام", "وزارة الصحة", "الرعاية الصحية"),
+    ("تطوير الطريق الدائري وتقاطعاته", "جدة", "وزارة النقل والخدمات اللوجستية", "البنية التحتية"),
+    ("إنشاء محطة معالجة مياه الصرف", "المدينة المنورة", "شركة المياه الوطنية", "المياه"),
+    ("إنشاء مبنى إداري للأمانة", "أبها", "أمانة منطقة عسير", "المباني الحكومية"),
+    ("تنفيذ شبكات الكهرباء للحي السكني", "تبوك", "الشركة السعودية للكهرباء", "الطاقة")
+]
+
+CHAPTERS = [
+    "الشروط العامة", "الشروط الخاصة", "المواصفات الفنية للأعمال المدنية", "المواصفات الفنية للأعمال الكهربائية",
+    "المواصفات الفنية للأعمال الميكانيكية", "متطلبات الجودة والسلامة", "الضمانات والتأمين", "شروط الدفع",
+    "إدارة المشروع والتقارير", "الاستلام والتسليم"
+]
+
+ORDINALS = ["الأول", "الثاني", "الثالث", "الرابع", "الخامس", "السادس", "السابع", "الثامن", "التاسع", "العاشر"]
+
+ARTICLE_TITLES = [
+    "نطاق الأعمال", "التزامات المقاول", "المواد والمعدات", "الجدول الزمني", "غرامات التأخير", "الضمان البنكي",
+    "التأمين", "الاختبارات والفحص", "المقاولون من الباطن", "الدفعات", "التغييرات في الأعمال", "فسخ العقد"
+]
+
+# قوالب البنود: متطلبات إلزامية وفنية ومالية ومخاطر وتواريخ
+CLAUSES = [
+    "يجب على المقاول تقديم خطة تنفيذ تفصيلية للأعمال خلال {days} يوماً من تاريخ استلام الموقع.",
+    "يلتزم المقاول بتوريد {material} مطابقاً للمواصفات القياسية السعودية واعتماد العينات قبل التوريد.",
+    "يجب أن لا تقل خبرة مدير المشروع عن {years} سنوات في مشاريع مماثلة، مع تقديم السيرة الذاتية للاعتماد.",
+    "تفرض غرامة تأخير بنسبة {percent}% من قيمة العقد عن كل أسبوع تأخير بحد أقصى 10% من قيمة العقد.",
+    "يقدم المقاول ضماناً بنكياً نهائياً بنسبة 5% من قيمة العقد ساري المفعول حتى الاستلام النهائي.",
+    "تصرف الدفعة المقدمة بنسبة {percent}% من قيمة العقد مقابل ضمان بنكي بالقيمة نفسها.",
+    "يتحمل المقاول مخاطر ارتفاع أسعار المواد والعمالة طوال مدة العقد دون تعويض.",
+    "يجب الحصول على جميع التصاريح اللازمة من الجهات المختصة قبل البدء في الأعمال بتاريخ {date}.",
+    "يلتزم المقاول بتطبيق اشتراطات السلامة المهنية وتعيين مشرف سلامة متفرغ في الموقع.",
+    "يجب إجراء اختبارات الضغط لجميع شبكات {material} وتوثيق النتائج في تقارير معتمدة.",
+    "تخضع جميع الأعمال لإشراف المهندس المشرف، ويحق له رفض أي أعمال غير مطابقة للمواصفات.",
+    "يلتزم المقاول بتقديم تقرير تقدم شهري يتضمن نسب الإنجاز والمخاطر وخطط المعالجة.",
+    "في حال تأخر صاحب العمل في تسليم الموقع أكثر من {days} يوماً يحق للمقاول طلب تمديد المدة.",
+    "يجب أن تكون المعدات المستخدمة بحالة جيدة وأن لا يزيد عمرها عن {years} سنوات.",
+    "يتم الاستلام الابتدائي بعد اكتمال الأعمال في موعد أقصاه {date}، ويبدأ بعده الضمان لمدة سنة."
+]
+
+LOCAL_CONTENT_CLAUSES = [
+    "يجب ألا تقل نسبة المحتوى المحلي في العقد عن {percent}% وفق آلية هيئة المحتوى المحلي والمشتريات الحكومية.",
+    "يلتزم المقاول باستخدام المنتجات الوطنية المدرجة في القائمة الإلزامية ومنها {material}.",
+    "تمنح الأفضلية السعرية للمنتج الوطني بنسبة 10% عند تقييم العروض المالية.",
+    "يجب أن لا تقل نسبة السعودة في العمالة الفنية عن {percent}% طوال مدة التنفيذ.",
+    "يقدم المقاول خطة المحتوى المحلي متضمنة الموردين المحليين وقيم المشتريات المتوقعة من كل مورد.",
+    "يتم التحقق من نسبة المحتوى المحلي عند كل مستخلص، وتطبق غرامة عند عدم تحقيق النسبة المستهدفة."
+]
+
+# مواد جدول الكميات: (الوصف، الوحدة، نطاق الكمية، نطاق سعر الوحدة)
+BOQ_MATERIALS = [
+    ("خرسانة مسلحة للأساسات مقاومة 35 نيوتن", "م3", (50, 2000), (650, 900)),
+    ("حديد تسليح مقاس 16 مم", "طن", (10, 400), (2800, 3400)),
+    ("أسمنت بورتلاندي عادي", "طن", (20, 800), (280, 350)),
+    ("بلوك أسمنتي معزول مقاس 20 سم", "م2", (200, 9000), (45, 70)),
+    ("أنابيب PVC للصرف قطر 160 مم", "م.ط", (100, 5000), (35, 60)),
+    ("كابلات كهربائية نحاسية 4×95 مم2", "م.ط", (100, 6000), (180, 260)),
+    ("لوحات توزيع كهربائية رئيسية", "عدد", (1, 40), (8000, 25000)),
+    ("دهانات داخلية أكريليك", "م2", (500, 20000), (18, 30)),
+    ("عزل مائي للأسطح بالرولات", "م2", (300, 8000), (40, 65)),
+    ("بلاط سيراميك للأرضيات", "م2", (300, 12000), (60, 110)),
+    ("أبواب خشبية داخلية", "عدد", (10, 600), (900, 1800)),
+    ("وحدات تكييف مركزي", "عدد", (2, 60), (35000, 90000)),
+    ("أسفلت طبقة سطحية سماكة 5 سم", "م2", (1000, 50000), (30, 45)),
+    ("مضخات مياه طرد مركزي", "عدد", (1, 20), (12000, 40000)),
+    ("ألواح ألمنيوم للواجهات", "م2", (100, 6000), (350, 600))
+]
+
+SUPPLIER_NAMES = ["مصنع", "شركة", "مؤسسة", "مجموعة"]
+SUPPLIER_REGIONS = ["الرياض", "مكة المكرمة", "المنطقة الشرقية", "المدينة المنورة", "القصيم", "عسير", "تبوك", "جازان"]
+SUPPLIER_CATEGORIES = ["مواد البناء", "المواد الكهربائية", "المواد الميكانيكية", "التشطيبات", "الطرق"]
+
+
+def generate_tender(pages: int, seed: int = 42) -> Dict[str, Any]:
+    """
+    توليد محتوى مناقصة اصطناعية بعدد الصفحات المطلوب
+    
+    المعاملات:
+    ----------
+    pages : int
+        عدد الصفحات (الغلاف، ثم قسم المحتوى المحلي، ثم صفحات الشروط وجداول الكميات بنسبة 4 إلى 1 تقريباً)
+    seed : int, optional
+        بذرة التوليد (افتراضي: 42)
+    
+    المخرجات:
+    --------
+    Dict[str, Any]
+        project (بيانات المشروع)، pages (قائمة الصفحات، وكل صفحة قائمة كتل من الأنواع
+        heading و paragraph و table)، boq_items (جميع بنود الكميات)
+    """
+    rng = random.Random(f"{seed}:{pages}")
+    title, location, client, sector = rng.choice(PROJECTS)
+    duration_months = rng.choice([12, 18, 24, 30, 36])
+    tender_date = date(2025, 1, 1) + timedelta(days=rng.randint(0, 300))
+    project = {
+        "title": title,
+        "location": location,
+        "client": client,
+        "sector": sector,
+        "duration_months": duration_months,
+        "tender_date": tender_date,
+        "submission_date": tender_date + timedelta(days=45),
+        "local_content_target": rng.choice([30, 35, 40, 45, 50])
+    }
+    
+    boq_items: List[Dict[str, Any]] = []
+    document_pages = [_cover_page(project, rng)]
+    if pages > 1:
+        document_pages.append(_local_content_page(project, rng))
+    
+    chapter = 0
+    article = 0
+    for page_number in range(len(document_pages), pages):
+        if page_number % 5 == 4:
+            document_pages.append(_boq_page(boq_items, rng))
+            continue
+        
+        blocks = []
+        if page_number % 10 == 2 or chapter == 0:
+            chapter += 1
+            blocks.append({"type": "heading", "level": 1, "text": _chapter_title(chapter)})
+        
+        while len(blocks) < BLOCKS_PER_PAGE:
+            article += 1
+            blocks.append({"type": "heading", "level": 2, "text": f"المادة {article}: {rng.choice(ARTICLE_TITLES)}"})
+            for _ in range(rng.randint(2, 4)):
+                blocks.append({"type": "paragraph", "text": _fill(rng.choice(CLAUSES), project, rng)})
+        document_pages.append(blocks)
+    
+    # ملخص المبالغ في نهاية المستند (تستخدمه محللات التكاليف)
+    total = sum(item["total_price"] for item in boq_items)
+    document_pages[-1].append({"type": "paragraph", "text": f"إجمالي قيمة جداول الكميات: {total:,.2f} ريال"})
+    
+    return {"project": project, "pages": document_pages, "boq_items": boq_items}
+
+
+def _chapter_title(chapter: int) -> str:
+    """
+    عنوان الباب بترتيبه (تتكرر أسماء الأبواب في المستندات الطويلة)
+    """
+    ordinal = ORDINALS[(chapter - 1) % len(ORDINALS)]
+    cycle = (chapter - 1) // len(ORDINALS)
+    suffix = f" ({cycle + 1})" if cycle else ""
+    return f"الباب {ordinal}: {CHAPTERS[(chapter - 1) % len(CHAPTERS)]}{suffix}"
+
+
+def _fill(template: str, project: Dict[str, Any], rng: random.Random) -> str:
+    """
+    تعبئة قالب بند بقيم عشوائية (مادة، نسبة، مدة، تاريخ)
+    """
+    clause_date = project["tender_date"] + timedelta(days=rng.randint(30, project["duration_months"] * 30))
+    return template.format(
+        days=rng.choice([7, 14, 15, 30, 45, 60]),
+        years=rng.choice([3, 5, 7, 10]),
+        percent=rng.choice([1, 2, 5, 10, 20, project["local_content_target"]]),
+        material=rng.choice(BOQ_MATERIALS)[0],
+        date=clause_date.strftime("%Y/%m/%d")
+    )
+
+
+def _cover_page(project: Dict[str, Any], rng: random.Random) -> List[Dict[str, Any]]:
+    """
+    صفحة الغلاف ببيانات المشروع الأساسية
+    """
+    value = rng.randint(5, 400) * 1_000_000
+    lines = [
+        f"اسم المشروع: {project['title']}",
+        f"موقع المشروع: {project['location']}",
+        f"الجهة المالكة: {project['client']}",
+        f"القطاع: {project['sector']}",
+        f"القيمة التقديرية: {value:,} ريال",
+        f"مدة التنفيذ: {project['duration_months']} شهر",
+        f"تاريخ طرح المنافسة: {project['tender_date'].strftime('%Y/%m/%d')}",
+        f"آخر موعد لتقديم العروض: {project['submission_date'].strftime('%Y/%m/%d')}",
+        f"رقم المنافسة: {rng.randint(240000000, 249999999)}"
+    ]
+    blocks = [{"type": "heading", "level": 1, "text": "كراسة الشروط والمواصفات"}]
+    blocks.extend({"type": "paragraph", "text": line} for line in lines)
+    blocks.append({"type": "heading", "level": 1, "text": "نطاق العمل"})
+    blocks.extend({"type": "paragraph", "text": f"- أعمال {material[0]}"} for material in rng.sample(BOQ_MATERIALS, 6))
+    return blocks
+
+
+def _local_content_page(project: Dict[str, Any], rng: random.Random) -> List[Dict[str, Any]]:
+    """
+    قسم متطلبات المحتوى المحلي
+    """
+    blocks = [
+        {"type": "heading", "level": 1, "text": "متطلبات المحتوى المحلي"},
+        {"type": "paragraph", "text": f"نسبة المحتوى المحلي المستهدفة: {project['local_content_target']}%"}
+    ]
+    for template in LOCAL_CONTENT_CLAUSES:
+        blocks.append({"type": "paragraph", "text": _fill(template, project, rng)})
+    blocks.append({"type": "paragraph", "text": "القائمة الإلزامية للمنتجات الوطنية:"})
+    blocks.extend({"type": "paragraph", "text": f"- {material[0]}"} for material in rng.sample(BOQ_MATERIALS, 8))
+    return blocks
+
+
+def _boq_page(boq_items: List[Dict[str, Any]], rng: random.Random) -> List[Dict[str, Any]]:
+    """
+    صفحة جدول كميات (تُضاف بنودها إلى قائمة البنود الكلية)
+    """
+    rows = [list(BOQ_HEADERS)]
+    for _ in range(BOQ_ROWS_PER_PAGE):
+        description, unit, quantity_range, price_range = rng.choice(BOQ_MATERIALS)
+        quantity = rng.randint(*quantity_range)
+        unit_price = round(rng.uniform(*price_range), 2)
+        item = {
+            "id": str(len(boq_items) + 1),
+            "description": description,
+            "unit": unit,
+            "quantity": float(quantity),
+            "unit_price": unit_price,
+            "total_price": round(quantity * unit_price, 2)
+        }
+        boq_items.append(item)
+        rows.append([item["id"], description, unit, str(quantity), f"{unit_price:.2f}", f"{item['total_price']:.2f}"])
+    return [{"type": "heading", "level": 1, "text": "جدول الكميات والأسعار"}, {"type": "table", "rows": rows}]
+
+
+def generate_suppliers(count: int, seed: int = 42) -> Dict[str, Any]:
+    """
+    توليد قاعدة موردين ومنتجات اصطناعية لقياس مسارات مطابقة الموردين
+    
+    المعاملات:
+    ----------
+    count : int
+        عدد الموردين
+    seed : int, optional
+        بذرة التوليد (افتراضي: 42)
+    
+    المخرجات:
+    --------
+    Dict[str, Any]
+        suppliers (بالصيغة التي تحملها SuppliersDatabase) و products (قاموس المنتجات بمعرفاتها)
+    """
+    rng = random.Random(f"suppliers:{seed}:{count}")
+    products = {}
+    for index, (description, _, _, _) in enumerate(BOQ_MATERIALS):
+        product_id = f"P{index + 1:04d}"
+        products[product_id] = {
+            "id": product_id,
+            "name": description,
+            "category": rng.choice(SUPPLIER_CATEGORIES),
+            "availability_percentage": rng.randint(20, 100)
+        }
+    
+    suppliers = []
+    for index in range(count):
+        suppliers.append({
+            "id": f"S{index + 1:04d}",
+            "name": f"{rng.choice(SUPPLIER_NAMES)} {rng.choice(SUPPLIER_REGIONS)} {index + 1} للصناعة",
+            "category": rng.choice(SUPPLIER_CATEGORIES),
+            "region": rng.choice(SUPPLIER_REGIONS),
+            "products": [material[0] for material in rng.sample(BOQ_MATERIALS, rng.randint(1, 4))],
+            "reliability": round(rng.uniform(2.5, 5.0), 1)
+        })
+    
+    return {"suppliers": suppliers, "products": products}
+
+
+def render_text(tender: Dict[str, Any]) -> str:
+    """
+    تحويل المناقصة إلى نص (الصيغة التي تصل إلى المحللات بعد الاستخراج)
+    """
+    lines = []
+    for page in tender["pages"]:
+        for block in page:
+            if block["type"] == "table":
+                lines.extend(" | ".join(row) for row in block["rows"])
+            elif block["type"] == "heading":
+                lines.append("")
+                lines.append(block["text"])
+            else:
+                lines.append(block["text"])
+        lines.append("\f")
+    return "\n".join(lines)
+
+
+def write_txt(tender: Dict[str, Any]) -> bytes:
+    """
+    كتابة المناقصة كملف نصي بترميز UTF-8
+    """
+    return render_text(tender).encode("utf-8")
+
+
+def write_docx(tender: Dict[str, Any]) -> bytes:
+    """
+    كتابة المناقصة كمستند Word (عناوين بأنماط العناوين، وجداول كميات حقيقية، وفاصل صفحة بعد كل صفحة)
+    """
+    import docx
+    
+    document = docx.Document()
+    for page_index, page in enumerate(tender["pages"]):
+        for block in page:
+            if block["type"] == "heading":
+                document.add_heading(block["text"], level=block["level"])
+            elif block["type"] == "paragraph":
+                document.add_paragraph(block["text"])
+            else:
+                rows = block["rows"]
+                table = document.add_table(rows=0, cols=len(rows[0]))
+                for row in rows:
+                    for cell, value in zip(table.add_row().cells, row):
+                        cell.text = value
+        if page_index < len(tender["pages"]) - 1:
+            document.add_page_break()
+    
+    output = io.BytesIO()
+    document.save(output)
+    return output.getvalue()
+
+
+def find_pdf_font() -> Optional[str]:
+    """
+    البحث عن خط يحتوي على الحروف العربية لكتابة ملفات PDF
+    """
+    candidates = [os.getenv("BENCHMARK_PDF_FONT")] + PDF_FONT_CANDIDATES
+    return next((path for path in candidates if path and os.path.exists(path)), None)
+
+
+def write_pdf(tender: Dict[str, Any], font_path: Optional[str] = None) -> bytes:
+    """
+    كتابة المناقصة كملف PDF بطبقة نصية (جداول الكميات بحدود خلايا ليكتشفها مستخرج الجداول)
+    
+    المعاملات:
+    ----------
+    tender : Dict[str, Any]
+        المناقصة المولدة
+    font_path : str, optional
+        مسار خط يحتوي على الحروف العربية (افتراضي: البحث في مسارات الخطوط المعتادة)
+    
+    المخرجات:
+    --------
+    bytes
+        محتوى الملف (يفشل مع RuntimeError إذا لم يوجد خط عربي)
+    """
+    import fitz  # PyMuPDF
+    
+    font_path = font_path or find_pdf_font()
+    if font_path is None:
+        raise RuntimeError("لم يتم العثور على خط عربي لكتابة ملفات PDF، حدد مساره في BENCHMARK_PDF_FONT")
+    font = fitz.Font(fontfile=font_path)
+    
+    document = fitz.open()
+    for page in tender["pages"]:
+        pdf_page = document.new_page()
+        writer = fitz.TextWriter(pdf_page.rect)
+        shape = pdf_page.new_shape()
+        y = 50
+        for block in page:
+            if block["type"] == "table":
+                widths = [50, 200, 45, 55, 65, 85]
+                for row in block["rows"]:
+                    x = 40
+                    for width, value in zip(widths, row):
+                        shape.draw_rect(fitz.Rect(x, y, x + width, y + 16))
+                        writer.append((x + 3, y + 12), value[:38], font=font, fontsize=7)
+                        x += width
+                    y += 16
+                y += 6
+                continue
+            
+            fontsize = 12 if block["type"] == "heading" else 9
+            for line in _wrap(block["text"], PDF_LINE_CHARS):
+                if y > pdf_page.rect.height - 40:
+                    # نقل ما يتجاوز الصفحة إلى صفحة جديدة
+                    shape.finish(color=(0, 0, 0), width=0.5)
+                    shape.commit()
+                    writer.write_text(pdf_page)
+                    pdf_page = document.new_page()
+                    writer = fitz.TextWriter(pdf_page.rect)
+                    shape = pdf_page.new_shape()
+                    y = 50
+                writer.append((40, y + fontsize), line, font=font, fontsize=fontsize)
+                y += fontsize + 4
+            y += 4
+        
+        shape.finish(color=(0, 0, 0), width=0.5)
+        shape.commit()
+        writer.write_text(pdf_page)
+    
+    content = document.tobytes(garbage=3, deflate=True)
+    document.close()
+    return content
+
+
+def _wrap(text: str, width: int) -> List[str]:
+    """
+    تقسيم النص إلى أسطر لا تتجاوز العرض المحدد دون قطع الكلمات
+    """
+    lines, current = [], ""
+    for word in text.split():
+        if current and len(current) + len(word) + 1 > width:
+            lines.append(current)
+            current = word
+        else:
+            current = f"{current} {word}" if current else word
+    lines.append(current)
+    return lines
+
+
+def write_xlsx(tender: Dict[str, Any]) -> bytes:
+    """
+    كتابة المناقصة كمصنف Excel: ورقة للشروط (سطر لكل كتلة) وورقة لجدول الكميات
+    """
+    from openpyxl import Workbook
+    
+    workbook = Workbook(write_only=True)
+    terms = workbook.create_sheet("الشروط")
+    for page in tender["pages"]:
+        for block in page:
+            if block["type"] != "table":
+                terms.append([block["text"]])
+    
+    boq = workbook.create_sheet("جدول الكميات")
+    boq.append(BOQ_HEADERS)
+    for item in tender["boq_items"]:
+        boq.append([int(item["id"]), item["description"], item["unit"], item["quantity"],
+                    item["unit_price"], item["total_price"]])
+    
+    output = io.BytesIO()
+    workbook.save(output)
+    return output.getvalue()
+
+
+WRITERS = {"txt": write_txt, "docx": write_docx, "pdf": write_pdf, "xlsx": write_xlsx}
+
+
+def build_document(pages: int, file_format: str, seed: int = 42, corpus_dir: Optional[str] = None) -> bytes:
+    """
+    إنشاء مستند المناقصة بالصيغة المطلوبة (مع حفظه وإعادة استخدامه من مجلد المجموعة إذا حُدد)
+    
+    المعاملات:
+    ----------
+    pages : int
+        عدد الصفحات
+    file_format : str
+        الصيغة (txt أو docx أو pdf أو xlsx)
+    seed : int, optional
+        بذرة التوليد (افتراضي: 42)
+    corpus_dir : str, optional
+        مجلد حفظ المستندات المولدة (افتراضي: بدون حفظ)
+    
+    المخرجات:
+    --------
+    bytes
+        محتوى الملف
+    """
+    if file_format not in WRITERS:
+        raise ValueError(f"صيغة غير مدعومة: {file_format}")
+    
+    path = os.path.join(corpus_dir, f"tender_{seed}_{pages}p.{file_format}") if corpus_dir else None
+    if path and os.path.exists(path):
+        with open(path, "rb") as f:
+            return f.read()
+    
+    content = WRITERS[file_format](generate_tender(pages, seed))
+    if path:
+        os.makedirs(corpus_dir, exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(content)
+    return content
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="توليد مستندات مناقصات عربية اصطناعية")
+    parser.add_argument("--pages", type=int, nargs="+", default=[10, 100, 500], help="أعداد الصفحات (افتراضي: 10 100 500)")
+    parser.add_argument("--formats", nargs="+", choices=FORMATS, default=list(FORMATS), help="الصيغ (افتراضي: جميعها)")
+    parser.add_argument("--seed", type=int, default=42, help="بذرة التوليد (افتراضي: 42)")
+    parser.add_argument("--output", default=os.path.join("data", "benchmarks", "corpus"), help="مجلد الحفظ")
+    args = parser.parse_args(argv)
+    
+    for pages in args.pages:
+        for file_format in args.formats:
+            content = build_document(pages, file_format, args.seed, args.output)
+            print(f"tender_{args.seed}_{pages}p.{file_format}: {len(content) / 1024:,.0f} كيلوبايت")
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -50,6 +50,44 @@ LOCAL_CONTENT = {
     }
 }
 
+# إعدادات معالجة المستندات
+DOCUMENT_PROCESSING = {
+    "pdf_workers": int(os.getenv("PDF_WORKERS", str(os.cpu_count() or 1))),
+    "parallel_min_pages": int(os.getenv("PDF_PARALLEL_MIN_PAGES", "50")),
+    "ocr_min_chars": int(os.getenv("OCR_MIN_CHARS", "20")),
+    "ocr_min_glyph_coverage": float(os.getenv("OCR_MIN_GLYPH_COVERAGE", "0.01")),
+    "ocr_dpi": int(os.getenv("OCR_DPI", "300")),
+    "ocr_workers": int(os.getenv("OCR_WORKERS", str(os.cpu_count() or 1))),
+    "cache_enabled": os.getenv("EXTRACTION_CACHE", "True").lower() in ("true", "1", "t"),
+    "cache_dir": os.path.join(DATA_DIR, "processed"),
+    "cache_max_size_mb": float(os.getenv("EXTRACTION_CACHE_MAX_MB", "500")),
+    "in_memory": os.getenv("PROCESS_IN_MEMORY", "True").lower() in ("true", "1", "t"),
+    "csv_chunk_size": int(os.getenv("CSV_CHUNK_SIZE", "50000")),
+    "extract_tables": os.getenv("EXTRACT_TABLES", "True").lower() in ("true", "1", "t"),
+    "ingest_workers": int(os.getenv("INGEST_WORKERS", str(os.cpu_count() or 1)))
+}
+
+# إعدادات خط تحليل المناقصة (0 = مرحلة لكل خيط)
+ANALYSIS_PIPELINE = {
+    "pipeline_workers": int(os.getenv("PIPELINE_WORKERS", "0")),
+    "pipeline_executor": os.getenv("PIPELINE_EXECUTOR", "thread")
+}
+
+# إعدادات تحليل أداء تشغيل واحد عند الطلب (ملفات .prof ولقطات الذاكرة في مجلد السجلات)
+PROFILING = {
+    "enabled": os.getenv("PROFILING", "False").lower() in ("true", "1", "t"),
+    "output_dir": LOGS_DIR,
+    "top_n": int(os.getenv("PROFILE_TOP_N", "25"))
+}
+
+# إعدادات قاعدة بيانات الموردين (ملف الفهارس المبني مسبقاً يُعاد بناؤه عند تغير ملفات المصدر)
+SUPPLIERS_DATABASE = {
+    "suppliers_file": os.path.join(TEMPLATES_DIR, "local_suppliers.json"),
+    "products_file": os.path.join(TEMPLATES_DIR, "local_materials.json"),
+    "index_artifact": os.getenv("SUPPLIERS_INDEX_ARTIFACT", "True").lower() in ("true", "1", "t"),
+    "index_artifact_path": os.path.join(DATA_DIR, "indexes", "suppliers_index.pkl")
+}
+
 # إعدادات واجهة المستخدم
 UI_SETTINGS = {
     "theme": os.getenv("UI_THEME", "light"),
@@ -98,6 +136,10 @@ def get_config(section: str = None) -> Dict[str, Any]:
         "api_keys": API_KEYS,
         "ai_models": AI_MODELS,
         "local_content": LOCAL_CONTENT,
+        "document_processing": DOCUMENT_PROCESSING,
+        "analysis_pipeline": ANALYSIS_PIPELINE,
+        "profiling": PROFILING,
+        "suppliers_database": SUPPLIERS_DATABASE,
         "ui": UI_SETTINGS,
         "db": DB_SETTINGS
     }
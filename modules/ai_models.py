@@ -8,6 +8,9 @@ from datetime import datetime
 from dotenv import load_dotenv
 import os
 
+from utils.keyword_matcher import get_keyword_matcher
+from utils.tracing import current_span, traced
+
 # تحميل المتغيرات البيئية
 load_dotenv()
 
@@ -373,10 +376,14 @@ class LLMProcessor:
         
         return prompt
     
+    @traced("llm.call")
     def _call_llm(self, prompt: str) -> str:
         """
         استدعاء نموذج اللغة الكبيرة
         """
+        trace = current_span()
+        trace.set("model", self.model_name)
+        trace.add_count("prompt_chars", len(prompt))
         try:
             # استدعاء واجهة برمجة التطبيقات Anthropic
             headers = {
@@ -400,8 +407,13 @@ class LLMProcessor:
                 json=data
             )
             
+            trace.set("status_code", response.status_code)
             if response.status_code == 200:
                 result = response.json()
+                trace.add_count("response_chars", len(result["content"][0]["text"]))
+                for counter, tokens in result.get("usage", {}).items():
+                    if isinstance(tokens, int):
+                        trace.add_count(counter, tokens)
                 return result["content"][0]["text"]
             else:
                 print(f"Error calling LLM API: {response.status_code}, {response.text}")
@@ -651,17 +663,18 @@ class ArabicBERTModel:
             "محتوى محلي", "توطين", "متطلبات", "مخاطر", "تكاليف", "سعر", "عمالة"
         ]
         
-        # اختيار كلمات مفتاحية عشوائية من النص
-        words = text.split()
+        # عدّ جميع الكلمات المفتاحية في مرور واحد على النص
+        counts = get_keyword_matcher(potential_keywords, whole_words=True).count(text)
+        word_count = len(text.split())
         selected_keywords = []
         
         for keyword in potential_keywords:
-            if keyword in words and len(selected_keywords) < top_n:
-                count = words.count(keyword)
+            count = counts[keyword]
+            if count and len(selected_keywords) < top_n:
                 selected_keywords.append({
                     "keyword": keyword,
                     "count": count,
-                    "importance": round(count / len(words) * 10, 2)
+                    "importance": round(count / word_count * 10, 2)
                 })
         
         # ترتيب الكلمات المفتاحية حسب الأهمية
@@ -0,0 +1,270 @@
+"""
+خط تحليل المناقصة
+يعرّف كل مرحلة تحليل بمدخلاتها (مدخلات المستند أو مخرجات مراحل أخرى) كرسم بياني موجه غير دوري،
+ويشغّل المراحل المستقلة بالتوازي فيصبح زمن التحليل الكلي قريباً من زمن أطول مسار بدلاً من مجموع أزمنة المراحل
+"""
+
+import time
+import contextvars
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, FIRST_COMPLETED, wait
+from functools import partial
+from typing import Dict, List, Any, Callable, Iterable, Optional, Tuple
+
+from utils.tracing import span
+from utils.profiling import profile_stage
+
+
+def _run_stage(name: str, function: Callable, args: Tuple[Any, ...]) -> Tuple[Any, float]:
+    """
+    تنفيذ مرحلة وقياس زمنها (تُستدعى داخل الخيط أو العملية المنفذة)
+    """
+    started = time.perf_counter()
+    with span(f"pipeline.{name}"), profile_stage(name):
+        output = function(*args)
+    return output, time.perf_counter() - started
+
+
+def _analyze_with_options(method: Callable, extracted_data: Dict[str, Any],
+                          project_data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    استدعاء محلل يقبل بيانات المشروع كمعاملات إضافية (مثل نوع المشروع والميزانية والمدة)
+    """
+    return method(extracted_data, **(project_data or {}))
+
+
+class TenderAnalysisPipeline:
+    """
+    تشغيل مراحل تحليل المناقصة حسب اعتمادياتها، مع تنفيذ المراحل المستقلة بالتوازي
+    """
+    
+    def __init__(self, config=None):
+        """
+        تهيئة خط التحليل
+        
+        المعاملات:
+        ----------
+        config : Dict, optional
+            إعدادات خط التحليل:
+            pipeline_workers (عدد المراحل المنفذة في الوقت نفسه، افتراضياً جميع المراحل)،
+            pipeline_executor ("thread" افتراضياً لأن معظم المراحل تنتظر نماذج اللغة، أو "process"
+            للمراحل الحسابية بشرط أن تكون دوالها ومحللاتها قابلة للنقل بين العمليات)
+        """
+        self.config = config or {}
+        self.workers = int(self.config.get("pipeline_workers") or 0)
+        self.executor = self.config.get("pipeline_executor", "thread")
+        if self.executor not in ("thread", "process"):
+            raise ValueError(f"نوع المنفذ غير مدعوم: {self.executor}")
+        
+        # المراحل بترتيب إضافتها: الاسم -> {function, inputs}
+        self.stages: Dict[str, Dict[str, Any]] = {}
+    
+    def add_stage(self, name: str, function: Callable, inputs: Iterable[str] = ()) -> "TenderAnalysisPipeline":
+        """
+        إضافة مرحلة إلى خط التحليل
+        
+        المعاملات:
+        ----------
+        name : str
+            اسم المرحلة (وهو أيضاً اسم مخرجها الذي يمكن أن تعتمد عليه مراحل أخرى)
+        function : Callable
+            دالة المرحلة، تُستدعى بقيم المدخلات بالترتيب نفسه
+        inputs : Iterable[str], optional
+            أسماء المدخلات: مدخلات الخط أو أسماء مراحل أخرى
+        
+        المخرجات:
+        --------
+        TenderAnalysisPipeline
+            خط التحليل نفسه (لتسلسل الإضافات)
+        """
+        if name in self.stages:
+            raise ValueError(f"المرحلة {name} مضافة مسبقاً")
+        self.stages[name] = {"function": function, "inputs": tuple(inputs)}
+        return self
+    
+    def execution_order(self, available_inputs: Iterable[str] = ()) -> List[List[str]]:
+        """
+        ترتيب المراحل في مستويات، مراحل كل مستوى مستقلة عن بعضها
+        
+        المعاملات:
+        ----------
+        available_inputs : Iterable[str], optional
+            أسماء مدخلات الخط المتوفرة
+        
+        المخرجات:
+        --------
+        List[List[str]]
+            المستويات بالترتيب (يفشل مع ValueError عند وجود مدخل غير معروف أو اعتمادية دورية)
+        """
+        available = set(available_inputs)
+        for name, stage in self.stages.items():
+            missing = [item for item in stage["inputs"] if item not in available and item not in self.stages]
+            if missing:
+                raise ValueError(f"مدخلات غير متوفرة للمرحلة {name}: {', '.join(missing)}")
+        
+        levels = []
+        done = set()
+        remaining = list(self.stages)
+        while remaining:
+            level = [name for name in remaining
+                     if all(item in done or item not in self.stages for item in self.stages[name]["inputs"])]
+            if not level:
+                raise ValueError(f"اعتمادية دورية بين المراحل: {', '.join(remaining)}")
+            levels.append(level)
+            done.update(level)
+            remaining = [name for name in remaining if name not in done]
+        
+        return levels
+    
+    def run(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        تشغيل جميع المراحل، وتبدأ كل مرحلة فور توفر مدخلاتها
+        
+        المعاملات:
+        ----------
+        inputs : Dict[str, Any]
+            مدخلات الخط (مثل النص والجداول وبيانات المشروع)
+        
+        المخرجات:
+        --------
+        Dict[str, Any]
+            results (مخرج كل مرحلة ناجحة)، errors (رسالة الخطأ لكل مرحلة فاشلة أو متخطاة)،
+            timings (زمن كل مرحلة بالثواني)، total_time (الزمن الفعلي الكلي)،
+            sequential_time (مجموع أزمنة المراحل، أي زمن التنفيذ المتتابع)
+        """
+        self.execution_order(inputs)
+        with span("pipeline.run", executor=self.executor) as trace:
+            trace.add_count("stages", len(self.stages))
+            return self._run(inputs)
+    
+    def _run(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        تنفيذ المراحل بعد التحقق من الرسم البياني
+        """
+        started = time.perf_counter()
+        
+        values = dict(inputs)
+        results: Dict[str, Any] = {}
+        errors: Dict[str, str] = {}
+        timings: Dict[str, float] = {}
+        
+        pending = dict(self.stages)
+        executor_class = ProcessPoolExecutor if self.executor == "process" else ThreadPoolExecutor
+        workers = max(1, min(self.workers or len(self.stages), len(self.stages)))
+        with executor_class(max_workers=workers) as executor:
+            running = {}
+            
+            while pending or running:
+                # تخطي المراحل التي فشلت إحدى المراحل التي تعتمد عليها
+                for name, stage in list(pending.items()):
+                    failed = next((item for item in stage["inputs"] if item in errors), None)
+                    if failed is not None:
+                        errors[name] = f"تم التخطي لفشل المرحلة {failed}"
+                        del pending[name]
+                
+                # إطلاق المراحل التي توفرت جميع مدخلاتها
+                for name, stage in list(pending.items()):
+                    if all(item in values for item in stage["inputs"]):
+                        args = tuple(values[item] for item in stage["inputs"])
+                        if self.executor == "thread":
+                            # نسخ السياق لتظهر نطاقات تتبع المرحلة داخل نطاق خط التحليل وتُحلَّل ضمن جلسة تحليل الأداء
+                            future = executor.submit(contextvars.copy_context().run, _run_stage,
+                                                     name, stage["function"], args)
+                        else:
+                            future = executor.submit(_run_stage, name, stage["function"], args)
+                        running[future] = name
+                        del pending[name]
+                
+                if not running:
+                    break
+                
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    try:
+                        output, elapsed = future.result()
+                        values[name] = results[name] = output
+                        timings[name] = elapsed
+                    except Exception as e:
+                        errors[name] = f"خطأ في مرحلة {name}: {str(e)}"
+        
+        return {
+            "results": results,
+            "errors": errors,
+            "timings": timings,
+            "total_time": time.perf_counter() - started,
+            "sequential_time": sum(timings.values())
+        }
+    
+    def run_document(self, extracted_data: Dict[str, Any],
+                     project_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        تشغيل خط التحليل على نتيجة معالج المستندات
+        
+        المعاملات:
+        ----------
+        extracted_data : Dict[str, Any]
+            البيانات المستخرجة من المستند (نتيجة DocumentProcessor.process_document)
+        project_data : Dict[str, Any], optional
+            بيانات المشروع (نوع المشروع، الميزانية، الموقع، المدة)
+        
+        المخرجات:
+        --------
+        Dict[str, Any]
+            نتيجة run
+        """
+        return self.run({
+            "text": extracted_data.get("text", ""),
+            "tables": extracted_data.get("tables") or None,
+            "boq_items": extracted_data.get("boq_items") or None,
+            "extracted_data": extracted_data,
+            "project_data": project_data or {}
+        })
+    
+    @classmethod
+    def from_analyzers(cls, requirement_analyzer=None, cost_estimator=None, risk_analyzer=None,
+                       local_content_analyzer=None, schedule_analyzer=None, supply_chain_analyzer=None,
+                       config=None) -> "TenderAnalysisPipeline":
+        """
+        إنشاء خط التحليل من محللات المناقصة (تُضاف مرحلة لكل محلل محدد فقط)
+        
+        المعاملات:
+        ----------
+        requirement_analyzer : analysis.requirement_analyzer.RequirementAnalyzer, optional
+            محلل المتطلبات (المرحلة requirements)
+        cost_estimator : analysis.cost_estimator.CostEstimator, optional
+            مقدّر التكاليف (المرحلة costs)
+        risk_analyzer : analysis.risk_analyzer.RiskAnalyzer, optional
+            محلل المخاطر (المرحلة risks)
+        local_content_analyzer : analysis.local_content_analyzer.LocalContentAnalyzer, optional
+            محلل المحتوى المحلي (المرحلة local_content)
+        schedule_analyzer : modules.schedule_analyzer.ScheduleAnalyzer, optional
+            محلل الجدول الزمني (المرحلة schedule)
+        supply_chain_analyzer : modules.supply_chain.SupplyChainAnalyzer, optional
+            محلل سلسلة الإمداد (المرحلة supply_chain)
+        config : Dict, optional
+            إعدادات خط التحليل
+        
+        المخرجات:
+        --------
+        TenderAnalysisPipeline
+            خط التحليل
+        """
+        pipeline = cls(config)
+        
+        # جميع المحللات تعمل على المستند نفسه دون الاعتماد على مخرجات بعضها، لذا تعمل كلها بالتوازي
+        if requirement_analyzer is not None:
+            pipeline.add_stage("requirements", requirement_analyzer.analyze, ("text",))
+        if cost_estimator is not None:
+            pipeline.add_stage("costs", cost_estimator.estimate, ("text", "tables", "boq_items"))
+        if risk_analyzer is not None:
+            pipeline.add_stage("risks", risk_analyzer.analyze, ("text",))
+        if local_content_analyzer is not None:
+            pipeline.add_stage("local_content", local_content_analyzer.analyze, ("text", "tables", "boq_items"))
+        if schedule_analyzer is not None:
+            pipeline.add_stage("schedule", partial(_analyze_with_options, schedule_analyzer.analyze),
+                               ("extracted_data", "project_data"))
+        if supply_chain_analyzer is not None:
+            pipeline.add_stage("supply_chain", partial(_analyze_with_options, supply_chain_analyzer.analyze),
+                               ("extracted_data", "project_data"))
+        
+        return pipeline
@@ -0,0 +1,302 @@
+import os
+import sys
+import json
+import time
+import zipfile
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from typing import Dict, List, Any, Tuple, Optional
+
+from .document_processor import DocumentProcessor
+
+# أنواع الملفات التي يدعمها معالج المستندات
+SUPPORTED_EXTENSIONS = ("pdf", "docx", "doc", "xlsx", "xls", "csv", "txt")
+
+# معالج المستندات الخاص بكل عملية فرعية (يُنشأ مرة واحدة عند بدء العملية)
+_worker_processor = None
+
+
+def _init_ingest_worker(config: Dict[str, Any]):
+    """
+    تهيئة عملية الإدخال الفرعية بإنشاء معالج مستندات واحد يُعاد استخدامه لجميع ملفاتها
+    """
+    global _worker_processor
+    _worker_processor = DocumentProcessor(config)
+
+
+def _ingest_file(file_ref: Tuple[str, Optional[str]], file_name: str, extension: str) -> Tuple[Dict[str, Any], float]:
+    """
+    قراءة ملف من المجلد أو من داخل ملف ZIP ومعالجته (تُستدعى داخل عملية منفصلة)
+    
+    المعاملات:
+    ----------
+    file_ref : Tuple[str, Optional[str]]
+        مسار الملف، أو مسار ملف ZIP مع اسم العنصر داخله
+    file_name : str
+        اسم الملف النسبي داخل الحزمة
+    extension : str
+        امتداد الملف
+    
+    المخرجات:
+    --------
+    Tuple[Dict[str, Any], float]
+        البيانات المستخرجة وزمن المعالجة بالثواني
+    """
+    started = time.perf_counter()
+    path, member = file_ref
+    try:
+        # قراءة العنصر داخل العملية الفرعية بدلاً من نقل محتواه من العملية الرئيسية
+        if member is None:
+            with open(path, "rb") as f:
+                file_content = f.read()
+        else:
+            with zipfile.ZipFile(path) as archive:
+                file_content = archive.read(member)
+        
+        result = _worker_processor.process_document(file_content, extension, file_name)
+    except Exception as e:
+        result = {"error": f"خطأ في معالجة الملف: {str(e)}"}
+    
+    return result, time.perf_counter() - started
+
+
+class BulkIngestor:
+    """
+    إدخال حزمة مناقصة كاملة (مجلد أو ملف ZIP) ومعالجة ملفاتها بالتوازي
+    """
+    
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        تهيئة أداة الإدخال
+        
+        المعاملات:
+        ----------
+        config : Dict, optional
+            إعدادات معالجة المستندات، ويُضاف إليها ingest_workers (عدد العمليات المتوازية)
+        """
+        self.config = config or {}
+        self.workers = max(1, int(self.config.get("ingest_workers") or os.cpu_count() or 1))
+        
+        # التوازي يكون على مستوى الملفات، لذا يعمل معالج كل عملية فرعية بعملية واحدة
+        # لتجنب إنشاء مجموعات عمليات متداخلة تتجاوز عدد الأنوية
+        self.worker_config = dict(self.config)
+        self.worker_config["pdf_workers"] = 1
+        self.worker_config["ocr_workers"] = 1
+    
+    def list_files(self, path: str) -> List[Tuple[str, Tuple[str, Optional[str]]]]:
+        """
+        سرد ملفات الحزمة من مجلد (بشكل متكرر) أو من ملف ZIP
+        
+        المعاملات:
+        ----------
+        path : str
+            مسار المجلد أو ملف ZIP
+        
+        المخرجات:
+        --------
+        List[Tuple[str, Tuple[str, Optional[str]]]]
+            الاسم النسبي لكل ملف مع مرجعه (المسار، واسم العنصر داخل ZIP إن وجد)
+        """
+        files = []
+        if os.path.isdir(path):
+            for root, dirs, names in os.walk(path):
+                dirs[:] = sorted(d for d in dirs if not d.startswith("."))
+                for name in sorted(names):
+                    if name.startswith("."):
+                        continue
+                    file_path = os.path.join(root, name)
+                    files.append((os.path.relpath(file_path, path).replace(os.sep, "/"), (file_path, None)))
+        elif zipfile.is_zipfile(path):
+            with zipfile.ZipFile(path) as archive:
+                for info in archive.infolist():
+                    # تخطي المجلدات وملفات النظام التي يضيفها macOS
+                    if info.is_dir() or info.filename.startswith("__MACOSX/"):
+                        continue
+                    if os.path.basename(info.filename).startswith("."):
+                        continue
+                    files.append((info.filename, (path, info.filename)))
+        else:
+            raise ValueError(f"المسار {path} ليس مجلداً أو ملف ZIP")
+        
+        return files
+    
+    def ingest(self, path: str) -> Dict[str, Any]:
+        """
+        معالجة جميع ملفات الحزمة ودمج نتائجها
+        
+        المعاملات:
+        ----------
+        path : str
+            مسار المجلد أو ملف ZIP
+        
+        المخرجات:
+        --------
+        Dict[str, Any]
+            نتيجة الحزمة المدمجة (package)، وسجل الملفات (manifest)، وملخص الأداء (summary)
+        """
+        started = time.perf_counter()
+        files = self.list_files(path)
+        
+        manifest = []
+        pending = []
+        for file_name, file_ref in files:
+            extension = os.path.splitext(file_name)[1].lstrip(".").lower()
+            entry = {
+                "file": file_name,
+                "extension": extension,
+                "status": "skipped",
+                "pages": 0,
+                "elapsed_seconds": 0.0
+            }
+            manifest.append(entry)
+            if extension in SUPPORTED_EXTENSIONS:
+                pending.append((entry, file_ref))
+            else:
+                entry["error"] = f"نوع الملف {extension} غير مدعوم"
+        
+        results = {}
+        workers = min(self.workers, len(pending))
+        if workers == 1:
+            _init_ingest_worker(self.worker_config)
+            for entry, file_ref in pending:
+                results[entry["file"]] = _ingest_file(file_ref, entry["file"], entry["extension"])
+        elif workers > 1:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_ingest_worker,
+                                     initargs=(self.worker_config,)) as executor:
+                futures = {
+                    executor.submit(_ingest_file, file_ref, entry["file"], entry["extension"]): entry
+                    for entry, file_ref in pending
+                }
+                for future in as_completed(futures):
+                    entry = futures[future]
+                    try:
+                        results[entry["file"]] = future.result()
+                    except Exception as e:
+                        # فشل العملية الفرعية نفسها (مثل نفاد الذاكرة) لا يوقف بقية الحزمة
+                        results[entry["file"]] = ({"error": f"خطأ في معالجة الملف: {str(e)}"}, 0.0)
+        
+        # دمج النتائج بترتيب ملفات الحزمة
+        package = {"source": os.path.abspath(path), "files": [], "text": "", "tables": [], "boq_items": []}
+        text_parts = []
+        for entry in manifest:
+            if entry["file"] not in results:
+                continue
+            
+            result, elapsed = results[entry["file"]]
+            entry["elapsed_seconds"] = round(elapsed, 4)
+            if "error" in result:
+                entry["status"] = "error"
+                entry["error"] = result["error"]
+                continue
+            
+            entry["status"] = "ok"
+            entry["pages"] = result.get("metadata", {}).get("page_count", 1)
+            entry["from_cache"] = result.get("from_cache", False)
+            entry["tables"] = len(result.get("tables", []))
+            entry["boq_items"] = len(result.get("boq_items", []))
+            
+            package["files"].append(entry["file"])
+            text_parts.append(f"===== {entry['file']} =====\n{result.get('text', '')}")
+            for table in result.get("tables", []):
+                package["tables"].append(dict(table, file=entry["file"]))
+            for item in result.get("boq_items", []):
+                package["boq_items"].append(dict(item, file=entry["file"]))
+        package["text"] = "\n\n".join(text_parts)
+        
+        elapsed = time.perf_counter() - started
+        processed = [entry for entry in manifest if entry["status"] == "ok"]
+        page_total = sum(entry["pages"] for entry in processed)
+        summary = {
+            "files": len(manifest),
+            "processed": len(processed),
+            "failed": sum(1 for entry in manifest if entry["status"] == "error"),
+            "skipped": sum(1 for entry in manifest if entry["status"] == "skipped"),
+            "pages": page_total,
+            "workers": workers,
+            "elapsed_seconds": round(elapsed, 4),
+            "files_per_second": round(len(processed) / elapsed, 3) if elapsed else 0.0,
+            "pages_per_second": round(page_total / elapsed, 3) if elapsed else 0.0,
+            "processed_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        }
+        
+        return {"package": package, "manifest": manifest, "summary": summary}
+    
+    def write_results(self, results: Dict[str, Any], output_dir: str) -> Dict[str, str]:
+        """
+        حفظ نتيجة الحزمة المدمجة وسجل الملفات كملفات JSON
+        
+        المعاملات:
+        ----------
+        results : Dict[str, Any]
+            نتيجة الدالة ingest
+        output_dir : str
+            مجلد الإخراج
+        
+        المخرجات:
+        --------
+        Dict[str, str]
+            مسارات الملفات المحفوظة
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        
+        # تحويل إطارات بيانات الجداول إلى أعمدة وصفوف قابلة للتمثيل في JSON
+        package = dict(results["package"])
+        package["tables"] = [
+            dict(table, data={"columns": list(table["data"].columns), "rows": table["data"].values.tolist()})
+            for table in package["tables"]
+        ]
+        
+        paths = {
+            "package": os.path.join(output_dir, "package.json"),
+            "manifest": os.path.join(output_dir, "manifest.json")
+        }
+        with open(paths["package"], "w", encoding="utf-8") as f:
+            json.dump(package, f, ensure_ascii=False, indent=2, default=str)
+        with open(paths["manifest"], "w", encoding="utf-8") as f:
+            json.dump({"summary": results["summary"], "files": results["manifest"]}, f, ensure_ascii=False, indent=2)
+        
+        return paths
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    نقطة الدخول لسطر الأوامر:
+    python -m modules.bulk_ingestion <مجلد أو ZIP> --output <مجلد الإخراج> [--workers N]
+    """
+    parser = argparse.ArgumentParser(description="إدخال حزمة مناقصة كاملة (مجلد أو ملف ZIP) ومعالجة ملفاتها بالتوازي")
+    parser.add_argument("path", help="مسار مجلد الحزمة أو ملف ZIP")
+    parser.add_argument("--output", "-o", default=None, help="مجلد حفظ package.json و manifest.json")
+    parser.add_argument("--workers", "-w", type=int, default=None, help="عدد العمليات المتوازية")
+    args = parser.parse_args(argv)
+    
+    from config import get_config
+    config = dict(get_config("document_processing"))
+    if args.workers:
+        config["ingest_workers"] = args.workers
+    
+    ingestor = BulkIngestor(config)
+    try:
+        results = ingestor.ingest(args.path)
+    except ValueError as e:
+        print(str(e), file=sys.stderr)
+        return 2
+    
+    output_dir = args.output or os.path.join(
+        get_config("paths").get("data_dir", "data"), "packages",
+        os.path.splitext(os.path.basename(os.path.normpath(args.path)))[0]
+    )
+    paths = ingestor.write_results(results, output_dir)
+    
+    summary = results["summary"]
+    print(f"الملفات: {summary['processed']}/{summary['files']} (فشل {summary['failed']}، تخطي {summary['skipped']})")
+    print(f"الصفحات: {summary['pages']} خلال {summary['elapsed_seconds']:.2f} ثانية بعدد {summary['workers']} عملية")
+    print(f"الإنتاجية: {summary['files_per_second']:.2f} ملف/ثانية، {summary['pages_per_second']:.2f} صفحة/ثانية")
+    print(f"النتائج: {paths['package']}")
+    print(f"السجل: {paths['manifest']}")
+    
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
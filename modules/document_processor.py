@@ -2,33 +2,100 @@ import os
 import re
 import io
 import tempfile
-from typing import Dict, List, Any, Union, Tuple, Optional
+import time
+import codecs
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Any, Union, Tuple, Optional, Iterator, FrozenSet
 import pandas as pd
 import numpy as np
 from datetime import datetime
 
 # المكتبات الخاصة بمعالجة أنواع المستندات المختلفة
 import docx
+from docx.text.paragraph import Paragraph as DocxParagraph
 import PyPDF2
 import fitz  # PyMuPDF
 import pdfplumber
 from openpyxl import load_workbook
+from openpyxl.utils.exceptions import InvalidFileException
 from PIL import Image
 import pytesseract
 
-# المكتبات الخاصة بالمعالجة الطبيعية للغة
-import nltk
-from nltk.tokenize import sent_tokenize, word_tokenize
-from nltk.corpus import stopwords
-from nltk import ngrams
+from .ocr_engine import OCREngine
+from .extraction_cache import ExtractionCache
+from .document_sources import DocumentSource, open_stream, read_bytes, source_path
+
+# موارد المعالجة الطبيعية للغة (تُحمَّل عند أول استخدام مع بديل مضمن عند عدم توفر بيانات NLTK)
+from .nltk_resources import get_stopwords, sent_tokenize, word_tokenize
+from utils.tracing import current_span, traced
+from utils.profiling import profile_stage
+
+
+def _iter_pdf_page_range(source: DocumentSource, start: int, end: int,
+                         extract_tables: bool = True) -> Iterator[Dict[str, Any]]:
+    """
+    استخراج نصوص وجداول نطاق من صفحات ملف PDF صفحة بصفحة مع مؤشرات وجود طبقة نصية
+    
+    المعاملات:
+    ----------
+    source : DocumentSource
+        مسار ملف PDF أو محتواه
+    start : int
+        رقم أول صفحة في النطاق (يبدأ من 0)
+    end : int
+        رقم الصفحة التالية لآخر صفحة في النطاق
+    extract_tables : bool, optional
+        استخراج الجداول بمكتشف جداول pdfplumber (افتراضي: True)
+        
+    المخرجات:
+    --------
+    Iterator[Dict[str, Any]]
+        نص كل صفحة وصفوف جداولها مع عدد الأحرف ونسبة تغطية الأحرف والصور لمساحة الصفحة وزمن الاستخراج
+    """
+    with pdfplumber.open(open_stream(source)) as pdf:
+        for page_index in range(start, end):
+            started = time.perf_counter()
+            page = pdf.pages[page_index]
+            page_text = page.extract_text() or ""
+            page_area = float(page.width * page.height) or 1.0
+            
+            # نسبة المساحة التي تغطيها الأحرف الفعلية في طبقة النص
+            glyph_area = sum((char["x1"] - char["x0"]) * (char["bottom"] - char["top"]) for char in page.chars)
+            
+            # نسبة المساحة التي تغطيها الصور (الصفحات الممسوحة ضوئياً تكون صورة واحدة كبيرة)
+            image_area = sum(
+                max(0.0, min(image["x1"], page.width) - max(image["x0"], 0)) *
+                max(0.0, min(image["bottom"], page.height) - max(image["top"], 0))
+                for image in page.images
+            )
+            
+            # مكتشف الجداول يعتمد على حدود الخلايا، فتُتخطى الصفحات التي لا تحتوي على خطوط مرسومة
+            tables = []
+            if extract_tables and page.edges:
+                tables = [table for table in page.extract_tables() if table]
+            
+            # تحرير ذاكرة التخزين المؤقت للصفحة بعد استخراجها
+            page.flush_cache()
+            
+            yield {
+                "page_index": page_index,
+                "text": page_text,
+                "tables": tables,
+                "char_count": len(page_text.strip()),
+                "glyph_coverage": min(1.0, glyph_area / page_area),
+                "image_coverage": min(1.0, image_area / page_area),
+                "extract_time": time.perf_counter() - started
+            }
+
+
+def _extract_pdf_page_range(source: DocumentSource, start: int, end: int,
+                            extract_tables: bool = True) -> List[Dict[str, Any]]:
+    """
+    استخراج نصوص نطاق من صفحات ملف PDF دفعة واحدة (تُستدعى داخل عملية منفصلة)
+    """
+    return list(_iter_pdf_page_range(source, start, end, extract_tables))
 
-# تحميل الموارد اللازمة للغة العربية
-try:
-    nltk.data.find('tokenizers/punkt')
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('punkt')
-    nltk.download('stopwords')
 
 class DocumentProcessor:
     """
@@ -36,94 +103,844 @@ class DocumentProcessor:
     تدعم الملفات بصيغة PDF, DOCX, XLSX, CSV, TXT
     """
     
-    def __init__(self):
+    # إصدار المعالج (يُضمَّن في مفتاح ذاكرة التخزين المؤقت، ويجب رفعه عند تغيير منطق الاستخراج)
+    PROCESSOR_VERSION = "1.2.0"
+    
+    # عدد الصفحات الأدنى لتفعيل الاستخراج المتوازي
+    DEFAULT_PARALLEL_MIN_PAGES = 50
+    
+    # أسماء أعمدة جداول الكميات (BOQ) المتوقعة في ملفات Excel و CSV
+    BOQ_COLUMN_ALIASES = {
+        "id": ["رقم البند", "البند", "م", "الرقم", "item", "item no", "no", "no."],
+        "description": ["الوصف", "البيان", "وصف البند", "وصف الأعمال", "description", "item description"],
+        "unit": ["الوحدة", "وحدة القياس", "unit", "uom"],
+        "quantity": ["الكمية", "الكميه", "qty", "quantity"],
+        "unit_price": ["سعر الوحدة", "الفئة", "السعر", "unit price", "unit rate", "rate", "price"],
+        "total_price": ["الإجمالي", "السعر الإجمالي", "المبلغ", "القيمة", "total", "total price", "amount"]
+    }
+    
+    # تحويل الأرقام العربية الهندية والفاصلة العشرية العربية
+    ARABIC_DIGITS = str.maketrans("٠١٢٣٤٥٦٧٨٩٫", "0123456789.")
+    
+    # عدد الصفوف التي يُبحث فيها عن صف العناوين في بداية كل ورقة
+    BOQ_HEADER_SCAN_ROWS = 30
+    
+    # عدد صفوف ملفات CSV التي تُقرأ في كل دفعة
+    DEFAULT_CSV_CHUNK_SIZE = 50000
+    
+    # حدود اكتشاف الصفحات التي تحتاج إلى OCR
+    DEFAULT_OCR_MIN_CHARS = 20
+    DEFAULT_OCR_MIN_GLYPH_COVERAGE = 0.01
+    OCR_IMAGE_COVERAGE = 0.5
+    
+    # أنماط فقرات العناوين في ملفات Word (تُستخدم لتحديد القسم الذي يقع فيه كل جدول)
+    DOCX_HEADING_STYLES = ("heading", "title", "عنوان")
+    
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
         تهيئة معالج المستندات
+        
+        المعاملات:
+        ----------
+        config : Dict, optional
+            إعدادات المعالجة (عدد العمليات المتوازية، الحد الأدنى للصفحات للاستخراج المتوازي،
+            حدود اكتشاف الصفحات التي تحتاج إلى OCR، دقة وعدد عمليات OCR، ذاكرة التخزين المؤقت،
+            المعالجة من الذاكرة، استخراج الجداول)
         """
+        self.config = config or {}
+        
+        # إعدادات الاستخراج المتوازي لملفات PDF
+        self.pdf_workers = max(1, int(self.config.get("pdf_workers") or os.cpu_count() or 1))
+        self.parallel_min_pages = int(self.config.get("parallel_min_pages", self.DEFAULT_PARALLEL_MIN_PAGES))
+        
+        # إعدادات اكتشاف الصفحات الممسوحة ضوئياً
+        self.ocr_min_chars = int(self.config.get("ocr_min_chars", self.DEFAULT_OCR_MIN_CHARS))
+        self.ocr_min_glyph_coverage = float(self.config.get("ocr_min_glyph_coverage", self.DEFAULT_OCR_MIN_GLYPH_COVERAGE))
+        
+        # محرك OCR للصفحات الممسوحة ضوئياً
+        self.ocr_engine = OCREngine(
+            dpi=self.config.get("ocr_dpi") or OCREngine.DEFAULT_DPI,
+            workers=self.config.get("ocr_workers") or self.pdf_workers,
+            preprocess=self.config.get("ocr_preprocess", True)
+        )
+        
+        # استخراج جداول ملفات PDF و Word كإطارات بيانات
+        self.extract_tables = bool(self.config.get("extract_tables", True))
+        
+        # حجم دفعات قراءة ملفات CSV
+        self.csv_chunk_size = int(self.config.get("csv_chunk_size", self.DEFAULT_CSV_CHUNK_SIZE))
+        
+        # معالجة الملفات من الذاكرة مباشرة دون كتابتها في ملف مؤقت
+        self.in_memory = bool(self.config.get("in_memory", True))
+        
+        # ذاكرة التخزين المؤقت لنتائج الاستخراج (مفهرسة ببصمة محتوى الملف)
+        self.cache = None
+        if self.config.get("cache_enabled", True):
+            self.cache = ExtractionCache(
+                cache_dir=self.config.get("cache_dir", "data/processed"),
+                max_size_mb=self.config.get("cache_max_size_mb", 500)
+            )
+        
         # تحميل قائمة الكلمات الدلالية للمناقصات
         self.tender_keywords = self._load_tender_keywords()
         
         # تحميل قائمة المتطلبات الشائعة
         self.common_requirements = self._load_common_requirements()
-        
-        # الكلمات التوقفية في اللغة العربية
-        self.arabic_stopwords = set(stopwords.words('arabic'))
-        
+    
+    @property
+    def arabic_stopwords(self) -> FrozenSet[str]:
+        """
+        الكلمات التوقفية في اللغة العربية (تُحمَّل عند أول استخدام ومرة واحدة لكل عملية)
+        """
+        return get_stopwords("arabic")
+    
+    @traced("document.process")
     def process_document(self, file_content: bytes, file_extension: str, file_name: str) -> Dict[str, Any]:
         """
         معالجة المستند وتحليله حسب نوعه
         """
-        with tempfile.NamedTemporaryFile(suffix=f".{file_extension}", delete=False) as temp_file:
-            temp_file.write(file_content)
-            temp_path = temp_file.name
-        
-        try:
-            if file_extension.lower() == 'pdf':
-                extracted_data = self._process_pdf(temp_path)
-            elif file_extension.lower() in ['docx', 'doc']:
-                extracted_data = self._process_docx(temp_path)
-            elif file_extension.lower() in ['xlsx', 'xls']:
-                extracted_data = self._process_excel(temp_path)
-            elif file_extension.lower() == 'csv':
-                extracted_data = self._process_csv(temp_path)
-            elif file_extension.lower() == 'txt':
-                extracted_data = self._process_txt(temp_path)
+        # مرحلة "document" في جلسة تحليل الأداء (إن وُجدت) موسومة ببصمة الملف
+        with profile_stage("document", file_content):
+            trace = current_span()
+            trace.set("file_type", file_extension)
+            trace.add_count("bytes", len(file_content))
+            
+            cache_key = None
+            if self.cache is not None:
+                cache_key = ExtractionCache.make_key(file_content, file_extension, self.PROCESSOR_VERSION)
+                cached_data = self.cache.get(cache_key)
+                if cached_data is not None:
+                    cached_data["file_name"] = file_name
+                    cached_data["file_type"] = file_extension
+                    cached_data["processed_time"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                    cached_data["from_cache"] = True
+                    trace.set("from_cache", True)
+                    return cached_data
+            
+            if self.in_memory:
+                extracted_data = self._process_source(file_content, file_extension)
             else:
-                extracted_data = {"error": f"نوع الملف {file_extension} غير مدعوم"}
+                with source_path(file_content, suffix=f".{file_extension}") as temp_path:
+                    extracted_data = self._process_source(temp_path, file_extension)
+            
+            # تخزين النتائج الناجحة فقط لإعادة استخدامها عند رفع نفس الملف مجدداً
+            # (لا تُخزن نتائج فشل OCR حتى يعاد تطبيقه على الملف نفسه بعد إصلاح محرك OCR)
+            if cache_key is not None and "error" not in extracted_data and not extracted_data.get("ocr_error"):
+                self.cache.put(cache_key, extracted_data)
             
             extracted_data["file_name"] = file_name
             extracted_data["file_type"] = file_extension
             extracted_data["processed_time"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            extracted_data["from_cache"] = False
+            
+            trace.set("from_cache", False)
+            trace.add_count("pages", len(extracted_data.get("pages", [])))
+            trace.add_count("tables", len(extracted_data.get("tables", [])))
+            trace.add_count("chars", len(extracted_data.get("text", "")))
             
             return extracted_data
+    
+    def iter_pages(self, file_content: bytes, file_extension: str) -> Iterator[Dict[str, Any]]:
+        """
+        استخراج المستند صفحة بصفحة وإعادة كل صفحة فور اكتمالها
+        (يسمح ببدء التحليل وعرض التقدم قبل انتهاء الاستخراج مع إبقاء استهلاك الذاكرة محدوداً)
+        
+        المعاملات:
+        ----------
+        file_content : bytes
+            محتوى الملف
+        file_extension : str
+            امتداد الملف
             
+        المخرجات:
+        --------
+        Iterator[Dict[str, Any]]
+            سجل لكل صفحة يحتوي على: page_number, page_count, text, tables, ocr, timings
+            (المستندات غير المقسمة إلى صفحات تُعاد كصفحة واحدة)
+        """
+        if file_extension.lower() == 'pdf':
+            yield from self._iter_pdf_pages(file_content)
+            return
+        
+        started = time.perf_counter()
+        extracted_data = self._process_source(file_content, file_extension)
+        if "error" in extracted_data:
+            raise ValueError(extracted_data["error"])
+        
+        yield {
+            "page_number": 1,
+            "page_count": 1,
+            "text": extracted_data.get("text", ""),
+            "tables": extracted_data.get("tables", []),
+            "ocr": False,
+            "timings": {"extract": time.perf_counter() - started, "ocr": 0.0}
+        }
+    
+    def _iter_pdf_pages(self, source: DocumentSource) -> Iterator[Dict[str, Any]]:
+        """
+        استخراج صفحات ملف PDF تباعاً مع تطبيق OCR على الصفحة عند الحاجة
+        
+        المعاملات:
+        ----------
+        source : DocumentSource
+            مسار ملف PDF أو محتواه
+            
+        المخرجات:
+        --------
+        Iterator[Dict[str, Any]]
+            سجل لكل صفحة بترتيب الصفحات
+        """
+        with pdfplumber.open(open_stream(source)) as pdf:
+            page_count = len(pdf.pages)
+        
+        if self.pdf_workers > 1 and page_count >= self.parallel_min_pages:
+            page_records = self._iter_pdf_pages_parallel(source, page_count)
+        else:
+            page_records = _iter_pdf_page_range(source, 0, page_count, self.extract_tables)
+        
+        # يُفتح الملف لـ OCR مرة واحدة عند أول صفحة تحتاجه وتُحوَّل منه جميع الصفحات التالية
+        ocr_document = None
+        boq_header = None
+        try:
+            for record in page_records:
+                page_index = record["page_index"]
+                page_text = record["text"]
+                ocr_applied = False
+                ocr_time = 0.0
+                
+                if self._page_needs_ocr(record):
+                    started = time.perf_counter()
+                    if ocr_document is None:
+                        ocr_document = self.ocr_engine.open_pdf(source)
+                    ocr_text = self._apply_ocr_to_page(ocr_document, page_index)
+                    ocr_time = time.perf_counter() - started
+                    if ocr_text is not None:
+                        ocr_applied = True
+                        page_text = ocr_text.strip() or page_text
+                
+                page_tables, boq_header = self._continue_boq_tables(record["tables"], boq_header)
+                yield {
+                    "page_number": page_index + 1,
+                    "page_count": page_count,
+                    "text": page_text,
+                    "tables": self._build_page_tables(page_tables, page_index + 1),
+                    "ocr": ocr_applied,
+                    "timings": {"extract": record["extract_time"], "ocr": ocr_time}
+                }
         finally:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+            if ocr_document is not None:
+                ocr_document.close()
+    
+    def _process_source(self, source: DocumentSource, file_extension: str) -> Dict[str, Any]:
+        """
+        توجيه المستند إلى دالة المعالجة المناسبة حسب نوعه
+        
+        المعاملات:
+        ----------
+        source : DocumentSource
+            مسار الملف أو محتواه في الذاكرة
+        file_extension : str
+            امتداد الملف
+            
+        المخرجات:
+        --------
+        Dict[str, Any]
+            البيانات المستخرجة
+        """
+        if file_extension.lower() == 'pdf':
+            return self._process_pdf(source)
+        elif file_extension.lower() in ['docx', 'doc']:
+            return self._process_docx(source)
+        elif file_extension.lower() in ['xlsx', 'xls']:
+            return self._process_excel(source)
+        elif file_extension.lower() == 'csv':
+            return self._process_csv(source)
+        elif file_extension.lower() == 'txt':
+            return self._process_txt(source)
+        else:
+            return {"error": f"نوع الملف {file_extension} غير مدعوم"}
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        الحصول على إحصائيات ذاكرة التخزين المؤقت لنتائج الاستخراج
+        
+        المخرجات:
+        --------
+        Dict[str, Any]
+            عدد الإصابات والإخفاقات ونسبة الإصابة والحجم الحالي
+        """
+        if self.cache is None:
+            return {"enabled": False}
+        
+        stats = self.cache.get_stats()
+        stats["enabled"] = True
+        return stats
     
-    def _process_pdf(self, file_path: str) -> Dict[str, Any]:
+    def _process_pdf(self, source: DocumentSource) -> Dict[str, Any]:
         """
-        معالجة ملف PDF واستخراج النص والبيانات منه
+        معالجة ملف PDF (من مسار أو من الذاكرة) واستخراج النص والبيانات منه
         """
-        extracted_data = {"text": "", "metadata": {}, "images": [], "tables": [], "pages": []}
+        extracted_data = {"text": "", "metadata": {}, "images": [], "tables": [], "boq_items": [], "pages": []}
         try:
-            with pdfplumber.open(file_path) as pdf:
-                for page in pdf.pages:
-                    extracted_text = page.extract_text()
-                    if extracted_text:
-                        extracted_data["text"] += extracted_text + "\n"
-            
-            if not extracted_data["text"].strip():
-                extracted_data["text"] = self._apply_ocr_to_pdf(file_path)
+            with pdfplumber.open(open_stream(source)) as pdf:
+                page_count = len(pdf.pages)
+            
+            if self.pdf_workers > 1 and page_count >= self.parallel_min_pages:
+                page_records = self._extract_pdf_pages_parallel(source, page_count)
+            else:
+                page_records = _extract_pdf_page_range(source, 0, page_count, self.extract_tables)
+            
+            # تطبيق OCR على الصفحات التي لا تحتوي على طبقة نصية كافية فقط
+            ocr_pages = [record["page_index"] for record in page_records if self._page_needs_ocr(record)]
+            ocr_texts = self._apply_ocr_to_pdf(source, ocr_pages) if ocr_pages else {}
+            
+            # تجميع النص بترتيب الصفحات مع حفظ موضع كل صفحة داخل النص الكامل
+            text_parts = []
+            offset = 0
+            boq_header = None
+            for record in page_records:
+                page_index = record["page_index"]
+                page_text = record["text"]
+                ocr_applied = page_index in ocr_texts
+                if ocr_applied:
+                    page_text = ocr_texts[page_index].strip() or page_text
+                
+                extracted_data["pages"].append({
+                    "page_number": page_index + 1,
+                    "text": page_text,
+                    "offset": offset,
+                    "length": len(page_text),
+                    "ocr": ocr_applied
+                })
+                if page_text:
+                    text_parts.append(page_text + "\n")
+                    offset += len(page_text) + 1
+                
+                # جداول الصفحة كإطارات بيانات، مع استخراج بنود جداول الكميات منها
+                page_tables, boq_header = self._continue_boq_tables(record["tables"], boq_header)
+                extracted_data["tables"].extend(self._build_page_tables(page_tables, page_index + 1))
+                for rows in page_tables:
+                    self._collect_boq_rows(iter(rows), [], extracted_data["boq_items"])
+            extracted_data["text"] = "".join(text_parts)
+            extracted_data["metadata"]["page_count"] = page_count
+            extracted_data["metadata"]["ocr_pages"] = [page_index + 1 for page_index in sorted(ocr_texts)]
+            
+            failed_pages = [page_index + 1 for page_index in ocr_pages if page_index not in ocr_texts]
+            if failed_pages:
+                extracted_data["ocr_error"] = f"تعذر تطبيق OCR على الصفحات: {', '.join(map(str, failed_pages))}"
         except Exception as e:
             extracted_data["error"] = f"خطأ في معالجة ملف PDF: {str(e)}"
         return extracted_data
     
-    def _apply_ocr_to_pdf(self, file_path: str) -> str:
+    def _page_needs_ocr(self, page_record: Dict[str, Any]) -> bool:
+        """
+        تحديد ما إذا كانت الصفحة تحتاج إلى OCR بناءً على عدد الأحرف ونسبة تغطيتها
+        
+        المعاملات:
+        ----------
+        page_record : Dict[str, Any]
+            بيانات الصفحة المستخرجة من طبقة النص
+            
+        المخرجات:
+        --------
+        bool
+            True إذا كانت الصفحة ممسوحة ضوئياً أو طبقتها النصية غير كافية
+        """
+        # صفحة بلا نص تقريباً
+        if page_record["char_count"] < self.ocr_min_chars:
+            return True
+        
+        # صفحة تغطيها صورة ممسوحة مع طبقة نصية ضئيلة (مثل ختم أو ترويسة فقط)
+        return (page_record["image_coverage"] >= self.OCR_IMAGE_COVERAGE and
+                page_record["glyph_coverage"] < self.ocr_min_glyph_coverage)
+    
+    def _extract_pdf_pages_parallel(self, source: DocumentSource, page_count: int) -> List[Dict[str, Any]]:
+        """
+        استخراج نصوص صفحات ملف PDF بالتوازي عبر مجموعة من العمليات
+        
+        المعاملات:
+        ----------
+        source : DocumentSource
+            مسار ملف PDF أو محتواه
+        page_count : int
+            عدد صفحات الملف
+            
+        المخرجات:
+        --------
+        List[Dict[str, Any]]
+            بيانات الصفحات مرتبة حسب ترتيب الصفحات
+        """
+        return list(self._iter_pdf_pages_parallel(source, page_count))
+    
+    def _iter_pdf_pages_parallel(self, source: DocumentSource, page_count: int) -> Iterator[Dict[str, Any]]:
+        """
+        استخراج صفحات ملف PDF بالتوازي مع إعادتها بترتيب الصفحات فور اكتمال كل نطاق
+        
+        المعاملات:
+        ----------
+        source : DocumentSource
+            مسار ملف PDF أو محتواه
+        page_count : int
+            عدد صفحات الملف
+            
+        المخرجات:
+        --------
+        Iterator[Dict[str, Any]]
+            بيانات الصفحات بترتيب الصفحات
+        """
+        workers = min(self.pdf_workers, page_count)
+        
+        # تقسيم الصفحات إلى نطاقات متقاربة الحجم (نطاقان لكل عملية لموازنة الحمل)
+        chunk_count = min(page_count, workers * 2)
+        chunk_size = -(-page_count // chunk_count)
+        starts = list(range(0, page_count, chunk_size))
+        ends = [min(start + chunk_size, page_count) for start in starts]
+        
+        # تمرير مسار ملف إلى العمليات بدلاً من نسخ محتوى الملف إلى كل منها
+        with source_path(source, suffix=".pdf") as file_path:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                # map تعيد النتائج بترتيب النطاقات للحفاظ على ترتيب الصفحات
+                for records in executor.map(_extract_pdf_page_range, [file_path] * len(starts), starts, ends,
+                                            [self.extract_tables] * len(starts)):
+                    yield from records
+    
+    def _apply_ocr_to_pdf(self, source: DocumentSource, page_indices: Optional[List[int]] = None) -> Dict[int, str]:
+        """
+        تطبيق OCR على صفحات محددة من ملف PDF لاستخراج النص من الصور
+        
+        المعاملات:
+        ----------
+        source : DocumentSource
+            مسار ملف PDF أو محتواه
+        page_indices : List[int], optional
+            أرقام الصفحات المطلوب تطبيق OCR عليها (تبدأ من 0)، افتراضياً جميع الصفحات
+            
+        المخرجات:
+        --------
+        Dict[int, str]
+            نص OCR لكل صفحة تمت معالجتها بنجاح
+        """
+        try:
+            return self.ocr_engine.ocr_pdf(source, page_indices)
+        except Exception as e:
+            print(f"خطأ في OCR: {str(e)}")
+            return {}
+    
+    def _apply_ocr_to_page(self, document, page_index: int) -> Optional[str]:
         """
-        تطبيق OCR على ملف PDF لاستخراج النص من الصور
+        تطبيق OCR على صفحة واحدة من ملف PDF مفتوح
+        
+        المعاملات:
+        ----------
+        document : fitz.Document
+            الملف المفتوح عبر محرك OCR
+        page_index : int
+            رقم الصفحة (يبدأ من 0)
+            
+        المخرجات:
+        --------
+        str or None
+            نص OCR للصفحة، أو None إذا فشلت معالجتها
         """
         try:
-            doc = fitz.open(file_path)
-            ocr_text = ""
-            for page in doc:
-                pix = page.get_pixmap()
-                img_data = pix.tobytes("png")
-                with io.BytesIO(img_data) as img_stream:
-                    img = Image.open(img_stream)
-                    ocr_text += pytesseract.image_to_string(img, lang='ara+eng') + "\n"
-            return ocr_text
+            return self.ocr_engine.ocr_page(document, page_index)
         except Exception as e:
-            return f"خطأ في OCR: {str(e)}"
+            print(f"خطأ في OCR للصفحة {page_index + 1}: {str(e)}")
+            return None
     
-    def _process_docx(self, file_path: str) -> Dict[str, Any]:
+    def _process_docx(self, source: DocumentSource) -> Dict[str, Any]:
         """
         معالجة ملف Word (DOCX) واستخراج النص والبيانات منه
         """
-        extracted_data = {"text": "", "metadata": {}, "images": [], "tables": [], "paragraphs": []}
+        extracted_data = {"text": "", "metadata": {}, "images": [], "tables": [], "boq_items": [], "paragraphs": []}
         try:
-            doc = docx.Document(file_path)
+            doc = docx.Document(open_stream(source))
             extracted_data["text"] = "\n".join([para.text for para in doc.paragraphs if para.text.strip()])
+            
+            if self.extract_tables:
+                # المرور على محتوى المستند بالترتيب لربط كل جدول بآخر عنوان يسبقه
+                section = None
+                for block in doc.iter_inner_content():
+                    if isinstance(block, DocxParagraph):
+                        style_name = (block.style.name if block.style is not None else "").lower()
+                        if block.text.strip() and style_name.startswith(self.DOCX_HEADING_STYLES):
+                            section = block.text.strip()
+                        continue
+                    
+                    rows = [[cell.text for cell in row.cells] for row in block.rows]
+                    table = self._build_table(rows, "docx", section=section, index=len(extracted_data["tables"]))
+                    if table is not None:
+                        extracted_data["tables"].append(table)
+                        self._collect_boq_rows(iter(rows), [], extracted_data["boq_items"])
         except Exception as e:
             extracted_data["error"] = f"خطأ في معالجة ملف DOCX: {str(e)}"
         return extracted_data
+    
+    def _continue_boq_tables(self, page_tables: List[List[list]],
+                             previous_header: Optional[list]) -> Tuple[List[List[list]], Optional[list]]:
+        """
+        إضافة صف عناوين جدول الكميات من الصفحة السابقة إلى أول جدول في الصفحة إذا كان تتمة له
+        (جدول كميات يمتد على عدة صفحات دون تكرار صف العناوين، وبعدد الأعمدة نفسه)
+        
+        المعاملات:
+        ----------
+        page_tables : List[List[list]]
+            صفوف كل جدول في الصفحة كما أعادها مكتشف الجداول
+        previous_header : list or None
+            صف عناوين جدول الكميات الذي انتهت به الصفحة السابقة
+            
+        المخرجات:
+        --------
+        Tuple[List[List[list]], Optional[list]]
+            جداول الصفحة، وصف عناوين جدول الكميات الذي تنتهي به الصفحة (لمتابعته في الصفحة التالية)
+        """
+        tables = list(page_tables)
+        header = None
+        for position, rows in enumerate(tables):
+            header = self._find_boq_header(rows)
+            if header is None and position == 0 and previous_header is not None:
+                first_row = next((row for row in rows if any(value not in (None, "") for value in row)), None)
+                if first_row is not None and len(first_row) == len(previous_header):
+                    tables[0] = [previous_header] + list(rows)
+                    header = previous_header
+        return tables, header
+    
+    def _find_boq_header(self, rows: List[list]) -> Optional[list]:
+        """
+        صف عناوين جدول الكميات في بداية الجدول، أو None إذا لم يكن الجدول جدول كميات
+        """
+        scanned_rows = 0
+        for row in rows:
+            cells = ["" if value is None else str(value).strip() for value in row]
+            if not any(cells):
+                continue
+            if self._detect_boq_columns(cells) is not None:
+                return list(row)
+            scanned_rows += 1
+            if scanned_rows >= self.BOQ_HEADER_SCAN_ROWS:
+                break
+        return None
+    
+    def _build_page_tables(self, page_tables: List[List[list]], page_number: int) -> List[Dict[str, Any]]:
+        """
+        تحويل صفوف جداول صفحة PDF إلى إطارات بيانات
+        
+        المعاملات:
+        ----------
+        page_tables : List[List[list]]
+            صفوف كل جدول كما أعادها مكتشف الجداول
+        page_number : int
+            رقم الصفحة (يبدأ من 1)
+            
+        المخرجات:
+        --------
+        List[Dict[str, Any]]
+            جداول الصفحة
+        """
+        tables = []
+        for rows in page_tables:
+            table = self._build_table(rows, "pdf", page=page_number, index=len(tables))
+            if table is not None:
+                tables.append(table)
+        return tables
+    
+    def _build_table(self, rows: List[list], source_type: str, page: Optional[int] = None,
+                     section: Optional[str] = None, index: int = 0) -> Optional[Dict[str, Any]]:
+        """
+        تحويل صفوف جدول إلى إطار بيانات مع مصدره في المستند
+        
+        المعاملات:
+        ----------
+        rows : List[list]
+            قيم خلايا الجدول (الصف الأول هو صف العناوين)
+        source_type : str
+            نوع المستند ("pdf" أو "docx")
+        page : int, optional
+            رقم الصفحة التي يقع فيها الجدول
+        section : str, optional
+            عنوان القسم الذي يقع فيه الجدول
+        index : int, optional
+            ترتيب الجدول في الصفحة (PDF) أو في المستند (DOCX)
+            
+        المخرجات:
+        --------
+        Dict[str, Any] or None
+            الجدول (source, page, section, index, data) أو None إذا لم يحتوِ على صفوف بيانات
+        """
+        cells = [
+            ["" if value is None else re.sub(r'\s+', ' ', str(value)).strip() for value in row]
+            for row in rows
+        ]
+        cells = [row for row in cells if any(row)]
+        if len(cells) < 2:
+            return None
+        
+        # أسماء الأعمدة من الصف الأول مع تسمية الأعمدة الفارغة أو المكررة بترتيبها
+        header = []
+        for position, name in enumerate(cells[0]):
+            name = name or f"عمود {position + 1}"
+            if name in header:
+                name = f"{name} ({position + 1})"
+            header.append(name)
+        
+        width = len(header)
+        data = [row[:width] + [""] * (width - len(row)) for row in cells[1:]]
+        
+        return {
+            "source": source_type,
+            "page": page,
+            "section": section,
+            "index": index,
+            "data": pd.DataFrame(data, columns=header)
+        }
+    
+    def _process_txt(self, source: DocumentSource) -> Dict[str, Any]:
+        """
+        معالجة ملف نصي واستخراج النص والفقرات منه
+        """
+        extracted_data = {"text": "", "metadata": {}, "paragraphs": []}
+        try:
+            content = read_bytes(source)
+            
+            # الملفات العربية القديمة قد تكون بترميز Windows-1256 بدلاً من UTF-8
+            try:
+                text = str(content, "utf-8-sig")
+            except UnicodeDecodeError:
+                text = str(content, "cp1256", errors="replace")
+            
+            extracted_data["text"] = text
+            extracted_data["paragraphs"] = [para.strip() for para in re.split(r'\n\s*\n', text) if para.strip()]
+        except Exception as e:
+            extracted_data["error"] = f"خطأ في معالجة الملف النصي: {str(e)}"
+        return extracted_data
+    
+    def _process_excel(self, source: DocumentSource) -> Dict[str, Any]:
+        """
+        معالجة ملف Excel (جدول كميات) بقراءة الصفوف تباعاً دون تحميل المصنف كاملاً في الذاكرة
+        """
+        extracted_data = {"text": "", "metadata": {"sheets": []}, "tables": [], "boq_items": []}
+        try:
+            text_lines = []
+            for sheet_name, rows in self._iter_excel_sheets(source):
+                sheet_items = self._collect_boq_rows(rows, text_lines, extracted_data["boq_items"])
+                extracted_data["metadata"]["sheets"].append({"name": sheet_name, "boq_items": sheet_items})
+            
+            extracted_data["text"] = "\n".join(text_lines)
+            extracted_data["metadata"]["row_count"] = len(text_lines)
+        except Exception as e:
+            extracted_data["error"] = f"خطأ في معالجة ملف Excel: {str(e)}"
+        return extracted_data
+    
+    def _iter_excel_sheets(self, source: DocumentSource) -> Iterator[Tuple[str, Iterator[tuple]]]:
+        """
+        قراءة أوراق مصنف Excel تباعاً (وضع القراءة فقط في openpyxl لملفات xlsx)
+        
+        المعاملات:
+        ----------
+        source : DocumentSource
+            مسار الملف أو محتواه
+            
+        المخرجات:
+        --------
+        Iterator[Tuple[str, Iterator[tuple]]]
+            اسم كل ورقة مع صفوفها
+        """
+        try:
+            workbook = load_workbook(open_stream(source), read_only=True, data_only=True)
+        except (InvalidFileException, zipfile.BadZipFile):
+            # ملفات xls القديمة لا يدعمها openpyxl (حجمها محدود بـ 65536 صفاً لكل ورقة)
+            sheets = pd.read_excel(open_stream(source), sheet_name=None, header=None, dtype=object)
+            for sheet_name, frame in sheets.items():
+                frame = frame.astype(object).where(frame.notna(), None)
+                yield sheet_name, frame.itertuples(index=False, name=None)
+            return
+        
+        try:
+            for worksheet in workbook.worksheets:
+                yield worksheet.title, worksheet.iter_rows(values_only=True)
+        finally:
+            workbook.close()
+    
+    def _process_csv(self, source: DocumentSource) -> Dict[str, Any]:
+        """
+        معالجة ملف CSV (جدول كميات) بقراءته على دفعات
+        """
+        extracted_data = {"text": "", "metadata": {}, "tables": [], "boq_items": []}
+        try:
+            text_lines = []
+            
+            # تحديد الترميز من بداية الملف (UTF-8 أو Windows-1256 للملفات العربية القديمة)
+            if isinstance(source, str):
+                with open(source, "rb") as f:
+                    sample = f.read(65536)
+            else:
+                sample = bytes(source[:65536])
+            try:
+                codecs.getincrementaldecoder("utf-8-sig")().decode(sample, final=False)
+                encoding = "utf-8-sig"
+            except UnicodeDecodeError:
+                encoding = "cp1256"
+            
+            reader = pd.read_csv(
+                open_stream(source), header=None, dtype=str, encoding=encoding,
+                chunksize=self.csv_chunk_size, keep_default_na=False,
+                skip_blank_lines=True, on_bad_lines="skip"
+            )
+            rows = (row for chunk in reader for row in chunk.itertuples(index=False, name=None))
+            self._collect_boq_rows(rows, text_lines, extracted_data["boq_items"])
+            
+            extracted_data["text"] = "\n".join(text_lines)
+            extracted_data["metadata"]["row_count"] = len(text_lines)
+            extracted_data["metadata"]["encoding"] = encoding
+        except Exception as e:
+            extracted_data["error"] = f"خطأ في معالجة ملف CSV: {str(e)}"
+        return extracted_data
+    
+    def _collect_boq_rows(self, rows: Iterator[tuple], text_lines: List[str], boq_items: List[Dict[str, Any]]) -> int:
+        """
+        تحويل صفوف ورقة عمل إلى أسطر نصية وبنود جدول كميات
+        
+        المعاملات:
+        ----------
+        rows : Iterator[tuple]
+            صفوف الورقة (قيم الخلايا)
+        text_lines : List[str]
+            قائمة الأسطر النصية التي تُضاف إليها الصفوف
+        boq_items : List[Dict[str, Any]]
+            قائمة البنود التي تُضاف إليها البنود المستخرجة
+            
+        المخرجات:
+        --------
+        int
+            عدد البنود المستخرجة من هذه الورقة
+        """
+        columns = None
+        scanned_rows = 0
+        item_count = 0
+        
+        for row in rows:
+            cells = ["" if value is None else str(value).strip() for value in row]
+            if not any(cells):
+                continue
+            text_lines.append(" | ".join(cell for cell in cells if cell))
+            
+            # البحث عن صف العناوين في بداية الورقة
+            if columns is None:
+                if scanned_rows < self.BOQ_HEADER_SCAN_ROWS:
+                    scanned_rows += 1
+                    columns = self._detect_boq_columns(cells)
+                continue
+            
+            item = self._parse_boq_row(row, columns)
+            if item:
+                boq_items.append(item)
+                item_count += 1
+        
+        return item_count
+    
+    def _detect_boq_columns(self, cells: List[str]) -> Optional[Dict[str, int]]:
+        """
+        تحديد أعمدة جدول الكميات من صف العناوين
+        
+        المعاملات:
+        ----------
+        cells : List[str]
+            قيم خلايا الصف
+            
+        المخرجات:
+        --------
+        Dict[str, int] or None
+            رقم العمود لكل حقل، أو None إذا لم يكن الصف صف عناوين لجدول كميات
+        """
+        columns = {}
+        for index, cell in enumerate(cells):
+            header = re.sub(r'\s+', ' ', cell.lower()).strip(" :.")
+            if not header:
+                continue
+            
+            # المطابقة التامة أولاً ثم أطول اسم بديل يحتويه العنوان
+            best_field, best_length = None, 0
+            for field, aliases in self.BOQ_COLUMN_ALIASES.items():
+                for alias in aliases:
+                    if header == alias:
+                        best_field, best_length = field, len(header) + 1000
+                    elif len(alias) > 2 and alias in header and len(alias) > best_length:
+                        best_field, best_length = field, len(alias)
+            
+            if best_field and best_field not in columns:
+                columns[best_field] = index
+        
+        if "description" in columns and "quantity" in columns:
+            return columns
+        return None
+    
+    def _parse_boq_row(self, row: tuple, columns: Dict[str, int]) -> Optional[Dict[str, Any]]:
+        """
+        تحويل صف من جدول الكميات إلى بند مصنف الحقول
+        
+        المعاملات:
+        ----------
+        row : tuple
+            قيم خلايا الصف
+        columns : Dict[str, int]
+            أرقام أعمدة الحقول
+            
+        المخرجات:
+        --------
+        Dict[str, Any] or None
+            البند (الوصف، الوحدة، الكمية، سعر الوحدة، الإجمالي) أو None لصفوف العناوين الفرعية والمجاميع
+        """
+        def cell(field):
+            index = columns.get(field)
+            if index is None or index >= len(row) or row[index] is None:
+                return ""
+            return row[index]
+        
+        description = str(cell("description")).strip()
+        quantity = self._parse_number(cell("quantity"))
+        if not description or quantity <= 0:
+            return None
+        
+        unit_price = self._parse_number(cell("unit_price"))
+        total_price = self._parse_number(cell("total_price")) or quantity * unit_price
+        
+        return {
+            "id": str(cell("id")).strip(),
+            "description": description,
+            "unit": str(cell("unit")).strip(),
+            "quantity": quantity,
+            "unit_price": unit_price,
+            "total_price": total_price
+        }
+    
+    def _parse_number(self, value: Any) -> float:
+        """
+        تحويل قيمة خلية إلى رقم (يدعم الأرقام العربية الهندية وفواصل الآلاف)
+        """
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return float(value)
+        
+        text = str(value).translate(self.ARABIC_DIGITS).replace(',', '').replace('٬', '')
+        match = re.search(r'-?\d+(?:\.\d+)?', text)
+        return float(match.group(0)) if match else 0.0
+    
+    def _load_tender_keywords(self) -> Dict[str, List[str]]:
+        """
+        تحميل الكلمات الدلالية للمناقصات مصنفة حسب الموضوع
+        """
+        return {
+            "requirements": ["المتطلبات", "الشروط", "يجب", "يلتزم", "مطلوب"],
+            "local_content": ["المحتوى المحلي", "التوطين", "نطاقات", "السعودة"],
+            "financial": ["التكلفة", "القيمة", "ريال", "الضمان", "الدفعات"],
+            "schedule": ["المدة", "تاريخ البدء", "تاريخ الانتهاء", "الجدول الزمني"]
+        }
+    
+    def _load_common_requirements(self) -> Dict[str, List[str]]:
+        """
+        تحميل قائمة المتطلبات الشائعة في المناقصات حسب الفئة
+        """
+        return {
+            "فنية": ["التصنيف", "الخبرة", "المشاريع المماثلة", "المواصفات الفنية"],
+            "مالية": ["الملاءة المالية", "الضمان البنكي", "القوائم المالية"],
+            "إدارية": ["السجل التجاري", "شهادة الزكاة", "شهادة التأمينات الاجتماعية"]
+        }
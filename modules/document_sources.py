@@ -0,0 +1,85 @@
+import io
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import Iterator, Union
+
+# مصدر المستند: إما مسار ملف على القرص أو محتوى الملف في الذاكرة
+DocumentSource = Union[str, bytes, bytearray, memoryview]
+
+
+def open_stream(source: DocumentSource) -> Union[str, io.BytesIO]:
+    """
+    تجهيز مصدر المستند للمكتبات التي تقبل مساراً أو كائن ملف
+    
+    المعاملات:
+    ----------
+    source : DocumentSource
+        مسار الملف أو محتواه
+    
+    المخرجات:
+    --------
+    Union[str, io.BytesIO]
+        المسار كما هو، أو تدفق في الذاكرة بمحتوى الملف
+    """
+    if isinstance(source, str):
+        return source
+    
+    # تمرير كائن bytes الأصلي بدلاً من memoryview عليه كاملاً (يُنسخ المحتوى عند إنشاء التدفق من memoryview
+    # أو bytearray، بينما قد يتجنب CPython نسخ bytes ما لم يُكتب في التدفق)
+    if isinstance(source, memoryview) and isinstance(source.obj, bytes) and source.nbytes == len(source.obj):
+        source = source.obj
+    return io.BytesIO(source)
+
+
+def read_bytes(source: DocumentSource) -> Union[bytes, bytearray, memoryview]:
+    """
+    قراءة محتوى المستند كبايتات
+    
+    المعاملات:
+    ----------
+    source : DocumentSource
+        مسار الملف أو محتواه
+    
+    المخرجات:
+    --------
+    Union[bytes, bytearray, memoryview]
+        محتوى الملف
+    """
+    if isinstance(source, str):
+        with open(source, "rb") as f:
+            return f.read()
+    return source
+
+
+@contextmanager
+def source_path(source: DocumentSource, suffix: str = "") -> Iterator[str]:
+    """
+    الحصول على مسار ملف حقيقي للمصدر (للمكتبات ومجموعات العمليات التي تتطلب ملفاً على القرص)
+    يُنشأ ملف مؤقت فقط إذا كان المصدر في الذاكرة، ويُحذف عند الخروج
+    
+    المعاملات:
+    ----------
+    source : DocumentSource
+        مسار الملف أو محتواه
+    suffix : str, optional
+        امتداد الملف المؤقت
+    
+    المخرجات:
+    --------
+    Iterator[str]
+        مسار الملف
+    """
+    if isinstance(source, str):
+        yield source
+        return
+    
+    with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as temp_file:
+        temp_file.write(source)
+        temp_path = temp_file.name
+    
+    try:
+        yield temp_path
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
@@ -0,0 +1,195 @@
+import os
+import hashlib
+import pickle
+import tempfile
+import threading
+from collections import defaultdict
+from typing import Dict, Any, Optional
+
+
+class ExtractionCache:
+    """
+    ذاكرة تخزين مؤقت على القرص لنتائج استخراج المستندات، مفهرسة بمحتوى الملف
+    مع حد أقصى للحجم وإزالة العناصر الأقل استخداماً مؤخراً (LRU)
+    """
+    
+    # عدادات الإصابة والإخفاق مشتركة بين جميع النسخ التي تستخدم نفس المجلد داخل العملية
+    _stats = defaultdict(lambda: {"hits": 0, "misses": 0, "writes": 0, "evictions": 0})
+    _lock = threading.Lock()
+    
+    def __init__(self, cache_dir: str = "data/processed", max_size_mb: float = 500):
+        """
+        تهيئة ذاكرة التخزين المؤقت
+        
+        المعاملات:
+        ----------
+        cache_dir : str, optional
+            مجلد تخزين النتائج (افتراضي: "data/processed")
+        max_size_mb : float, optional
+            الحجم الأقصى للذاكرة بالميجابايت (افتراضي: 500)
+        """
+        self.cache_dir = os.path.abspath(cache_dir)
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        os.makedirs(self.cache_dir, exist_ok=True)
+    
+    @staticmethod
+    def make_key(file_content: bytes, file_extension: str, version: str) -> str:
+        """
+        إنشاء مفتاح التخزين من بصمة SHA-256 لمحتوى الملف ونوعه وإصدار المعالج
+        
+        المعاملات:
+        ----------
+        file_content : bytes
+            محتوى الملف
+        file_extension : str
+            امتداد الملف
+        version : str
+            إصدار معالج المستندات
+        
+        المخرجات:
+        --------
+        str
+            المفتاح
+        """
+        digest = hashlib.sha256(file_content).hexdigest()
+        return f"{digest}_{file_extension.lower()}_{version}"
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        استرجاع نتيجة مخزنة
+        
+        المعاملات:
+        ----------
+        key : str
+            مفتاح التخزين
+        
+        المخرجات:
+        --------
+        Dict[str, Any] or None
+            النتيجة المخزنة أو None إذا لم تكن موجودة
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                result = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            self._count("misses")
+            return None
+        
+        # تحديث وقت الاستخدام لاعتماده في سياسة الإزالة
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+        
+        self._count("hits")
+        return result
+    
+    def put(self, key: str, result: Dict[str, Any]) -> bool:
+        """
+        تخزين نتيجة جديدة ثم إزالة أقدم العناصر إذا تجاوز الحجم الحد الأقصى
+        
+        المعاملات:
+        ----------
+        key : str
+            مفتاح التخزين
+        result : Dict[str, Any]
+            نتيجة الاستخراج
+        
+        المخرجات:
+        --------
+        bool
+            نجاح أو فشل العملية
+        """
+        # الكتابة في ملف مؤقت ثم استبداله لتجنب قراءة ملف غير مكتمل من عملية أخرى
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, self._path(key))
+        except Exception as e:
+            print(f"Error writing extraction cache: {str(e)}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return False
+        
+        self._count("writes")
+        self._evict()
+        return True
+    
+    def clear(self) -> None:
+        """
+        حذف جميع النتائج المخزنة
+        """
+        for entry in self._entries():
+            try:
+                os.remove(entry[0])
+            except OSError:
+                pass
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        الحصول على إحصائيات استخدام الذاكرة المؤقتة
+        
+        المخرجات:
+        --------
+        Dict[str, Any]
+            عدد الإصابات والإخفاقات والكتابات والإزالات، ونسبة الإصابة، والحجم الحالي
+        """
+        with self._lock:
+            stats = dict(self._stats[self.cache_dir])
+        
+        lookups = stats["hits"] + stats["misses"]
+        entries = self._entries()
+        stats["hit_rate"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+        stats["entries"] = len(entries)
+        stats["size_bytes"] = sum(entry[2] for entry in entries)
+        stats["max_size_bytes"] = self.max_size_bytes
+        return stats
+    
+    def _path(self, key: str) -> str:
+        """
+        مسار ملف النتيجة المخزنة
+        """
+        return os.path.join(self.cache_dir, f"{key}.pkl")
+    
+    def _count(self, counter: str, amount: int = 1) -> None:
+        """
+        زيادة أحد عدادات الإحصائيات
+        """
+        with self._lock:
+            self._stats[self.cache_dir][counter] += amount
+    
+    def _entries(self):
+        """
+        قائمة الملفات المخزنة (المسار، وقت آخر استخدام، الحجم)
+        """
+        entries = []
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if entry.is_file() and entry.name.endswith(".pkl"):
+                    stat = entry.stat()
+                    entries.append((entry.path, stat.st_mtime, stat.st_size))
+        return entries
+    
+    def _evict(self) -> None:
+        """
+        إزالة العناصر الأقل استخداماً مؤخراً حتى يصبح الحجم ضمن الحد الأقصى
+        """
+        entries = self._entries()
+        total_size = sum(entry[2] for entry in entries)
+        if total_size <= self.max_size_bytes:
+            return
+        
+        evicted = 0
+        for path, _, size in sorted(entries, key=lambda entry: entry[1]):
+            if total_size <= self.max_size_bytes:
+                break
+            try:
+                os.remove(path)
+                total_size -= size
+                evicted += 1
+            except OSError:
+                pass
+        
+        self._count("evictions", evicted)
@@ -6,6 +6,8 @@ import pandas as pd
 from typing import Dict, List, Any, Union, Tuple, Optional
 from datetime import datetime
 
+from utils.keyword_matcher import get_keyword_matcher
+
 class LocalContentCalculator:
     """
     فئة لحساب وتحليل المحتوى المحلي في المناقصات
@@ -288,20 +290,19 @@ class LocalContentCalculator:
             "بنوك": "الخدمات المالية"
         }
         
+        matcher = get_keyword_matcher(project_to_sector)
+        
         # محاولة تحديد القطاع من نوع المشروع
         if project_type:
+            found = matcher.matches(project_type)
             for key, value in project_to_sector.items():
-                if key in project_type.lower():
+                if key in found:
                     return value
         
         # إذا لم يتم تحديد القطاع من نوع المشروع، نحاول تحديده من البيانات المستخرجة
         if "text" in extracted_data:
-            text = extracted_data["text"].lower()
-            sector_scores = {}
-            
-            for sector in self.sectors:
-                score = text.count(sector.lower())
-                sector_scores[sector] = score
+            # عدّ أسماء القطاعات في مرور واحد على النص
+            sector_scores = get_keyword_matcher(self.sectors).count(extracted_data["text"])
             
             # اختيار القطاع الأكثر ذكراً
             if sector_scores:
@@ -0,0 +1,144 @@
+import os
+import re
+import threading
+from typing import Dict, List, FrozenSet
+
+# قائمة مضمنة بالكلمات التوقفية العربية تُستخدم عند عدم توفر بيانات NLTK (مثل الخوادم المعزولة عن الإنترنت)
+ARABIC_STOPWORDS_FALLBACK = frozenset("""
+في من على إلى عن مع هذا هذه ذلك تلك هؤلاء أولئك الذي التي الذين اللاتي اللواتي ما ماذا متى أين كيف لماذا
+هل لا لم لن ليس ليست إن أن إذا إذ كان كانت كانوا يكون تكون أو أم ثم بل لكن حتى قد كل بعض غير بين عند
+عندما حيث منذ خلال بعد قبل أمام خلف فوق تحت هو هي هم هن أنا نحن أنت أنتم أنتن هما له لها لهم لهن به بها
+بهم فيه فيها فيهم منه منها منهم عليه عليها عليهم إليه إليها إليهم عنه عنها عنهم كما أيضا أيضاً ذات ذو
+و ف ب ل ك يا أي التى الى او اي اذا ان انه انها كذلك هنا هناك مثل نحو دون سوى لدى لدي إلا الا ضد وفق
+""".split())
+
+# موارد NLTK المطلوبة ومسار كل منها داخل مجلد البيانات
+NLTK_RESOURCES = {
+    "stopwords": "corpora/stopwords",
+    "punkt": "tokenizers/punkt"
+}
+
+_lock = threading.Lock()
+_availability: Dict[str, bool] = {}
+_stopwords: Dict[str, FrozenSet[str]] = {}
+
+
+def _auto_download() -> bool:
+    """
+    السماح بتنزيل موارد NLTK الناقصة (معطل افتراضياً لتجنب تعليق الخوادم المعزولة عن الإنترنت)
+    """
+    return os.getenv("NLTK_AUTO_DOWNLOAD", "False").lower() in ("true", "1", "t")
+
+
+def resource_available(name: str) -> bool:
+    """
+    التحقق من توفر أحد موارد NLTK (مرة واحدة لكل عملية)
+    
+    المعاملات:
+    ----------
+    name : str
+        اسم المورد ("stopwords" أو "punkt")
+    
+    المخرجات:
+    --------
+    bool
+        True إذا كان المورد متاحاً محلياً (أو تم تنزيله بنجاح)
+    """
+    with _lock:
+        if name in _availability:
+            return _availability[name]
+        
+        # استيراد NLTK عند أول حاجة إليه فقط لتقليل زمن بدء التشغيل
+        import nltk
+        
+        try:
+            nltk.data.find(NLTK_RESOURCES[name])
+            available = True
+        except LookupError:
+            available = False
+            if _auto_download():
+                try:
+                    available = bool(nltk.download(name, quiet=True))
+                except Exception as e:
+                    print(f"تعذر تنزيل مورد NLTK {name}: {str(e)}")
+        
+        _availability[name] = available
+        return available
+
+
+def get_stopwords(language: str = "arabic") -> FrozenSet[str]:
+    """
+    الحصول على الكلمات التوقفية للغة (تُحمَّل مرة واحدة لكل عملية)
+    
+    المعاملات:
+    ----------
+    language : str, optional
+        اللغة (افتراضي: "arabic")
+    
+    المخرجات:
+    --------
+    FrozenSet[str]
+        الكلمات التوقفية من NLTK، أو القائمة المضمنة للعربية عند عدم توفرها
+    """
+    if language in _stopwords:
+        return _stopwords[language]
+    
+    words = None
+    if resource_available("stopwords"):
+        from nltk.corpus import stopwords
+        try:
+            words = frozenset(stopwords.words(language))
+        except (LookupError, OSError):
+            words = None
+    
+    if words is None:
+        words = ARABIC_STOPWORDS_FALLBACK if language == "arabic" else frozenset()
+    
+    with _lock:
+        return _stopwords.setdefault(language, words)
+
+
+def word_tokenize(text: str) -> List[str]:
+    """
+    تقسيم النص إلى كلمات (باستخدام NLTK إذا توفر، وإلا بتقسيم بسيط على الحروف والأرقام)
+    
+    المعاملات:
+    ----------
+    text : str
+        النص
+    
+    المخرجات:
+    --------
+    List[str]
+        الكلمات وعلامات الترقيم
+    """
+    if resource_available("punkt"):
+        from nltk.tokenize import word_tokenize as nltk_word_tokenize
+        try:
+            return nltk_word_tokenize(text)
+        except LookupError:
+            pass
+    return re.findall(r'\w+|[^\w\s]', text)
+
+
+def sent_tokenize(text: str) -> List[str]:
+    """
+    تقسيم النص إلى جمل (باستخدام NLTK إذا توفر، وإلا بالتقسيم عند علامات نهاية الجملة)
+    
+    المعاملات:
+    ----------
+    text : str
+        النص
+    
+    المخرجات:
+    --------
+    List[str]
+        الجمل
+    """
+    if resource_available("punkt"):
+        from nltk.tokenize import sent_tokenize as nltk_sent_tokenize
+        try:
+            return nltk_sent_tokenize(text)
+        except LookupError:
+            pass
+    return [sentence.strip() for sentence in re.split(r'(?<=[.!?؟])\s+|\n+', text) if sentence.strip()]
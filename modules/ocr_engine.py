@@ -0,0 +1,310 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Any, Tuple, Optional
+import numpy as np
+
+import fitz  # PyMuPDF
+from PIL import Image
+import pytesseract
+
+from .document_sources import DocumentSource, source_path
+from utils.tracing import current_span, traced
+
+
+def binarize_image(image: np.ndarray) -> np.ndarray:
+    """
+    تحويل صورة رمادية إلى صورة ثنائية (أبيض وأسود) باستخدام عتبة Otsu
+    
+    المعاملات:
+    ----------
+    image : np.ndarray
+        مصفوفة الصورة الرمادية (uint8)
+    
+    المخرجات:
+    --------
+    np.ndarray
+        الصورة الثنائية بقيم 0 (نص) و 255 (خلفية)
+    """
+    histogram = np.bincount(image.ravel(), minlength=256).astype(np.float64)
+    total = histogram.sum()
+    if total == 0:
+        return image
+    
+    # حساب التباين بين الفئتين لكل عتبة ممكنة واختيار العتبة الأفضل
+    levels = np.arange(256)
+    weight_background = np.cumsum(histogram)
+    weight_foreground = total - weight_background
+    cumulative_mean = np.cumsum(histogram * levels)
+    mean_background = cumulative_mean / np.maximum(weight_background, 1)
+    mean_foreground = (cumulative_mean[-1] - cumulative_mean) / np.maximum(weight_foreground, 1)
+    between_variance = weight_background * weight_foreground * (mean_background - mean_foreground) ** 2
+    threshold = int(np.argmax(between_variance))
+    
+    return np.where(image > threshold, 255, 0).astype(np.uint8)
+
+
+def estimate_skew_angle(binary_image: np.ndarray, max_angle: float = 5.0, step: float = 0.25) -> float:
+    """
+    تقدير زاوية ميل الصفحة باستخدام الإسقاط الأفقي لبكسلات النص
+    
+    المعاملات:
+    ----------
+    binary_image : np.ndarray
+        الصورة الثنائية (النص بقيمة 0)
+    max_angle : float, optional
+        أقصى زاوية ميل يتم البحث عنها بالدرجات (افتراضي: 5.0)
+    step : float, optional
+        دقة البحث بالدرجات (افتراضي: 0.25)
+    
+    المخرجات:
+    --------
+    float
+        زاوية الميل بالدرجات (موجبة عكس اتجاه عقارب الساعة)
+    """
+    rows, cols = np.nonzero(binary_image == 0)
+    if rows.size == 0:
+        return 0.0
+    
+    # الاكتفاء بعينة من بكسلات النص لتسريع الحساب في الصفحات الكثيفة
+    if rows.size > 200000:
+        sample = np.random.default_rng(0).choice(rows.size, 200000, replace=False)
+        rows, cols = rows[sample], cols[sample]
+    
+    height = binary_image.shape[0]
+    best_angle, best_score = 0.0, -1.0
+    for angle in np.arange(-max_angle, max_angle + step / 2, step):
+        # إزاحة كل بكسل رأسياً بمقدار ميل السطر ثم قياس حدة الإسقاط الأفقي
+        shifted_rows = np.round(rows + cols * np.tan(np.radians(angle))).astype(np.int64)
+        shifted_rows -= shifted_rows.min()
+        profile = np.bincount(shifted_rows, minlength=height)
+        score = float(np.sum(np.diff(profile.astype(np.float64)) ** 2))
+        if score > best_score:
+            best_angle, best_score = float(angle), score
+    
+    return best_angle
+
+
+def preprocess_page_image(image: np.ndarray, deskew: bool = True) -> np.ndarray:
+    """
+    تجهيز صورة الصفحة قبل OCR (تحويل ثنائي ثم تصحيح الميل)
+    
+    المعاملات:
+    ----------
+    image : np.ndarray
+        مصفوفة الصورة الرمادية (uint8)
+    deskew : bool, optional
+        تصحيح ميل الصفحة (افتراضي: True)
+    
+    المخرجات:
+    --------
+    np.ndarray
+        الصورة بعد المعالجة
+    """
+    binary = binarize_image(image)
+    if not deskew:
+        return binary
+    
+    angle = estimate_skew_angle(binary)
+    if abs(angle) < 0.1:
+        return binary
+    
+    # تدوير الصورة لتصحيح الميل مع ملء الأطراف باللون الأبيض
+    rotated = Image.fromarray(binary).rotate(-angle, resample=Image.NEAREST, fillcolor=255)
+    return np.asarray(rotated)
+
+
+def _init_ocr_worker():
+    """
+    تهيئة عملية OCR الفرعية (منع Tesseract من إنشاء خيوط إضافية داخل كل عملية)
+    """
+    os.environ["OMP_THREAD_LIMIT"] = "1"
+
+
+def _open_pdf(source: DocumentSource) -> fitz.Document:
+    """
+    فتح ملف PDF من مسار أو من الذاكرة
+    """
+    return fitz.open(source) if isinstance(source, str) else fitz.open(stream=source, filetype="pdf")
+
+
+def _ocr_document_page(doc: fitz.Document, page_index: int, dpi: int, lang: str, preprocess: bool) -> str:
+    """
+    تطبيق OCR على صفحة واحدة من ملف PDF مفتوح
+    """
+    # تحويل الصفحة مباشرة إلى مصفوفة رمادية دون ترميز وسيط بصيغة PNG
+    pix = doc[page_index].get_pixmap(dpi=dpi, colorspace=fitz.csGRAY, alpha=False)
+    image = np.frombuffer(pix.samples_mv, dtype=np.uint8).reshape(pix.height, pix.stride)[:, :pix.width]
+    
+    if preprocess:
+        image = preprocess_page_image(image)
+    
+    return pytesseract.image_to_string(Image.fromarray(image), lang=lang)
+
+
+def _ocr_pdf_pages(source: DocumentSource, page_indices: List[int], dpi: int, lang: str,
+                   preprocess: bool) -> List[Tuple[int, str]]:
+    """
+    تطبيق OCR على مجموعة من صفحات ملف PDF (تُستدعى أيضاً داخل عملية منفصلة)
+    
+    المعاملات:
+    ----------
+    source : DocumentSource
+        مسار ملف PDF أو محتواه
+    page_indices : List[int]
+        أرقام الصفحات (تبدأ من 0)
+    dpi : int
+        دقة تحويل الصفحة إلى صورة
+    lang : str
+        لغات Tesseract
+    preprocess : bool
+        تطبيق التحويل الثنائي وتصحيح الميل
+    
+    المخرجات:
+    --------
+    List[Tuple[int, str]]
+        أرقام الصفحات ونصوصها (الصفحات التي فشلت معالجتها لا تُضمَّن)
+    """
+    results = []
+    doc = _open_pdf(source)
+    try:
+        for page_index in page_indices:
+            try:
+                results.append((page_index, _ocr_document_page(doc, page_index, dpi, lang, preprocess)))
+            except Exception as e:
+                print(f"خطأ في OCR للصفحة {page_index + 1}: {str(e)}")
+    finally:
+        doc.close()
+    return results
+
+
+class OCREngine:
+    """
+    محرك OCR لملفات PDF الممسوحة ضوئياً يوزع الصفحات على مجموعة من العمليات
+    """
+    
+    DEFAULT_DPI = 300
+    DEFAULT_LANG = "ara+eng"
+    
+    def __init__(self, dpi: int = DEFAULT_DPI, workers: Optional[int] = None,
+                 lang: str = DEFAULT_LANG, preprocess: bool = True):
+        """
+        تهيئة محرك OCR
+        
+        المعاملات:
+        ----------
+        dpi : int, optional
+            دقة تحويل الصفحات إلى صور (افتراضي: 300)
+        workers : int, optional
+            عدد العمليات المتوازية (افتراضي: عدد الأنوية)
+        lang : str, optional
+            لغات Tesseract (افتراضي: "ara+eng")
+        preprocess : bool, optional
+            تطبيق التحويل الثنائي وتصحيح الميل قبل OCR (افتراضي: True)
+        """
+        self.dpi = int(dpi)
+        self.workers = max(1, int(workers or os.cpu_count() or 1))
+        self.lang = lang
+        self.preprocess = preprocess
+    
+    @traced("ocr.pdf")
+    def ocr_pdf(self, source: DocumentSource, page_indices: Optional[List[int]] = None) -> Dict[int, str]:
+        """
+        تطبيق OCR على صفحات ملف PDF
+        
+        المعاملات:
+        ----------
+        source : DocumentSource
+            مسار ملف PDF أو محتواه
+        page_indices : List[int], optional
+            أرقام الصفحات المطلوبة (تبدأ من 0)، افتراضياً جميع الصفحات
+        
+        المخرجات:
+        --------
+        Dict[int, str]
+            نص OCR لكل صفحة تمت معالجتها بنجاح
+        """
+        if page_indices is None:
+            doc = _open_pdf(source)
+            page_indices = list(range(doc.page_count))
+            doc.close()
+        
+        if not page_indices:
+            return {}
+        
+        workers = min(self.workers, len(page_indices))
+        current_span().add_count("pages", len(page_indices))
+        current_span().set("workers", workers)
+        if workers == 1:
+            return dict(_ocr_pdf_pages(source, page_indices, self.dpi, self.lang, self.preprocess))
+        
+        # توزيع الصفحات بالتناوب على العمليات لموازنة الحمل بين الصفحات الكثيفة والخفيفة
+        batches = [page_indices[i::workers] for i in range(workers)]
+        
+        ocr_texts = {}
+        # تمرير مسار ملف إلى العمليات بدلاً من نسخ محتوى الملف إلى كل منها
+        with source_path(source, suffix=".pdf") as file_path:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_ocr_worker) as executor:
+                futures = [
+                    executor.submit(_ocr_pdf_pages, file_path, batch, self.dpi, self.lang, self.preprocess)
+                    for batch in batches
+                ]
+                for future, batch in zip(futures, batches):
+                    # فشل عملية كاملة (مثل انهيارها) يفقد صفحات دفعتها فقط دون نتائج الدفعات الأخرى
+                    try:
+                        ocr_texts.update(future.result())
+                    except Exception as e:
+                        pages = ", ".join(str(page_index + 1) for page_index in batch)
+                        print(f"خطأ في OCR للصفحات {pages}: {str(e)}")
+        
+        return ocr_texts
+    
+    def open_pdf(self, source: DocumentSource) -> fitz.Document:
+        """
+        فتح ملف PDF مرة واحدة لتطبيق OCR على صفحاته تباعاً عبر ocr_page (يغلقه المستدعي)
+        
+        المعاملات:
+        ----------
+        source : DocumentSource
+            مسار ملف PDF أو محتواه
+        
+        المخرجات:
+        --------
+        fitz.Document
+            الملف المفتوح
+        """
+        return _open_pdf(source)
+    
+    @traced("ocr.page")
+    def ocr_page(self, document: fitz.Document, page_index: int) -> str:
+        """
+        تطبيق OCR على صفحة واحدة من ملف PDF مفتوح عبر open_pdf (في العملية الحالية)
+        
+        المعاملات:
+        ----------
+        document : fitz.Document
+            الملف المفتوح
+        page_index : int
+            رقم الصفحة (يبدأ من 0)
+        
+        المخرجات:
+        --------
+        str
+            نص الصفحة
+        """
+        return _ocr_document_page(document, page_index, self.dpi, self.lang, self.preprocess)
+    
+    def get_settings(self) -> Dict[str, Any]:
+        """
+        الحصول على إعدادات المحرك الحالية
+        
+        المخرجات:
+        --------
+        Dict[str, Any]
+            الإعدادات
+        """
+        return {
+            "dpi": self.dpi,
+            "workers": self.workers,
+            "lang": self.lang,
+            "preprocess": self.preprocess
+        }
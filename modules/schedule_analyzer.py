@@ -7,6 +7,8 @@ import pandas as pd
 from typing import Dict, List, Any, Union, Tuple, Optional
 from datetime import datetime, timedelta
 
+from utils.keyword_matcher import get_keyword_matcher
+
 class ScheduleAnalyzer:
     """
     فئة لتحليل الجدول الزمني للمناقصات
@@ -392,22 +394,23 @@ class ScheduleAnalyzer:
             "تطبيقات": "تقنية المعلومات"
         }
         
+        matcher = get_keyword_matcher(project_to_sector)
+        
         # محاولة تحديد القطاع من نوع المشروع
         if project_type:
+            found = matcher.matches(project_type)
             for key, value in project_to_sector.items():
-                if key in project_type.lower():
+                if key in found:
                     return value
         
         # إذا لم يتم تحديد القطاع من نوع المشروع، نحاول تحديده من البيانات المستخرجة
         if "text" in extracted_data:
-            text = extracted_data["text"].lower()
+            # عدّ جميع الكلمات المفتاحية في مرور واحد على النص
+            counts = matcher.count(extracted_data["text"])
             sector_scores = {}
             
             for key, value in project_to_sector.items():
-                score = text.count(key.lower())
-                if value not in sector_scores:
-                    sector_scores[value] = 0
-                sector_scores[value] += score
+                sector_scores[value] = sector_scores.get(value, 0) + counts[key]
             
             # اختيار القطاع الأكثر ذكراً
             if sector_scores:
@@ -504,6 +507,9 @@ class ScheduleAnalyzer:
                 r'(معلم|محطة|مرحلة|تسليم)[^:]*بتاريخ[^:]*:(.*?)(?=\n|$)'
             ]
             
+            # أوصاف المعالم المضافة (للتحقق من التكرار دون المرور على جميع المعالم لكل مطابقة)
+            milestone_descriptions = {milestone["description"] for milestone in schedule_info["milestones"]}
+            
             for pattern in milestone_patterns:
                 matches = re.finditer(pattern, text)
                 for match in matches:
@@ -524,7 +530,8 @@ class ScheduleAnalyzer:
                             date_obj = datetime(year, month, day).date()
                             
                             # التحقق من عدم وجود هذا المعلم مسبقاً
-                            if not any(milestone["description"] == milestone_description for milestone in schedule_info["milestones"]):
+                            if milestone_description not in milestone_descriptions:
+                                milestone_descriptions.add(milestone_description)
                                 schedule_info["milestones"].append({
                                     "name": milestone_type,
                                     "date": date_obj,
@@ -5,6 +5,9 @@ import numpy as np
 from typing import Dict, List, Any, Union, Tuple, Optional
 from datetime import datetime
 
+from utils.keyword_matcher import get_keyword_matcher
+from utils.supplier_store import SupplierStore
+
 class SupplyChainAnalyzer:
     """
     فئة لتحليل سلسلة الإمداد في المناقصات
@@ -14,8 +17,8 @@ class SupplyChainAnalyzer:
         """
         تهيئة محلل سلسلة الإمداد
         """
-        # تحميل قاعدة بيانات الموردين
-        self.suppliers_db = self._load_suppliers_database()
+        # تحميل قاعدة بيانات الموردين (في المخزن العمودي المشترك مع قاعدة بيانات الموردين المحليين)
+        self.suppliers_db = SupplierStore.from_records(self._load_suppliers_database().values())
         
         # تحميل قاعدة بيانات المواد
         self.materials_db = self._load_materials_database()
@@ -180,21 +183,16 @@ class SupplyChainAnalyzer:
         """
         الحصول على قاعدة بيانات الموردين كـ DataFrame
         """
-        suppliers_list = []
-        
-        for supplier_id, supplier_data in self.suppliers_db.items():
-            supplier_info = {
-                "id": supplier_data["id"],
-                "name": supplier_data["name"],
-                "sector": supplier_data["sector"],
-                "location": supplier_data["location"],
-                "categories": ", ".join(supplier_data["categories"]),
-                "local_content_percentage": supplier_data["local_content_percentage"],
-                "rating": supplier_data["rating"]
-            }
-            suppliers_list.append(supplier_info)
-        
-        return pd.DataFrame(suppliers_list)
+        # بناء الأعمدة من المخزن مباشرة دون إنشاء قاموس لكل مورد
+        return pd.DataFrame({
+            "id": self.suppliers_db.values("id"),
+            "name": self.suppliers_db.values("name"),
+            "sector": self.suppliers_db.values("sector"),
+            "location": self.suppliers_db.values("location"),
+            "categories": [", ".join(categories) for categories in self.suppliers_db.values("categories", [])],
+            "local_content_percentage": self.suppliers_db.values("local_content_percentage"),
+            "rating": self.suppliers_db.values("rating")
+        })
     
     def analyze(self, extracted_data: Dict[str, Any], **kwargs) -> Dict[str, Any]:
         """
@@ -272,22 +270,23 @@ class SupplyChainAnalyzer:
             "أسواق": "التجارة"
         }
         
+        matcher = get_keyword_matcher(project_to_sector)
+        
         # محاولة تحديد القطاع من نوع المشروع
         if project_type:
+            found = matcher.matches(project_type)
             for key, value in project_to_sector.items():
-                if key in project_type.lower():
+                if key in found:
                     return value
         
         # إذا لم يتم تحديد القطاع من نوع المشروع، نحاول تحديده من البيانات المستخرجة
         if "text" in extracted_data:
-            text = extracted_data["text"].lower()
+            # عدّ جميع الكلمات المفتاحية في مرور واحد على النص
+            counts = matcher.count(extracted_data["text"])
             sector_scores = {}
             
             for key, value in project_to_sector.items():
-                score = text.count(key.lower())
-                if value not in sector_scores:
-                    sector_scores[value] = 0
-                sector_scores[value] += score
+                sector_scores[value] = sector_scores.get(value, 0) + counts[key]
             
             # اختيار القطاع الأكثر ذكراً
             if sector_scores:
@@ -427,29 +426,27 @@ class SupplyChainAnalyzer:
             if "category" in material:
                 material_categories.add(material["category"])
         
-        # تحديد الموردين المحتملين بناءً على المواد المطلوبة والقطاع
-        for supplier_id, supplier_data in self.suppliers_db.items():
-            # التحقق من القطاع
-            if supplier_data["sector"] == sector or supplier_data["sector"] == "عام":
-                # التحقق من فئات المواد
-                supplier_categories = set(supplier_data["categories"])
+        # تحديد الموردين المحتملين بناءً على القطاع وفئات المواد المطلوبة (بأقنعة على أعمدة المخزن)
+        candidates = self.suppliers_db.isin("sector", [sector, "عام"])
+        if material_categories:
+            candidates &= self.suppliers_db.isin("categories", material_categories)
                 
-                if material_categories.intersection(supplier_categories) or not material_categories:
-                    supplier_info = {
-                        "id": supplier_data["id"],
-                        "name": supplier_data["name"],
-                        "sector": supplier_data["sector"],
-                        "location": supplier_data["location"],
-                        "categories": supplier_data["categories"],
-                        "local_content_percentage": supplier_data["local_content_percentage"],
-                        "rating": supplier_data["rating"],
-                        "contact": supplier_data["contact"],
-                        "certifications": supplier_data["certifications"],
-                        "historical_performance": supplier_data["historical_performance"],
-                        "match_score": self._calculate_supplier_match_score(supplier_data, needed_materials, sector)
-                    }
+        for supplier_data in self.suppliers_db.records(np.flatnonzero(candidates)):
+            supplier_info = {
+                "id": supplier_data["id"],
+                "name": supplier_data["name"],
+                "sector": supplier_data["sector"],
+                "location": supplier_data["location"],
+                "categories": supplier_data["categories"],
+                "local_content_percentage": supplier_data["local_content_percentage"],
+                "rating": supplier_data["rating"],
+                "contact": supplier_data["contact"],
+                "certifications": supplier_data["certifications"],
+                "historical_performance": supplier_data["historical_performance"],
+                "match_score": self._calculate_supplier_match_score(supplier_data, needed_materials, sector)
+            }
                     
-                    potential_suppliers.append(supplier_info)
+            potential_suppliers.append(supplier_info)
         
         # ترتيب الموردين المحتملين بناءً على درجة التطابق
         potential_suppliers = sorted(potential_suppliers, key=lambda x: x["match_score"], reverse=True)
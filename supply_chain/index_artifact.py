@@ -0,0 +1,202 @@
+"""
+ملف فهارس الموردين المبني مسبقاً
+يحفظ بيانات الموردين والمنتجات وفهارس البحث والمطابقة المبنية منها في ملف ثنائي واحد ذي إصدار وبصمة تحقق،
+فتحمّله كل نسخة جديدة من SuppliersDatabase (نسخة لكل جلسة Streamlit) بدلاً من إعادة قراءة ملفات JSON
+وإعادة بناء الفهارس، ولا يعاد بناؤه إلا عند تغير بصمة ملفات المصدر أو شيفرة الفهرسة
+
+الاستخدام (بناء الملف مسبقاً قبل تشغيل التطبيق):
+    python -m supply_chain.index_artifact [--suppliers-file ...] [--products-file ...] [--output ...] [--force]
+"""
+
+import os
+import sys
+import mmap
+import pickle
+import hashlib
+import logging
+import argparse
+import tempfile
+from functools import lru_cache
+from typing import Dict, List, Any, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+# صيغة الملف: المعرّف، ثم الإصدار (بايتان)، ثم بصمة المصدر وبصمة المحتوى (SHA-256)، ثم الفهارس بصيغة pickle
+ARTIFACT_MAGIC = b"SUPIDX"
+INDEX_ARTIFACT_VERSION = 1
+HEADER_SIZE = len(ARTIFACT_MAGIC) + 2 + 32 + 32
+
+# ملفات الشيفرة التي تحدد محتوى الفهارس (تغيّرها يبطل الملفات المبنية سابقاً)
+CODE_FILES = (
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "suppliers_database.py"),
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "utils", "arabic_normalizer.py"),
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "utils", "supplier_store.py")
+)
+
+
+@lru_cache(maxsize=None)
+def _code_digest(path: str) -> bytes:
+    """
+    بصمة ملف شيفرة (تُحسب مرة واحدة لكل عملية)
+    """
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).digest()
+    except OSError:
+        return b""
+
+
+def source_fingerprint(paths: Iterable[str]) -> Optional[bytes]:
+    """
+    بصمة ملفات المصدر (بمحتواها) مع إصدار الصيغة وشيفرة الفهرسة
+    
+    المعاملات:
+    ----------
+    paths : Iterable[str]
+        ملفات بيانات الموردين والمنتجات
+    
+    المخرجات:
+    --------
+    bytes or None
+        البصمة، أو None إذا كان أحد الملفات غير موجود (البيانات الافتراضية لا تُحفظ)
+    """
+    digest = hashlib.sha256(str(INDEX_ARTIFACT_VERSION).encode("ascii"))
+    for path in CODE_FILES:
+        digest.update(_code_digest(path))
+    
+    for path in paths:
+        try:
+            with open(path, "rb") as f:
+                digest.update(hashlib.sha256(f.read()).digest())
+        except OSError:
+            return None
+    
+    return digest.digest()
+
+
+def load_index_artifact(path: str, fingerprint: bytes) -> Optional[Dict[str, Any]]:
+    """
+    تحميل الفهارس من الملف المبني مسبقاً (بربط الملف بالذاكرة دون نسخه قبل فك الترميز)
+    
+    المعاملات:
+    ----------
+    path : str
+        مسار الملف
+    fingerprint : bytes
+        بصمة ملفات المصدر الحالية
+    
+    المخرجات:
+    --------
+    Dict[str, Any] or None
+        الفهارس، أو None إذا كان الملف غير موجود أو من إصدار آخر أو لمصدر آخر أو تالفاً
+    """
+    try:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if len(mapped) < HEADER_SIZE or mapped[:len(ARTIFACT_MAGIC)] != ARTIFACT_MAGIC:
+                logger.warning(f"ملف فهارس الموردين غير صالح: {path}")
+                return None
+            
+            offset = len(ARTIFACT_MAGIC)
+            version = int.from_bytes(mapped[offset:offset + 2], "big")
+            stored_fingerprint = mapped[offset + 2:offset + 34]
+            checksum = mapped[offset + 34:HEADER_SIZE]
+            if version != INDEX_ARTIFACT_VERSION or stored_fingerprint != fingerprint:
+                return None
+            
+            with memoryview(mapped) as view:
+                payload = view[HEADER_SIZE:]
+                try:
+                    if hashlib.sha256(payload).digest() != checksum:
+                        logger.warning(f"بصمة محتوى ملف فهارس الموردين غير مطابقة: {path}")
+                        return None
+                    return pickle.loads(payload)
+                finally:
+                    payload.release()
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, pickle.UnpicklingError, EOFError, AttributeError, ImportError) as e:
+        logger.warning(f"فشل في تحميل ملف فهارس الموردين: {str(e)}")
+        return None
+
+
+def save_index_artifact(path: str, fingerprint: bytes, state: Dict[str, Any]) -> bool:
+    """
+    حفظ الفهارس في ملف جديد
+    
+    المعاملات:
+    ----------
+    path : str
+        مسار الملف
+    fingerprint : bytes
+        بصمة ملفات المصدر التي بُنيت منها الفهارس
+    state : Dict[str, Any]
+        الفهارس
+    
+    المخرجات:
+    --------
+    bool
+        نجاح أو فشل العملية
+    """
+    payload = pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+    header = (ARTIFACT_MAGIC + INDEX_ARTIFACT_VERSION.to_bytes(2, "big") + fingerprint
+              + hashlib.sha256(payload).digest())
+    
+    # الكتابة في ملف مؤقت ثم استبداله حتى لا تقرأ جلسة أخرى ملفاً غير مكتمل
+    directory = os.path.dirname(os.path.abspath(path))
+    temp_path = None
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(header)
+            f.write(payload)
+        os.replace(temp_path, path)
+    except OSError as e:
+        logger.warning(f"فشل في حفظ ملف فهارس الموردين: {str(e)}")
+        if temp_path and os.path.exists(temp_path):
+            os.remove(temp_path)
+        return False
+    
+    return True
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    نقطة الدخول لسطر الأوامر: بناء ملف فهارس الموردين من ملفات المصدر
+    """
+    from config import get_config
+    from supply_chain.suppliers_database import SuppliersDatabase
+    
+    config = dict(get_config("suppliers_database"))
+    parser = argparse.ArgumentParser(description="بناء ملف فهارس الموردين والمنتجات مسبقاً")
+    parser.add_argument("--suppliers-file", default=config["suppliers_file"], help="ملف بيانات الموردين")
+    parser.add_argument("--products-file", default=config["products_file"], help="ملف بيانات المنتجات")
+    parser.add_argument("--output", "-o", default=config["index_artifact_path"], help="مسار ملف الفهارس")
+    parser.add_argument("--force", action="store_true", help="إعادة البناء حتى لو لم تتغير ملفات المصدر")
+    args = parser.parse_args(argv)
+    
+    for path in (args.suppliers_file, args.products_file):
+        if not os.path.exists(path):
+            print(f"الملف غير موجود: {path}", file=sys.stderr)
+            return 2
+    
+    if args.force and os.path.exists(args.output):
+        os.remove(args.output)
+    
+    config.update({
+        "suppliers_file": args.suppliers_file,
+        "products_file": args.products_file,
+        "index_artifact": True,
+        "index_artifact_path": args.output
+    })
+    database = SuppliersDatabase(config)
+    if not os.path.exists(args.output):
+        return 1
+    
+    print(f"الموردون: {database.get_total_suppliers()}، المنتجات: {database.get_total_products()}")
+    print(f"ملف الفهارس: {args.output} ({os.path.getsize(args.output) / 1024 / 1024:.1f} ميغابايت)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
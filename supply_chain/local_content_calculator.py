@@ -1,9 +1,73 @@
-# الحصول على معلومات العمالة
+"""
+حاسبة نسب المحتوى المحلي
+تقوم بحساب نسب المحتوى المحلي وفقًا للوائح هيئة المحتوى المحلي وتنمية القطاع الخاص
+"""
+
+import logging
+import json
+import os
+from typing import Dict, List, Any, Tuple, Optional, Union
+
+from utils.tracing import current_span, traced
+
+logger = logging.getLogger(__name__)
+
+class LocalContentCalculator:
+    """
+    حاسبة نسب المحتوى المحلي
+    """
+    
+    def __init__(self, config=None):
+        """
+        تهيئة حاسبة المحتوى المحلي
+        
+        المعاملات:
+        ----------
+        config : Dict, optional
+            إعدادات الحاسبة
+        """
+        self.config = config or {}
+        
+        # تحميل قواعد حساب المحتوى المحلي
+        self.calculation_rules = self._load_calculation_rules()
+        
+        logger.info("تم تهيئة حاسبة المحتوى المحلي")
+    
+    @traced("supply_chain.local_content_calculator.calculate")
+    def calculate(self, project_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        حساب نسب المحتوى المحلي للمشروع
+        
+        المعاملات:
+        ----------
+        project_data : Dict[str, Any]
+            بيانات المشروع
+            
+        المخرجات:
+        --------
+        Dict[str, Any]
+            نتائج حساب المحتوى المحلي
+        """
+        try:
+            logger.info("بدء حساب نسب المحتوى المحلي")
+            
+            # الحصول على معلومات القطاع
+            sector = project_data.get("sector", "general")
+            
+            # الحصول على معلومات المواد
+            materials = project_data.get("materials", [])
+            
+            # الحصول على معلومات العمالة
             labor = project_data.get("labor", [])
             
             # الحصول على معلومات الخدمات
             services = project_data.get("services", [])
             
+            trace = current_span()
+            trace.add_count("materials", len(materials))
+            trace.add_count("labor", len(labor))
+            trace.add_count("services", len(services))
+            
             # حساب نسبة المحتوى المحلي للمواد
             materials_local_content = self._calculate_materials_local_content(materials, sector)
             
@@ -497,58 +561,7 @@
                     "labor_weight": 0.4,
                     "services_weight": 0.2,
                     "materials": 0.9,
-                """
-حاسبة نسب المحتوى المحلي
-تقوم بحساب نسب المحتوى المحلي وفقًا للوائح هيئة المحتوى المحلي وتنمية القطاع الخاص
-"""
-
-import logging
-import json
-import os
-from typing import Dict, List, Any, Tuple, Optional, Union
-
-logger = logging.getLogger(__name__)
-
-class LocalContentCalculator:
-    """
-    حاسبة نسب المحتوى المحلي
-    """
-    
-    def __init__(self, config=None):
-        """
-        تهيئة حاسبة المحتوى المحلي
-        
-        المعاملات:
-        ----------
-        config : Dict, optional
-            إعدادات الحاسبة
-        """
-        self.config = config or {}
-        
-        # تحميل قواعد حساب المحتوى المحلي
-        self.calculation_rules = self._load_calculation_rules()
-        
-        logger.info("تم تهيئة حاسبة المحتوى المحلي")
-    
-    def calculate(self, project_data: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        حساب نسب المحتوى المحلي للمشروع
-        
-        المعاملات:
-        ----------
-        project_data : Dict[str, Any]
-            بيانات المشروع
-            
-        المخرجات:
-        --------
-        Dict[str, Any]
-            نتائج حساب المحتوى المحلي
-        """
-        try:
-            logger.info("بدء حساب نسب المحتوى المحلي")
-            
-            # الحصول على معلومات القطاع
-            sector = project_data.get("sector", "general")
-            
-            # الحصول على معلومات المواد
-            materials = project_data.get("materials", [])
\ No newline at end of file
+                    "services": 1.1
+                }
+            }
+        }
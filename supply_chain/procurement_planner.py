@@ -8,6 +8,8 @@ import datetime
 from typing import Dict, List, Any, Tuple, Optional, Union
 from collections import defaultdict
 
+from utils.tracing import traced
+
 logger = logging.getLogger(__name__)
 
 class ProcurementPlanner:
@@ -31,6 +33,7 @@ class ProcurementPlanner:
         
         logger.info("تم تهيئة مخطط المشتريات")
     
+    @traced("supply_chain.procurement_planner.generate_plan")
     def generate_plan(self, local_content_data: Dict[str, Any], 
                      suppliers_data: Dict[str, Any]) -> Dict[str, Any]:
         """
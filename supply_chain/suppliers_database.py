@@ -5,13 +5,41 @@
 
 import json
 import logging
+import math
 import os
 import re
-from typing import Dict, List, Any, Tuple, Optional, Union
+from typing import Dict, FrozenSet, List, Any, Set, Tuple, Optional, Union
 from collections import defaultdict
 
+import numpy as np
+
+from utils.arabic_normalizer import normalize_arabic, normalize_term, normalized_words, word_similarity, words_similarity
+from utils.supplier_store import SupplierStore
+from utils.tracing import current_span, traced
+from supply_chain.index_artifact import source_fingerprint, load_index_artifact, save_index_artifact
+
 logger = logging.getLogger(__name__)
 
+# عتبة التشابه لمطابقة أسماء المواد والمنتجات
+PRODUCT_SIMILARITY_THRESHOLD = 0.7
+
+# ملفات البيانات وملف الفهارس المبني مسبقاً (يمكن تجاوزها من الإعدادات)
+DEFAULT_SUPPLIERS_FILE = "data/templates/local_suppliers.json"
+DEFAULT_PRODUCTS_FILE = "data/templates/local_materials.json"
+DEFAULT_INDEX_ARTIFACT_PATH = "data/indexes/suppliers_index.pkl"
+
+# البيانات والفهارس المحفوظة في ملف الفهارس
+INDEX_STATE_ATTRIBUTES = (
+    "suppliers", "products", "supplier_products", "product_suppliers", "_suppliers_by_id", "_normalized_suppliers",
+    "_supplier_trigram_index", "_product_entries", "_product_word_index"
+)
+
+def _trigrams(text: str) -> Set[str]:
+    """
+    المقاطع الثلاثية (ثلاثة أحرف متتالية) في نص موحد
+    """
+    return {text[index:index + 3] for index in range(len(text) - 2)}
+
 class SuppliersDatabase:
     """
     قاعدة بيانات الموردين المحليين
@@ -28,18 +56,25 @@ class SuppliersDatabase:
         """
         self.config = config or {}
         
-        # تحميل بيانات الموردين
-        self.suppliers = self._load_suppliers()
-        
-        # تحميل بيانات المنتجات
-        self.products = self._load_products()
-        
-        # تهيئة فهارس البحث
-        self._initialize_indexes()
+        # تحميل البيانات والفهارس من الملف المبني مسبقاً إذا لم تتغير ملفات المصدر
+        if not self._load_index_artifact():
+            # تحميل بيانات الموردين
+            self.suppliers = self._load_suppliers()
+            
+            # تحميل بيانات المنتجات
+            self.products = self._load_products()
+            
+            # تهيئة فهارس البحث
+            self._initialize_indexes()
+            
+            # حفظ الفهارس لتحميلها في النسخ التالية
+            self._save_index_artifact()
         
         logger.info(f"تم تهيئة قاعدة بيانات الموردين: {len(self.suppliers)} مورد")
     
-    def search_suppliers(self, query: str, category: Optional[str] = None) -> List[Dict[str, Any]]:
+    @traced("supply_chain.suppliers_database.search_suppliers")
+    def search_suppliers(self, query: str, category: Optional[str] = None, limit: Optional[int] = None,
+                         rank: bool = False) -> List[Dict[str, Any]]:
         """
         البحث عن الموردين
         
@@ -49,40 +84,105 @@ class SuppliersDatabase:
             استعلام البحث
         category : str, optional
             فئة المورد
+        limit : int, optional
+            الحد الأقصى لعدد النتائج (افتراضي: جميع النتائج)
+        rank : bool, optional
+            ترتيب النتائج حسب موضع المطابقة: بداية اسم المورد، ثم بداية كلمة فيه، ثم داخله، ثم المنطقة، ثم المنتجات
+            (افتراضي: بترتيب الموردين في قاعدة البيانات)
             
         المخرجات:
         --------
         List[Dict[str, Any]]
             قائمة الموردين المطابقين
         """
+        # تنظيف الاستعلام وتوحيده بالصيغة نفسها المستخدمة في الفهرس
+        query = normalize_arabic(query).strip()
+        
+        # التحقق من الفئة إذا تم تحديدها
+        if category == "الكل":
+            category = None
+        
+        # المرشحون: الموردون الذين تحتوي حقولهم على أندر المقاطع الثلاثية للاستعلام (بترتيبهم في قاعدة البيانات)،
+        # والاستعلامات الأقصر من ثلاثة أحرف تُفحص على جميع الموردين
+        query_trigrams = _trigrams(query)
+        if query_trigrams:
+            positions = min((self._supplier_trigram_index.get(trigram, []) for trigram in query_trigrams), key=len)
+        else:
+            positions = range(len(self.suppliers))
+        
+        # تصفية المرشحين حسب الفئة بقناع على عمود الفئة
+        if category:
+            positions = np.asarray(positions, dtype=np.int64)
+            positions = positions[self.suppliers.isin("category", [category])[positions]].tolist()
+        current_span().add_count("candidates", len(positions))
+        
+        # التحقق من المطابقة في اسم المورد ومنطقته ومنتجاته
         results = []
+        ranked_matches = []
+        best_matches = 0
+        for position in positions:
+            name, region, products = self._normalized_suppliers[position]
+            if rank:
+                match_rank = self._search_rank(query, name, region, products)
+                if match_rank is None:
+                    continue
+                ranked_matches.append((match_rank, position))
+                
+                # لا يتقدم أي مورد لاحق على المطابقات في بداية الاسم
+                if match_rank == 0:
+                    best_matches += 1
+                    if limit and best_matches >= limit:
+                        break
+            elif query in name or query in region or any(query in product for product in products):
+                results.append(self.suppliers[position])
+                if limit and len(results) >= limit:
+                    break
+        
+        if rank:
+            ranked_matches.sort(key=lambda match: match[0])
+            results = [self.suppliers[position] for _, position in ranked_matches[:limit]]
         
-        # تنظيف الاستعلام
-        query = query.lower().strip()
+        return results
+    
+    def _search_rank(self, query: str, name: str, region: str, products: List[str]) -> Optional[int]:
+        """
+        موضع مطابقة الاستعلام في حقول المورد الموحدة
         
-        # البحث عن الموردين المطابقين
-        for supplier in self.suppliers:
-            # التحقق من الفئة إذا تم تحديدها
-            if category and category != "الكل" and supplier.get("category") != category:
-                continue
-            
-            # البحث في اسم المورد
-            if query in supplier.get("name", "").lower():
-                results.append(supplier)
-                continue
-            
-            # البحث في المنطقة
-            if query in supplier.get("region", "").lower():
-                results.append(supplier)
-                continue
+        المعاملات:
+        ----------
+        query : str
+            الاستعلام الموحد
+        name : str
+            اسم المورد الموحد
+        region : str
+            المنطقة الموحدة
+        products : List[str]
+            المنتجات الموحدة
             
-            # البحث في المنتجات
-            if any(query in product.lower() for product in supplier.get("products", [])):
-                results.append(supplier)
-                continue
-        
-        return results
+        المخرجات:
+        --------
+        Optional[int]
+            رتبة المطابقة (الأصغر أولاً)، أو None إذا لم يطابق المورد
+        """
+        # البحث في اسم المورد
+        if query in name:
+            if name.startswith(query):
+                return 0
+            if f" {query}" in name:
+                return 1
+            return 2
+        
+        # البحث في المنطقة
+        if query in region:
+            return 3
+        
+        # البحث في المنتجات
+        if any(query in product for product in products):
+            return 4
+        
+        return None
     
+    @traced("supply_chain.suppliers_database.find_matching_suppliers")
     def find_matching_suppliers(self, materials: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         البحث عن الموردين المطابقين للمواد المطلوبة
@@ -106,30 +206,29 @@ class SuppliersDatabase:
         
         material_suppliers = {}
         all_matching_suppliers = []
+        current_span().add_count("materials", len(materials))
+        
+        # مطابقة أسماء المواد بالمنتجات دفعة واحدة (مرة واحدة لكل اسم مهما تكرر في جدول الكميات)
+        product_matches = self._match_products_batch([material.get("name", "") for material in materials])
+        current_span().add_count("distinct_materials", len(product_matches))
         
         # البحث عن الموردين المطابقين لكل مادة
         for material in materials:
             material_name = material.get("name", "")
-            if not material_name:
+            if not material_name or material_name in material_suppliers:
                 continue
             
-            # البحث عن المنتجات المطابقة
-            matching_products = []
-            for product_id, product in self.products.items():
-                similarity = self._calculate_similarity(material_name, product.get("name", ""))
-                if similarity > 0.7:  # عتبة التشابه
-                    matching_products.append((product_id, similarity))
-            
-            # ترتيب المنتجات حسب التشابه
-            matching_products.sort(key=lambda x: x[1], reverse=True)
+            # ترتيب المنتجات المطابقة حسب التشابه
+            matching_products = sorted(product_matches[material_name], key=lambda x: x[1], reverse=True)
             
             # البحث عن الموردين لهذه المنتجات
             suppliers_for_material = []
             for product_id, similarity in matching_products[:5]:  # أفضل 5 منتجات
                 product_suppliers = self.product_suppliers.get(product_id, [])
                 for supplier_id in product_suppliers:
-                    supplier = next((s for s in self.suppliers if s.get("id") == supplier_id), None)
-                    if supplier:
+                    position = self._suppliers_by_id.get(supplier_id)
+                    if position is not None:
+                        supplier = self.suppliers[position]
                         suppliers_for_material.append(supplier)
                         all_matching_suppliers.append(supplier)
             
@@ -149,6 +248,12 @@ class SuppliersDatabase:
             coverage = min(100.0, len(unique_suppliers) * 20.0)  # كل مورد يغطي 20% بحد أقصى 100%
             results["material_coverage"][material_name] = coverage
         
+        # المواد التي يوفرها كل مورد (بترتيب المواد، في مرور واحد بدلاً من البحث في جميع المواد لكل مورد)
+        materials_by_supplier = defaultdict(list)
+        for material_name, suppliers in material_suppliers.items():
+            for supplier in suppliers:
+                materials_by_supplier[supplier.get("id")].append(material_name)
+        
         # إزالة التكرارات من قائمة الموردين
         unique_matching_suppliers = []
         supplier_ids = set()
@@ -158,13 +263,8 @@ class SuppliersDatabase:
                 supplier_ids.add(supplier_id)
                 
                 # إضافة معلومات المواد التي يوفرها المورد
-                supplier_materials = []
-                for material_name, suppliers in material_suppliers.items():
-                    if any(s.get("id") == supplier_id for s in suppliers):
-                        supplier_materials.append(material_name)
-                
                 supplier_copy = supplier.copy()
-                supplier_copy["materials"] = supplier_materials
+                supplier_copy["materials"] = list(materials_by_supplier[supplier_id])
                 
                 unique_matching_suppliers.append(supplier_copy)
         
@@ -226,7 +326,7 @@ class SuppliersDatabase:
         int
             عدد المناطق المغطاة
         """
-        regions = set(supplier.get("region", "") for supplier in self.suppliers if supplier.get("region"))
+        regions = [region for region in self.suppliers.vocabulary("region") if region]
         return len(regions)
     
     def get_suppliers_by_region(self) -> Dict[str, int]:
@@ -238,12 +338,7 @@ class SuppliersDatabase:
         Dict[str, int]
             توزيع الموردين حسب المنطقة
         """
-        region_counts = defaultdict(int)
-        for supplier in self.suppliers:
-            region = supplier.get("region", "غير محدد")
-            region_counts[region] += 1
-        
-        return dict(region_counts)
+        return self.suppliers.value_counts("region", "غير محدد")
     
     def get_suppliers_by_category(self) -> Dict[str, int]:
         """
@@ -254,12 +349,7 @@ class SuppliersDatabase:
         Dict[str, int]
             توزيع الموردين حسب الفئة
         """
-        category_counts = defaultdict(int)
-        for supplier in self.suppliers:
-            category = supplier.get("category", "غير محدد")
-            category_counts[category] += 1
-        
-        return dict(category_counts)
+        return self.suppliers.value_counts("category", "غير محدد")
     
     def _load_suppliers(self) -> List[Dict[str, Any]]:
         """
@@ -271,7 +361,7 @@ class SuppliersDatabase:
             بيانات الموردين
         """
         try:
-            file_path = 'data/templates/local_suppliers.json'
+            file_path = self.config.get("suppliers_file", DEFAULT_SUPPLIERS_FILE)
             if os.path.exists(file_path):
                 with open(file_path, 'r', encoding='utf-8') as f:
                     suppliers = json.load(f)
@@ -300,7 +390,7 @@ class SuppliersDatabase:
             بيانات المنتجات
         """
         try:
-            file_path = 'data/templates/local_materials.json'
+            file_path = self.config.get("products_file", DEFAULT_PRODUCTS_FILE)
             if os.path.exists(file_path):
                 with open(file_path, 'r', encoding='utf-8') as f:
                     materials = json.load(f)
@@ -324,29 +414,130 @@ class SuppliersDatabase:
             logger.error(f"فشل في تحميل بيانات المنتجات: {str(e)}")
             return self._create_default_products()
     
+    def _index_artifact_fingerprint(self) -> Optional[bytes]:
+        """
+        بصمة ملفات المصدر لملف الفهارس، أو None إذا كان ملف الفهارس معطلاً أو لم تكن ملفات المصدر موجودة
+        """
+        if not self.config.get("index_artifact", True):
+            return None
+        
+        return source_fingerprint([
+            self.config.get("suppliers_file", DEFAULT_SUPPLIERS_FILE),
+            self.config.get("products_file", DEFAULT_PRODUCTS_FILE)
+        ])
+    
+    def _load_index_artifact(self) -> bool:
+        """
+        تحميل البيانات والفهارس من الملف المبني مسبقاً
+        
+        المخرجات:
+        --------
+        bool
+            True إذا حُمّلت الفهارس، و False إذا يجب بناؤها من ملفات المصدر
+        """
+        self._index_fingerprint = self._index_artifact_fingerprint()
+        if self._index_fingerprint is None:
+            return False
+        
+        path = self.config.get("index_artifact_path", DEFAULT_INDEX_ARTIFACT_PATH)
+        state = load_index_artifact(path, self._index_fingerprint)
+        if not isinstance(state, dict) or any(attribute not in state for attribute in INDEX_STATE_ATTRIBUTES):
+            return False
+        
+        for attribute in INDEX_STATE_ATTRIBUTES:
+            setattr(self, attribute, state[attribute])
+        
+        logger.info(f"تم تحميل فهارس الموردين من: {path}")
+        return True
+    
+    def _save_index_artifact(self) -> bool:
+        """
+        حفظ البيانات والفهارس في ملف الفهارس (إذا كان مفعلاً وملفات المصدر موجودة)
+        
+        المخرجات:
+        --------
+        bool
+            نجاح أو فشل العملية
+        """
+        if self._index_fingerprint is None:
+            return False
+        
+        path = self.config.get("index_artifact_path", DEFAULT_INDEX_ARTIFACT_PATH)
+        state = {attribute: getattr(self, attribute) for attribute in INDEX_STATE_ATTRIBUTES}
+        if not save_index_artifact(path, self._index_fingerprint, state):
+            return False
+        
+        logger.info(f"تم حفظ فهارس الموردين في: {path}")
+        return True
+    
     def _initialize_indexes(self):
         """
         تهيئة فهارس البحث
         """
+        # حفظ الموردين في المخزن العمودي بدلاً من قائمة القواميس
+        self.suppliers = SupplierStore.from_records(self.suppliers)
+        supplier_ids = self.suppliers.values("id")
+        supplier_product_names = self.suppliers.values("products", [])
+        
         # إنشاء فهرس للمنتجات حسب المورد
         self.supplier_products = defaultdict(list)
         
         # إنشاء فهرس للموردين حسب المنتج
         self.product_suppliers = defaultdict(list)
         
+        # فهرس مواقع الموردين في المخزن حسب المعرف (بدلاً من البحث في قائمة الموردين لكل منتج مطابق)
+        self._suppliers_by_id = {}
+        for position, supplier_id in enumerate(supplier_ids):
+            self._suppliers_by_id.setdefault(supplier_id, position)
+        
+        # الصيغ الموحدة لحقول البحث لكل مورد (تُحسب مرة واحدة بدلاً من كل استعلام، ومرة واحدة لكل منطقة ومنتج مختلف)
+        normalized_regions = {region: normalize_term(region) for region in self.suppliers.vocabulary("region")}
+        normalized_products = {}
+        self._normalized_suppliers = []
+        for name, region, products in zip(self.suppliers.values("name", ""), self.suppliers.values("region", ""),
+                                          supplier_product_names):
+            for product in products:
+                if product not in normalized_products:
+                    normalized_products[product] = normalize_term(product)
+            self._normalized_suppliers.append((
+                normalize_term(name),
+                normalized_regions[region] if region in normalized_regions else normalize_term(region),
+                [normalized_products[product] for product in products]
+            ))
+        
+        # فهرس المقاطع الثلاثية للحقول الموحدة (من المقطع إلى مواقع الموردين بترتيبهم)
+        self._supplier_trigram_index = defaultdict(list)
+        for position, (name, region, products) in enumerate(self._normalized_suppliers):
+            trigrams = set()
+            for field in (name, region, *products):
+                trigrams.update(_trigrams(field))
+            for trigram in trigrams:
+                self._supplier_trigram_index[trigram].append(position)
+        
+        # فهرس مقلوب من الكلمة الموحدة إلى مواقع المنتجات (بترتيبها في القاموس) بدلاً من مقارنة كل اسم بجميع المنتجات
+        # (مع كلمات كل منتج الموحدة للتحقق من المرشحين دون إعادة توحيد أسمائها)
+        self._product_entries = []
+        self._product_word_index = defaultdict(list)
+        for position, (product_id, product) in enumerate(self.products.items()):
+            words = frozenset(normalize_term(product.get("name", "")).split())
+            self._product_entries.append((product_id, words))
+            for word in words:
+                self._product_word_index[word].append(position)
+        
+        # مطابقة أسماء منتجات جميع الموردين دفعة واحدة (يتكرر المنتج نفسه لدى موردين كثيرين)
+        product_matches = self._match_products_batch(
+            [product_name for products in supplier_product_names for product_name in products]
+        )
+        
         # ربط المنتجات بالموردين
-        for supplier in self.suppliers:
-            supplier_id = supplier.get("id")
-            supplier_products = supplier.get("products", [])
-            
+        for supplier_id, supplier_products in zip(supplier_ids, supplier_product_names):
             for product_name in supplier_products:
-                # البحث عن المنتج المطابق
+                # البحث عن المنتج المطابق (الأول عند تساوي التشابه)
                 matching_product_id = None
                 best_similarity = 0
                 
-                for product_id, product in self.products.items():
-                    similarity = self._calculate_similarity(product_name, product.get("name", ""))
-                    if similarity > 0.7 and similarity > best_similarity:  # عتبة التشابه
+                for product_id, similarity in product_matches[product_name]:
+                    if similarity > best_similarity:
                         best_similarity = similarity
                         matching_product_id = product_id
                 
@@ -354,6 +545,83 @@ class SuppliersDatabase:
                     self.supplier_products[supplier_id].append(matching_product_id)
                     self.product_suppliers[matching_product_id].append(supplier_id)
     
+    def _match_products_batch(self, names: List[str]) -> Dict[str, List[Tuple[str, float]]]:
+        """
+        مطابقة قائمة أسماء بالمنتجات دفعة واحدة
+        
+        تُحسب المطابقات مرة واحدة لكل مجموعة كلمات موحدة، فالأسماء المكررة والصيغ المختلفة للاسم نفسه
+        (الهمزات والتاء المربوطة وترتيب الكلمات) تشترك في النتيجة نفسها
+        
+        المعاملات:
+        ----------
+        names : List[str]
+            أسماء المواد أو المنتجات المطلوبة
+            
+        المخرجات:
+        --------
+        Dict[str, List[Tuple[str, float]]]
+            المنتجات المطابقة لكل اسم (قوائم مشتركة بين الأسماء المتكافئة لا يجوز تعديلها)
+        """
+        matches = {}
+        matches_by_words = {}
+        for name in names:
+            if name in matches:
+                continue
+            words = normalized_words(name)
+            if words not in matches_by_words:
+                matches_by_words[words] = self._match_words(words)
+            matches[name] = matches_by_words[words]
+        
+        return matches
+    
+    def _match_products(self, name: str) -> List[Tuple[str, float]]:
+        """
+        المنتجات التي يتجاوز تشابه أسمائها مع الاسم عتبة التشابه
+        
+        المعاملات:
+        ----------
+        name : str
+            اسم المادة أو المنتج المطلوب
+            
+        المخرجات:
+        --------
+        List[Tuple[str, float]]
+            معرفات المنتجات المطابقة ودرجات تشابهها بترتيب المنتجات في قاعدة البيانات
+        """
+        return self._match_words(normalized_words(name))
+    
+    def _match_words(self, words: FrozenSet[str]) -> List[Tuple[str, float]]:
+        """
+        المنتجات التي يتجاوز تشابه كلماتها مع مجموعة كلمات موحدة عتبة التشابه
+        
+        المعاملات:
+        ----------
+        words : FrozenSet[str]
+            الكلمات الموحدة للاسم المطلوب
+            
+        المخرجات:
+        --------
+        List[Tuple[str, float]]
+            معرفات المنتجات المطابقة ودرجات تشابهها بترتيب المنتجات في قاعدة البيانات
+        """
+        if not words:
+            return []
+        
+        # تشابه جاكارد أعلى من العتبة يتطلب اشتراك أكثر من (العتبة × عدد الكلمات) كلمة، لذا يكفي البحث بأندر
+        # (عدد الكلمات - floor(العتبة × عدد الكلمات)) كلمة: أي منتج مطابق يشترك في إحداها على الأقل
+        postings = sorted((self._product_word_index.get(word, []) for word in words), key=len)
+        prefix_length = len(words) - math.floor(PRODUCT_SIMILARITY_THRESHOLD * len(words) - 1e-9)
+        candidates = sorted(set().union(*postings[:prefix_length]))
+        
+        matching_products = []
+        for position in candidates:
+            product_id, product_words = self._product_entries[position]
+            similarity = words_similarity(words, product_words)
+            if similarity > PRODUCT_SIMILARITY_THRESHOLD:
+                matching_products.append((product_id, similarity))
+        
+        return matching_products
+    
     def _calculate_similarity(self, str1: str, str2: str) -> float:
         """
         حساب درجة التشابه بين سلسلتين
@@ -370,22 +638,8 @@ class SuppliersDatabase:
         float
             درجة التشابه (0 إلى 1)
         """
-        # تنظيف السلاسل
-        str1 = str1.lower().strip()
-        str2 = str2.lower().strip()
-        
-        # تحويل السلاسل إلى مجموعات من الكلمات
-        words1 = set(str1.split())
-        words2 = set(str2.split())
-        
-        # حساب معامل جاكارد
-        intersection = len(words1.intersection(words2))
-        union = len(words1.union(words2))
-        
-        if union == 0:
-            return 0.0
-        
-        return intersection / union
+        # معامل جاكارد بين مجموعات الكلمات بعد توحيد الأحرف العربية (تُحسب مرة واحدة لكل سلسلة)
+        return word_similarity(str1, str2)
     
     def _create_default_suppliers(self) -> List[Dict[str, Any]]:
         """
@@ -404,6 +658,26 @@ class SuppliersDatabase:
                 "category": "مواد بناء",
                 "products": ["حديد تسليح", "حديد مجلفن"],
                 "reliability": 4.5,
+                "contact": "info@rajhi-steel.sa",
+                "nitaqat_category": "بلاتيني"
+            },
+            {
+                "id": "S0002",
+                "name": "اسمنت اليمامة",
+                "region": "الرياض",
+                "category": "مواد بناء",
+                "products": ["أسمنت", "خرسانة جاهزة"],
+                "reliability": 4.7,
+                "contact": "info@yamama-cement.sa",
+                "nitaqat_category": "بلاتيني"
+            },
+            {
+                "id": "S0003",
+                "name": "الشركة السعودية للصناعات الكهربائية",
+                "region": "جدة",
+                "category": "كهرباء",
+                "products": ["أسلاك كهربائية", "لوحات كهربائية", "مفاتيح كهربائية"],
+                "reliability": 4.2,
                 "contact": "info@siec.sa",
                 "nitaqat_category": "أخضر مرتفع"
             },
@@ -511,24 +785,4 @@ class SuppliersDatabase:
             "P0020": {"id": "P0020", "name": "نوافذ ألمنيوم", "category": "ألمنيوم", "availability_percentage": 75.0}
         }
         
-        return productsrajhi-steel.sa",
-                "nitaqat_category": "بلاتيني"
-            },
-            {
-                "id": "S0002",
-                "name": "اسمنت اليمامة",
-                "region": "الرياض",
-                "category": "مواد بناء",
-                "products": ["أسمنت", "خرسانة جاهزة"],
-                "reliability": 4.7,
-                "contact": "info@yamama-cement.sa",
-                "nitaqat_category": "بلاتيني"
-            },
-            {
-                "id": "S0003",
-                "name": "الشركة السعودية للصناعات الكهربائية",
-                "region": "جدة",
-                "category": "كهرباء",
-                "products": ["أسلاك كهربائية", "لوحات كهربائية", "مفاتيح كهربائية"],
-                "reliability": 4.2,
-                "contact": "info@
\ No newline at end of file
+        return products
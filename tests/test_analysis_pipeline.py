@@ -0,0 +1,101 @@
+import os
+import sys
+import time
+import unittest
+
+# إضافة المسار الرئيسي للمشروع إلى PATH
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# استيراد الوحدات المراد اختبارها
+from modules.analysis_pipeline import TenderAnalysisPipeline
+from modules.schedule_analyzer import ScheduleAnalyzer
+from modules.supply_chain import SupplyChainAnalyzer
+from analysis.cost_estimator import CostEstimator
+
+def slow_stage(value, delay=0.2):
+    """
+    مرحلة اختبارية تنتظر مدة محددة (مثل انتظار استجابة نموذج لغة)
+    """
+    time.sleep(delay)
+    return value
+
+class TestAnalysisPipeline(unittest.TestCase):
+    """
+    اختبارات وحدة لخط تحليل المناقصة
+    """
+    
+    def test_independent_stages_run_concurrently(self):
+        """
+        اختبار أن الزمن الكلي للمراحل المستقلة قريب من زمن أطولها وليس مجموعها
+        """
+        pipeline = TenderAnalysisPipeline()
+        for name in ("requirements", "costs", "risks", "local_content"):
+            pipeline.add_stage(name, slow_stage, ("text",))
+        
+        output = pipeline.run({"text": "نص المناقصة"})
+        
+        self.assertEqual(output["errors"], {})
+        self.assertEqual(set(output["results"]), {"requirements", "costs", "risks", "local_content"})
+        self.assertGreaterEqual(output["sequential_time"], 0.8)
+        self.assertLess(output["total_time"], 0.5)
+    
+    def test_dependencies_and_failures(self):
+        """
+        اختبار تمرير المخرجات بين المراحل وتخطي المراحل المعتمدة على مرحلة فاشلة
+        """
+        def fail(text):
+            raise RuntimeError("تعذر الاتصال بالنموذج")
+        
+        pipeline = (TenderAnalysisPipeline()
+                    .add_stage("costs", lambda text: len(text), ("text",))
+                    .add_stage("summary", lambda costs, text: f"{text}:{costs}", ("costs", "text"))
+                    .add_stage("risks", fail, ("text",))
+                    .add_stage("mitigation", lambda risks: risks, ("risks",)))
+        
+        self.assertEqual(pipeline.execution_order(["text"]), [["costs", "risks"], ["summary", "mitigation"]])
+        
+        output = pipeline.run({"text": "abc"})
+        self.assertEqual(output["results"], {"costs": 3, "summary": "abc:3"})
+        self.assertIn("تعذر الاتصال بالنموذج", output["errors"]["risks"])
+        self.assertIn("risks", output["errors"]["mitigation"])
+        self.assertEqual(set(output["timings"]), {"costs", "summary"})
+    
+    def test_invalid_graph(self):
+        """
+        اختبار رفض المدخلات غير المعروفة والاعتماديات الدورية
+        """
+        pipeline = TenderAnalysisPipeline().add_stage("costs", len, ("missing",))
+        with self.assertRaises(ValueError):
+            pipeline.run({"text": ""})
+        
+        pipeline = TenderAnalysisPipeline().add_stage("a", len, ("b",)).add_stage("b", len, ("a",))
+        with self.assertRaises(ValueError):
+            pipeline.execution_order()
+        
+        with self.assertRaises(ValueError):
+            pipeline.add_stage("a", len)
+    
+    def test_from_analyzers(self):
+        """
+        اختبار تشغيل المحللات الفعلية على نتيجة معالج المستندات
+        """
+        pipeline = TenderAnalysisPipeline.from_analyzers(
+            cost_estimator=CostEstimator({"result_cache": False}),
+            schedule_analyzer=ScheduleAnalyzer(),
+            supply_chain_analyzer=SupplyChainAnalyzer()
+        )
+        extracted_data = {
+            "text": "اسم المشروع: إنشاء مبنى إداري\nمدة التنفيذ: 12 شهر\nقيمة المشروع: 5,000,000 ريال",
+            "tables": [],
+            "boq_items": []
+        }
+        
+        output = pipeline.run_document(extracted_data, {"project_type": "مبنى إداري", "budget": 5000000})
+        
+        self.assertEqual(output["errors"], {})
+        self.assertEqual(set(output["results"]), {"costs", "schedule", "supply_chain"})
+        self.assertIn("phases", output["results"]["schedule"])
+        self.assertEqual(set(output["timings"]), {"costs", "schedule", "supply_chain"})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import os
+import sys
+import unittest
+
+# إضافة المسار الرئيسي للمشروع إلى PATH
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# استيراد الوحدات المراد اختبارها
+from utils.arabic_normalizer import NORMALIZATION_TABLE, normalize_arabic, normalized_words, word_similarity, words_similarity
+from analysis.section_index import DocumentIndex
+from analysis.risk_analyzer import RiskAnalyzer
+from supply_chain.suppliers_database import SuppliersDatabase
+
+class TestArabicNormalizer(unittest.TestCase):
+    """
+    اختبارات وحدة لتوحيد النصوص العربية
+    """
+    
+    def test_normalize_arabic(self):
+        """
+        اختبار توحيد صور الألف والهمزة والتاء المربوطة والتطويل والتشكيل والأرقام
+        """
+        self.assertEqual(normalize_arabic("أإآٱ"), "اااا")
+        self.assertEqual(normalize_arabic("الطاقة مبنى مؤسسة مسئولية"), "الطاقه مبني موسسه مسيوليه")
+        self.assertEqual(normalize_arabic("خرســانةُ مُقاوِلٌ"), "خرسانه مقاول")
+        self.assertEqual(normalize_arabic("المدة ٢٤ شهراً و۱۲ يوماً"), "المده 24 شهرا و12 يوما")
+        self.assertEqual(normalize_arabic("Steel PIPES"), "steel pipes")
+        self.assertEqual(normalize_arabic(""), "")
+    
+    def test_matches_translation_table(self):
+        """
+        اختبار تطابق النتيجة مع تطبيق جدول التحويل مباشرة
+        """
+        text = "توريد ١٢٠ طناً من الإسمنت المُقاوِم للكبريتات إلى موقع المشروع ــ المرحلة الأولى\n" * 50
+        self.assertEqual(normalize_arabic(text), text.translate(NORMALIZATION_TABLE).lower())
+    
+    def test_word_similarity(self):
+        """
+        اختبار التشابه بين صيغ الكتابة المختلفة للاسم نفسه
+        """
+        self.assertEqual(word_similarity("أسمنت بورتلاندي", "اسمنت بورتلاندى"), 1.0)
+        self.assertEqual(word_similarity("", "اسمنت"), 0.0)
+        self.assertAlmostEqual(word_similarity("حديد تسليح", "حديد"), 0.5)
+        self.assertEqual(words_similarity(normalized_words("حديد تسليح"), normalized_words("حديد")), 0.5)
+        self.assertIs(normalized_words("حديد تسليح"), normalized_words("حديد تسليح"))
+    
+    def test_similarity_routines(self):
+        """
+        اختبار استخدام التوحيد في دوال التشابه لدى المحللات وقاعدة الموردين
+        """
+        self.assertTrue(RiskAnalyzer(None)._is_similar_risk(
+            {"risk": "تأخر توريد المواد الإنشائية"}, {"risk": "تاخر توريد المواد الانشائيه"}
+        ))
+        
+        database = SuppliersDatabase()
+        self.assertEqual(database._calculate_similarity("إسمنت مقاوم", "اسمنت مقاوم"), 1.0)
+        self.assertEqual(
+            [supplier["id"] for supplier in database.search_suppliers("إسمنت")],
+            [supplier["id"] for supplier in database.search_suppliers("اسمنت")]
+        )
+    
+    def test_index_keyword_search(self):
+        """
+        اختبار البحث في فقرات وعناوين المستند بعد التوحيد
+        """
+        index = DocumentIndex("# متطلبات المحتوى المحلى\n\nنسبة المحتوى المحلي المطلوبة ٣٠٪\n\nفقرة أخرى")
+        self.assertEqual(len(index.find_headings(["المحتوى المحلي"])), 1)
+        self.assertEqual(len(index.paragraphs_containing(["المحتوي المحلي"])), 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import os
+import sys
+import json
+import shutil
+import tempfile
+import unittest
+import zipfile
+
+import fitz  # PyMuPDF
+
+# إضافة المسار الرئيسي للمشروع إلى PATH
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# استيراد الوحدات المراد اختبارها
+from modules.bulk_ingestion import BulkIngestor
+
+class TestBulkIngestion(unittest.TestCase):
+    """
+    اختبارات وحدة لإدخال حزم المناقصات
+    """
+    
+    def setUp(self):
+        """
+        إنشاء حزمة ZIP تحتوي على ملفات PDF وملف نصي وملف غير مدعوم وملف تالف
+        """
+        self.temp_dir = tempfile.mkdtemp()
+        self.zip_path = os.path.join(self.temp_dir, "package.zip")
+        
+        with zipfile.ZipFile(self.zip_path, "w") as archive:
+            for file_index in range(4):
+                doc = fitz.open()
+                for page_index in range(2):
+                    doc.new_page().insert_text((72, 72), f"Tender attachment {file_index} page {page_index + 1}")
+                archive.writestr(f"attachments/file{file_index}.pdf", doc.tobytes())
+                doc.close()
+            archive.writestr("notes.txt", "مناقصة توريد مواد بناء".encode("utf-8"))
+            archive.writestr("drawing.dwg", b"binary")
+            archive.writestr("broken.pdf", b"not a pdf")
+            archive.writestr("__MACOSX/._notes.txt", b"")
+    
+    def tearDown(self):
+        """
+        تنظيف بيئة الاختبار
+        """
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_ingest_zip_package(self):
+        """
+        اختبار معالجة ملفات الحزمة بالتوازي ودمج النتائج وحساب الإنتاجية
+        """
+        ingestor = BulkIngestor({"ingest_workers": 2, "cache_enabled": False})
+        results = ingestor.ingest(self.zip_path)
+        
+        statuses = {entry["file"]: entry["status"] for entry in results["manifest"]}
+        self.assertEqual(statuses, {
+            "attachments/file0.pdf": "ok",
+            "attachments/file1.pdf": "ok",
+            "attachments/file2.pdf": "ok",
+            "attachments/file3.pdf": "ok",
+            "notes.txt": "ok",
+            "drawing.dwg": "skipped",
+            "broken.pdf": "error"
+        })
+        
+        summary = results["summary"]
+        self.assertEqual((summary["processed"], summary["failed"], summary["skipped"]), (5, 1, 1))
+        self.assertEqual(summary["pages"], 9)
+        self.assertGreater(summary["files_per_second"], 0)
+        self.assertGreater(summary["pages_per_second"], 0)
+        
+        # النص المدمج يحافظ على ترتيب ملفات الحزمة
+        package_text = results["package"]["text"]
+        self.assertLess(package_text.index("Tender attachment 0"), package_text.index("Tender attachment 3"))
+        self.assertIn("مناقصة توريد مواد بناء", package_text)
+        
+        paths = ingestor.write_results(results, os.path.join(self.temp_dir, "output"))
+        with open(paths["manifest"], encoding="utf-8") as f:
+            manifest = json.load(f)
+        self.assertEqual(manifest["summary"]["processed"], 5)
+        self.assertEqual(len(manifest["files"]), 7)
+        self.assertTrue(os.path.exists(paths["package"]))
+
+if __name__ == '__main__':
+    unittest.main()
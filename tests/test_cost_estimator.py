@@ -0,0 +1,69 @@
+import os
+import sys
+import unittest
+
+# إضافة المسار الرئيسي للمشروع إلى PATH
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# استيراد الوحدات المراد اختبارها
+from analysis.cost_estimator import CostEstimator
+
+SAMPLE_TEXT = """مشروع تطوير المدارس
+اسم المشروع: إنشاء مدرسة ابتدائية
+موقع المشروع: الرياض
+الجهة المالكة: وزارة التعليم
+قيمة المشروع: 5,000,000 ريال
+القيمة التقديرية: 4,500,000 ريال
+مدة العقد: 400 يوم
+مدة التنفيذ: 18 شهر
+
+نطاق العمل:
+- أعمال الحفر والردم
+- أعمال الخرسانة
+"""
+
+class TestCostEstimator(unittest.TestCase):
+    """
+    اختبارات وحدة لاستخراج معلومات المشروع في محلل التكاليف
+    """
+    
+    def setUp(self):
+        """
+        إعداد بيئة الاختبار
+        """
+        self.estimator = CostEstimator()
+    
+    def test_keyword_priority(self):
+        """
+        اختبار اختيار الكلمة المفتاحية الأعلى أولوية بغض النظر عن موضعها في النص
+        """
+        info = self.estimator._extract_project_info(SAMPLE_TEXT)
+        self.assertEqual(info["title"], "إنشاء مدرسة ابتدائية")
+        self.assertEqual(info["location"], "الرياض")
+        self.assertEqual(info["client"], "وزارة التعليم")
+        self.assertEqual(info["sector"], "غير محدد")
+        self.assertEqual(info["estimated_value"], 4500000.0)
+        
+        # المدة بالأشهر مقدمة على المدة بالأيام حتى لو وردت بعدها
+        self.assertEqual(self.estimator._extract_project_duration(SAMPLE_TEXT), 18)
+        self.assertEqual(self.estimator._extract_project_duration("مدة العقد: 400 يوم"), 13)
+        self.assertEqual(self.estimator._extract_project_duration("فترة التنفيذ: 2 سنوات"), 24)
+        self.assertEqual(self.estimator._extract_project_duration("لا توجد مدة"), 12)
+        
+        self.assertEqual(self.estimator._extract_scope_of_work(SAMPLE_TEXT), ["أعمال الحفر والردم", "أعمال الخرسانة"])
+    
+    def test_scan_shared_per_text(self):
+        """
+        اختبار البحث عن الكلمات المفتاحية مرة واحدة للنص نفسه
+        """
+        first = self.estimator._scan_keywords(SAMPLE_TEXT)
+        self.assertIs(self.estimator._scan_keywords(SAMPLE_TEXT), first)
+        self.assertIsNot(self.estimator._scan_keywords(SAMPLE_TEXT + "\n"), first)
+        
+        # التقدير لا يحتفظ بنص المستند بعد استخراج الحقول
+        estimator = CostEstimator({"result_cache": False})
+        estimator.estimate(SAMPLE_TEXT)
+        self.assertIsNone(estimator._keyword_scan)
+
+if __name__ == '__main__':
+    unittest.main()
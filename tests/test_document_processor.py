@@ -1,9 +1,15 @@
 import os
 import sys
 import unittest
+from unittest import mock
 from datetime import datetime
+import shutil
 import tempfile
 
+import docx
+import fitz  # PyMuPDF
+from openpyxl import Workbook
+
 # إضافة المسار الرئيسي للمشروع إلى PATH
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -19,7 +25,10 @@ class TestDocumentProcessor(unittest.TestCase):
         """
         إعداد بيئة الاختبار
         """
-        self.document_processor = DocumentProcessor()
+        # ذاكرة الاستخراج المؤقتة في مجلد الاختبار بدلاً من مجلد البيانات في المشروع
+        self.cache_dir = tempfile.mkdtemp()
+        self.config = {"cache_dir": self.cache_dir}
+        self.document_processor = DocumentProcessor(self.config)
         
         # إنشاء ملفات اختبار مؤقتة
         self.temp_files = {}
@@ -53,6 +62,34 @@ class TestDocumentProcessor(unittest.TestCase):
         for file_path in self.temp_files.values():
             if os.path.exists(file_path):
                 os.remove(file_path)
+        shutil.rmtree(self.cache_dir)
+    
+    def _create_pdf(self, key, page_texts):
+        """
+        إنشاء ملف PDF مؤقت يحتوي على صفحة لكل نص
+        """
+        doc = fitz.open()
+        for page_text in page_texts:
+            page = doc.new_page()
+            if page_text:
+                page.insert_text((72, 72), page_text)
+        
+        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
+            self.temp_files[key] = tmp.name
+        doc.save(self.temp_files[key])
+        doc.close()
+        return self.temp_files[key]
+    
+    def _draw_table(self, page, rows):
+        """
+        رسم جدول بحدود خلايا في صفحة PDF
+        """
+        for row_index, row in enumerate(rows):
+            for column_index, value in enumerate(row):
+                rect = fitz.Rect(72 + column_index * 110, 80 + row_index * 20,
+                                 182 + column_index * 110, 100 + row_index * 20)
+                page.draw_rect(rect, color=(0, 0, 0), width=0.7)
+                page.insert_text((rect.x0 + 3, rect.y1 - 6), value, fontsize=9)
     
     def test_process_txt_document(self):
         """
@@ -124,3 +161,279 @@ class TestDocumentProcessor(unittest.TestCase):
         """
         اختبار استخراج معلومات المحتوى المحلي
         """
+    
+    def test_parallel_pdf_extraction_matches_serial(self):
+        """
+        اختبار تطابق نتائج الاستخراج المتوازي لملفات PDF مع الاستخراج التسلسلي
+        """
+        pdf_path = self._create_pdf("pdf", [f"Tender general conditions clause {i + 1}" for i in range(12)])
+        
+        serial_processor = DocumentProcessor(dict(self.config, pdf_workers=1))
+        parallel_processor = DocumentProcessor(dict(self.config, pdf_workers=2, parallel_min_pages=1))
+        
+        serial_result = serial_processor._process_pdf(pdf_path)
+        parallel_result = parallel_processor._process_pdf(pdf_path)
+        
+        self.assertEqual(serial_result["text"], parallel_result["text"])
+        self.assertEqual(serial_result["pages"], parallel_result["pages"])
+        
+        # التحقق من ترتيب الصفحات وصحة مواضعها في النص الكامل
+        for page in parallel_result["pages"]:
+            self.assertEqual(page["text"], f"Tender general conditions clause {page['page_number']}")
+            self.assertEqual(
+                parallel_result["text"][page["offset"]:page["offset"] + page["length"]],
+                page["text"]
+            )
+    
+    def test_selective_ocr_only_for_pages_without_text_layer(self):
+        """
+        اختبار تطبيق OCR على الصفحات الممسوحة فقط ودمجها بترتيب الصفحات
+        """
+        pdf_path = self._create_pdf("pdf", [
+            "Typed general terms and conditions page",
+            "",
+            "Typed technical specifications page"
+        ])
+        
+        with mock.patch.object(
+            self.document_processor, "_apply_ocr_to_pdf", return_value={1: "Scanned signed annex"}
+        ) as ocr_mock:
+            result = self.document_processor._process_pdf(pdf_path)
+        
+        # يجب تطبيق OCR على الصفحة الفارغة فقط
+        ocr_mock.assert_called_once_with(pdf_path, [1])
+        
+        self.assertEqual([page["ocr"] for page in result["pages"]], [False, True, False])
+        self.assertEqual(result["metadata"]["ocr_pages"], [2])
+        self.assertEqual(
+            result["text"].splitlines(),
+            ["Typed general terms and conditions page", "Scanned signed annex", "Typed technical specifications page"]
+        )
+    
+    def test_extraction_cache_returns_repeat_uploads(self):
+        """
+        اختبار إعادة نتائج الاستخراج المخزنة عند رفع نفس الملف مرة أخرى
+        """
+        pdf_path = self._create_pdf("pdf", ["Cached tender document general terms"])
+        with open(pdf_path, "rb") as f:
+            file_content = f.read()
+        
+        with tempfile.TemporaryDirectory() as cache_dir:
+            processor = DocumentProcessor({"cache_dir": cache_dir})
+            
+            first = processor.process_document(file_content, "pdf", "first.pdf")
+            with mock.patch.object(processor, "_process_pdf") as process_mock:
+                second = processor.process_document(file_content, "pdf", "second.pdf")
+            
+            process_mock.assert_not_called()
+            self.assertFalse(first["from_cache"])
+            self.assertTrue(second["from_cache"])
+            self.assertEqual(second["file_name"], "second.pdf")
+            self.assertEqual(first["text"], second["text"])
+            
+            stats = processor.get_cache_stats()
+            self.assertEqual((stats["hits"], stats["misses"], stats["entries"]), (1, 1, 1))
+    
+    def test_extraction_cache_skips_failed_ocr(self):
+        """
+        اختبار عدم تخزين نتائج الاستخراج التي فشل فيها OCR حتى يعاد تطبيقه عند رفع الملف مجدداً
+        """
+        pdf_path = self._create_pdf("pdf", ["Typed general terms and conditions page", ""])
+        with open(pdf_path, "rb") as f:
+            file_content = f.read()
+        
+        processor = DocumentProcessor(self.config)
+        with mock.patch.object(processor.ocr_engine, "ocr_pdf", side_effect=RuntimeError("tesseract")):
+            first = processor.process_document(file_content, "pdf", "scanned.pdf")
+        self.assertEqual(first["ocr_error"], "تعذر تطبيق OCR على الصفحات: 2")
+        
+        with mock.patch.object(processor, "_apply_ocr_to_pdf", return_value={1: "Scanned signed annex"}) as ocr_mock:
+            second = processor.process_document(file_content, "pdf", "scanned.pdf")
+        
+        ocr_mock.assert_called_once()
+        self.assertFalse(second["from_cache"])
+        self.assertNotIn("ocr_error", second)
+        self.assertIn("Scanned signed annex", second["text"])
+        self.assertEqual(processor.get_cache_stats()["entries"], 1)
+    
+    def test_in_memory_processing_avoids_temp_files(self):
+        """
+        اختبار معالجة المستندات من الذاكرة دون إنشاء ملفات مؤقتة ومطابقتها لمسار الملف المؤقت
+        """
+        document = docx.Document()
+        document.add_paragraph("كراسة الشروط والمواصفات")
+        document.add_paragraph("نطاق العمل: إنشاء مبنى إداري")
+        with tempfile.NamedTemporaryFile(suffix=".docx", delete=False) as tmp:
+            self.temp_files["docx"] = tmp.name
+        document.save(self.temp_files["docx"])
+        with open(self.temp_files["docx"], "rb") as f:
+            file_content = f.read()
+        
+        in_memory_processor = DocumentProcessor({"cache_enabled": False})
+        temp_file_processor = DocumentProcessor({"cache_enabled": False, "in_memory": False})
+        
+        with mock.patch("modules.document_sources.tempfile.NamedTemporaryFile") as temp_mock:
+            in_memory_result = in_memory_processor.process_document(file_content, "docx", "tender.docx")
+        temp_mock.assert_not_called()
+        
+        temp_file_result = temp_file_processor.process_document(file_content, "docx", "tender.docx")
+        self.assertEqual(in_memory_result["text"], "كراسة الشروط والمواصفات\nنطاق العمل: إنشاء مبنى إداري")
+        self.assertEqual(in_memory_result["text"], temp_file_result["text"])
+    
+    def test_iter_pages_streams_page_records(self):
+        """
+        اختبار إعادة صفحات المستند تباعاً مع بيانات OCR والتوقيت لكل صفحة
+        """
+        pdf_path = self._create_pdf("pdf", [
+            "Typed general terms and conditions page",
+            "",
+            "",
+            "Typed technical specifications page"
+        ])
+        with open(pdf_path, "rb") as f:
+            file_content = f.read()
+        
+        ocr_engine = self.document_processor.ocr_engine
+        with mock.patch.object(ocr_engine, "open_pdf", wraps=ocr_engine.open_pdf) as open_mock, \
+                mock.patch.object(ocr_engine, "ocr_page", return_value="Scanned signed annex") as ocr_mock:
+            pages = self.document_processor.iter_pages(file_content, "pdf")
+            first_page = next(pages)
+            remaining_pages = list(pages)
+        
+        self.assertEqual(first_page["page_number"], 1)
+        self.assertEqual(first_page["page_count"], 4)
+        self.assertEqual([page["page_number"] for page in remaining_pages], [2, 3, 4])
+        self.assertEqual(remaining_pages[0]["text"], "Scanned signed annex")
+        self.assertEqual([page["ocr"] for page in remaining_pages], [True, True, False])
+        
+        # الصفحات الممسوحة تُحوَّل من الملف نفسه دون إعادة فتحه لكل صفحة
+        open_mock.assert_called_once()
+        self.assertEqual([call.args[1] for call in ocr_mock.call_args_list], [1, 2])
+        self.assertEqual(len({id(call.args[0]) for call in ocr_mock.call_args_list}), 1)
+        self.assertIn("extract", first_page["timings"])
+        self.assertIn("ocr", first_page["timings"])
+    
+    def test_process_excel_boq(self):
+        """
+        اختبار استخراج بنود جدول الكميات من ملف Excel
+        """
+        workbook = Workbook()
+        worksheet = workbook.active
+        worksheet.title = "جدول الكميات"
+        worksheet.append(["جدول الكميات - مبنى إداري"])
+        worksheet.append(["رقم البند", "وصف البند", "الوحدة", "الكمية", "سعر الوحدة", "الإجمالي"])
+        worksheet.append(["", "أعمال الخرسانة", "", "", "", ""])
+        worksheet.append([1, "خرسانة مسلحة للأساسات", "م3", "١٬٢٠٠", 350, None])
+        worksheet.append([2, "حديد تسليح", "طن", 85.5, "3,000", 256500])
+        with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as tmp:
+            self.temp_files["xlsx"] = tmp.name
+        workbook.save(self.temp_files["xlsx"])
+        with open(self.temp_files["xlsx"], "rb") as f:
+            file_content = f.read()
+        
+        result = DocumentProcessor({"cache_enabled": False}).process_document(file_content, "xlsx", "boq.xlsx")
+        
+        self.assertNotIn("error", result)
+        self.assertEqual(result["boq_items"], [
+            {"id": "1", "description": "خرسانة مسلحة للأساسات", "unit": "م3",
+             "quantity": 1200.0, "unit_price": 350.0, "total_price": 420000.0},
+            {"id": "2", "description": "حديد تسليح", "unit": "طن",
+             "quantity": 85.5, "unit_price": 3000.0, "total_price": 256500.0}
+        ])
+        self.assertEqual(result["metadata"]["sheets"], [{"name": "جدول الكميات", "boq_items": 2}])
+        self.assertIn("خرسانة مسلحة للأساسات", result["text"])
+    
+    def test_process_csv_boq_in_chunks(self):
+        """
+        اختبار قراءة جدول كميات من ملف CSV على دفعات
+        """
+        lines = ["Item,Description,Unit,Qty,Unit Price,Amount"]
+        lines += [f"{i},Steel rebar {i},ton,\"1,200\",3000," for i in range(1, 26)]
+        file_content = "\n".join(lines).encode("utf-8")
+        
+        result = DocumentProcessor({"cache_enabled": False, "csv_chunk_size": 4}).process_document(
+            file_content, "csv", "boq.csv"
+        )
+        
+        self.assertNotIn("error", result)
+        self.assertEqual(len(result["boq_items"]), 25)
+        self.assertEqual(result["boq_items"][-1]["description"], "Steel rebar 25")
+        self.assertEqual(result["boq_items"][0]["quantity"], 1200.0)
+        self.assertEqual(result["boq_items"][0]["total_price"], 3600000.0)
+    
+    def test_extract_pdf_and_docx_tables(self):
+        """
+        اختبار استخراج جداول PDF و Word كإطارات بيانات مع مصدرها واستخدامها في تقدير الكميات
+        """
+        rows = [["Item", "Description", "Unit", "Quantity"],
+                ["1", "Concrete works", "m3", "120"],
+                ["2", "Steel rebar", "ton", "15"]]
+        doc = fitz.open()
+        doc.new_page()
+        self._draw_table(doc.new_page(), rows)
+        pdf_content = doc.tobytes()
+        doc.close()
+        
+        word_document = docx.Document()
+        word_document.add_paragraph("مقدمة")
+        word_document.add_heading("جدول الكميات", level=1)
+        word_table = word_document.add_table(rows=3, cols=4)
+        for row_index, row in enumerate([["رقم البند", "الوصف", "الوحدة", "الكمية"],
+                                         ["1", "خرسانة مسلحة", "م3", "120"],
+                                         ["2", "حديد تسليح", "طن", "15"]]):
+            for column_index, value in enumerate(row):
+                word_table.cell(row_index, column_index).text = value
+        with tempfile.NamedTemporaryFile(suffix=".docx", delete=False) as tmp:
+            self.temp_files["docx"] = tmp.name
+        word_document.save(self.temp_files["docx"])
+        with open(self.temp_files["docx"], "rb") as f:
+            docx_content = f.read()
+        
+        processor = DocumentProcessor({"cache_enabled": False, "pdf_workers": 1})
+        pdf_result = processor.process_document(pdf_content, "pdf", "tables.pdf")
+        docx_result = processor.process_document(docx_content, "docx", "tables.docx")
+        
+        self.assertNotIn("error", pdf_result)
+        self.assertEqual(len(pdf_result["tables"]), 1)
+        pdf_table = pdf_result["tables"][0]
+        self.assertEqual((pdf_table["source"], pdf_table["page"], pdf_table["index"]), ("pdf", 2, 0))
+        self.assertEqual(list(pdf_table["data"].columns), rows[0])
+        self.assertEqual(pdf_table["data"].values.tolist(), rows[1:])
+        self.assertEqual([item["quantity"] for item in pdf_result["boq_items"]], [120.0, 15.0])
+        
+        self.assertNotIn("error", docx_result)
+        docx_table = docx_result["tables"][0]
+        self.assertEqual((docx_table["source"], docx_table["section"]), ("docx", "جدول الكميات"))
+        self.assertEqual(docx_table["data"]["الوصف"].tolist(), ["خرسانة مسلحة", "حديد تسليح"])
+        
+        # المحلل يستخدم الجداول المستخرجة مباشرة دون البحث عنها في النص
+        from analysis.cost_estimator import CostEstimator
+        quantities = CostEstimator()._extract_quantities("", tables=docx_result["tables"])
+        self.assertEqual([(item["description"], item["quantity"], item["unit"]) for item in quantities],
+                         [("خرسانة مسلحة", 120.0, "م3"), ("حديد تسليح", 15.0, "طن")])
+    
+    def test_pdf_boq_continues_across_pages(self):
+        """
+        اختبار متابعة جدول الكميات في الصفحة التالية عندما لا يتكرر صف العناوين
+        """
+        header = ["Item", "Description", "Unit", "Quantity"]
+        doc = fitz.open()
+        self._draw_table(doc.new_page(), [header, ["1", "Concrete works", "m3", "120"], ["2", "Steel rebar", "ton", "15"]])
+        self._draw_table(doc.new_page(), [["3", "Block works", "m2", "300"], ["4", "Plastering", "m2", "450"]])
+        self._draw_table(doc.new_page(), [["Name", "Phone"], ["Ahmed", "0500000000"]])
+        pdf_content = doc.tobytes()
+        doc.close()
+        
+        processor = DocumentProcessor({"cache_enabled": False, "pdf_workers": 1})
+        result = processor.process_document(pdf_content, "pdf", "boq.pdf")
+        
+        self.assertNotIn("error", result)
+        self.assertEqual([(item["description"], item["quantity"]) for item in result["boq_items"]],
+                         [("Concrete works", 120.0), ("Steel rebar", 15.0), ("Block works", 300.0), ("Plastering", 450.0)])
+        self.assertEqual([table["page"] for table in result["tables"]], [1, 2, 3])
+        self.assertEqual(list(result["tables"][1]["data"].columns), header)
+        self.assertEqual(result["tables"][1]["data"]["Description"].tolist(), ["Block works", "Plastering"])
+        self.assertEqual(list(result["tables"][2]["data"].columns), ["Name", "Phone"])
+        
+        pages = list(processor.iter_pages(pdf_content, "pdf"))
+        self.assertEqual(list(pages[1]["tables"][0]["data"].columns), header)
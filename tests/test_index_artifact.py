@@ -0,0 +1,133 @@
+import os
+import sys
+import json
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+# إضافة المسار الرئيسي للمشروع إلى PATH
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+
+# استيراد الوحدات المراد اختبارها
+from supplier_index_benchmark import generate_catalogue, write_source_files
+from supply_chain.index_artifact import HEADER_SIZE, main as build_artifact
+from supply_chain.suppliers_database import SuppliersDatabase, INDEX_STATE_ATTRIBUTES
+from utils.supplier_store import SupplierStore
+
+class TestIndexArtifact(unittest.TestCase):
+    """
+    اختبارات وحدة لملف فهارس الموردين المبني مسبقاً
+    """
+    
+    def setUp(self):
+        """
+        إعداد بيئة الاختبار
+        """
+        self.test_dir = tempfile.mkdtemp()
+        self.config = write_source_files(generate_catalogue(200, 1000), self.test_dir)
+    
+    def tearDown(self):
+        """
+        تنظيف بيئة الاختبار
+        """
+        shutil.rmtree(self.test_dir)
+    
+    def _load(self, config=None):
+        """
+        إنشاء قاعدة بيانات مع تسجيل ما إذا أعيد بناء الفهارس
+        """
+        with mock.patch.object(SuppliersDatabase, "_initialize_indexes", autospec=True,
+                               side_effect=SuppliersDatabase._initialize_indexes) as initialize:
+            database = SuppliersDatabase(config or self.config)
+        return database, initialize.called
+    
+    def test_artifact_is_built_once_and_loaded(self):
+        """
+        اختبار أن النسخة الأولى تبني الفهارس وتحفظها وأن النسخ التالية تحملها كما هي
+        """
+        built, rebuilt = self._load()
+        self.assertTrue(rebuilt)
+        self.assertTrue(os.path.exists(self.config["index_artifact_path"]))
+        
+        loaded, rebuilt = self._load()
+        self.assertFalse(rebuilt)
+        for attribute in INDEX_STATE_ATTRIBUTES:
+            self.assertEqual(getattr(loaded, attribute), getattr(built, attribute))
+        
+        # الموردون يُحمّلون في المخزن العمودي كما بُنوا
+        supplier = loaded.suppliers[0]
+        self.assertIsInstance(loaded.suppliers, SupplierStore)
+        self.assertEqual(loaded.suppliers[loaded._suppliers_by_id[supplier["id"]]], supplier)
+        
+        query = supplier["products"][0]
+        self.assertEqual(loaded.search_suppliers(query), built.search_suppliers(query))
+        self.assertEqual(loaded.find_matching_suppliers([{"name": query}]),
+                         built.find_matching_suppliers([{"name": query}]))
+    
+    def test_source_change_rebuilds_artifact(self):
+        """
+        اختبار إعادة البناء عند تغير ملف المصدر
+        """
+        self._load()
+        with open(self.config["suppliers_file"], encoding="utf-8") as f:
+            suppliers = json.load(f)
+        suppliers.append({"id": "S999999", "name": "مورد جديد", "region": "تبوك", "products": []})
+        with open(self.config["suppliers_file"], "w", encoding="utf-8") as f:
+            json.dump(suppliers, f, ensure_ascii=False)
+        
+        database, rebuilt = self._load()
+        self.assertTrue(rebuilt)
+        self.assertEqual(database.search_suppliers("مورد جديد")[0]["id"], "S999999")
+        
+        database, rebuilt = self._load()
+        self.assertFalse(rebuilt)
+        self.assertEqual(database.get_total_suppliers(), len(suppliers))
+    
+    def test_corrupted_artifact_is_rebuilt(self):
+        """
+        اختبار أن الملف التالف يُكتشف ببصمة المحتوى ويعاد بناؤه
+        """
+        self._load()
+        with open(self.config["index_artifact_path"], "r+b") as f:
+            f.seek(HEADER_SIZE + 100)
+            byte = f.read(1)
+            f.seek(HEADER_SIZE + 100)
+            f.write(bytes([byte[0] ^ 0xFF]))
+        
+        _, rebuilt = self._load()
+        self.assertTrue(rebuilt)
+        _, rebuilt = self._load()
+        self.assertFalse(rebuilt)
+    
+    def test_disabled_artifact_and_missing_sources(self):
+        """
+        اختبار عدم إنشاء الملف عند تعطيله أو عند غياب ملفات المصدر
+        """
+        _, rebuilt = self._load(dict(self.config, index_artifact=False))
+        self.assertTrue(rebuilt)
+        self.assertFalse(os.path.exists(self.config["index_artifact_path"]))
+        
+        missing = dict(self.config, suppliers_file=os.path.join(self.test_dir, "missing.json"))
+        database, _ = self._load(missing)
+        self.assertTrue(database.suppliers)
+        self.assertFalse(os.path.exists(self.config["index_artifact_path"]))
+    
+    def test_build_command(self):
+        """
+        اختبار بناء الملف من سطر الأوامر
+        """
+        output = os.path.join(self.test_dir, "prebuilt", "index.pkl")
+        arguments = ["--suppliers-file", self.config["suppliers_file"], "--products-file", self.config["products_file"],
+                     "--output", output]
+        with mock.patch("builtins.print"):
+            self.assertEqual(build_artifact(arguments), 0)
+            self.assertEqual(build_artifact(arguments + ["--force"]), 0)
+            self.assertEqual(build_artifact(["--suppliers-file", os.path.join(self.test_dir, "missing.json")]), 2)
+        
+        _, rebuilt = self._load(dict(self.config, index_artifact_path=output))
+        self.assertFalse(rebuilt)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import os
+import sys
+import unittest
+
+# إضافة المسار الرئيسي للمشروع إلى PATH
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# استيراد الوحدات المراد اختبارها
+from utils.keyword_matcher import KeywordMatcher, get_keyword_matcher
+from utils.helpers import extract_keywords
+
+class TestKeywordMatcher(unittest.TestCase):
+    """
+    اختبارات وحدة لمحرك البحث عن الكلمات المفتاحية المتعددة
+    """
+    
+    def test_nested_keywords_and_positions(self):
+        """
+        اختبار احتساب الكلمات المتداخلة ومواضعها في مرور واحد
+        """
+        text = "مشروع صرف صحي ومياه، ثم صرف الأمطار"
+        matcher = KeywordMatcher(["صرف", "صرف صحي", "مياه"])
+        
+        hits = list(matcher.finditer(text))
+        self.assertIn(("صرف صحي", 6, 13), hits)
+        self.assertIn(("صرف", 6, 9), hits)
+        self.assertEqual(matcher.count(text), {"صرف": 2, "صرف صحي": 1, "مياه": 1})
+        self.assertEqual(matcher.first(text), "صرف صحي")
+    
+    def test_partially_overlapping_keywords(self):
+        """
+        اختبار احتساب الكلمات المتداخلة جزئياً (لا تقع إحداهما بالكامل داخل الأخرى)
+        """
+        text = "أعمال الخرسانة المسلحة"
+        matcher = KeywordMatcher(["أعمال الخرسانة", "الخرسانة المسلحة", "الخرسانة"])
+        
+        self.assertEqual(matcher.count(text), {"أعمال الخرسانة": 1, "الخرسانة المسلحة": 1, "الخرسانة": 1})
+        self.assertEqual(sorted(matcher.finditer(text), key=lambda hit: (hit[1], -hit[2])),
+                         [("أعمال الخرسانة", 0, 14), ("الخرسانة المسلحة", 6, 22), ("الخرسانة", 6, 14)])
+        
+        whole = KeywordMatcher(["أعمال الخرسانة", "الخرسانة المسلحة"], whole_words=True)
+        self.assertEqual(whole.count(text), {"أعمال الخرسانة": 1, "الخرسانة المسلحة": 1})
+    
+    def test_word_modes(self):
+        """
+        اختبار مطابقة الكلمات الكاملة والبادئات وتجاهل حالة الأحرف
+        """
+        whole = KeywordMatcher(["عقد", "Steel"], whole_words=True)
+        self.assertEqual(whole.count("عقد التوريد والعقود، STEEL و steelwork"), {"عقد": 1, "Steel": 1})
+        
+        prefix = KeywordMatcher(["تصميم"], prefix=True)
+        self.assertEqual(prefix.count("تصميمات المشروع والتصميم"), {"تصميم": 1})
+        self.assertEqual(list(prefix.finditer("تصميمات المشروع")), [("تصميم", 0, 7)])
+        
+        # الكلمات المختلفة في حالة الأحرف فقط، والأحرف التي يعدّها re.IGNORECASE متكافئة ولا يوحدها lower()
+        cased = KeywordMatcher(["ISO", "iso", "steel", "STEEL PIPE", "İstanbul"])
+        self.assertEqual(cased.keywords, ["ISO", "steel", "STEEL PIPE", "İstanbul"])
+        self.assertEqual(cased.count("ISO iso ſteel Steel Pipe istanbul İstanbul"),
+                         {"ISO": 2, "steel": 2, "STEEL PIPE": 1, "İstanbul": 2})
+        self.assertEqual(list(KeywordMatcher(["ISO", "iso"], ignore_case=False).finditer("iso ISO")),
+                         [("iso", 0, 3), ("ISO", 4, 7)])
+        
+        self.assertEqual(KeywordMatcher([]).count("أي نص"), {})
+        self.assertIs(get_keyword_matcher(("مياه", "صرف")), get_keyword_matcher(["مياه", "صرف"]))
+    
+    def test_extract_keywords_context(self):
+        """
+        اختبار استخراج الكلمات المفتاحية مع سياقها مرتبة حسب الموضع
+        """
+        results = extract_keywords("الضمان البنكي مطلوب. تطبق غرامة التأخير على العقد", ["غرامة", "الضمان"], context_size=5)
+        self.assertEqual([result["keyword"] for result in results], ["الضمان", "غرامة"])
+        self.assertEqual(results[1]["context"], "تطبق غرامة التأ")
+        self.assertEqual(results[1]["position"], 26)
+
+if __name__ == '__main__':
+    unittest.main()
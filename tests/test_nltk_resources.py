@@ -0,0 +1,68 @@
+import os
+import sys
+import subprocess
+import unittest
+from unittest import mock
+
+# إضافة المسار الرئيسي للمشروع إلى PATH
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# استيراد الوحدات المراد اختبارها
+from modules import nltk_resources
+
+class TestNLTKResources(unittest.TestCase):
+    """
+    اختبارات وحدة لتحميل موارد NLTK عند الحاجة
+    """
+    
+    def setUp(self):
+        """
+        مسح الموارد المحملة مسبقاً في هذه العملية
+        """
+        nltk_resources._availability.clear()
+        nltk_resources._stopwords.clear()
+    
+    def tearDown(self):
+        """
+        تنظيف بيئة الاختبار
+        """
+        nltk_resources._availability.clear()
+        nltk_resources._stopwords.clear()
+    
+    def test_import_does_not_load_nltk(self):
+        """
+        اختبار أن استيراد معالج المستندات وإنشاءه لا يحمّلان NLTK
+        """
+        probe = (
+            "import sys\n"
+            "from modules.document_processor import DocumentProcessor\n"
+            "DocumentProcessor({'cache_enabled': False})\n"
+            "print('nltk' in sys.modules)\n"
+        )
+        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        output = subprocess.run([sys.executable, "-c", probe], cwd=project_root,
+                                capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.strip().splitlines()[-1], "False")
+    
+    def test_offline_fallback(self):
+        """
+        اختبار استخدام القائمة المضمنة والتقسيم البسيط عند عدم توفر بيانات NLTK دون محاولة التنزيل
+        """
+        with mock.patch("nltk.data.find", side_effect=LookupError), \
+                mock.patch("nltk.download") as download, \
+                mock.patch.dict(os.environ, {"NLTK_AUTO_DOWNLOAD": "False"}):
+            stopwords = nltk_resources.get_stopwords("arabic")
+            sentences = nltk_resources.sent_tokenize("يجب تقديم الضمان البنكي. هل المدة 24 شهر؟ نعم")
+            words = nltk_resources.word_tokenize("توريد 120 م3 خرسانة.")
+        
+        download.assert_not_called()
+        self.assertIs(stopwords, nltk_resources.ARABIC_STOPWORDS_FALLBACK)
+        self.assertIn("في", stopwords)
+        self.assertEqual(sentences, ["يجب تقديم الضمان البنكي.", "هل المدة 24 شهر؟", "نعم"])
+        self.assertEqual(words, ["توريد", "120", "م3", "خرسانة", "."])
+        
+        # تُحمَّل الكلمات مرة واحدة لكل عملية
+        self.assertIs(nltk_resources.get_stopwords("arabic"), stopwords)
+
+if __name__ == '__main__':
+    unittest.main()
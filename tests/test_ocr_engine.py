@@ -0,0 +1,86 @@
+import os
+import sys
+import unittest
+from concurrent.futures import Future
+from unittest import mock
+
+import numpy as np
+from PIL import Image
+
+# إضافة المسار الرئيسي للمشروع إلى PATH
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# استيراد الوحدات المراد اختبارها
+from modules.ocr_engine import OCREngine, binarize_image, estimate_skew_angle, preprocess_page_image
+
+
+class FailingBatchExecutor:
+    """
+    بديل لمجموعة العمليات ينفذ الدفعات مباشرة، وتفشل فيه الدفعة التي تحتوي على الصفحة 3
+    """
+    
+    def __init__(self, *args, **kwargs):
+        pass
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        return False
+    
+    def submit(self, function, file_path, batch, *args):
+        future = Future()
+        if 2 in batch:
+            future.set_exception(RuntimeError("worker crashed"))
+        else:
+            future.set_result([(page_index, f"page {page_index + 1}") for page_index in batch])
+        return future
+
+class TestOCRPreprocessing(unittest.TestCase):
+    """
+    اختبارات وحدة لمعالجة صور الصفحات قبل OCR
+    """
+    
+    def setUp(self):
+        """
+        إعداد صورة صفحة اصطناعية تحتوي على أسطر نصية أفقية
+        """
+        self.page_image = np.full((600, 800), 230, dtype=np.uint8)
+        for top in range(100, 500, 30):
+            self.page_image[top:top + 6, 100:700] = 20
+    
+    def test_binarize_image(self):
+        """
+        اختبار تحويل الصورة إلى قيمتين فقط مع الحفاظ على بكسلات النص
+        """
+        binary = binarize_image(self.page_image)
+        
+        self.assertEqual(set(np.unique(binary)), {0, 255})
+        self.assertEqual(int((binary == 0).sum()), int((self.page_image == 20).sum()))
+    
+    def test_deskew_rotated_page(self):
+        """
+        اختبار تقدير زاوية ميل الصفحة وتصحيحها
+        """
+        skewed = np.asarray(Image.fromarray(self.page_image).rotate(2.0, fillcolor=230))
+        
+        self.assertAlmostEqual(estimate_skew_angle(binarize_image(skewed)), 2.0, delta=0.25)
+        self.assertAlmostEqual(estimate_skew_angle(preprocess_page_image(skewed)), 0.0, delta=0.25)
+
+class TestOCREngine(unittest.TestCase):
+    """
+    اختبارات وحدة لتوزيع صفحات OCR على العمليات
+    """
+    
+    def test_failed_batch_keeps_other_pages(self):
+        """
+        اختبار الاحتفاظ بنتائج الدفعات الناجحة عند فشل إحدى الدفعات
+        """
+        engine = OCREngine(workers=2)
+        with mock.patch("modules.ocr_engine.ProcessPoolExecutor", FailingBatchExecutor):
+            ocr_texts = engine.ocr_pdf("scanned.pdf", [0, 1, 2, 3])
+        
+        self.assertEqual(ocr_texts, {1: "page 2", 3: "page 4"})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,276 @@
+import os
+import sys
+import time
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+# إضافة المسار الرئيسي للمشروع إلى PATH
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+
+# استيراد الوحدات المراد اختبارها
+from tender_corpus import generate_tender, generate_suppliers, render_text
+from supplier_index_benchmark import (SEARCH_QUERIES, generate_catalogue, generate_materials, full_scan_links,
+                                      full_scan_matches, full_scan_search)
+from supply_chain import suppliers_database
+from supply_chain.suppliers_database import SuppliersDatabase
+from utils.arabic_normalizer import normalized_words
+from utils.database import VectorDBConnector
+from analysis.cost_estimator import CostEstimator
+from modules.schedule_analyzer import ScheduleAnalyzer
+
+# مضاعفة حجم المدخلات في اختبارات التدرج
+SCALE_FACTOR = 4
+
+# أقصى نسبة زمن مسموحة عند مضاعفة المدخلات 4 مرات (المسار الخطي ≈ 4، والتربيعي ≈ 16)
+MAX_SCALING_RATIO = 8.0
+
+def best_time(function, repeats=5):
+    """
+    أقل زمن تنفيذ من عدة تكرارات (أقل تأثراً بتذبذب أجهزة التكامل المستمر من المتوسط)
+    """
+    samples = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        function()
+        samples.append(time.perf_counter() - started)
+    return min(samples)
+
+def scaling_ratio(make_case, size):
+    """
+    نسبة زمن التنفيذ عند مضاعفة حجم المدخلات SCALE_FACTOR مرات
+    
+    المعاملات:
+    ----------
+    make_case : Callable[[int], Callable[[], Any]]
+        تُنشئ المدخلات بالحجم المحدد وتعيد دالة التنفيذ
+    size : int
+        الحجم الأصغر
+    """
+    small = make_case(size)
+    large = make_case(size * SCALE_FACTOR)
+    
+    # تشغيل أولي لتحميل الذاكرات المؤقتة وبناء الأنماط قبل القياس
+    small()
+    large()
+    return best_time(large) / best_time(small)
+
+class TestPerformanceGates(unittest.TestCase):
+    """
+    اختبارات أداء للمسارات الحرجة: عدد العمليات وتدرج الزمن مع حجم المدخلات
+    (تكشف المسارات التربيعية العرضية دون الاعتماد على أزمنة مطلقة تختلف بين الأجهزة)
+    """
+    
+    def setUp(self):
+        """
+        إعداد بيئة الاختبار
+        """
+        self.test_dir = tempfile.mkdtemp()
+    
+    def tearDown(self):
+        """
+        تنظيف بيئة الاختبار
+        """
+        shutil.rmtree(self.test_dir)
+    
+    def _suppliers_database(self, supplier_count, product_count=None):
+        """
+        قاعدة موردين اصطناعية بالحجم المطلوب (وبكتالوج منتجات كبير عند تحديد عدد المنتجات)
+        """
+        if product_count:
+            data = generate_catalogue(supplier_count, product_count)
+        else:
+            data = generate_suppliers(supplier_count)
+        database = SuppliersDatabase()
+        database.suppliers = data["suppliers"]
+        database.products = data["products"]
+        database._initialize_indexes()
+        return database
+    
+    def test_product_index_matches_full_scan(self):
+        """
+        اختبار أن الفهرس المقلوب يعطي روابط ومطابقات المسح الكامل نفسها مع مقارنة جزء صغير من الكتالوج فقط
+        """
+        database = self._suppliers_database(300, 3000)
+        
+        supplier_products, product_suppliers = full_scan_links(database, database.suppliers)
+        self.assertEqual(database.supplier_products, supplier_products)
+        self.assertEqual(database.product_suppliers, product_suppliers)
+        
+        names = [name for supplier in database.suppliers for name in supplier["products"]]
+        with mock.patch.object(suppliers_database, "words_similarity",
+                               wraps=suppliers_database.words_similarity) as similarity:
+            matches = [database._match_products(name) for name in names]
+        self.assertLess(similarity.call_count, len(names) * len(database.products) / 20)
+        
+        for name, matching_products in zip(names, matches):
+            self.assertEqual(matching_products, full_scan_matches(database, name))
+    
+    def test_find_matching_suppliers_matches_each_distinct_material_once(self):
+        """
+        اختبار أن مطابقة جدول كميات كبير تبحث في الفهرس مرة واحدة لكل مادة مميزة وتعطي نتائج المسح الكامل
+        """
+        database = self._suppliers_database(300, 3000)
+        materials = generate_materials(database.products, 600)
+        names = [material["name"] for material in materials]
+        
+        with mock.patch.object(database, "_match_words", wraps=database._match_words) as match_words:
+            results = database.find_matching_suppliers(materials)
+        
+        self.assertEqual(match_words.call_count, len({normalized_words(name) for name in names}))
+        self.assertEqual(set(results["material_coverage"]), set(names))
+        for name in set(names):
+            top_products = sorted(full_scan_matches(database, name), key=lambda match: match[1], reverse=True)[:5]
+            supplier_ids = {supplier_id for product_id, _ in top_products
+                            for supplier_id in database.product_suppliers.get(product_id, [])}
+            self.assertEqual(results["material_coverage"][name], min(100.0, len(supplier_ids) * 20.0))
+    
+    def test_find_matching_suppliers_returns_suppliers_per_material(self):
+        """
+        اختبار أن مطابقة المواد تعيد موردي كل مادة دون مقارنتها بجميع المنتجات
+        """
+        database = self._suppliers_database(200)
+        materials = [{"name": product["name"]} for product in database.products.values()] * 3
+        
+        with mock.patch.object(suppliers_database, "words_similarity",
+                               wraps=suppliers_database.words_similarity) as similarity:
+            results = database.find_matching_suppliers(materials)
+        
+        self.assertLess(similarity.call_count, len(materials) * len(database.products))
+        self.assertTrue(results["local_suppliers"])
+        for supplier in results["local_suppliers"]:
+            self.assertTrue(supplier["materials"])
+    
+    def test_search_suppliers_matches_full_scan(self):
+        """
+        اختبار أن البحث بفهرس المقاطع الثلاثية يعطي نتائج المرور على جميع الموردين مع تحديد العدد والترتيب
+        """
+        database = self._suppliers_database(2000)
+        queries = SEARCH_QUERIES + ["", "إسمنت", "أسمنت بورتلاندي", "S0012"]
+        for category in [None, "الكل", "مواد البناء", "فئة غير موجودة"]:
+            for query in queries:
+                with self.subTest(query=query, category=category):
+                    expected = full_scan_search(database, query, category)
+                    self.assertEqual(database.search_suppliers(query, category), expected)
+                    self.assertEqual(database.search_suppliers(query, category, limit=7), expected[:7])
+                    
+                    ranked = database.search_suppliers(query, category, rank=True)
+                    self.assertCountEqual([supplier["id"] for supplier in ranked],
+                                          [supplier["id"] for supplier in expected])
+                    self.assertEqual(database.search_suppliers(query, category, limit=7, rank=True), ranked[:7])
+        
+        ranked = database.search_suppliers("مصنع", rank=True)
+        self.assertTrue(all(supplier["name"].startswith("مصنع") for supplier in ranked[:10]))
+    
+    def test_search_suppliers_checks_only_candidates(self):
+        """
+        اختبار أن البحث بنص محدد يتحقق من الموردين المرشحين من الفهرس فقط
+        """
+        database = self._suppliers_database(2000)
+        with mock.patch.object(database, "_search_rank", wraps=database._search_rank) as search_rank:
+            results = database.search_suppliers(database.suppliers[1233]["name"], rank=True)
+        
+        self.assertEqual(results[0], database.suppliers[1233])
+        self.assertLess(search_rank.call_count, len(database.suppliers) / 20)
+    
+    def test_find_matching_suppliers_scales_linearly(self):
+        """
+        اختبار أن زمن مطابقة المواد يتدرج خطياً مع عدد الموردين ومع عدد المواد
+        """
+        def with_suppliers(count):
+            database = self._suppliers_database(count)
+            materials = [{"name": product["name"]} for product in database.products.values()] * 10
+            return lambda: database.find_matching_suppliers(materials)
+        
+        database = self._suppliers_database(200)
+        products = list(database.products.values())
+        
+        def with_materials(count):
+            materials = [{"name": f"{products[index % len(products)]['name']} {index}"} for index in range(count)]
+            return lambda: database.find_matching_suppliers(materials)
+        
+        self.assertLess(scaling_ratio(with_suppliers, 400), MAX_SCALING_RATIO)
+        self.assertLess(scaling_ratio(with_materials, 150), MAX_SCALING_RATIO)
+    
+    def test_retrieve_similar_scales_linearly(self):
+        """
+        اختبار أن استرجاع المستندات المتشابهة يتدرج خطياً مع عدد المتجهات ويعيد الأكثر تشابهاً أولاً
+        """
+        rng = np.random.default_rng(0)
+        query = rng.random(384)
+        
+        def with_vectors(count):
+            connector = VectorDBConnector(os.path.join(self.test_dir, "vector_db"))
+            for index in range(count):
+                connector.store_vector(f"doc{index}", f"مستند {index}", rng.random(384))
+            return lambda: connector.retrieve_similar(query, top_k=5)
+        
+        results = with_vectors(50)()
+        self.assertEqual(len(results), 5)
+        self.assertEqual(results, sorted(results, key=lambda result: result["similarity"], reverse=True))
+        
+        self.assertLess(scaling_ratio(with_vectors, 1000), MAX_SCALING_RATIO)
+    
+    def test_cost_estimate_categorizes_each_item_once(self):
+        """
+        اختبار أن تقدير التكاليف يصنف كل بند من جدول الكميات مرة واحدة
+        """
+        tender = generate_tender(20)
+        estimator = CostEstimator({"result_cache": False})
+        
+        with mock.patch.object(estimator, "_determine_material_category",
+                               wraps=estimator._determine_material_category) as categorize:
+            result = estimator.estimate(render_text(tender), None, tender["boq_items"])
+        
+        self.assertNotIn("error", result)
+        self.assertEqual(categorize.call_count, len(tender["boq_items"]))
+    
+    def test_cost_estimate_scales_linearly(self):
+        """
+        اختبار أن زمن تقدير التكاليف يتدرج خطياً مع حجم المناقصة (من النص وحده ومع بنود الكميات)
+        """
+        estimator = CostEstimator({"result_cache": False})
+        
+        def from_text(pages):
+            text = render_text(generate_tender(pages))
+            return lambda: estimator.estimate(text)
+        
+        def from_boq(pages):
+            tender = generate_tender(pages)
+            text = render_text(tender)
+            return lambda: estimator.estimate(text, None, tender["boq_items"])
+        
+        self.assertLess(scaling_ratio(from_text, 50), MAX_SCALING_RATIO)
+        self.assertLess(scaling_ratio(from_boq, 50), MAX_SCALING_RATIO)
+    
+    def test_schedule_analysis_scales_linearly(self):
+        """
+        اختبار أن تحليل الجدول الزمني يتدرج خطياً مع حجم المناقصة وعدد المعالم فيها
+        """
+        analyzer = ScheduleAnalyzer()
+        
+        def with_pages(pages):
+            extracted_data = {"text": render_text(generate_tender(pages))}
+            return lambda: analyzer.analyze(extracted_data)
+        
+        def with_milestones(count):
+            lines = ["مدة التنفيذ: 24 شهر"] + [
+                f"تسليم المرحلة {index}: أعمال الجزء {index} بتاريخ {index % 28 + 1}/{index % 12 + 1}/2026"
+                for index in range(count)
+            ]
+            extracted_data = {"text": "\n".join(lines)}
+            return lambda: analyzer.analyze(extracted_data)
+        
+        # المعالم المكررة تُضاف مرة واحدة
+        repeated = {"text": "تسليم المرحلة 1: 1/2/2026\nتسليم المرحلة 1: 1/2/2026\nتسليم المرحلة 2: 1/3/2026"}
+        self.assertEqual(len(analyzer._extract_schedule_info(repeated)["milestones"]), 2)
+        
+        self.assertLess(scaling_ratio(with_pages, 50), MAX_SCALING_RATIO)
+        self.assertLess(scaling_ratio(with_milestones, 1000), MAX_SCALING_RATIO)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+import os
+import sys
+import json
+import pstats
+import shutil
+import hashlib
+import tempfile
+import unittest
+import tracemalloc
+
+# إضافة المسار الرئيسي للمشروع إلى PATH
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# استيراد الوحدات المراد اختبارها
+from utils.profiling import profile_run, profile_stage, current_session
+from modules.analysis_pipeline import TenderAnalysisPipeline
+
+def build_words(count):
+    """
+    مرحلة اختبارية تخصص قائمة نصوص
+    """
+    return [f"بند {index}" for index in range(count)]
+
+class TestProfiling(unittest.TestCase):
+    """
+    اختبارات وحدة لتحليل أداء التشغيل عند الطلب
+    """
+    
+    def setUp(self):
+        """
+        إعداد بيئة الاختبار
+        """
+        self.test_dir = tempfile.mkdtemp()
+    
+    def tearDown(self):
+        """
+        تنظيف بيئة الاختبار
+        """
+        shutil.rmtree(self.test_dir)
+    
+    def test_disabled_run_writes_nothing(self):
+        """
+        اختبار أن التعطيل لا ينشئ جلسة ولا يبدأ تتبع الذاكرة ولا يكتب ملفات
+        """
+        with profile_run("test", enabled=False, output_dir=self.test_dir) as session:
+            self.assertIsNone(session)
+            self.assertIsNone(current_session())
+            with profile_stage("document", b"content"):
+                self.assertFalse(tracemalloc.is_tracing())
+        
+        self.assertEqual(os.listdir(self.test_dir), [])
+    
+    def test_run_writes_profiles_and_memory_snapshots(self):
+        """
+        اختبار كتابة ملفات .prof ولقطات الذاكرة لكل مرحلة موسومة ببصمة المستند
+        """
+        document = "نص المناقصة".encode("utf-8")
+        pipeline = TenderAnalysisPipeline()
+        pipeline.add_stage("words", build_words, ("count",))
+        pipeline.add_stage("total", len, ("words",))
+        
+        with profile_run("test", enabled=True, output_dir=self.test_dir, top_n=5) as session:
+            with profile_stage("document", document):
+                build_words(1000)
+            output = pipeline.run({"count": 2000})
+        
+        self.assertEqual(output["results"]["total"], 2000)
+        self.assertFalse(tracemalloc.is_tracing())
+        
+        document_tag = hashlib.sha256(document).hexdigest()[:16]
+        self.assertTrue(all(os.path.basename(path).startswith(f"profile_{document_tag}_") for path in session.files))
+        
+        # ملف للتشغيل الرئيسي وملف لكل مرحلة نُفذت في خيط آخر
+        profiles = sorted(path.rsplit("_", 1)[1] for path in session.files if path.endswith(".prof"))
+        self.assertEqual(profiles, ["run.prof", "total.prof", "words.prof"])
+        stats = pstats.Stats(next(path for path in session.files if path.endswith("_words.prof")))
+        self.assertTrue(any(function[2] == "build_words" for function in stats.stats))
+        
+        memory_path = next(path for path in session.files if path.endswith("_memory.json"))
+        with open(memory_path, encoding="utf-8") as f:
+            memory = json.load(f)
+        stages = {stage["stage"]: stage for stage in memory["stages"]}
+        self.assertEqual(set(stages), {"run", "document", "words", "total"})
+        self.assertFalse(stages["document"]["own_profile"])
+        self.assertLessEqual(len(stages["words"]["top_allocations"]), 5)
+        self.assertTrue(any("test_profiling.py" in allocation["location"]
+                            for allocation in stages["words"]["top_allocations"]))
+    
+    def test_nested_runs_share_session(self):
+        """
+        اختبار أن التشغيل المتداخل لا يفتح جلسة ثانية
+        """
+        with profile_run("outer", enabled=True, output_dir=self.test_dir) as outer:
+            with profile_run("inner", enabled=True, output_dir=self.test_dir) as inner:
+                self.assertIsNone(inner)
+                self.assertIs(current_session(), outer)
+        
+        self.assertEqual(len([name for name in os.listdir(self.test_dir) if name.endswith("_memory.json")]), 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,139 @@
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import pandas as pd
+
+# إضافة المسار الرئيسي للمشروع إلى PATH
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# استيراد الوحدات المراد اختبارها
+from analysis.cost_estimator import CostEstimator
+from analysis import result_cache
+from analysis.result_cache import get_result_cache
+
+SAMPLE_TEXT = """اسم المشروع: إنشاء مدرسة ابتدائية
+موقع المشروع: الرياض
+قيمة المشروع: 5,000,000 ريال
+مدة التنفيذ: 18 شهر
+"""
+
+class TestResultCache(unittest.TestCase):
+    """
+    اختبارات وحدة لذاكرة نتائج المحللات
+    """
+    
+    def setUp(self):
+        """
+        إعداد بيئة الاختبار
+        """
+        self.test_dir = tempfile.mkdtemp()
+        self.config = {"result_cache_dir": self.test_dir}
+        self.cache = get_result_cache(self.config)
+        self.cache.clear()
+    
+    def tearDown(self):
+        """
+        تنظيف بيئة الاختبار
+        """
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+    
+    def test_repeat_analysis_uses_cache(self):
+        """
+        اختبار إعادة النتيجة المخزنة للنص نفسه من الذاكرة ثم من القرص
+        """
+        estimator = CostEstimator(self.config)
+        first = estimator.estimate(SAMPLE_TEXT)
+        
+        # تعديل النتيجة المعادة لا يؤثر على النسخة المخزنة
+        first["project_info"]["title"] = "معدل"
+        second = CostEstimator(self.config).estimate(SAMPLE_TEXT)
+        self.assertEqual(second["project_info"]["title"], "إنشاء مدرسة ابتدائية")
+        self.assertEqual(self.cache.get_stats()["memory_hits"], 1)
+        
+        # عملية جديدة (ذاكرة فارغة) تقرأ النتيجة من القرص
+        self.cache._memory.clear()
+        third = CostEstimator(self.config).estimate(SAMPLE_TEXT)
+        self.assertEqual(third, second)
+        self.assertEqual(self.cache.get_stats()["disk_hits"], 1)
+    
+    def test_database_change_invalidates(self):
+        """
+        اختبار إعادة التحليل عند تغير قاعدة بيانات التكاليف أو النص
+        """
+        estimator = CostEstimator(self.config)
+        estimator.estimate(SAMPLE_TEXT)
+        
+        estimator.cost_db = dict(estimator.cost_db, updated=True)
+        estimator.estimate(SAMPLE_TEXT)
+        estimator.estimate(SAMPLE_TEXT + "\nملاحظة")
+        
+        # تعديل قاعدة البيانات والإعدادات في مكانها
+        estimator.cost_db["updated"] = False
+        estimator.estimate(SAMPLE_TEXT)
+        estimator.config["contingency"] = 0.2
+        estimator.estimate(SAMPLE_TEXT)
+        
+        stats = self.cache.get_stats()
+        self.assertEqual(stats["misses"], 5)
+        self.assertEqual(stats["memory_hits"], 0)
+    
+    def test_helper_module_change_invalidates(self):
+        """
+        اختبار إعادة التحليل عند تغير إحدى الوحدات المساعدة التي يعتمد عليها المحلل
+        """
+        helper = os.path.join(self.test_dir, "keyword_matcher.py")
+        with open(helper, "w", encoding="utf-8") as f:
+            f.write("VERSION = 1\n")
+        
+        estimator = CostEstimator(self.config)
+        with mock.patch.object(result_cache, "CODE_FILES", (helper,)):
+            result_cache._code_fingerprint.cache_clear()
+            estimator.estimate(SAMPLE_TEXT)
+            
+            with open(helper, "w", encoding="utf-8") as f:
+                f.write("VERSION = 2\n")
+            result_cache._code_fingerprint.cache_clear()
+            estimator.estimate(SAMPLE_TEXT)
+        result_cache._code_fingerprint.cache_clear()
+        
+        stats = self.cache.get_stats()
+        self.assertEqual(stats["misses"], 2)
+        self.assertEqual(stats["memory_hits"], 0)
+    
+    def test_long_tables_with_same_head_and_tail(self):
+        """
+        اختبار اختلاف المفتاح لجدولين طويلين يشتركان في الصفوف الأولى والأخيرة
+        """
+        def boq_table(middle_quantity):
+            quantities = [10] * 5 + [middle_quantity] * 70 + [10] * 5
+            return pd.DataFrame({
+                "رقم": range(1, 81),
+                "الوصف": [f"خرسانة مسلحة للبند {index}" for index in range(1, 81)],
+                "الكمية": quantities,
+                "الوحدة": ["م3"] * 80
+            })
+        
+        first, second = boq_table(100), boq_table(5000)
+        self.assertEqual(str(first), str(second))
+        
+        estimator = CostEstimator(self.config)
+        expected = CostEstimator({"result_cache": False}).estimate(SAMPLE_TEXT, [{"data": second}])
+        estimator.estimate(SAMPLE_TEXT, [{"data": first}])
+        result = estimator.estimate(SAMPLE_TEXT, [{"data": second}])
+        self.assertEqual(result["total_cost"], expected["total_cost"])
+        self.assertEqual(self.cache.get_stats()["misses"], 2)
+    
+    def test_disabled_cache(self):
+        """
+        اختبار تعطيل الذاكرة من إعدادات المحلل
+        """
+        self.assertIsNone(get_result_cache({"result_cache": False}))
+        estimator = CostEstimator({"result_cache": False})
+        self.assertEqual(estimator.estimate(SAMPLE_TEXT), estimator.estimate(SAMPLE_TEXT))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import os
+import sys
+import unittest
+
+# إضافة المسار الرئيسي للمشروع إلى PATH
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# استيراد الوحدات المراد اختبارها
+from analysis.section_index import DocumentIndex, get_document_index
+from analysis.local_content_analyzer import LocalContentAnalyzer
+from analysis.risk_analyzer import RiskAnalyzer
+
+SAMPLE_TEXT = """الباب الأول: الشروط العامة
+
+نطاق العمل:
+- أعمال الحفر والردم للموقع
+- أعمال الخرسانة المسلحة
+  للأساسات
+
+1. المتطلبات الفنية:
+1.1 يجب أن تكون المواد مطابقة للمواصفات السعودية.
+1.2 يلتزم المقاول بتقديم عينات.
+
+الباب الثاني: المحتوى المحلي
+يجب ألا تقل نسبة المحتوى المحلي عن 40%. وفي حال التأخير تطبق غرامة.
+"""
+
+class TestSectionIndex(unittest.TestCase):
+    """
+    اختبارات وحدة لفهرس أقسام المستند
+    """
+    
+    def test_heading_hierarchy_and_offsets(self):
+        """
+        اختبار تسلسل العناوين ومواضع الأقسام والبنود في النص
+        """
+        index = DocumentIndex(SAMPLE_TEXT)
+        
+        titles = [(heading["title"], heading["level"]) for heading in index.headings]
+        self.assertEqual(titles, [
+            ("الباب الأول: الشروط العامة", 1),
+            ("نطاق العمل", 2),
+            ("المتطلبات الفنية", 3),
+            ("الباب الثاني: المحتوى المحلي", 1)
+        ])
+        
+        technical = index.headings[2]
+        self.assertEqual(index.section_path(technical), ["الباب الأول: الشروط العامة", "نطاق العمل", "المتطلبات الفنية"])
+        self.assertTrue(index.section_text(technical).endswith("يلتزم المقاول بتقديم عينات."))
+        
+        # البنود المرقمة مع أرقامها ومواضعها في النص
+        numbered = index.clauses_in(technical["start"], technical["end"], kind="numbered")
+        self.assertEqual([clause["number"] for clause in numbered], ["1.1", "1.2"])
+        for clause in index.clauses:
+            self.assertTrue(SAMPLE_TEXT[clause["start"]:clause["end"]].endswith(clause["text"].splitlines()[-1]))
+        
+        # السطر التابع يُضم إلى البند السابق
+        bullets = index.list_blocks("bullet")[0]
+        self.assertEqual(len(index.clauses_in(bullets["start"], bullets["end"])), 2)
+        self.assertIn("للأساسات", index.clauses[1]["text"])
+        
+        self.assertEqual(index.sentences_containing("غرامة"), ["وفي حال التأخير تطبق غرامة."])
+        self.assertIs(index.paragraph_at(SAMPLE_TEXT.index("40%"))["section"], 3)
+    
+    def test_index_shared_between_analyzers(self):
+        """
+        اختبار بناء الفهرس مرة واحدة للنص نفسه واستعلام المحللات منه
+        """
+        index = get_document_index(SAMPLE_TEXT)
+        self.assertIs(get_document_index(SAMPLE_TEXT), index)
+        
+        paragraphs = LocalContentAnalyzer(None)._find_local_content_paragraphs(SAMPLE_TEXT)
+        self.assertEqual(len(paragraphs), 1)
+        self.assertTrue(paragraphs[0].startswith("الباب الثاني"))
+        
+        risks = RiskAnalyzer(None)._extract_explicit_risks(SAMPLE_TEXT)
+        self.assertIn("وفي حال التأخير تطبق غرامة.", [risk["risk"] for risk in risks])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+import os
+import sys
+import json
+import pickle
+import unittest
+
+import numpy as np
+
+# إضافة المسار الرئيسي للمشروع إلى PATH
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+
+# استيراد الوحدات المراد اختبارها
+from supplier_store_benchmark import generate_supplier_records
+from utils.supplier_store import SupplierStore, NUMERIC, CATEGORICAL, STRING, STRING_LIST, NESTED, OBJECT
+from modules.supply_chain import SupplyChainAnalyzer
+
+class TestSupplierStore(unittest.TestCase):
+    """
+    اختبارات وحدة لمخزن الموردين العمودي
+    """
+    
+    def setUp(self):
+        """
+        إعداد بيئة الاختبار
+        """
+        self.records = json.loads(json.dumps(generate_supplier_records(500), ensure_ascii=False))
+        
+        # حقول ناقصة وقيم غير متجانسة
+        del self.records[3]["region"]
+        del self.records[4]["historical_performance"]["cost"]
+        self.records[5]["contact"] = {"phone": "0500000000"}
+        self.records[6]["products"] = []
+        self.store = SupplierStore.from_records(self.records)
+    
+    def test_records_round_trip(self):
+        """
+        اختبار أن المخزن يعيد السجلات الأصلية بحقولها وأنواعها وترتيبها
+        """
+        self.assertEqual(len(self.store), len(self.records))
+        self.assertEqual(list(self.store), self.records)
+        self.assertEqual(self.store[-1], self.records[-1])
+        self.assertEqual(self.store[10:13], self.records[10:13])
+        self.assertEqual(list(self.store[3]), list(self.records[3]))
+        self.assertIsInstance(self.store[0]["local_content_percentage"], int)
+        self.assertIsInstance(self.store[0]["rating"], float)
+        with self.assertRaises(IndexError):
+            self.store[len(self.records)]
+        
+        # المخزن نفسه يعاد كما هو
+        self.assertIs(SupplierStore.from_records(self.store), self.store)
+        self.assertEqual(len(SupplierStore.from_records([])), 0)
+    
+    def test_column_kinds(self):
+        """
+        اختبار اختيار نوع العمود حسب قيم الحقل
+        """
+        kinds = {field: self.store._fields[field].kind for field in self.store.fields}
+        self.assertEqual(kinds["id"], STRING)
+        self.assertEqual(kinds["sector"], CATEGORICAL)
+        self.assertEqual(kinds["region"], CATEGORICAL)
+        self.assertEqual(kinds["products"], STRING_LIST)
+        self.assertEqual(kinds["rating"], NUMERIC)
+        self.assertEqual(kinds["historical_performance"], NESTED)
+        self.assertEqual(kinds["contact"], OBJECT)
+    
+    def test_filters_match_records(self):
+        """
+        اختبار أن أقنعة الأعمدة تطابق التصفية بالمرور على السجلات
+        """
+        mask = self.store.isin("sector", ["الإنشاءات", "عام"]) & self.store.isin("categories", ["الطرق"])
+        expected = [position for position, record in enumerate(self.records)
+                    if record["sector"] in ("الإنشاءات", "عام") and "الطرق" in record["categories"]]
+        self.assertEqual(np.flatnonzero(mask).tolist(), expected)
+        
+        quality = self.store.numeric("historical_performance.quality")
+        self.assertEqual(np.flatnonzero(quality >= 90).tolist(),
+                         [position for position, record in enumerate(self.records)
+                          if record["historical_performance"]["quality"] >= 90])
+        self.assertTrue(np.isnan(self.store.numeric("historical_performance.cost")[4]))
+        self.assertFalse(self.store.isin("region", [None]).any())
+        
+        # الشرط يُقيَّم مرة واحدة لكل منتج مختلف
+        calls = []
+        providers = self.store.match("products", lambda product: calls.append(product) or "خرسانة" in product)
+        self.assertEqual(len(calls), len(set(calls)))
+        self.assertEqual(self.store.records(np.flatnonzero(providers)),
+                         [record for record in self.records if any("خرسانة" in product for product in record["products"])])
+    
+    def test_values_and_counts(self):
+        """
+        اختبار قيم الحقول وتوزيعها مع القيم الافتراضية للسجلات الناقصة
+        """
+        self.assertEqual(self.store.values("region", "غير محدد"),
+                         [record.get("region", "غير محدد") for record in self.records])
+        self.assertEqual(self.store.values("missing"), [None] * len(self.records))
+        
+        expected = {}
+        for record in self.records:
+            region = record.get("region", "غير محدد")
+            expected[region] = expected.get(region, 0) + 1
+        self.assertEqual(list(self.store.value_counts("region", "غير محدد").items()), list(expected.items()))
+    
+    def test_fingerprint_and_pickle(self):
+        """
+        اختبار أن بصمة المخزن تتبع المحتوى وأنه يُحفظ ويُحمّل كما هو
+        """
+        same = SupplierStore.from_records(json.loads(json.dumps(self.records, ensure_ascii=False)))
+        self.assertEqual(repr(same), repr(self.store))
+        self.assertEqual(same, self.store)
+        
+        self.records[0]["rating"] = 1.0
+        changed = SupplierStore.from_records(self.records)
+        self.assertNotEqual(changed.fingerprint(), self.store.fingerprint())
+        self.assertNotEqual(changed, self.store)
+        
+        loaded = pickle.loads(pickle.dumps(self.store))
+        self.assertEqual(loaded, self.store)
+        self.assertEqual(list(loaded), list(self.store))
+    
+    def test_supply_chain_analyzer_filters_store(self):
+        """
+        اختبار تصفية SupplyChainAnalyzer للموردين من المخزن حسب القطاع وفئات المواد
+        """
+        analyzer = SupplyChainAnalyzer()
+        self.assertIsInstance(analyzer.suppliers_db, SupplierStore)
+        
+        suppliers = analyzer._identify_potential_suppliers([{"name": "حديد", "category": "حديد"}], "الإنشاءات")
+        self.assertTrue(suppliers)
+        for supplier in suppliers:
+            self.assertIn(supplier["sector"], ("الإنشاءات", "عام"))
+            self.assertIn("حديد", supplier["categories"])
+        
+        frame = analyzer.get_suppliers_database()
+        self.assertEqual(frame["id"].tolist(), analyzer.suppliers_db.values("id"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import os
+import sys
+import unittest
+
+# إضافة المسار الرئيسي للمشروع إلى PATH
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+
+# استيراد الوحدات المراد اختبارها
+from tender_corpus import build_document, generate_tender, render_text, find_pdf_font
+from tender_benchmark import compare_reports
+from modules.document_processor import DocumentProcessor
+
+class TestTenderCorpus(unittest.TestCase):
+    """
+    اختبارات وحدة لمولد المناقصات الاصطناعية المستخدم في قياس الأداء
+    """
+    
+    def setUp(self):
+        """
+        إعداد بيئة الاختبار
+        """
+        self.processor = DocumentProcessor({"cache_enabled": False})
+    
+    def test_generation_is_deterministic(self):
+        """
+        اختبار أن المناقصة نفسها تُولد لكل بذرة وعدد صفحات
+        """
+        tender = generate_tender(10, seed=7)
+        self.assertEqual(render_text(tender), render_text(generate_tender(10, seed=7)))
+        self.assertNotEqual(render_text(tender), render_text(generate_tender(10, seed=8)))
+        self.assertEqual(len(tender["pages"]), 10)
+        self.assertTrue(tender["boq_items"])
+        
+        text = render_text(tender)
+        for expected in ("اسم المشروع:", "مدة التنفيذ:", "متطلبات المحتوى المحلي", "جدول الكميات", "المادة 1:"):
+            self.assertIn(expected, text)
+    
+    def test_documents_are_processed(self):
+        """
+        اختبار أن معالج المستندات يستخرج النص وبنود الكميات من كل صيغة
+        """
+        tender = generate_tender(10)
+        formats = ["txt", "docx", "xlsx"] + (["pdf"] if find_pdf_font() else [])
+        for file_format in formats:
+            with self.subTest(file_format=file_format):
+                result = self.processor.process_document(build_document(10, file_format), file_format,
+                                                         f"tender.{file_format}")
+                self.assertNotIn("error", result)
+                self.assertIn("المحتوى المحلي", result["text"])
+                if file_format != "txt":
+                    self.assertEqual(len(result["boq_items"]), len(tender["boq_items"]))
+    
+    def test_compare_reports_flags_regressions(self):
+        """
+        اختبار اكتشاف التراجع عند مقارنة تقريرين مع تجاهل التذبذب في الحالات القصيرة
+        """
+        baseline = {"results": [
+            {"name": "analysis.risks", "pages": 100, "median_s": 0.200},
+            {"name": "analysis.costs", "pages": 100, "median_s": 0.001},
+            {"name": "suppliers.search", "pages": 100, "median_s": 0.050}
+        ]}
+        current = {"results": [
+            {"name": "analysis.risks", "pages": 100, "median_s": 0.300},
+            {"name": "analysis.costs", "pages": 100, "median_s": 0.002},
+            {"name": "suppliers.search", "pages": 100, "median_s": 0.040},
+            {"name": "analysis.requirements", "pages": 100, "median_s": 0.100}
+        ]}
+        
+        comparison = {entry["name"]: entry for entry in compare_reports(current, baseline, 1.25)}
+        self.assertEqual(set(comparison), {"analysis.risks", "analysis.costs", "suppliers.search"})
+        self.assertTrue(comparison["analysis.risks"]["regression"])
+        self.assertFalse(comparison["analysis.costs"]["regression"])
+        self.assertFalse(comparison["suppliers.search"]["regression"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import os
+import sys
+import json
+import shutil
+import tempfile
+import unittest
+
+# إضافة المسار الرئيسي للمشروع إلى PATH
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# استيراد الوحدات المراد اختبارها
+from utils.tracing import get_tracer, span, traced, current_span
+from modules.analysis_pipeline import TenderAnalysisPipeline
+
+@traced("test.count_words")
+def count_words(text):
+    """
+    دالة اختبارية متتبعة
+    """
+    words = text.split()
+    current_span().add_count("words", len(words))
+    return len(words)
+
+class TestTracing(unittest.TestCase):
+    """
+    اختبارات وحدة لتتبع مراحل المعالجة
+    """
+    
+    def setUp(self):
+        """
+        إعداد بيئة الاختبار
+        """
+        self.tracer = get_tracer()
+        self.tracer.reset()
+        self.test_dir = tempfile.mkdtemp()
+    
+    def tearDown(self):
+        """
+        تنظيف بيئة الاختبار
+        """
+        self.tracer.reset()
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+    
+    def test_nested_spans(self):
+        """
+        اختبار تداخل النطاقات وتسجيل الأعداد والأخطاء
+        """
+        with span("test.document", file_type="txt"):
+            count_words("توريد وتركيب المعدات")
+            with self.assertRaises(ValueError):
+                with span("test.failing"):
+                    raise ValueError("خطأ")
+        
+        data = self.tracer.roots[-1].to_dict()
+        self.assertEqual(data["name"], "test.document")
+        self.assertEqual(data["attributes"], {"file_type": "txt"})
+        self.assertEqual([child["name"] for child in data["children"]], ["test.count_words", "test.failing"])
+        self.assertEqual(data["children"][0]["counts"], {"words": 3})
+        self.assertIn("ValueError", data["children"][1]["error"])
+        self.assertGreaterEqual(data["wall_ms"], data["children"][0]["wall_ms"])
+        self.assertEqual(len(self.tracer.roots), 1)
+    
+    def test_histogram_and_export(self):
+        """
+        اختبار المدرج التكراري المجمع وتصدير التتبع إلى JSON
+        """
+        for _ in range(5):
+            count_words("نص قصير")
+        
+        histogram = self.tracer.get_histogram()["test.count_words"]
+        self.assertEqual(histogram["count"], 5)
+        self.assertEqual(sum(histogram["buckets"].values()), 5)
+        self.assertLessEqual(histogram["p50_ms"], histogram["p95_ms"])
+        
+        path = self.tracer.export(os.path.join(self.test_dir, "trace.json"))
+        with open(path, encoding="utf-8") as f:
+            trace = json.load(f)
+        self.assertEqual(len(trace["spans"]), 5)
+        self.assertIn("test.count_words", trace["histogram"])
+    
+    def test_pipeline_stage_spans(self):
+        """
+        اختبار ظهور نطاقات مراحل خط التحليل المنفذة في خيوط أخرى داخل نطاق خط التحليل
+        """
+        pipeline = (TenderAnalysisPipeline()
+                    .add_stage("requirements", count_words, ("text",))
+                    .add_stage("risks", count_words, ("text",)))
+        pipeline.run({"text": "نطاق العمل"})
+        
+        root = self.tracer.roots[-1].to_dict()
+        self.assertEqual(root["name"], "pipeline.run")
+        stages = {child["name"]: child for child in root["children"]}
+        self.assertEqual(set(stages), {"pipeline.requirements", "pipeline.risks"})
+        self.assertEqual(stages["pipeline.risks"]["children"][0]["name"], "test.count_words")
+
+if __name__ == '__main__':
+    unittest.main()
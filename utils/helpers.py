@@ -5,6 +5,8 @@ import pandas as pd
 from typing import Dict, List, Any, Union, Tuple, Optional
 from datetime import datetime
 
+from utils.keyword_matcher import get_keyword_matcher
+
 def format_currency(amount: float, currency: str = "ريال") -> str:
     """
     تنسيق المبالغ المالية
@@ -102,29 +104,9 @@ def extract_keywords(text: str, keywords: List[str], context_size: int = 50) ->
     List[Dict[str, str]]
         قائمة بالكلمات المفتاحية وسياقها
     """
-    results = []
-    
-    for keyword in keywords:
-        # البحث عن الكلمة المفتاحية في النص
-        pattern = re.compile(r'\\b' + re.escape(keyword) + r'\\b', re.IGNORECASE | re.MULTILINE)
-        matches = pattern.finditer(text)
-        
-        for match in matches:
-            start_idx = max(0, match.start() - context_size)
-            end_idx = min(len(text), match.end() + context_size)
-            
-            # استخراج السياق
-            context = text[start_idx:end_idx]
-            
-            # إضافة النتيجة
-            results.append({
-                "keyword": keyword,
-                "context": context,
-                "position": match.start()
-            })
-    
-    # ترتيب النتائج حسب الموقع في النص
-    results = sorted(results, key=lambda x: x["position"])
+    # البحث عن جميع الكلمات المفتاحية في مرور واحد على النص (المحرك يُبنى مرة واحدة لكل مجموعة كلمات)
+    matcher = get_keyword_matcher(keywords, whole_words=True)
+    results = matcher.find_all(text, context_size)
     
     return results
 
@@ -0,0 +1,240 @@
+"""
+محرك البحث عن كلمات مفتاحية متعددة
+يبني من مجموعة الكلمات المفتاحية شجرة بادئات (دالة الانتقال في خوارزمية Aho-Corasick) مرة واحدة لكل مجموعة،
+ويترجمها إلى تعبير منتظم واحد داخل نظرة أمامية ينفذه محرك re في مرور واحد على النص، فيُجرَّب كل موضع في النص
+دون أن تستهلك المطابقة نصها، وتُحتسب الكلمات المتداخلة جزئياً (مثل "أعمال الخرسانة" و"الخرسانة المسلحة")،
+مع روابط المخرجات للكلمات التي تبدأ بها كلمة أطول في الموضع نفسه (مثل "صرف" في "صرف صحي")
+"""
+
+import re
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, List, Any, Iterable, Iterator, Optional, Set, Tuple
+
+# بقية الكلمة بعد الكلمة المفتاحية في وضع البادئات
+_WORD_TAIL = re.compile(r"\w*")
+
+
+def _build_trie(keywords: Iterable[str]) -> Dict[str, Any]:
+    """
+    بناء شجرة البادئات للكلمات المفتاحية (المفتاح "" يعني نهاية كلمة)
+    """
+    trie: Dict[str, Any] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}
+    return trie
+
+
+def _trie_pattern(node: Dict[str, Any]) -> str:
+    """
+    تحويل شجرة البادئات إلى تعبير منتظم (يفضّل الكلمة الأطول عند تداخل الكلمات في الموضع نفسه)
+    """
+    branches = [re.escape(char) + _trie_pattern(child) for char, child in node.items() if char]
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    return f"(?:{body})?" if "" in node else body
+
+
+class KeywordMatcher:
+    """
+    البحث عن مجموعة كلمات مفتاحية في النص بمرور واحد، مع مواضعها وسياقها
+    """
+    
+    def __init__(self, keywords: Iterable[str], whole_words: bool = False, prefix: bool = False,
+                 ignore_case: bool = True):
+        """
+        بناء المحرك لمجموعة الكلمات المفتاحية
+        
+        المعاملات:
+        ----------
+        keywords : Iterable[str]
+            الكلمات المفتاحية (تُحذف الفارغة والمكررة مع الحفاظ على الترتيب)
+        whole_words : bool, optional
+            مطابقة الكلمات الكاملة فقط (افتراضي: False)
+        prefix : bool, optional
+            مطابقة الكلمات التي تبدأ بالكلمة المفتاحية، مثل "تصميم" تطابق "تصميمات" (افتراضي: False)
+        ignore_case : bool, optional
+            تجاهل حالة الأحرف اللاتينية (افتراضي: True)
+        """
+        self.ignore_case = ignore_case
+        self.whole_words = whole_words
+        self.prefix = prefix
+        
+        # الكلمة الأصلية لكل صيغة مطابقة
+        self.keywords: List[str] = []
+        self._lookup: Dict[str, str] = {}
+        for keyword in keywords:
+            if not keyword:
+                continue
+            key = self._key(keyword)
+            if key not in self._lookup:
+                self._lookup[key] = keyword
+                self.keywords.append(keyword)
+        
+        # المطابقة داخل نظرة أمامية بطول صفري، فيتقدم البحث حرفاً واحداً بعد كل مطابقة
+        # بدلاً من تخطي نصها، وتُطابَق أطول كلمة تبدأ في كل موضع
+        self._flags = re.IGNORECASE if ignore_case else 0
+        self._pattern = None
+        if self._lookup:
+            body = "(?P<keyword>" + _trie_pattern(_build_trie(self._lookup)) + ")"
+            if whole_words:
+                body = r"\b" + body + r"\b"
+            elif prefix:
+                body = r"\b" + body
+            self._pattern = re.compile(f"(?={body})", self._flags)
+        
+        # روابط المخرجات: الكلمات المفتاحية التي تبدأ بها كلمة مفتاحية أطول (تبدأ في الموضع نفسه فلا تُطابَق
+        # وحدها، أما الكلمات الواقعة بعد بداية الكلمة الأطول فتُطابَق في موضعها)
+        self._nested: Dict[str, List[str]] = {}
+        for outer in self.keywords:
+            for inner in self.keywords:
+                if (inner != outer and self._key(outer).startswith(self._key(inner))
+                        and self._inner_match_allowed(outer, len(inner))):
+                    self._nested.setdefault(outer, []).append(inner)
+    
+    def _key(self, text: str) -> str:
+        """
+        الصيغة المستخدمة للمقارنة (بطول النص نفسه، فالأحرف التي يغيّر lower() طولها مثل "İ" تبقى كما هي)
+        """
+        if not self.ignore_case:
+            return text
+        lowered = text.lower()
+        if len(lowered) == len(text):
+            return lowered
+        return "".join(char.lower() if len(char.lower()) == 1 else char for char in text)
+    
+    def _canonical(self, matched: str) -> str:
+        """
+        الكلمة المفتاحية الأصلية للنص المطابق
+        """
+        keyword = self._lookup.get(self._key(matched))
+        if keyword is None:
+            # أحرف يعدّها re.IGNORECASE متكافئة ولا يوحدها lower()، مثل "ſ" و"s"
+            keyword = next(keyword for keyword in self.keywords
+                           if re.fullmatch(re.escape(keyword), matched, self._flags))
+            self._lookup[self._key(matched)] = keyword
+        return keyword
+    
+    def _inner_match_allowed(self, outer: str, length: int) -> bool:
+        """
+        التحقق من حدود الكلمة لنهاية الكلمة الداخلية (بدايتها هي بداية الكلمة الخارجية المتحققة عند مطابقتها)
+        """
+        if self.whole_words and length < len(outer) and (outer[length].isalnum() or outer[length] == "_"):
+            return False
+        return True
+    
+    def finditer(self, text: str) -> Iterator[Tuple[str, int, int]]:
+        """
+        جميع مطابقات الكلمات المفتاحية بترتيب ورودها
+        
+        المعاملات:
+        ----------
+        text : str
+            النص المراد البحث فيه
+        
+        المخرجات:
+        --------
+        Iterator[Tuple[str, int, int]]
+            (الكلمة المفتاحية، موضع البداية، موضع النهاية)
+        """
+        if self._pattern is None or not text:
+            return
+        
+        for match in self._pattern.finditer(text):
+            keyword = self._canonical(match.group("keyword"))
+            start = match.start()
+            end = match.end("keyword")
+            if self.prefix:
+                # نهاية الكلمة التي تبدأ بالكلمة المفتاحية
+                end = _WORD_TAIL.match(text, end).end()
+            yield keyword, start, end
+            for inner in self._nested.get(keyword, ()):
+                yield inner, start, start + len(inner)
+    
+    def find_all(self, text: str, context_size: int = 50) -> List[Dict[str, Any]]:
+        """
+        جميع مطابقات الكلمات المفتاحية مع سياقها
+        
+        المعاملات:
+        ----------
+        text : str
+            النص المراد البحث فيه
+        context_size : int, optional
+            حجم السياق بالأحرف قبل وبعد الكلمة (افتراضي: 50)
+        
+        المخرجات:
+        --------
+        List[Dict[str, Any]]
+            الكلمة المفتاحية وسياقها وموضعها، مرتبة حسب الموضع في النص
+        """
+        results = [
+            {
+                "keyword": keyword,
+                "context": text[max(0, start - context_size):min(len(text), end + context_size)],
+                "position": start
+            }
+            for keyword, start, end in self.finditer(text)
+        ]
+        results.sort(key=lambda result: result["position"])
+        return results
+    
+    def count(self, text: str) -> Dict[str, int]:
+        """
+        عدد مرات ظهور كل كلمة مفتاحية (بما فيها الكلمات غير الموجودة بعدد صفر)
+        """
+        counts = dict.fromkeys(self.keywords, 0)
+        if self._pattern is None or not text:
+            return counts
+        
+        # findall و Counter يعملان بالكامل داخل C دون إنشاء كائن مطابقة لكل نتيجة
+        for matched, occurrences in Counter(self._pattern.findall(text)).items():
+            keyword = self._canonical(matched)
+            counts[keyword] += occurrences
+            for inner in self._nested.get(keyword, ()):
+                counts[inner] += occurrences
+        return counts
+    
+    def matches(self, text: str) -> Set[str]:
+        """
+        الكلمات المفتاحية الموجودة في النص
+        """
+        return {keyword for keyword, occurrences in self.count(text).items() if occurrences}
+    
+    def first(self, text: str) -> Optional[str]:
+        """
+        أول كلمة مفتاحية ترد في النص، أو None
+        """
+        return next((keyword for keyword, _, _ in self.finditer(text)), None)
+
+
+@lru_cache(maxsize=128)
+def _cached_matcher(keywords: Tuple[str, ...], whole_words: bool, prefix: bool, ignore_case: bool) -> KeywordMatcher:
+    return KeywordMatcher(keywords, whole_words=whole_words, prefix=prefix, ignore_case=ignore_case)
+
+
+def get_keyword_matcher(keywords: Iterable[str], whole_words: bool = False, prefix: bool = False,
+                        ignore_case: bool = True) -> KeywordMatcher:
+    """
+    الحصول على محرك البحث لمجموعة كلمات مفتاحية (يُبنى مرة واحدة لكل مجموعة ويُعاد استخدامه)
+    
+    المعاملات:
+    ----------
+    keywords : Iterable[str]
+        الكلمات المفتاحية
+    whole_words : bool, optional
+        مطابقة الكلمات الكاملة فقط (افتراضي: False)
+    prefix : bool, optional
+        مطابقة الكلمات التي تبدأ بالكلمة المفتاحية (افتراضي: False)
+    ignore_case : bool, optional
+        تجاهل حالة الأحرف اللاتينية (افتراضي: True)
+    
+    المخرجات:
+    --------
+    KeywordMatcher
+        محرك البحث
+    """
+    return _cached_matcher(tuple(keywords), whole_words, prefix, ignore_case)
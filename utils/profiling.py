@@ -0,0 +1,263 @@
+"""
+تحليل أداء تشغيل واحد عند الطلب (cProfile و tracemalloc)
+يُفعَّل بمتغير البيئة PROFILING أو بإعدادات profiling، فيُغلَّف تشغيل المعالجة والتحليل في جلسة تكتب إلى مجلد السجلات:
+ملف .prof لكل خيط تنفيذ (التشغيل الرئيسي ومراحل خط التحليل المنفذة في خيوط أخرى)،
+وملف JSON بأكبر N مواضع تخصيص للذاكرة في كل مرحلة، وجميعها موسومة ببصمة المستند.
+عند تعطيل المفتاح لا تكلف الجلسة والمراحل سوى قراءة متغير سياق واحد
+
+الاستخدام:
+    with profile_run("procurement"):
+        extracted = processor.process_document(content, "pdf", name)   # مرحلة "document"
+        pipeline.run_document(extracted)                                # مرحلة لكل محلل
+    
+    python -m pstats logs/profile_<hash>_<time>_run.prof
+"""
+
+import os
+import json
+import time
+import hashlib
+import cProfile
+import threading
+import contextvars
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List, Any, Iterator, Optional, Union
+
+# جلسة التحليل النشطة في السياق الحالي (تُنقل إلى خيوط خط التحليل مع نسخ السياق)
+_active_session: contextvars.ContextVar = contextvars.ContextVar("profiling_session", default=None)
+
+# مواضع التخصيص المستبعدة من اللقطات (أدوات القياس نفسها واستيراد الوحدات)
+_SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+def profiling_enabled() -> bool:
+    """
+    قراءة مفتاح التفعيل من متغير البيئة PROFILING (معطل افتراضياً)
+    """
+    return os.getenv("PROFILING", "False").lower() in ("true", "1", "t")
+
+
+def _top_allocations(snapshot, previous, top_n: int) -> List[Dict[str, Any]]:
+    """
+    أكبر مواضع التخصيص في لقطة (أو أكبر الزيادات مقارنة باللقطة السابقة)
+    """
+    if previous is not None:
+        statistics = snapshot.compare_to(previous, "lineno")
+        return [
+            {
+                "location": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                "size_kb": round(stat.size / 1024, 1),
+                "size_diff_kb": round(stat.size_diff / 1024, 1),
+                "count_diff": stat.count_diff
+            }
+            for stat in statistics[:top_n]
+        ]
+    return [
+        {
+            "location": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+            "size_kb": round(stat.size / 1024, 1),
+            "count": stat.count
+        }
+        for stat in snapshot.statistics("lineno")[:top_n]
+    ]
+
+
+class ProfilingSession:
+    """
+    جلسة تحليل أداء لتشغيل واحد: ملفات cProfile لكل خيط ولقطات الذاكرة لكل مرحلة
+    """
+    
+    def __init__(self, label: str, output_dir: str = "logs", top_n: int = 25):
+        """
+        تهيئة الجلسة
+        
+        المعاملات:
+        ----------
+        label : str
+            وصف التشغيل (مثل اسم الصفحة أو الأمر)
+        output_dir : str, optional
+            مجلد ملفات التحليل (افتراضي: "logs")
+        top_n : int, optional
+            عدد مواضع التخصيص المحفوظة لكل مرحلة (افتراضي: 25)
+        """
+        self.label = label
+        self.output_dir = output_dir
+        self.top_n = top_n
+        self.document_hash: Optional[str] = None
+        self.started = datetime.now()
+        self.stages: List[Dict[str, Any]] = []
+        self.files: List[str] = []
+        
+        # الخيوط التي يعمل فيها محلل cProfile حالياً (لا يمكن تشغيل محللين في الخيط نفسه)
+        self._profiled_threads = set()
+        self._profiles: List[tuple] = []
+        self._lock = threading.Lock()
+    
+    def set_document(self, content: Union[bytes, str]) -> None:
+        """
+        تسجيل بصمة المستند لوسم ملفات التحليل (يُعتمد أول مستند في التشغيل)
+        """
+        if self.document_hash is None:
+            data = content.encode("utf-8") if isinstance(content, str) else content
+            self.document_hash = hashlib.sha256(data).hexdigest()
+    
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        قياس مرحلة: لقطة ذاكرة قبلها وبعدها، ومحلل cProfile خاص بها إذا نُفذت في خيط غير محلل
+        """
+        thread_id = threading.get_ident()
+        with self._lock:
+            profile = None
+            if thread_id not in self._profiled_threads:
+                profile = cProfile.Profile()
+                self._profiled_threads.add(thread_id)
+        
+        before = tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+        started = time.perf_counter()
+        if profile is not None:
+            profile.enable()
+        try:
+            yield
+        finally:
+            if profile is not None:
+                profile.disable()
+            elapsed = time.perf_counter() - started
+            after = tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+            
+            with self._lock:
+                if profile is not None:
+                    self._profiled_threads.discard(thread_id)
+                    self._profiles.append((name, profile))
+                self.stages.append({
+                    "stage": name,
+                    "thread": threading.current_thread().name,
+                    "wall_time": round(elapsed, 4),
+                    "own_profile": profile is not None,
+                    # المراحل المتزامنة تظهر تخصيصات بعضها في الفروق
+                    "top_allocations": _top_allocations(after, before, self.top_n)
+                })
+    
+    def write(self) -> List[str]:
+        """
+        كتابة ملفات التحليل إلى مجلد السجلات
+        
+        المخرجات:
+        --------
+        List[str]
+            مسارات الملفات المكتوبة
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+        document_tag = (self.document_hash or "nodoc")[:16]
+        prefix = os.path.join(self.output_dir, f"profile_{document_tag}_{self.started.strftime('%Y%m%d_%H%M%S')}")
+        
+        used_names = {}
+        for name, profile in self._profiles:
+            # ترقيم المراحل المتكررة (مثل معالجة عدة مستندات)
+            used_names[name] = used_names.get(name, 0) + 1
+            suffix = name if used_names[name] == 1 else f"{name}_{used_names[name]}"
+            path = f"{prefix}_{suffix}.prof"
+            profile.dump_stats(path)
+            self.files.append(path)
+        
+        memory_path = f"{prefix}_memory.json"
+        with open(memory_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "label": self.label,
+                "document_hash": self.document_hash,
+                "started": self.started.isoformat(timespec="seconds"),
+                "peak_memory_kb": round(tracemalloc.get_traced_memory()[1] / 1024, 1),
+                "stages": self.stages
+            }, f, ensure_ascii=False, indent=2)
+        self.files.append(memory_path)
+        
+        return self.files
+
+
+def current_session() -> Optional[ProfilingSession]:
+    """
+    جلسة التحليل النشطة (أو None)
+    """
+    return _active_session.get()
+
+
+@contextmanager
+def profile_run(label: str, enabled: Optional[bool] = None, output_dir: Optional[str] = None,
+                top_n: Optional[int] = None) -> Iterator[Optional[ProfilingSession]]:
+    """
+    تغليف تشغيل معالجة وتحليل واحد بجلسة تحليل أداء عند تفعيلها
+    
+    المعاملات:
+    ----------
+    label : str
+        وصف التشغيل
+    enabled : bool, optional
+        تفعيل التحليل (افتراضي: متغير البيئة PROFILING)
+    output_dir : str, optional
+        مجلد الملفات (افتراضي: متغير البيئة LOGS_DIR أو "logs")
+    top_n : int, optional
+        عدد مواضع التخصيص لكل مرحلة (افتراضي: متغير البيئة PROFILE_TOP_N أو 25)
+    
+    المخرجات:
+    --------
+    Iterator[Optional[ProfilingSession]]
+        الجلسة، أو None عند التعطيل أو عند وجود جلسة نشطة مسبقاً
+    """
+    if not (profiling_enabled() if enabled is None else enabled) or _active_session.get() is not None:
+        yield None
+        return
+    
+    session = ProfilingSession(
+        label,
+        output_dir or os.getenv("LOGS_DIR", "logs"),
+        int(top_n or os.getenv("PROFILE_TOP_N", "25"))
+    )
+    
+    started_tracemalloc = not tracemalloc.is_tracing()
+    if started_tracemalloc:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    
+    token = _active_session.set(session)
+    try:
+        with session.stage("run"):
+            yield session
+    finally:
+        _active_session.reset(token)
+        try:
+            files = session.write()
+            print(f"تم حفظ ملفات تحليل الأداء: {', '.join(files)}")
+        except OSError as e:
+            print(f"Error writing profiling output: {str(e)}")
+        if started_tracemalloc:
+            tracemalloc.stop()
+
+
+@contextmanager
+def profile_stage(name: str, document: Optional[Union[bytes, str]] = None) -> Iterator[None]:
+    """
+    تحديد مرحلة داخل جلسة التحليل النشطة (لا تفعل شيئاً خارج الجلسات)
+    
+    المعاملات:
+    ----------
+    name : str
+        اسم المرحلة
+    document : bytes or str, optional
+        محتوى المستند لوسم ملفات الجلسة ببصمته
+    """
+    session = _active_session.get()
+    if session is None:
+        yield
+        return
+    
+    if document is not None:
+        session.set_document(document)
+    with session.stage(name):
+        yield
@@ -0,0 +1,407 @@
+"""
+مخزن الموردين العمودي
+يحفظ سجلات الموردين أعمدةً بدلاً من قائمة قواميس: الحقول الرقمية في مصفوفات NumPy، والحقول النصية المتكررة
+(المنطقة والقطاع والفئة) برموز فئوية، والنصوص الفريدة (المعرف والاسم) في مخزن UTF-8 واحد مع مواضعها،
+وقوائم النصوص (المنتجات والفئات والشهادات) برموز في مفردات مشتركة. يستخدمه SuppliersDatabase
+و SupplyChainAnalyzer و LocalContentAnalyzer، ويعيد كل سجل قاموساً مطابقاً للأصل عند طلبه
+"""
+
+import sys
+import json
+import hashlib
+from collections.abc import Sequence
+from typing import Dict, List, Any, Callable, Iterable, Optional
+
+import numpy as np
+
+# أنواع الأعمدة
+NUMERIC = "numeric"
+CATEGORICAL = "categorical"
+STRING = "string"
+STRING_LIST = "string_list"
+NESTED = "nested"
+OBJECT = "object"
+
+# يُرمَّز الحقل النصي فئوياً إذا لم يتجاوز عدد قيمه المختلفة هذا الحد أو هذه النسبة من عدد السجلات
+CATEGORICAL_MAX_VALUES = 16
+CATEGORICAL_MAX_RATIO = 0.5
+
+# قيمة الحقل غير الموجود في السجل
+_MISSING = object()
+
+
+class _Column:
+    """
+    عمود واحد في المخزن مع قناع وجود القيمة في كل سجل
+    """
+    
+    def __init__(self, kind: str, present: np.ndarray, **data):
+        self.kind = kind
+        self.present = present
+        self.__dict__.update(data)
+    
+    def value(self, position: int) -> Any:
+        """
+        قيمة العمود في سجل واحد بالنوع الأصلي
+        """
+        # item() يعيد القيمة بنوع Python مباشرة دون إنشاء قيمة NumPy وسيطة
+        kind = self.kind
+        if kind == CATEGORICAL:
+            return self.categories[self.codes.item(position)]
+        if kind == STRING:
+            return self.buffer[self.offsets.item(position):self.offsets.item(position + 1)].decode("utf-8")
+        if kind == NUMERIC:
+            return self.values.item(position)
+        if kind == STRING_LIST:
+            vocabulary = self.vocabulary
+            return [vocabulary[code] for code in self.codes[self.offsets.item(position):self.offsets.item(position + 1)].tolist()]
+        if kind == NESTED:
+            return {key: child.value(position) for key, child in self.children.items() if child.present.item(position)}
+        return self.values[position]
+
+
+def _intern(value: str) -> str:
+    """
+    توحيد نسخ النص المتكرر في الذاكرة
+    """
+    return sys.intern(value)
+
+
+def _build_column(values: List[Any]) -> _Column:
+    """
+    بناء عمود من قيم حقل في جميع السجلات (بأصغر نوع يحفظ القيم كما هي)
+    """
+    present = np.array([value is not _MISSING for value in values], dtype=bool)
+    found = [value for value in values if value is not _MISSING]
+    
+    # أرقام (الأعداد الصحيحة تبقى صحيحة عند استرجاعها)
+    if all(isinstance(value, (int, float)) and not isinstance(value, bool) for value in found):
+        integer = all(isinstance(value, int) for value in found)
+        try:
+            numbers = np.array([value if value is not _MISSING else 0 for value in values],
+                               dtype=np.int64 if integer else np.float64)
+        except OverflowError:
+            return _Column(OBJECT, present, values=[None if value is _MISSING else value for value in values])
+        return _Column(NUMERIC, present, values=numbers)
+    
+    # نصوص: رموز فئوية للقيم المتكررة، ومخزن UTF-8 واحد للقيم الفريدة
+    if all(isinstance(value, str) for value in found):
+        categories = list(dict.fromkeys(found))
+        if len(categories) <= max(CATEGORICAL_MAX_VALUES, CATEGORICAL_MAX_RATIO * len(found)):
+            category_codes = {category: code for code, category in enumerate(categories)}
+            codes = np.array([category_codes[value] if value is not _MISSING else -1 for value in values], dtype=np.int32)
+            return _Column(CATEGORICAL, present, codes=codes, categories=[_intern(category) for category in categories])
+        
+        encoded = [value.encode("utf-8") if value is not _MISSING else b"" for value in values]
+        offsets = np.zeros(len(values) + 1, dtype=np.int64)
+        np.cumsum([len(value) for value in encoded], out=offsets[1:])
+        return _Column(STRING, present, buffer=b"".join(encoded), offsets=offsets)
+    
+    # قوائم نصوص: رموز متتالية لجميع السجلات في مفردات مشتركة
+    if all(isinstance(value, list) and all(isinstance(item, str) for item in value) for value in found):
+        vocabulary = {}
+        codes = []
+        offsets = np.zeros(len(values) + 1, dtype=np.int64)
+        for position, value in enumerate(values):
+            if value is not _MISSING:
+                codes.extend(vocabulary.setdefault(item, len(vocabulary)) for item in value)
+            offsets[position + 1] = len(codes)
+        return _Column(STRING_LIST, present, codes=np.array(codes, dtype=np.int32), offsets=offsets,
+                       vocabulary=[_intern(item) for item in vocabulary])
+    
+    # قواميس أرقام (مثل مؤشرات الأداء السابق): عمود رقمي لكل مفتاح
+    if found and all(isinstance(value, dict) for value in found):
+        keys = list(dict.fromkeys(key for value in found for key in value))
+        children = {
+            key: _build_column([value.get(key, _MISSING) if value is not _MISSING else _MISSING for value in values])
+            for key in keys
+        }
+        if all(isinstance(key, str) for key in keys) and all(child.kind == NUMERIC for child in children.values()):
+            return _Column(NESTED, present, children=children)
+    
+    return _Column(OBJECT, present, values=[None if value is _MISSING else value for value in values])
+
+
+class SupplierStore(Sequence):
+    """
+    مخزن عمودي للقراءة فقط لسجلات الموردين
+    (يُستخدم كقائمة قواميس، ويوفر مرشحات متجهة على الأعمدة دون إنشاء السجلات)
+    """
+    
+    def __init__(self, size: int, fields: Dict[str, _Column]):
+        """
+        تهيئة المخزن (يُنشأ عادة عبر from_records)
+        
+        المعاملات:
+        ----------
+        size : int
+            عدد السجلات
+        fields : Dict[str, _Column]
+            الأعمدة بترتيب ظهور الحقول في السجلات
+        """
+        self._size = size
+        self._fields = fields
+        self._fingerprint = None
+    
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]]) -> "SupplierStore":
+        """
+        بناء المخزن من سجلات الموردين
+        
+        المعاملات:
+        ----------
+        records : Iterable[Dict[str, Any]]
+            سجلات الموردين (قائمة قواميس أو مخزن آخر)
+        
+        المخرجات:
+        --------
+        SupplierStore
+            المخزن
+        """
+        if isinstance(records, SupplierStore):
+            return records
+        
+        records = list(records)
+        names = list(dict.fromkeys(key for record in records for key in record))
+        fields = {name: _build_column([record.get(name, _MISSING) for record in records]) for name in names}
+        return cls(len(records), fields)
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [self.record(index) for index in range(*position.indices(self._size))]
+        if position < 0:
+            position += self._size
+        if not 0 <= position < self._size:
+            raise IndexError("supplier index out of range")
+        return self.record(position)
+    
+    def __iter__(self):
+        for position in range(self._size):
+            yield self.record(position)
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, SupplierStore):
+            return len(self) == len(other) and self.fingerprint() == other.fingerprint()
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+    
+    def __repr__(self) -> str:
+        # يدخل في بصمات ذاكرة نتائج التحليل، لذا يتضمن بصمة المحتوى
+        return f"SupplierStore({self._size} suppliers, {self.fingerprint()})"
+    
+    @property
+    def fields(self) -> List[str]:
+        """
+        أسماء الحقول بترتيب ظهورها في السجلات
+        """
+        return list(self._fields)
+    
+    def record(self, position: int) -> Dict[str, Any]:
+        """
+        سجل مورد واحد كقاموس جديد
+        
+        المعاملات:
+        ----------
+        position : int
+            موقع المورد
+        
+        المخرجات:
+        --------
+        Dict[str, Any]
+            السجل بالحقول والقيم الأصلية
+        """
+        return {name: column.value(position) for name, column in self._fields.items() if column.present.item(position)}
+    
+    def records(self, positions: Iterable[int]) -> List[Dict[str, Any]]:
+        """
+        سجلات الموردين في المواقع المحددة (مثل نتيجة np.flatnonzero على قناع)
+        """
+        return [self.record(int(position)) for position in positions]
+    
+    def values(self, field: str, default: Any = None) -> List[Any]:
+        """
+        قيم حقل في جميع السجلات (القيمة الافتراضية للسجلات التي لا تحتويه)
+        """
+        column = self._fields.get(field)
+        if column is None:
+            return [default] * self._size
+        if column.kind == CATEGORICAL:
+            categories = column.categories + [default]
+            return [categories[code] for code in column.codes.tolist()]
+        present = column.present.tolist()
+        return [column.value(position) if present[position] else default for position in range(self._size)]
+    
+    def numeric(self, field: str) -> np.ndarray:
+        """
+        قيم حقل رقمي كمصفوفة (NaN للسجلات التي لا تحتويه)، ويُشار إلى الحقول المتداخلة بالنقطة
+        مثل "historical_performance.quality"
+        """
+        column = self._column(field)
+        if column is None or column.kind != NUMERIC:
+            return np.full(self._size, np.nan)
+        return np.where(column.present, column.values, np.nan)
+    
+    def present(self, field: str) -> np.ndarray:
+        """
+        قناع السجلات التي تحتوي الحقل
+        """
+        column = self._column(field)
+        if column is None:
+            return np.zeros(self._size, dtype=bool)
+        return column.present.copy()
+    
+    def isin(self, field: str, values: Iterable[Any]) -> np.ndarray:
+        """
+        قناع السجلات التي تساوي قيمة الحقل فيها إحدى القيم، أو تحتوي قائمتها على إحداها
+        
+        المعاملات:
+        ----------
+        field : str
+            اسم الحقل
+        values : Iterable[Any]
+            القيم المطلوبة
+        
+        المخرجات:
+        --------
+        np.ndarray
+            قناع منطقي بطول المخزن
+        """
+        wanted = set(values)
+        return self.match(field, lambda value: value in wanted)
+    
+    def match(self, field: str, predicate: Callable[[Any], bool]) -> np.ndarray:
+        """
+        قناع السجلات التي تحقق قيمة الحقل فيها الشرط، أو يحققه أحد عناصر قائمتها
+        (يُقيَّم الشرط مرة واحدة لكل قيمة مختلفة في الحقول الفئوية وقوائم النصوص)
+        
+        المعاملات:
+        ----------
+        field : str
+            اسم الحقل
+        predicate : Callable[[Any], bool]
+            الشرط
+        
+        المخرجات:
+        --------
+        np.ndarray
+            قناع منطقي بطول المخزن
+        """
+        column = self._column(field)
+        if column is None:
+            return np.zeros(self._size, dtype=bool)
+        
+        if column.kind == CATEGORICAL:
+            accepted = np.array([bool(predicate(category)) for category in column.categories] + [False])
+            return accepted[column.codes]
+        
+        if column.kind == STRING_LIST:
+            accepted = np.array([bool(predicate(item)) for item in column.vocabulary] + [False])
+            rows = np.repeat(np.arange(self._size), np.diff(column.offsets))
+            mask = np.zeros(self._size, dtype=bool)
+            mask[rows[accepted[column.codes]]] = True
+            return mask
+        
+        if column.kind == NUMERIC:
+            values = column.values.tolist()
+            return np.array([present and bool(predicate(value)) for present, value in zip(column.present.tolist(), values)],
+                            dtype=bool)
+        
+        present = column.present.tolist()
+        mask = np.zeros(self._size, dtype=bool)
+        for position in range(self._size):
+            if present[position]:
+                value = column.value(position)
+                if isinstance(value, list):
+                    mask[position] = any(predicate(item) for item in value)
+                else:
+                    mask[position] = bool(predicate(value))
+        return mask
+    
+    def value_counts(self, field: str, default: Any = None) -> Dict[Any, int]:
+        """
+        عدد السجلات لكل قيمة في الحقل (القيمة الافتراضية للسجلات التي لا تحتويه)، بترتيب ظهور القيم
+        """
+        column = self._fields.get(field)
+        if column is not None and column.kind == CATEGORICAL:
+            # رموز الفئات مرتبة بظهورها الأول، فيكفي تحديد موضع أول سجل لا يحتوي الحقل بينها
+            counts = np.bincount(column.codes + 1, minlength=len(column.categories) + 1).tolist()
+            missing_before = len(column.categories)
+            if counts[0]:
+                first_missing = int(np.argmax(column.codes < 0))
+                missing_before = int(column.codes[:first_missing].max()) + 1 if first_missing else 0
+            
+            result = {}
+            for code, category in enumerate(column.categories + [None]):
+                if code == missing_before and counts[0]:
+                    result[default] = result.get(default, 0) + counts[0]
+                if code < len(column.categories):
+                    result[category] = result.get(category, 0) + counts[code + 1]
+            return result
+        
+        result = {}
+        for value in self.values(field, default):
+            result[value] = result.get(value, 0) + 1
+        return result
+    
+    def vocabulary(self, field: str) -> List[str]:
+        """
+        القيم المختلفة في حقل فئوي أو في قوائم النصوص
+        """
+        column = self._fields.get(field)
+        if column is None:
+            return []
+        if column.kind == CATEGORICAL:
+            return list(column.categories)
+        if column.kind == STRING_LIST:
+            return list(column.vocabulary)
+        return list(dict.fromkeys(value for value in self.values(field, _MISSING) if value is not _MISSING))
+    
+    def fingerprint(self) -> str:
+        """
+        بصمة SHA-256 لمحتوى المخزن (تُحسب مرة واحدة لأن المخزن للقراءة فقط)
+        """
+        if self._fingerprint is None:
+            digest = hashlib.sha256(str(self._size).encode("ascii"))
+            for name, column in self._fields.items():
+                self._update_digest(digest, name, column)
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+    
+    def _column(self, field: str) -> Optional[_Column]:
+        """
+        عمود الحقل (والحقول المتداخلة بالنقطة)
+        """
+        name, _, key = field.partition(".")
+        column = self._fields.get(name)
+        if key and column is not None:
+            return column.children.get(key) if column.kind == NESTED else None
+        return column
+    
+    def _update_digest(self, digest, name: str, column: _Column) -> None:
+        """
+        إضافة محتوى عمود إلى البصمة
+        """
+        digest.update(f"{name}:{column.kind}".encode("utf-8"))
+        digest.update(column.present.tobytes())
+        if column.kind == NUMERIC:
+            digest.update(str(column.values.dtype).encode("ascii"))
+            digest.update(column.values.tobytes())
+        elif column.kind == CATEGORICAL:
+            digest.update(json.dumps(column.categories, ensure_ascii=False).encode("utf-8"))
+            digest.update(column.codes.tobytes())
+        elif column.kind == STRING:
+            digest.update(column.buffer)
+            digest.update(column.offsets.tobytes())
+        elif column.kind == STRING_LIST:
+            digest.update(json.dumps(column.vocabulary, ensure_ascii=False).encode("utf-8"))
+            digest.update(column.codes.tobytes())
+            digest.update(column.offsets.tobytes())
+        elif column.kind == NESTED:
+            for key, child in column.children.items():
+                self._update_digest(digest, key, child)
+        else:
+            digest.update(json.dumps(column.values, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8"))
@@ -0,0 +1,355 @@
+"""
+تتبع مراحل المعالجة وقياس أزمنتها
+يوفر نطاقات (spans) متداخلة تُفتح بمدير سياق أو بمزخرف، ويسجل كل نطاق زمنه الفعلي وزمن المعالج
+والأعداد المرتبطة به (الصفحات، البنود، الأحرف)، ويجمع أزمنة كل مرحلة في مدرج تكراري،
+مع تصدير التتبع بصيغة JSON
+
+الاستخدام:
+    with span("document.process", file_type="pdf") as current:
+        current.add_count("pages", 12)
+    
+    @traced("analysis.risk_analyzer.analyze")
+    def analyze(self, text): ...
+    
+    get_tracer().export("data/traces/trace.json")
+
+متغيرات البيئة: TRACING (تفعيل التتبع، افتراضي: True)، TRACE_DIR (مجلد يُصدَّر إليه كل تتبع جذري عند انتهائه)
+"""
+
+import os
+import json
+import time
+import threading
+import contextvars
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from functools import wraps
+from typing import Dict, List, Any, Callable, Iterator, Optional
+
+# حدود فئات المدرج التكراري بالمللي ثانية
+HISTOGRAM_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000)
+
+# عدد التتبعات الجذرية المحتفظ بها في الذاكرة
+MAX_ROOT_SPANS = 100
+
+# النطاق المفتوح حالياً في السياق (يُنقل إلى خيوط خط التحليل مع نسخ السياق)
+_current_span: contextvars.ContextVar = contextvars.ContextVar("current_span", default=None)
+
+
+class Span:
+    """
+    نطاق تتبع واحد: اسم، وسمات، وأعداد، وأزمنة، ونطاقات فرعية
+    """
+    
+    __slots__ = ("name", "attributes", "counts", "children", "parent", "start_time", "wall_time", "cpu_time",
+                 "thread", "error", "_started", "_cpu_started")
+    
+    def __init__(self, name: str, attributes: Optional[Dict[str, Any]] = None, parent: Optional["Span"] = None):
+        self.name = name
+        self.attributes = dict(attributes or {})
+        self.counts: Dict[str, int] = {}
+        self.children: List["Span"] = []
+        self.parent = parent
+        self.start_time = time.time()
+        self.wall_time = 0.0
+        self.cpu_time = 0.0
+        self.thread = threading.current_thread().name
+        self.error: Optional[str] = None
+        self._started = time.perf_counter()
+        # زمن المعالج للخيط الحالي فقط (عمل الخيوط والعمليات الفرعية يظهر في نطاقاتها)
+        self._cpu_started = time.thread_time()
+    
+    def set(self, key: str, value: Any) -> None:
+        """
+        تعيين سمة للنطاق
+        """
+        self.attributes[key] = value
+    
+    def add_count(self, key: str, amount: int = 1) -> None:
+        """
+        زيادة أحد أعداد النطاق (مثل عدد الصفحات أو البنود)
+        """
+        self.counts[key] = self.counts.get(key, 0) + amount
+    
+    def finish(self) -> None:
+        """
+        إغلاق النطاق وتسجيل أزمنته
+        """
+        self.wall_time = time.perf_counter() - self._started
+        self.cpu_time = time.thread_time() - self._cpu_started
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        تحويل النطاق ونطاقاته الفرعية إلى قاموس قابل للتصدير
+        
+        المخرجات:
+        --------
+        Dict[str, Any]
+            الاسم والبداية والأزمنة بالمللي ثانية والسمات والأعداد والنطاقات الفرعية
+        """
+        data = {
+            "name": self.name,
+            "start": datetime.fromtimestamp(self.start_time).isoformat(timespec="milliseconds"),
+            "wall_ms": round(self.wall_time * 1000, 3),
+            "cpu_ms": round(self.cpu_time * 1000, 3),
+            "thread": self.thread
+        }
+        if self.attributes:
+            data["attributes"] = self.attributes
+        if self.counts:
+            data["counts"] = self.counts
+        if self.error:
+            data["error"] = self.error
+        if self.children:
+            data["children"] = [child.to_dict() for child in list(self.children)]
+        return data
+
+
+class _NullSpan:
+    """
+    نطاق فارغ يُستخدم عند تعطيل التتبع أو خارج أي نطاق
+    """
+    
+    def set(self, key: str, value: Any) -> None:
+        pass
+    
+    def add_count(self, key: str, amount: int = 1) -> None:
+        pass
+
+
+NULL_SPAN = _NullSpan()
+
+
+class Tracer:
+    """
+    جامع نطاقات التتبع في العملية: التتبعات الجذرية الأخيرة ومدرج أزمنة كل مرحلة
+    """
+    
+    def __init__(self, enabled: bool = True, export_dir: Optional[str] = None, max_roots: int = MAX_ROOT_SPANS):
+        """
+        تهيئة جامع التتبع
+        
+        المعاملات:
+        ----------
+        enabled : bool, optional
+            تفعيل التتبع (افتراضي: True)
+        export_dir : str, optional
+            مجلد يُصدَّر إليه كل تتبع جذري عند انتهائه (افتراضي: بدون تصدير تلقائي)
+        max_roots : int, optional
+            عدد التتبعات الجذرية المحتفظ بها في الذاكرة (افتراضي: 100)
+        """
+        self.enabled = enabled
+        self.export_dir = export_dir
+        self.roots: deque = deque(maxlen=max_roots)
+        self._histogram: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+    
+    def record(self, finished: Span) -> None:
+        """
+        تسجيل نطاق منتهٍ في المدرج، وحفظه إذا كان جذرياً
+        """
+        elapsed_ms = finished.wall_time * 1000
+        with self._lock:
+            stage = self._histogram.get(finished.name)
+            if stage is None:
+                stage = self._histogram[finished.name] = {
+                    "count": 0, "errors": 0, "total_ms": 0.0, "cpu_ms": 0.0,
+                    "min_ms": elapsed_ms, "max_ms": elapsed_ms,
+                    "buckets": [0] * (len(HISTOGRAM_BUCKETS_MS) + 1)
+                }
+            stage["count"] += 1
+            stage["errors"] += 1 if finished.error else 0
+            stage["total_ms"] += elapsed_ms
+            stage["cpu_ms"] += finished.cpu_time * 1000
+            stage["min_ms"] = min(stage["min_ms"], elapsed_ms)
+            stage["max_ms"] = max(stage["max_ms"], elapsed_ms)
+            stage["buckets"][self._bucket(elapsed_ms)] += 1
+            
+            if finished.parent is None:
+                self.roots.append(finished)
+        
+        if finished.parent is None and self.export_dir:
+            try:
+                timestamp = datetime.fromtimestamp(finished.start_time).strftime("%Y%m%d_%H%M%S_%f")
+                self.export(os.path.join(self.export_dir, f"trace_{timestamp}_{finished.name}.json"), [finished])
+            except OSError as e:
+                print(f"Error exporting trace: {str(e)}")
+    
+    @staticmethod
+    def _bucket(elapsed_ms: float) -> int:
+        """
+        رقم فئة المدرج المناسبة للزمن
+        """
+        for index, bound in enumerate(HISTOGRAM_BUCKETS_MS):
+            if elapsed_ms <= bound:
+                return index
+        return len(HISTOGRAM_BUCKETS_MS)
+    
+    def get_histogram(self) -> Dict[str, Dict[str, Any]]:
+        """
+        المدرج التكراري المجمع لأزمنة كل مرحلة
+        
+        المخرجات:
+        --------
+        Dict[str, Dict[str, Any]]
+            لكل اسم نطاق: العدد والأخطاء والمجموع والمتوسط والأدنى والأعلى وزمن المعالج بالمللي ثانية،
+            وتقدير p50 و p95 (الحد الأعلى للفئة)، وعدد القياسات في كل فئة
+        """
+        labels = [f"<={bound}ms" for bound in HISTOGRAM_BUCKETS_MS] + [f">{HISTOGRAM_BUCKETS_MS[-1]}ms"]
+        histogram = {}
+        with self._lock:
+            for name, stage in self._histogram.items():
+                histogram[name] = {
+                    "count": stage["count"],
+                    "errors": stage["errors"],
+                    "total_ms": round(stage["total_ms"], 3),
+                    "mean_ms": round(stage["total_ms"] / stage["count"], 3),
+                    "min_ms": round(stage["min_ms"], 3),
+                    "max_ms": round(stage["max_ms"], 3),
+                    "cpu_ms": round(stage["cpu_ms"], 3),
+                    "p50_ms": self._percentile(stage, 0.50),
+                    "p95_ms": self._percentile(stage, 0.95),
+                    "buckets": {label: count for label, count in zip(labels, stage["buckets"]) if count}
+                }
+        return histogram
+    
+    @staticmethod
+    def _percentile(stage: Dict[str, Any], fraction: float) -> float:
+        """
+        تقدير النسبة المئوية من فئات المدرج (الحد الأعلى للفئة، أو أعلى زمن للفئة الأخيرة)
+        """
+        target = fraction * stage["count"]
+        seen = 0
+        for index, count in enumerate(stage["buckets"]):
+            seen += count
+            if seen >= target and count:
+                if index < len(HISTOGRAM_BUCKETS_MS):
+                    return float(min(HISTOGRAM_BUCKETS_MS[index], round(stage["max_ms"], 3)))
+                break
+        return round(stage["max_ms"], 3)
+    
+    def export(self, path: str, roots: Optional[List[Span]] = None) -> str:
+        """
+        تصدير التتبعات والمدرج التكراري إلى ملف JSON
+        
+        المعاملات:
+        ----------
+        path : str
+            مسار الملف
+        roots : List[Span], optional
+            التتبعات المراد تصديرها (افتراضي: جميع التتبعات الجذرية المحفوظة)
+        
+        المخرجات:
+        --------
+        str
+            مسار الملف
+        """
+        if roots is None:
+            with self._lock:
+                roots = list(self.roots)
+        
+        trace = {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "spans": [root.to_dict() for root in roots],
+            "histogram": self.get_histogram()
+        }
+        
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(trace, f, ensure_ascii=False, indent=2)
+        return path
+    
+    def reset(self) -> None:
+        """
+        حذف التتبعات والمدرج المجمع
+        """
+        with self._lock:
+            self.roots.clear()
+            self._histogram.clear()
+
+
+_tracer = Tracer(
+    enabled=os.getenv("TRACING", "True").lower() in ("true", "1", "t"),
+    export_dir=os.getenv("TRACE_DIR") or None
+)
+
+
+def get_tracer() -> Tracer:
+    """
+    جامع التتبع المشترك في العملية
+    """
+    return _tracer
+
+
+def current_span():
+    """
+    النطاق المفتوح حالياً (أو نطاق فارغ إذا لم يكن هناك نطاق أو كان التتبع معطلاً)
+    """
+    return _current_span.get() or NULL_SPAN
+
+
+@contextmanager
+def span(name: str, **attributes) -> Iterator[Any]:
+    """
+    فتح نطاق تتبع داخل النطاق الحالي
+    
+    المعاملات:
+    ----------
+    name : str
+        اسم المرحلة (مثل "analysis.cost_estimator.estimate")
+    **attributes : Any
+        سمات النطاق (مثل نوع الملف أو اسم النموذج)
+    
+    المخرجات:
+    --------
+    Iterator[Span]
+        النطاق المفتوح (لإضافة السمات والأعداد)
+    """
+    if not _tracer.enabled:
+        yield NULL_SPAN
+        return
+    
+    parent = _current_span.get()
+    opened = Span(name, attributes, parent)
+    if parent is not None:
+        parent.children.append(opened)
+    
+    token = _current_span.set(opened)
+    try:
+        yield opened
+    except BaseException as e:
+        opened.error = f"{type(e).__name__}: {str(e)}"
+        raise
+    finally:
+        _current_span.reset(token)
+        opened.finish()
+        _tracer.record(opened)
+
+
+def traced(name: Optional[str] = None) -> Callable:
+    """
+    مزخرف لتتبع دالة في نطاق باسمها
+    
+    المعاملات:
+    ----------
+    name : str, optional
+        اسم النطاق (افتراضي: اسم الوحدة والدالة)
+    
+    المخرجات:
+    --------
+    Callable
+        المزخرف
+    """
+    def decorator(function: Callable) -> Callable:
+        span_name = name or f"{function.__module__}.{function.__qualname__}"
+        
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            with span(span_name):
+                return function(*args, **kwargs)
+        
+        return wrapper
+    
+    return decorator
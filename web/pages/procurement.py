@@ -22,12 +22,16 @@ import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 # استيراد الوحدات الخاصة بالمشروع
+from config import get_config
 from modules.document_processor import DocumentProcessor
 from modules.requirement_analyzer import RequirementAnalyzer
 from modules.cost_risk_analyzer import CostRiskAnalyzer
 from modules.schedule_analyzer import ScheduleAnalyzer
 from modules.local_content import LocalContentCalculator
 from modules.supply_chain import SupplyChainAnalyzer
+from modules.analysis_pipeline import TenderAnalysisPipeline
+from utils.tracing import span
+from utils.profiling import profile_run
 from modules.ai_models import LLMProcessor, ArabicBERTModel
 from utils.database import VectorDBConnector, TemplateLoader
 from utils.api_integrations import MunafasatAPI, EtimadAPI, BaladyAPI
@@ -95,7 +99,7 @@ def process_uploaded_documents(uploaded_files):
     if not uploaded_files:
         return None, None
     
-    document_processor = DocumentProcessor()
+    document_processor = DocumentProcessor(get_config("document_processing"))
     
     extracted_data = {}
     file_contents = {}
@@ -502,29 +506,36 @@ def main():
     # معالجة زر التحليل
     if analysis_btn and uploaded_files:
         with st.spinner("جارٍ تحليل المستندات..."):
-            # معالجة المستندات المرفوعة
-            extracted_data, file_contents = process_uploaded_documents(uploaded_files)
-            st.session_state.extracted_data = extracted_data
-            
-            # تحليل المتطلبات
-            requirement_results = analyze_requirements(extracted_data)
-            
-            # تحليل المحتوى المحلي
-            local_content_results = analyze_local_content(
-                extracted_data, 
-                st.session_state.project_data
-            )
-            
-            # إنشاء نتائج التحليل الشاملة
-            st.session_state.analysis_results = {
-                "requirements": requirement_results,
-                "local_content": local_content_results,
-                # هنا ستضاف نتائج التحليلات الأخرى
-            }
+            # تحليل أداء المعالجة والتحليل عند تفعيل PROFILING
+            with profile_run("procurement", **get_config("profiling")):
+                # معالجة المستندات المرفوعة
+                extracted_data, file_contents = process_uploaded_documents(uploaded_files)
+                st.session_state.extracted_data = extracted_data
+                
+                # تحليل المتطلبات والمحتوى المحلي بالتوازي (مرحلتان مستقلتان)
+                pipeline = TenderAnalysisPipeline(get_config("analysis_pipeline"))
+                pipeline.add_stage("requirements", analyze_requirements, ("extracted_data",))
+                pipeline.add_stage("local_content", analyze_local_content, ("extracted_data", "project_data"))
+                pipeline_output = pipeline.run({
+                    "extracted_data": extracted_data,
+                    "project_data": st.session_state.project_data
+                })
+                
+                for error in pipeline_output["errors"].values():
+                    st.error(error)
+                
+                # إنشاء نتائج التحليل الشاملة
+                st.session_state.analysis_results = {
+                    "requirements": pipeline_output["results"].get("requirements"),
+                    "local_content": pipeline_output["results"].get("local_content"),
+                    # هنا ستضاف نتائج التحليلات الأخرى
+                }
             
             st.success("تم الانتهاء من التحليل!")
     elif analysis_btn and not uploaded_files:
         st.error("يرجى رفع المستندات المطلوبة أولاً.")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # تتبع زمن تنفيذ الصفحة كاملة في كل إعادة تشغيل (بما فيها التحليل والعرض)
+    with span("ui.procurement"):
+        main()
\ No newline at end of file